@@ -5,6 +5,7 @@ from flask import Flask, request, g
 from flask_cors import CORS
 from .config import config
 from .utils.logging.logger import app_logger, log_api_access
+from .utils.common.helpers import env_bool
 import time
 
 def create_app(config_name='default'):
@@ -41,8 +42,24 @@ def create_app(config_name='default'):
     # 기본 에러 핸들러 등록
     register_error_handlers(app)
     
+    # 이론/퀴즈 자료용 섹션 청크 인덱스(및 NumPy 벡터 검색 인덱스) 미리 생성
+    preload_vector_indexes(app)
+    
     return app
 
+def preload_vector_indexes(app):
+    """벡터 DB 메모리 인덱스 미리 생성 (SECTION_CHUNK_INDEX_PRELOAD=false면 첫 요청 시 생성)
+    
+    Args:
+        app (Flask): Flask 애플리케이션 인스턴스
+    """
+    if not env_bool('SECTION_CHUNK_INDEX_PRELOAD', True):
+        return
+    
+    from .tools.external.vector_search_tools import preload_vector_search_indexes
+    if not preload_vector_search_indexes():
+        app.logger.warning("벡터 검색 인덱스 미리 생성 실패, 첫 요청 시 다시 시도")
+
 def register_request_handlers(app):
     """요청 전후 처리 함수 등록"""
     
@@ -4,6 +4,7 @@
 from typing import Dict, Any
 from app.core.langraph.state_manager import TutorState, state_manager
 from app.tools.analysis.intent_analysis_tools import user_intent_analysis_tool
+from app.tools.content.qna_speculative_retrieval import speculative_retrieval
 from app.agents.learning_supervisor.response_generator import response_generator
 from app.utils.common.chat_logger import chat_logger
 import uuid
@@ -184,13 +185,25 @@ class LearningSupervisor:
         if not user_message:
             return self._handle_no_message_in_question_phase(state)
         
-        # 사용자 의도 분석
-        analyzed_intent = self._analyze_user_intent(state, user_message)
+        # 의도 분석과 동시에 QnA 벡터 검색을 미리 시작 (question이면 재사용, next_step이면 폐기)
+        speculation = speculative_retrieval.start(user_message, state.get("session_progress_stage", ""))
+        
+        # 사용자 의도 분석 (실패하면 진행 중인 추측 검색을 폐기한 뒤 예외 전달)
+        try:
+            analyzed_intent = self._analyze_user_intent(state, user_message)
+        except Exception:
+            if speculation:
+                speculation.discard()
+            raise
         print(f"[DEBUG] 분석된 사용자 의도: '{analyzed_intent}'")
         
         # === 🚀 NEW: question 의도에 대한 특별 처리 ===
         if analyzed_intent == "question":
-            return self._handle_question_intent_for_streaming(state, user_message)
+            prefetched_context = speculation.collect() if speculation else None
+            return self._handle_question_intent_for_streaming(state, user_message, prefetched_context)
+        
+        if speculation:
+            speculation.discard()
         
         # 분석 결과를 State에 저장 (기존 로직)
         updated_state = state.copy()
@@ -215,13 +228,15 @@ class LearningSupervisor:
         return updated_state
     
     # === 🚀 NEW METHOD: 질문 의도에 대한 스트리밍 준비 처리 ===
-    def _handle_question_intent_for_streaming(self, state: TutorState, user_message: str) -> TutorState:
+    def _handle_question_intent_for_streaming(self, state: TutorState, user_message: str,
+                                              prefetched_context: Dict[str, Any] = None) -> TutorState:
         """
         질문 의도 감지 시 스트리밍 준비 상태로 전환
         
         Args:
             state: 현재 TutorState
             user_message: 사용자 질문
+            prefetched_context: 의도 분석과 병렬로 미리 검색한 QnA 자료 (없으면 None)
             
         Returns:
             스트리밍 준비 상태로 설정된 TutorState
@@ -235,7 +250,7 @@ class LearningSupervisor:
         temp_session_id = str(uuid.uuid4())
         
         # 2. 스트리밍 세션 데이터 준비 (전역 임시 저장소에 저장)
-        from app.routes.learning.session.qna_stream import streaming_sessions
+        from app.routes.learning.session.qna_stream import save_streaming_session
         
         streaming_session_data = {
             "user_message": user_message,
@@ -245,12 +260,13 @@ class LearningSupervisor:
                 "session_stage": state.get("session_progress_stage", ""),
                 "user_type": state.get("user_type", "beginner")
             },
+            "prefetched_context": prefetched_context,  # 있으면 스트리밍 시 분석 LLM 호출 생략
             "expires_at": time.time() + 30,  # 30초 후 만료
             "original_state": state.copy()  # QnA Agent에서 State 관리할 때 사용
         }
         
         # 3. 전역 임시 저장소에 스트리밍 세션 저장
-        streaming_sessions[temp_session_id] = streaming_session_data
+        save_streaming_session(temp_session_id, streaming_session_data)
         
         # 4. State 업데이트 (TutorState 구조 유지)
         updated_state = state.copy()
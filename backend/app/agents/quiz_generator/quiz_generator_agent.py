@@ -1,11 +1,12 @@
 # backend/app/agents/quiz_generator/quiz_generator_agent.py
 # v2.0 업데이트: State 필드명 변경 대응, parse_quiz_from_json 활용
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import json
 import os
 
 from app.core.langraph.state_manager import TutorState, state_manager
+from app.core.artifacts import content_artifact_store
 from app.tools.content.quiz_tools_chatgpt import quiz_generation_tool
 
 
@@ -46,51 +47,53 @@ class QuizGenerator:
             # 2. theory_draft 우선 확인
             theory_draft = self._get_theory_draft_from_state(updated_state)
             
-            # 3. 섹션 데이터 로드 (챕터 제목, 섹션 제목, 퀴즈 타입 포함)
-            section_data = self._load_section_data(updated_state["current_chapter"], updated_state["current_section"])
-            if not section_data:
-                raise ValueError(f"챕터 {updated_state['current_chapter']} 섹션 {updated_state['current_section']} 데이터를 찾을 수 없습니다.")
+            # 3. 재학습 여부 확인
+            is_retry_session = updated_state["current_session_count"] > 0
             
-            # 4. 데이터 소스 결정
+            # 4. 사전 생성된 퀴즈 대본 우선 조회 (같은 사전 생성 이론 대본 기반일 때만 사용)
+            quiz_content = None
             if theory_draft:
-                print(f"[{self.agent_name}] theory_draft 기반 퀴즈 생성 모드 - 퀴즈 타입: {section_data.get('quiz_type', 'unknown')}")
-                content_source = "theory_draft"
+                quiz_content = content_artifact_store.get_quiz(
+                    updated_state["current_chapter"],
+                    updated_state["current_section"],
+                    updated_state["user_type"],
+                    is_retry_session,
+                    theory_draft
+                )
+            
+            if quiz_content is not None:
+                print(f"[{self.agent_name}] 사전 생성된 퀴즈 대본 사용")
+                source_info = "사전 생성 콘텐츠"
             else:
-                print(f"[{self.agent_name}] 폴백 전략: 기존 JSON 파일 사용 - 퀴즈 타입: {section_data.get('quiz_type', 'unknown')}")
-                content_source = "fallback"
-            
-            # 5. 재학습 여부 확인
-            is_retry_session = updated_state["current_session_count"] > 0
-            
-            # 6. 순수 퀴즈 대본 생성 (힌트 포함, 사용자 대면 메시지 없음)
-            quiz_content = quiz_generation_tool(
-                section_data=section_data,
-                user_type=updated_state["user_type"],
-                is_retry_session=is_retry_session,
-                theory_content=theory_draft,
-                content_source=content_source
-            )
-            
-            # 5. 퀴즈 정보 파싱 및 State 업데이트 (v2.0 새로운 메서드 사용)
+                # 5. 순수 퀴즈 대본 생성 (힌트 포함, 사용자 대면 메시지 없음)
+                quiz_content, content_source = self.generate_quiz_content(
+                    updated_state["current_chapter"],
+                    updated_state["current_section"],
+                    updated_state["user_type"],
+                    is_retry_session,
+                    theory_draft
+                )
+                source_info = "theory_draft 기반" if content_source == "theory_draft" else "폴백 JSON 파일"
+            
+            # 6. 퀴즈 정보 파싱 및 State 업데이트 (v2.0 새로운 메서드 사용)
             quiz_info = self._parse_quiz_content(quiz_content)
             if quiz_info:
                 updated_state = state_manager.parse_quiz_from_json(updated_state, quiz_info)
             
-            # 6. State 업데이트 - 순수 대본만 저장
+            # 7. State 업데이트 - 순수 대본만 저장
             updated_state = state_manager.update_agent_draft(
                 updated_state, 
                 self.agent_name, 
                 quiz_content
             )
             
-            # 7. 현재 에이전트 설정
+            # 8. 현재 에이전트 설정
             updated_state = state_manager.update_agent_transition(
                 updated_state,
                 self.agent_name
             )
             
-            # 8. 대화 기록 추가 (데이터 소스 정보 포함)
-            source_info = "theory_draft 기반" if content_source == "theory_draft" else "폴백 JSON 파일"
+            # 9. 대화 기록 추가 (데이터 소스 정보 포함)
             updated_state = state_manager.add_conversation(
                 updated_state,
                 agent_name=self.agent_name,
@@ -116,6 +119,52 @@ class QuizGenerator:
             )
             return error_state
     
+    def generate_quiz_content(self,
+                              chapter_number: int,
+                              section_number: int,
+                              user_type: str,
+                              is_retry_session: bool,
+                              theory_draft: Any = "",
+                              raise_on_error: bool = False) -> Tuple[str, str]:
+        """
+        theory_draft 기반(없으면 폴백 JSON 기반) 퀴즈 대본 생성
+        
+        Args:
+            chapter_number: 챕터 번호
+            section_number: 섹션 번호
+            user_type: 사용자 유형
+            is_retry_session: 재학습 여부
+            theory_draft: 이론 설명 대본 (dict 또는 str, 없으면 빈 문자열)
+            raise_on_error: True면 생성 실패 시 폴백 대본 대신 예외 발생 (사전 생성 배치 작업용)
+            
+        Returns:
+            (퀴즈 JSON 문자열, 콘텐츠 소스 "theory_draft"/"fallback")
+        """
+        # 1. 섹션 데이터 로드 (챕터 제목, 섹션 제목, 퀴즈 타입 포함)
+        section_data = self._load_section_data(chapter_number, section_number)
+        if not section_data:
+            raise ValueError(f"챕터 {chapter_number} 섹션 {section_number} 데이터를 찾을 수 없습니다.")
+        
+        # 2. 데이터 소스 결정
+        if theory_draft:
+            print(f"[{self.agent_name}] theory_draft 기반 퀴즈 생성 모드 - 퀴즈 타입: {section_data.get('quiz_type', 'unknown')}")
+            content_source = "theory_draft"
+        else:
+            print(f"[{self.agent_name}] 폴백 전략: 기존 JSON 파일 사용 - 퀴즈 타입: {section_data.get('quiz_type', 'unknown')}")
+            content_source = "fallback"
+        
+        # 3. 순수 퀴즈 대본 생성 (힌트 포함, 사용자 대면 메시지 없음)
+        quiz_content = quiz_generation_tool(
+            section_data=section_data,
+            user_type=user_type,
+            is_retry_session=is_retry_session,
+            theory_content=theory_draft,
+            content_source=content_source,
+            raise_on_error=raise_on_error
+        )
+        
+        return quiz_content, content_source
+    
     def _load_section_metadata(self, chapter_number: int, section_number: int) -> Dict[str, Any]:
         """
         chapters_metadata.json에서 특정 섹션의 메타데이터만 로드
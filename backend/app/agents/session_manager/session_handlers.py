@@ -1,7 +1,10 @@
 # backend/app/agents/session_manager/session_handlers.py
 
 """
-SessionHandlers v2.4 - 세션 데이터 DB 저장 핸들러
+SessionHandlers v2.5 - 세션 데이터 DB 저장 핸들러
+
+주요 v2.5 변경사항:
+- 퀴즈 통계를 전체 재계산하지 않고 저장된 퀴즈 한 건만큼 증분 반영
 
 주요 v2.4 변경사항:
 - _update_user_statistics() 메서드 수정
@@ -14,11 +17,59 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from app.utils.database.query_builder import insert_record, update_record, count_records
-from app.utils.database.connection import fetch_one, fetch_all, execute_query
-from app.utils.database.transaction import execute_transaction
+from app.utils.database.connection import fetch_one, execute_query
+from app.utils.database.transaction import execute_transaction, execute_batch_insert
+from app.utils.database.statements import register_statement, fetch_all_statement, execute_statement
 from app.config.db_config import DatabaseQueryError, DatabaseIntegrityError
 
 
+# 세션 기록 조회 쿼리 (등록 시 한 번만 파싱)
+SESSION_HISTORY_STATEMENT = register_statement(
+    'session.history',
+    """
+    SELECT 
+        session_id, chapter_number, section_number,
+        session_start_time, session_end_time, study_duration_seconds,
+        retry_decision_result, created_at
+    FROM learning_sessions
+    WHERE user_id = %s
+    ORDER BY session_start_time DESC
+    LIMIT %s
+    """
+)
+
+SESSION_CONVERSATIONS_STATEMENT = register_statement(
+    'session.conversations',
+    """
+    SELECT 
+        message_sequence, agent_name, message_type, message_content,
+        message_timestamp, session_progress_stage, created_at
+    FROM session_conversations
+    WHERE session_id = %s
+    ORDER BY message_sequence
+    """
+)
+
+# 방금 저장한 퀴즈 한 건만큼 퀴즈 통계를 증분 반영 (원자적 UPDATE)
+# 단일 테이블 UPDATE의 SET 절은 왼쪽부터 평가되므로 정답률/평균은 갱신된 누적값으로 계산됨
+APPLY_QUIZ_STATISTICS_DELTA_STATEMENT = register_statement(
+    'statistics.apply_quiz_delta',
+    """
+    UPDATE user_statistics
+    SET total_multiple_choice_count = COALESCE(total_multiple_choice_count, 0) + %(mc_count)s,
+        total_multiple_choice_correct = COALESCE(total_multiple_choice_correct, 0) + %(mc_correct)s,
+        multiple_choice_accuracy = CASE WHEN total_multiple_choice_count > 0
+            THEN ROUND(total_multiple_choice_correct / total_multiple_choice_count * 100, 2) ELSE 0 END,
+        total_subjective_count = COALESCE(total_subjective_count, 0) + %(subjective_count)s,
+        total_subjective_score = COALESCE(total_subjective_score, 0) + %(subjective_score)s,
+        subjective_average_score = CASE WHEN total_subjective_count > 0
+            THEN ROUND(total_subjective_score / total_subjective_count, 2) ELSE 0 END,
+        updated_at = NOW()
+    WHERE user_id = %(user_id)s
+    """
+)
+
+
 class SessionHandlers:
     """
     세션 데이터 DB 저장을 담당하는 핸들러 클래스
@@ -77,19 +128,26 @@ class SessionHandlers:
             self.logger.error(f"세션 정보 저장 중 예상치 못한 오류: {str(e)}")
             return None
     
-    def finalize_session_statistics(self, user_id: int) -> bool:
+    def finalize_session_statistics(self, user_id: int, quiz_data: Optional[Dict[str, Any]] = None) -> bool:
         """
-        모든 세션 데이터 저장 완료 후 퀴즈 통계 재계산 (v2.4 신규)
+        모든 세션 데이터 저장 완료 후 퀴즈 통계 반영 (v2.5: 전체 재계산 → 증분 반영)
+        
+        이번 세션에 저장된 퀴즈 한 건만큼만 user_statistics를 갱신합니다.
+        누적값 드리프트는 scripts/reconcile_user_statistics.py로 일괄 보정합니다.
         
         Args:
             user_id: 사용자 ID
+            quiz_data: 이번 세션에 저장된 퀴즈 정보 (없으면 반영할 통계 없음)
             
         Returns:
-            재계산 성공 여부
+            반영 성공 여부
         """
         try:
-            self._recalculate_average_accuracy(user_id)
-            return True
+            if not quiz_data:
+                self.logger.info(f"반영할 퀴즈 결과 없음, 통계 유지: user_id={user_id}")
+                return True
+            
+            return self._apply_quiz_statistics_delta(user_id, quiz_data)
         except Exception as e:
             self.logger.error(f"세션 통계 마무리 중 오류: {str(e)}")
             return False
@@ -110,11 +168,10 @@ class SessionHandlers:
                 self.logger.info("저장할 대화 기록이 없습니다.")
                 return True
             
-            # 배치 INSERT를 위한 트랜잭션 작업 준비
-            operations = []
+            records = []
             
             for idx, conv in enumerate(conversations, 1):
-                record_data = {
+                records.append({
                     'session_id': session_id,
                     'message_sequence': idx,
                     'agent_name': conv.get('agent_name', 'unknown'),
@@ -122,25 +179,13 @@ class SessionHandlers:
                     'message_content': str(conv.get('message', '')),
                     'message_timestamp': self._format_timestamp(conv.get('timestamp')),
                     'session_progress_stage': conv.get('session_stage', 'session_start')
-                }
-                
-                operation = {
-                    'type': 'insert',
-                    'table': 'session_conversations',
-                    'data': record_data,
-                    'return_id': False
-                }
-                operations.append(operation)
+                })
             
-            # 트랜잭션으로 배치 INSERT
-            result = execute_transaction(operations)
+            # 다중 행 INSERT로 한 번에 저장 (ID는 사용하지 않음)
+            execute_batch_insert('session_conversations', records, return_ids=False)
             
-            if result:
-                self.logger.info(f"대화 기록 저장 완료: {session_id} ({len(conversations)}개)")
-                return True
-            else:
-                self.logger.error("대화 기록 저장 실패")
-                return False
+            self.logger.info(f"대화 기록 저장 완료: {session_id} ({len(conversations)}개)")
+            return True
                 
         except DatabaseIntegrityError as e:
             self.logger.error(f"대화 기록 저장 무결성 오류: {str(e)}")
@@ -159,18 +204,33 @@ class SessionHandlers:
         Args:
             quiz_data: 퀴즈 정보 딕셔너리
             
+        Returns:
+            저장 성공 여부
+        """
+        if not quiz_data:
+            self.logger.info("저장할 퀴즈 정보가 없습니다.")
+            return True
+        
+        return self.save_session_quizzes([quiz_data])
+    
+    def save_session_quizzes(self, quiz_list: List[Dict[str, Any]]) -> bool:
+        """
+        session_quizzes 테이블에 여러 퀴즈 정보를 다중 행 INSERT로 저장
+        
+        Args:
+            quiz_list: 퀴즈 정보 딕셔너리 리스트 (모두 같은 컬럼 구조)
+            
         Returns:
             저장 성공 여부
         """
         try:
-            if not quiz_data:
+            if not quiz_list:
                 self.logger.info("저장할 퀴즈 정보가 없습니다.")
                 return True
             
-            result = insert_record('session_quizzes', quiz_data, return_id=False)
+            execute_batch_insert('session_quizzes', quiz_list, return_ids=False)
             
-            # insert_record는 return_id=False일 때 None을 반환하므로 예외가 없으면 성공
-            self.logger.info(f"퀴즈 정보 저장 완료: {quiz_data['session_id']}")
+            self.logger.info(f"퀴즈 정보 저장 완료: {quiz_list[0]['session_id']} ({len(quiz_list)}개)")
             return True
                 
         except DatabaseIntegrityError as e:
@@ -179,6 +239,9 @@ class SessionHandlers:
         except DatabaseQueryError as e:
             self.logger.error(f"퀴즈 정보 저장 쿼리 오류: {str(e)}")
             return False
+        except ValueError as e:
+            self.logger.error(f"퀴즈 정보 형식 오류: {str(e)}")
+            return False
         except Exception as e:
             self.logger.error(f"퀴즈 정보 저장 중 예상치 못한 오류: {str(e)}")
             return False
@@ -290,97 +353,57 @@ class SessionHandlers:
         """
         user_statistics 테이블 업데이트 (기존 메서드 - 호환성 유지)
         
+        퀴즈 통계는 finalize_session_statistics()에서 증분 반영되므로
+        여기서는 기본 통계만 업데이트합니다.
+        
         Args:
             combined_data: 세션 정보
             
         Returns:
             업데이트 성공 여부
         """
-        # 기본 통계 업데이트 후 퀴즈 통계 재계산
-        success = self._update_user_statistics_without_quiz_recalc(combined_data)
-        if success:
-            self._recalculate_average_accuracy(combined_data['user_id'])
-        return success
+        return self._update_user_statistics_without_quiz_recalc(combined_data)
     
-    def _recalculate_average_accuracy(self, user_id: int) -> bool:
+    def _apply_quiz_statistics_delta(self, user_id: int, quiz_data: Dict[str, Any]) -> bool:
         """
-        사용자의 평균 정확도 재계산 (v2.0: 객관식/주관식 분리 통계)
+        저장된 퀴즈 한 건을 user_statistics에 증분 반영 (v2.5 신규)
         
         Args:
             user_id: 사용자 ID
+            quiz_data: session_quizzes에 저장된 퀴즈 정보
             
         Returns:
-            재계산 성공 여부
+            반영 성공 여부
         """
         try:
-            # v2.0: 객관식/주관식 분리된 퀴즈 점수 조회
-            query = """
-            SELECT sq.quiz_type, sq.multiple_answer_correct, sq.subjective_answer_score
-            FROM session_quizzes sq
-            JOIN learning_sessions ls ON sq.session_id = ls.session_id
-            WHERE ls.user_id = %s
-            """
-            
-            quiz_results = fetch_all(query, [user_id])
-            
-            if not quiz_results:
-                # 퀴즈 결과가 없으면 기본값 유지
-                self.logger.info(f"퀴즈 결과 없음, 통계 기본값 유지: user_id={user_id}")
-                return True
-            
-            # v2.0: 객관식/주관식 분리 통계 계산
-            multiple_choice_count = 0
-            multiple_choice_correct = 0
-            subjective_count = 0
-            subjective_total_score = 0
+            quiz_type = quiz_data.get('quiz_type', 'multiple_choice')
+            
+            if quiz_type == 'multiple_choice':
+                delta = {
+                    'mc_count': 1,
+                    'mc_correct': 1 if quiz_data.get('multiple_answer_correct') else 0,
+                    'subjective_count': 0,
+                    'subjective_score': 0
+                }
+            else:  # subjective
+                delta = {
+                    'mc_count': 0,
+                    'mc_correct': 0,
+                    'subjective_count': 1,
+                    'subjective_score': quiz_data.get('subjective_answer_score') or 0
+                }
             
-            for result in quiz_results:
-                quiz_type = result.get('quiz_type', 'multiple_choice')
-                
-                if quiz_type == 'multiple_choice':
-                    multiple_choice_count += 1
-                    if result.get('multiple_answer_correct', False):
-                        multiple_choice_correct += 1
-                else:  # subjective
-                    subjective_count += 1
-                    subjective_total_score += result.get('subjective_answer_score', 0)
-            
-            # 객관식 정답률 계산
-            multiple_choice_accuracy = (multiple_choice_correct / multiple_choice_count * 100) if multiple_choice_count > 0 else 0
-            
-            # 주관식 평균 점수 계산
-            subjective_average_score = (subjective_total_score / subjective_count) if subjective_count > 0 else 0
-            
-            # v2.0: 분리된 통계 업데이트
-            update_data = {
-                'total_multiple_choice_count': multiple_choice_count,
-                'total_multiple_choice_correct': multiple_choice_correct,
-                'multiple_choice_accuracy': round(multiple_choice_accuracy, 2),
-                'total_subjective_count': subjective_count,
-                'total_subjective_score': subjective_total_score,
-                'subjective_average_score': round(subjective_average_score, 2),
-                'updated_at': datetime.now()
-            }
-            
-            where_clause = "user_id = %s"
-            where_params = [user_id]
-            
-            result = update_record(
-                'user_statistics', 
-                update_data, 
-                where_clause, 
-                where_params
-            )
+            result = execute_statement(APPLY_QUIZ_STATISTICS_DELTA_STATEMENT, {'user_id': user_id, **delta})
             
             if result > 0:
-                self.logger.info(f"분리 통계 재계산 완료: user_id={user_id}, 객관식={multiple_choice_accuracy:.2f}% ({multiple_choice_correct}/{multiple_choice_count}), 주관식={subjective_average_score:.2f}점 ({subjective_count}개)")
+                self.logger.info(f"퀴즈 통계 증분 반영 완료: user_id={user_id}, 유형={quiz_type}, 변화량={delta}")
                 return True
             else:
-                self.logger.error("분리 통계 업데이트 실패")
+                self.logger.error(f"퀴즈 통계 증분 반영 실패 (통계 레코드 없음): user_id={user_id}")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"분리 통계 재계산 중 오류: {str(e)}")
+            self.logger.error(f"퀴즈 통계 증분 반영 중 오류: {str(e)}")
             return False
     
     def _format_timestamp(self, timestamp) -> datetime:
@@ -416,19 +439,7 @@ class SessionHandlers:
         """
         try:
             # v2.1: study_duration_seconds로 컬럼명 변경
-            query = """
-            SELECT 
-                session_id, chapter_number, section_number,
-                session_start_time, session_end_time, study_duration_seconds,
-                retry_decision_result, created_at
-            FROM learning_sessions
-            WHERE user_id = %s
-            ORDER BY session_start_time DESC
-            LIMIT %s
-            """
-            
-            params = [user_id, limit]
-            results = fetch_all(query, params)
+            results = fetch_all_statement(SESSION_HISTORY_STATEMENT, (user_id, limit))
             
             if results:
                 self.logger.info(f"세션 기록 조회 완료: user_id={user_id}, count={len(results)}")
@@ -451,17 +462,7 @@ class SessionHandlers:
             대화 기록 리스트
         """
         try:
-            query = """
-            SELECT 
-                message_sequence, agent_name, message_type, message_content,
-                message_timestamp, session_progress_stage, created_at
-            FROM session_conversations
-            WHERE session_id = %s
-            ORDER BY message_sequence
-            """
-            
-            params = [session_id]
-            results = fetch_all(query, params)
+            results = fetch_all_statement(SESSION_CONVERSATIONS_STATEMENT, (session_id,))
             
             if results:
                 self.logger.info(f"대화 기록 조회 완료: session_id={session_id}, count={len(results)}")
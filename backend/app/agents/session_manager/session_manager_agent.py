@@ -17,6 +17,7 @@ from datetime import datetime
 from typing import Dict, Any
 
 from app.core.langraph.state_manager import TutorState, state_manager
+from app.core.langraph.state import with_appended
 from app.agents.session_manager.session_handlers import SessionHandlers
 
 
@@ -276,13 +277,16 @@ class SessionManager:
             
             # 4. 퀴즈 정보 저장
             quiz_data = self._prepare_quiz_data(state, session_id)
+            saved_quiz_data = None
             if quiz_data:
                 success = self.session_handlers.save_session_quiz(quiz_data)
-                if not success:
+                if success:
+                    saved_quiz_data = quiz_data
+                else:
                     self.logger.warning(f"퀴즈 정보 저장 실패: session_id={session_id}")
 
-            # 5. 모든 저장 완료 후 퀴즈 통계 재계산 (v2.4 추가)
-            self.session_handlers.finalize_session_statistics(session_data["user_id"])
+            # 5. 모든 저장 완료 후 저장된 퀴즈만큼 통계 증분 반영 (v2.5 변경)
+            self.session_handlers.finalize_session_statistics(session_data["user_id"], saved_quiz_data)
             
             self.logger.info(f"세션 데이터 DB 저장 완료: session_id={session_id}")
             return session_id
@@ -398,21 +402,8 @@ class SessionManager:
             # 현재 세션 요약 생성
             session_summary = self._create_session_summary(state, decision_result, session_id)
             
-            # 기존 요약 목록 가져오기
-            recent_summaries = state.get("recent_sessions_summary", [])
-            
-            # 새 요약 추가
-            recent_summaries.append(session_summary)
-            
-            # 최근 5개만 유지
-            if len(recent_summaries) > 5:
-                recent_summaries = recent_summaries[-5:]
-            
-            # State 업데이트
-            updated_state = state.copy()
-            updated_state["recent_sessions_summary"] = recent_summaries
-            
-            return updated_state
+            # 새 요약 추가 (기존 요약 리스트는 수정하지 않음), 최근 5개만 유지
+            return with_appended(state, "recent_sessions_summary", session_summary, max_items=5)
             
         except Exception as e:
             self.logger.error(f"세션 요약 추가 중 오류: {str(e)}")
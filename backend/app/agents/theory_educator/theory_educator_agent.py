@@ -1,10 +1,11 @@
 # backend/app/agents/theory_educator/theory_educator_agent.py
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import json
 import os
 
 from app.core.langraph.state_manager import TutorState, state_manager
+from app.core.artifacts import content_artifact_store
 from app.tools.content.theory_tools_chatgpt import theory_generation_tool
 from app.tools.external.vector_search_tools import search_theory_materials
 
@@ -37,79 +38,50 @@ class TheoryEducator:
         try:
             print(f"[{self.agent_name}] 벡터 DB 기반 이론 설명 생성 시작 - 챕터 {state['current_chapter']} 섹션 {state['current_section']}")
             
-            # 1. 메타데이터에서 챕터/섹션 기본 정보 로드
-            section_metadata = self._load_section_metadata(state["current_chapter"], state["current_section"])
-            if not section_metadata:
-                raise ValueError(f"챕터 {state['current_chapter']} 섹션 {state['current_section']} 메타데이터를 찾을 수 없습니다.")
-            
-            # 2. 벡터 DB에서 관련 자료 검색
-            print(f"[{self.agent_name}] 벡터 DB에서 이론 생성용 자료 검색 중...")
-            vector_materials = search_theory_materials(state["current_chapter"], state["current_section"])
-            
-            # 3. 벡터 검색 결과 확인 및 폴백 전략 적용
-            if vector_materials and len(vector_materials) > 0:
-                print(f"[{self.agent_name}] 벡터 검색 성공 - {len(vector_materials)}개 자료 발견")
-
-                # 벡터 DB 데이터 내용 터미널 출력
-                print(f"[{self.agent_name}] === 벡터 DB 검색 결과 상세 ===")
-                for i, material in enumerate(vector_materials, 1):
-                    chunk_type = material.get('chunk_type', 'unknown')
-                    quality_score = material.get('content_quality_score', 0)
-                    keywords = material.get('primary_keywords', [])
-                    content = material.get('content', '')[:200]  # 처음 200자만
-                    
-                    print(f"[{self.agent_name}] 자료 {i}:")
-                    print(f"  - 타입: {chunk_type}")
-                    print(f"  - 품질점수: {quality_score}")
-                    print(f"  - 키워드: {', '.join(keywords) if keywords else '없음'}")
-                    print(f"  - 내용: {content}...")
-                    print()
-                print(f"[{self.agent_name}] === 벡터 DB 검색 결과 끝 ===")
-
-                content_source = "vector"
-                section_data = section_metadata  # 메타데이터만 사용
-            else:
-                print(f"[{self.agent_name}] 벡터 검색 실패 또는 결과 없음 - 폴백 전략 활성화")
-                section_data = self._load_section_data_fallback(state["current_chapter"], state["current_section"])
-                if not section_data:
-                    raise ValueError(f"폴백 데이터도 찾을 수 없습니다.")
-                content_source = "fallback"
-                vector_materials = []  # 폴백 시에는 빈 리스트
-            
-            # 4. 재학습 여부 확인
+            # 1. 재학습 여부 확인
             is_retry_session = state["current_session_count"] > 0
             
-            # 5. 벡터 기반 또는 폴백 기반으로 이론 설명 대본 생성
-            theory_content = theory_generation_tool(
-                section_metadata=section_metadata,  # 항상 메타데이터 전달
-                section_data=section_data if content_source == "fallback" else None,  # 폴백 시에만 상세 데이터 전달
-                vector_materials=vector_materials,  # 벡터 검색 결과
-                user_type=state["user_type"],
-                is_retry_session=is_retry_session,
-                content_source=content_source  # "vector" or "fallback"
+            # 2. 사전 생성된 이론 대본 우선 조회 (배치 작업으로 미리 생성된 경우 LLM 호출 생략)
+            theory_content = content_artifact_store.get_theory(
+                state["current_chapter"],
+                state["current_section"],
+                state["user_type"],
+                is_retry_session
             )
             
-            # 6. State 업데이트 - 순수 대본만 저장
+            if theory_content is not None:
+                print(f"[{self.agent_name}] 사전 생성된 이론 대본 사용")
+                source_info = "사전 생성 콘텐츠"
+            else:
+                # 3. 벡터 기반 또는 폴백 기반으로 이론 설명 대본 생성
+                theory_content, content_source, material_count = self.generate_theory_content(
+                    state["current_chapter"],
+                    state["current_section"],
+                    state["user_type"],
+                    is_retry_session
+                )
+                source_info = f"벡터 DB ({material_count}개 자료)" if content_source == "vector" else "폴백 JSON 파일"
+            
+            # 4. State 업데이트 - 순수 대본만 저장
             updated_state = state_manager.update_agent_draft(
                 state, 
                 self.agent_name, 
                 theory_content
             )
             
-            # 7. 세션 진행 단계 업데이트
+            # 5. 세션 진행 단계 업데이트
             updated_state = state_manager.update_session_progress(
                 updated_state, 
                 self.agent_name
             )
             
-            # 8. 현재 에이전트 설정
+            # 6. 현재 에이전트 설정
             updated_state = state_manager.update_agent_transition(
                 updated_state,
                 self.agent_name
             )
             
-            # 9. 대화 기록 추가 (벡터 사용 여부 기록)
-            source_info = f"벡터 DB ({len(vector_materials)}개 자료)" if content_source == "vector" else "폴백 JSON 파일"
+            # 7. 대화 기록 추가 (콘텐츠 출처 기록)
             updated_state = state_manager.add_conversation(
                 updated_state,
                 agent_name=self.agent_name,
@@ -135,6 +107,77 @@ class TheoryEducator:
             )
             return error_state
     
+    def generate_theory_content(self,
+                                chapter_number: int,
+                                section_number: int,
+                                user_type: str,
+                                is_retry_session: bool,
+                                raise_on_error: bool = False) -> Tuple[Any, str, int]:
+        """
+        벡터 DB 기반(실패 시 폴백 JSON 기반) 이론 설명 대본 생성
+        
+        Args:
+            chapter_number: 챕터 번호
+            section_number: 섹션 번호
+            user_type: 사용자 유형
+            is_retry_session: 재학습 여부
+            raise_on_error: True면 생성 실패 시 폴백 대본 대신 예외 발생 (사전 생성 배치 작업용)
+            
+        Returns:
+            (이론 대본, 콘텐츠 소스 "vector"/"fallback", 사용한 벡터 자료 수)
+        """
+        # 1. 메타데이터에서 챕터/섹션 기본 정보 로드
+        section_metadata = self._load_section_metadata(chapter_number, section_number)
+        if not section_metadata:
+            raise ValueError(f"챕터 {chapter_number} 섹션 {section_number} 메타데이터를 찾을 수 없습니다.")
+        
+        # 2. 벡터 DB에서 관련 자료 검색
+        print(f"[{self.agent_name}] 벡터 DB에서 이론 생성용 자료 검색 중...")
+        vector_materials = search_theory_materials(chapter_number, section_number)
+        
+        # 3. 벡터 검색 결과 확인 및 폴백 전략 적용
+        if vector_materials and len(vector_materials) > 0:
+            print(f"[{self.agent_name}] 벡터 검색 성공 - {len(vector_materials)}개 자료 발견")
+
+            # 벡터 DB 데이터 내용 터미널 출력
+            print(f"[{self.agent_name}] === 벡터 DB 검색 결과 상세 ===")
+            for i, material in enumerate(vector_materials, 1):
+                chunk_type = material.get('chunk_type', 'unknown')
+                quality_score = material.get('content_quality_score', 0)
+                keywords = material.get('primary_keywords', [])
+                content = material.get('content', '')[:200]  # 처음 200자만
+                
+                print(f"[{self.agent_name}] 자료 {i}:")
+                print(f"  - 타입: {chunk_type}")
+                print(f"  - 품질점수: {quality_score}")
+                print(f"  - 키워드: {', '.join(keywords) if keywords else '없음'}")
+                print(f"  - 내용: {content}...")
+                print()
+            print(f"[{self.agent_name}] === 벡터 DB 검색 결과 끝 ===")
+
+            content_source = "vector"
+            section_data = section_metadata  # 메타데이터만 사용
+        else:
+            print(f"[{self.agent_name}] 벡터 검색 실패 또는 결과 없음 - 폴백 전략 활성화")
+            section_data = self._load_section_data_fallback(chapter_number, section_number)
+            if not section_data:
+                raise ValueError(f"폴백 데이터도 찾을 수 없습니다.")
+            content_source = "fallback"
+            vector_materials = []  # 폴백 시에는 빈 리스트
+        
+        # 4. 벡터 기반 또는 폴백 기반으로 이론 설명 대본 생성
+        theory_content = theory_generation_tool(
+            section_metadata=section_metadata,  # 항상 메타데이터 전달
+            section_data=section_data if content_source == "fallback" else None,  # 폴백 시에만 상세 데이터 전달
+            vector_materials=vector_materials,  # 벡터 검색 결과
+            user_type=user_type,
+            is_retry_session=is_retry_session,
+            content_source=content_source,  # "vector" or "fallback"
+            raise_on_error=raise_on_error
+        )
+        
+        return theory_content, content_source, len(vector_materials)
+    
     def _load_section_metadata(self, chapter_number: int, section_number: int) -> Dict[str, Any]:
         """
         chapters_metadata.json에서 특정 섹션의 메타데이터만 로드
@@ -6,12 +6,13 @@ import pymysql
 import logging
 import time
 import threading
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
+from collections import deque
 from contextlib import contextmanager
 from pymysql.connections import Connection
 from pymysql.cursors import DictCursor
 from queue import Queue, Empty
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 # 로깅 설정
@@ -51,9 +52,13 @@ class ConnectionPoolConfig:
     min_connections: int = 5
     max_connections: int = 20
     max_idle_time: int = 300  # 5분
+    max_lifetime: int = 1800  # 30분 (연결 생성 후 최대 사용 시간)
     health_check_interval: int = 60  # 1분
+    health_check_batch_size: int = 2  # 헬스체크 1회당 확인할 유휴 연결 수
+    validation_idle_threshold: int = 30  # 체크아웃 시 이 시간(초) 이상 유휴였던 연결만 ping
     connection_retry_attempts: int = 3
     connection_retry_delay: float = 1.0
+    checkout_timeout: float = 10.0  # 풀 포화 시 연결 대기 최대 시간(초)
 
 class DatabaseConfig:
     """데이터베이스 설정 클래스 v2.0"""
@@ -104,27 +109,39 @@ class DatabaseConfig:
                 min_connections=int(os.getenv('DB_MIN_CONNECTIONS', 2)),
                 max_connections=int(os.getenv('DB_MAX_CONNECTIONS', 10)),
                 max_idle_time=int(os.getenv('DB_MAX_IDLE_TIME', 600)),  # 10분
+                max_lifetime=int(os.getenv('DB_MAX_LIFETIME', 3600)),
                 health_check_interval=int(os.getenv('DB_HEALTH_CHECK_INTERVAL', 120)),  # 2분
+                health_check_batch_size=int(os.getenv('DB_HEALTH_CHECK_BATCH_SIZE', 2)),
+                validation_idle_threshold=int(os.getenv('DB_VALIDATION_IDLE_THRESHOLD', 30)),
                 connection_retry_attempts=int(os.getenv('DB_RETRY_ATTEMPTS', 3)),
-                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 1.0))
+                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 1.0)),
+                checkout_timeout=float(os.getenv('DB_POOL_TIMEOUT', 5.0))
             )
         elif self.environment == EnvironmentType.TESTING:
             return ConnectionPoolConfig(
                 min_connections=int(os.getenv('DB_MIN_CONNECTIONS', 1)),
                 max_connections=int(os.getenv('DB_MAX_CONNECTIONS', 5)),
                 max_idle_time=int(os.getenv('DB_MAX_IDLE_TIME', 300)),  # 5분
+                max_lifetime=int(os.getenv('DB_MAX_LIFETIME', 1800)),
                 health_check_interval=int(os.getenv('DB_HEALTH_CHECK_INTERVAL', 60)),  # 1분
+                health_check_batch_size=int(os.getenv('DB_HEALTH_CHECK_BATCH_SIZE', 2)),
+                validation_idle_threshold=int(os.getenv('DB_VALIDATION_IDLE_THRESHOLD', 30)),
                 connection_retry_attempts=int(os.getenv('DB_RETRY_ATTEMPTS', 2)),
-                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 0.5))
+                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 0.5)),
+                checkout_timeout=float(os.getenv('DB_POOL_TIMEOUT', 3.0))
             )
         else:  # PRODUCTION
             return ConnectionPoolConfig(
                 min_connections=int(os.getenv('DB_MIN_CONNECTIONS', 5)),
                 max_connections=int(os.getenv('DB_MAX_CONNECTIONS', 20)),
                 max_idle_time=int(os.getenv('DB_MAX_IDLE_TIME', 300)),  # 5분
+                max_lifetime=int(os.getenv('DB_MAX_LIFETIME', 1800)),
                 health_check_interval=int(os.getenv('DB_HEALTH_CHECK_INTERVAL', 30)),  # 30초
+                health_check_batch_size=int(os.getenv('DB_HEALTH_CHECK_BATCH_SIZE', 2)),
+                validation_idle_threshold=int(os.getenv('DB_VALIDATION_IDLE_THRESHOLD', 30)),
                 connection_retry_attempts=int(os.getenv('DB_RETRY_ATTEMPTS', 5)),
-                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 2.0))
+                connection_retry_delay=float(os.getenv('DB_RETRY_DELAY', 2.0)),
+                checkout_timeout=float(os.getenv('DB_POOL_TIMEOUT', 10.0))
             )
     
     def _validate_config(self) -> None:
@@ -176,6 +193,17 @@ class PooledConnection:
     last_used_at: float
     is_healthy: bool = True
 
+@dataclass
+class ConnectionWaiter:
+    """풀 포화 시 연결을 기다리는 요청 (FIFO 대기열 항목)
+    
+    전달 시점에 슬롯이 _pending_creations로 예약되므로, 전달 중인 연결도 최대 연결 수에 포함됩니다.
+    """
+    enqueued_at: float
+    event: threading.Event = field(default_factory=threading.Event)
+    pooled_conn: Optional[PooledConnection] = None  # 반환된 연결을 직접 전달받는 경우
+    slot_granted: bool = False  # 연결이 종료되어 새 연결 생성 권한을 전달받은 경우
+
 class DatabaseConnectionManager:
     """데이터베이스 연결 관리 클래스 v2.0"""
     
@@ -185,9 +213,15 @@ class DatabaseConnectionManager:
         
         # v2.0 연결 풀 (Queue 기반으로 스레드 안전성 보장)
         self._connection_pool: Queue[PooledConnection] = Queue(maxsize=self.pool_config.max_connections)
-        self._active_connections: List[PooledConnection] = []
+        # 사용 중인 연결 (id(connection) → PooledConnection, O(1) 등록/해제)
+        self._active_connections: Dict[int, PooledConnection] = {}
         self._pool_lock = threading.Lock()
         
+        # 풀 포화 시 FIFO 대기열 및 생성 중인 연결 수
+        self._waiters: deque = deque()
+        self._pending_creations = 0
+        self._health_checking = 0  # 헬스체크가 풀에서 잠시 꺼내 확인 중인 연결 수
+        
         # v2.0 헬스체크 스레드
         self._health_check_thread = None
         self._health_check_running = False
@@ -196,6 +230,13 @@ class DatabaseConnectionManager:
         self._total_connections_created = 0
         self._total_connections_closed = 0
         
+        # 대기 통계
+        self._total_waits = 0
+        self._total_wait_timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._peak_waiting = 0
+        
         # 초기 연결 풀 생성
         self._initialize_pool()
         
@@ -244,38 +285,74 @@ class DatabaseConnectionManager:
         
         raise DatabaseConnectionError(f"연결 생성 실패 (최대 시도 횟수 초과): {last_error}")
     
-    def get_connection(self) -> Connection:
-        """데이터베이스 연결 획득 v2.0"""
+    def get_connection(self, timeout: Optional[float] = None) -> Connection:
+        """
+        데이터베이스 연결 획득 v2.0
+        
+        풀이 비어 있고 최대 연결 수에 도달한 경우, 다른 요청이 연결을 반환할 때까지
+        FIFO 순서로 최대 timeout초 동안 대기합니다.
+        
+        Args:
+            timeout: 대기 최대 시간(초). None이면 pool_config.checkout_timeout 사용
+            
+        Raises:
+            DatabaseConnectionError: 연결 생성 실패 또는 대기 시간 초과 시
+        """
+        if timeout is None:
+            timeout = self.pool_config.checkout_timeout
+        
         try:
-            # 풀에서 사용 가능한 연결 확인
-            try:
-                pooled_conn = self._connection_pool.get(block=False)
-                
-                # 연결 상태 확인
-                if self._is_connection_healthy(pooled_conn.connection):
+            pooled_conn = None
+            waiter = None
+            
+            # 이후 모든 경로에서 슬롯 하나를 _pending_creations로 예약한 상태로 진행
+            with self._pool_lock:
+                # 대기 중인 요청이 있으면 순서를 지키기 위해 뒤에 줄을 선다
+                if not self._waiters:
+                    try:
+                        pooled_conn = self._connection_pool.get(block=False)
+                        self._pending_creations += 1
+                    except Empty:
+                        # 헬스체크 중인 연결이 곧 돌아오므로 그동안은 새 연결을 만들지 않고 대기
+                        if (self._health_checking == 0 and
+                                self._total_connections_locked() < self.pool_config.max_connections):
+                            self._pending_creations += 1
+                        else:
+                            waiter = self._enqueue_waiter()
+                else:
+                    waiter = self._enqueue_waiter()
+                    self._grant_free_slots_locked()
+            
+            if waiter is not None:
+                # 반환된 연결 또는 (연결 종료로 비워진) 생성 슬롯을 전달받을 때까지 대기
+                pooled_conn = self._wait_for_connection(waiter, timeout)
+            
+            if pooled_conn is not None:
+                # 수명 확인 + 일정 시간 이상 유휴였던 연결만 상태 확인 (지연 검증)
+                idle_time = time.time() - pooled_conn.last_used_at
+                if not self._is_expired(pooled_conn) and (
+                        idle_time < self.pool_config.validation_idle_threshold or
+                        self._is_connection_healthy(pooled_conn.connection)):
                     pooled_conn.last_used_at = time.time()
                     with self._pool_lock:
-                        self._active_connections.append(pooled_conn)
+                        self._pending_creations -= 1
+                        self._active_connections[id(pooled_conn.connection)] = pooled_conn
                     logger.debug("풀에서 기존 연결 재사용")
                     return pooled_conn.connection
-                else:
-                    # 비정상 연결 제거
-                    self._close_connection(pooled_conn.connection)
-                    logger.debug("비정상 연결 제거됨")
-                    
-            except Empty:
-                # 풀이 비어있음
-                pass
-            
-            # 새 연결 생성 (최대 연결 수 확인)
-            with self._pool_lock:
-                total_connections = len(self._active_connections) + self._connection_pool.qsize()
                 
-                if total_connections >= self.pool_config.max_connections:
-                    raise DatabaseConnectionError(f"최대 연결 수 초과 ({self.pool_config.max_connections})")
+                # 만료/비정상 연결 제거 후 같은 슬롯으로 새 연결 생성
+                self._close_connection(pooled_conn.connection)
+                logger.debug("만료 또는 비정상 연결 제거됨")
             
             # 새 연결 생성
-            connection = self._create_new_connection()
+            try:
+                connection = self._create_new_connection()
+            except Exception:
+                with self._pool_lock:
+                    self._pending_creations -= 1
+                self._notify_slot_freed()
+                raise
+            
             pooled_conn = PooledConnection(
                 connection=connection,
                 created_at=time.time(),
@@ -283,7 +360,8 @@ class DatabaseConnectionManager:
             )
             
             with self._pool_lock:
-                self._active_connections.append(pooled_conn)
+                self._pending_creations -= 1
+                self._active_connections[id(connection)] = pooled_conn
             
             logger.debug("새로운 연결 생성 및 할당")
             return connection
@@ -292,46 +370,133 @@ class DatabaseConnectionManager:
             logger.error(f"연결 획득 실패: {e}")
             raise DatabaseConnectionError(f"데이터베이스 연결 획득 실패: {e}")
     
+    def _total_connections_locked(self) -> int:
+        """현재 열려 있거나 생성 중인 연결 수 (_pool_lock 보유 상태에서 호출)"""
+        return len(self._active_connections) + self._connection_pool.qsize() + self._pending_creations
+    
+    def _is_expired(self, pooled_conn: PooledConnection) -> bool:
+        """연결이 최대 수명(max_lifetime)을 넘겼는지 확인"""
+        return time.time() - pooled_conn.created_at > self.pool_config.max_lifetime
+    
+    def _enqueue_waiter(self) -> ConnectionWaiter:
+        """대기열에 요청 추가 (_pool_lock 보유 상태에서 호출)"""
+        waiter = ConnectionWaiter(enqueued_at=time.time())
+        self._waiters.append(waiter)
+        self._peak_waiting = max(self._peak_waiting, len(self._waiters))
+        return waiter
+    
+    def _wait_for_connection(self, waiter: ConnectionWaiter, timeout: float) -> Optional[PooledConnection]:
+        """
+        대기열에서 연결 전달을 기다림
+        
+        Returns:
+            Optional[PooledConnection]: 전달받은 연결 (생성 슬롯만 전달받은 경우 None)
+            
+        Raises:
+            DatabaseConnectionError: 대기 시간 초과 시
+        """
+        waiter.event.wait(timeout)
+        
+        with self._pool_lock:
+            wait_time = time.time() - waiter.enqueued_at
+            self._total_waits += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+            
+            if not waiter.event.is_set():
+                self._waiters.remove(waiter)
+                self._total_wait_timeouts += 1
+                raise DatabaseConnectionError(
+                    f"연결 대기 시간 초과 ({timeout}초, 최대 연결 수: {self.pool_config.max_connections})"
+                )
+        
+        logger.debug(f"연결 대기 완료 ({wait_time * 1000:.1f}ms)")
+        return waiter.pooled_conn
+    
+    def _handoff_or_pool(self, pooled_conn: PooledConnection) -> bool:
+        """
+        반환된 연결을 가장 오래 기다린 요청에 직접 전달하거나 풀에 넣음
+        
+        Returns:
+            bool: 전달 또는 풀 반환 성공 여부
+        """
+        with self._pool_lock:
+            return self._handoff_or_pool_locked(pooled_conn)
+    
+    def _handoff_or_pool_locked(self, pooled_conn: PooledConnection) -> bool:
+        """_handoff_or_pool의 본체 (_pool_lock 보유 상태에서 호출)"""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.pooled_conn = pooled_conn
+            self._pending_creations += 1
+            waiter.event.set()
+            return True
+        
+        if self._connection_pool.qsize() < self.pool_config.max_connections:
+            self._connection_pool.put(pooled_conn, block=False)
+            return True
+        
+        return False
+    
     def return_connection(self, connection: Connection) -> None:
         """연결을 풀로 반환 v2.0"""
+        with self._pool_lock:
+            # 활성 연결 맵에서 제거 (검증하는 동안에는 슬롯을 예약해 둠)
+            pooled_conn = self._active_connections.pop(id(connection), None)
+            if pooled_conn:
+                self._pending_creations += 1
+        
+        if not pooled_conn:
+            logger.warning("반환하려는 연결이 활성 목록에 없습니다.")
+            self._close_connection(connection)
+            return
+        
         try:
-            with self._pool_lock:
-                # 활성 연결 목록에서 찾기
-                pooled_conn = None
-                for conn in self._active_connections:
-                    if conn.connection == connection:
-                        pooled_conn = conn
-                        self._active_connections.remove(conn)
-                        break
-                
-                if not pooled_conn:
-                    logger.warning("반환하려는 연결이 활성 목록에 없습니다.")
-                    self._close_connection(connection)
-                    return
+            # 최대 수명을 넘긴 연결은 풀에 넣지 않고 교체
+            if self._is_expired(pooled_conn):
+                logger.debug("최대 수명 초과 연결 교체")
             
             # 연결 상태 확인 및 초기화
-            try:
-                if connection.open:
-                    connection.rollback()  # 트랜잭션 롤백
-                    
-                    # 연결이 건강하고 풀에 공간이 있으면 반환
-                    if (self._is_connection_healthy(connection) and 
-                        self._connection_pool.qsize() < self.pool_config.max_connections):
-                        
-                        pooled_conn.last_used_at = time.time()
-                        self._connection_pool.put(pooled_conn, block=False)
+            elif connection.open:
+                connection.rollback()  # 트랜잭션 롤백
+                
+                # 연결이 건강하면 대기 요청에 전달하거나 풀로 반환
+                if self._is_connection_healthy(connection):
+                    pooled_conn.last_used_at = time.time()
+                    with self._pool_lock:
+                        self._pending_creations -= 1
+                        returned = self._handoff_or_pool_locked(pooled_conn)
+                        if not returned:
+                            self._pending_creations += 1
+                    if returned:
                         logger.debug("연결이 풀로 반환되었습니다.")
                         return
-                
-            except Exception as e:
-                logger.warning(f"연결 반환 중 오류: {e}")
-            
-            # 연결 종료
-            self._close_connection(connection)
             
         except Exception as e:
-            logger.error(f"연결 반환 처리 중 오류: {e}")
-            self._close_connection(connection)
+            logger.warning(f"연결 반환 중 오류: {e}")
+        
+        # 연결 종료 후 예약 슬롯 해제
+        self._close_connection(connection)
+        with self._pool_lock:
+            self._pending_creations -= 1
+            self._grant_free_slots_locked()
+    
+    def _notify_slot_freed(self) -> None:
+        """
+        연결이 종료되어 슬롯이 비었음을 알림
+        대기 중인 요청이 있으면 슬롯을 예약(_pending_creations)한 채로 생성 권한을 전달합니다.
+        """
+        with self._pool_lock:
+            self._grant_free_slots_locked()
+    
+    def _grant_free_slots_locked(self) -> None:
+        """남는 슬롯을 대기 순서대로 전달 (_pool_lock 보유 상태에서 호출)"""
+        while (self._waiters and self._health_checking == 0 and
+               self._total_connections_locked() < self.pool_config.max_connections):
+            waiter = self._waiters.popleft()
+            waiter.slot_granted = True
+            self._pending_creations += 1
+            waiter.event.set()
     
     def _is_connection_healthy(self, connection: Connection) -> bool:
         """연결 상태 확인 v2.0"""
@@ -384,64 +549,99 @@ class DatabaseConnectionManager:
                 logger.error(f"헬스체크 중 오류: {e}")
     
     def _perform_health_check(self) -> None:
-        """헬스체크 수행"""
-        current_time = time.time()
-        unhealthy_connections = []
+        """
+        점진적 헬스체크 수행
         
-        # 풀의 연결들 확인
-        temp_connections = []
+        풀을 비우지 않고 유휴 연결을 한 번에 하나씩 꺼내 확인한 뒤 즉시 되돌립니다.
+        확인 중인 연결은 슬롯이 예약된 상태로 유지되고, 그동안 연결이 필요한 요청은
+        새 연결을 만들지 않고 해당 연결을 전달받습니다.
+        """
+        removed = 0
+        batch_size = min(self.pool_config.health_check_batch_size, self._connection_pool.qsize())
         
-        while not self._connection_pool.empty():
+        for _ in range(batch_size):
+            with self._pool_lock:
+                # 연결을 기다리는 요청이 있으면 실제 트래픽에 양보
+                if self._waiters:
+                    break
+                try:
+                    pooled_conn = self._connection_pool.get(block=False)
+                except Empty:
+                    break
+                self._pending_creations += 1
+                self._health_checking += 1
+            
+            keep = False
             try:
-                pooled_conn = self._connection_pool.get(block=False)
-                
-                # 유휴 시간 확인
-                idle_time = current_time - pooled_conn.last_used_at
-                if idle_time > self.pool_config.max_idle_time:
-                    unhealthy_connections.append(pooled_conn)
-                    continue
+                keep = self._should_keep_idle_connection(pooled_conn)
+            finally:
+                with self._pool_lock:
+                    self._pending_creations -= 1
+                    self._health_checking -= 1
+                    if keep:
+                        keep = self._handoff_or_pool_locked(pooled_conn)
+                    if keep:
+                        self._grant_free_slots_locked()
                 
-                # 연결 상태 확인
-                if self._is_connection_healthy(pooled_conn.connection):
-                    temp_connections.append(pooled_conn)
-                else:
-                    unhealthy_connections.append(pooled_conn)
-                    
-            except Empty:
-                break
+                if not keep:
+                    self._close_connection(pooled_conn.connection)
+                    self._notify_slot_freed()
+                    removed += 1
+        
+        if removed:
+            logger.info(f"헬스체크: {removed}개 비정상 연결 제거")
+        
+        self._ensure_min_connections()
+    
+    def _should_keep_idle_connection(self, pooled_conn: PooledConnection) -> bool:
+        """헬스체크 대상 유휴 연결을 풀에 유지할지 판단"""
+        if self._is_expired(pooled_conn):
+            return False
+        
+        # 오래 유휴 상태였던 연결은 최소 연결 수를 넘는 경우에만 정리
+        idle_time = time.time() - pooled_conn.last_used_at
+        if (idle_time > self.pool_config.max_idle_time and
+                self._connection_pool.qsize() >= self.pool_config.min_connections):
+            return False
         
-        # 건강한 연결들 다시 풀에 추가
-        for conn in temp_connections:
+        return self._is_connection_healthy(pooled_conn.connection)
+    
+    def _ensure_min_connections(self) -> None:
+        """최소 연결 수 유지 (생성 중인 연결도 슬롯을 예약해 최대 연결 수를 넘지 않음)"""
+        created = 0
+        
+        while True:
+            with self._pool_lock:
+                if (self._connection_pool.qsize() + self._pending_creations >= self.pool_config.min_connections or
+                        self._total_connections_locked() >= self.pool_config.max_connections):
+                    break
+                self._pending_creations += 1
+            
             try:
-                self._connection_pool.put(conn, block=False)
-            except:
-                unhealthy_connections.append(conn)
-        
-        # 비정상 연결들 종료
-        for conn in unhealthy_connections:
-            self._close_connection(conn.connection)
-        
-        if unhealthy_connections:
-            logger.info(f"헬스체크: {len(unhealthy_connections)}개 비정상 연결 제거")
-        
-        # 최소 연결 수 유지
-        current_pool_size = self._connection_pool.qsize()
-        if current_pool_size < self.pool_config.min_connections:
-            needed = self.pool_config.min_connections - current_pool_size
-            logger.info(f"최소 연결 수 유지: {needed}개 연결 추가")
+                connection = self._create_new_connection()
+            except Exception as e:
+                with self._pool_lock:
+                    self._pending_creations -= 1
+                    self._grant_free_slots_locked()
+                logger.warning(f"최소 연결 수 유지 중 연결 생성 실패: {e}")
+                break
             
-            for _ in range(needed):
-                try:
-                    connection = self._create_new_connection()
-                    pooled_conn = PooledConnection(
-                        connection=connection,
-                        created_at=time.time(),
-                        last_used_at=time.time()
-                    )
-                    self._connection_pool.put(pooled_conn, block=False)
-                except Exception as e:
-                    logger.warning(f"최소 연결 수 유지 중 연결 생성 실패: {e}")
-                    break
+            pooled_conn = PooledConnection(
+                connection=connection,
+                created_at=time.time(),
+                last_used_at=time.time()
+            )
+            with self._pool_lock:
+                self._pending_creations -= 1
+                added = self._handoff_or_pool_locked(pooled_conn)
+            
+            if not added:
+                self._close_connection(connection)
+                break
+            created += 1
+        
+        if created:
+            logger.info(f"최소 연결 수 유지: {created}개 연결 추가")
     
     def get_pool_stats(self) -> Dict[str, Any]:
         """연결 풀 통계 반환"""
@@ -452,7 +652,17 @@ class DatabaseConnectionManager:
                 'total_created': self._total_connections_created,
                 'total_closed': self._total_connections_closed,
                 'max_connections': self.pool_config.max_connections,
-                'min_connections': self.pool_config.min_connections
+                'min_connections': self.pool_config.min_connections,
+                'max_lifetime': self.pool_config.max_lifetime,
+                'health_checking': self._health_checking,
+                # 대기열 통계 (풀 크기 산정용)
+                'waiting_requests': len(self._waiters),
+                'peak_waiting_requests': self._peak_waiting,
+                'total_waits': self._total_waits,
+                'total_wait_timeouts': self._total_wait_timeouts,
+                'avg_wait_time_ms': round(self._total_wait_time / self._total_waits * 1000, 2) if self._total_waits else 0.0,
+                'max_wait_time_ms': round(self._max_wait_time * 1000, 2),
+                'checkout_timeout': self.pool_config.checkout_timeout
             }
     
     def close_all_connections(self) -> None:
@@ -464,7 +674,7 @@ class DatabaseConnectionManager:
         
         # 활성 연결들 종료
         with self._pool_lock:
-            for pooled_conn in self._active_connections:
+            for pooled_conn in self._active_connections.values():
                 self._close_connection(pooled_conn.connection)
             self._active_connections.clear()
         
@@ -615,6 +825,7 @@ def cleanup_database():
 __all__ = [
     'EnvironmentType',
     'ConnectionPoolConfig',
+    'ConnectionWaiter',
     'DatabaseConfig',
     'DatabaseConnectionManager', 
     'DatabaseConnectionError',
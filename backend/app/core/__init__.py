@@ -11,6 +11,10 @@ from .langraph import StateManager, WorkflowExecutor, TutorGraphBuilder
 # ⚠️ DEPRECATED - 데이터베이스 모듈은 더 이상 export하지 않음
 # from .database import MySQLClient, MigrationRunner
 from .external import ChromaDBClient, get_chroma_client, VectorDBSetup
+from .state_store import StateStore, create_state_store
+from .runtime import BackgroundEventLoop, background_loop, run_async
+from .llm import llm_registry, get_chat_model
+from .artifacts import content_artifact_store
 
 __all__ = [
     'StateManager', 
@@ -19,5 +23,13 @@ __all__ = [
     # 'MySQLClient', 'MigrationRunner',  # ⚠️ DEPRECATED
     'ChromaDBClient',
     'get_chroma_client',
-    'VectorDBSetup'
+    'VectorDBSetup',
+    'StateStore',
+    'create_state_store',
+    'BackgroundEventLoop',
+    'background_loop',
+    'run_async',
+    'llm_registry',
+    'get_chat_model',
+    'content_artifact_store'
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+# backend/app/core/artifacts/__init__.py
+"""
+사전 생성 콘텐츠 아티팩트 모듈
+배치 작업으로 미리 생성한 이론/퀴즈 대본을 버전별로 저장하고 에이전트가 먼저 조회합니다.
+"""
+
+from .content_artifact_store import (
+    ContentArtifactStore,
+    content_artifact_store,
+    create_content_artifact_store,
+    theory_fingerprint
+)
+
+__all__ = [
+    'ContentArtifactStore',
+    'content_artifact_store',
+    'create_content_artifact_store',
+    'theory_fingerprint'
+]
@@ -0,0 +1,251 @@
+# backend/app/core/artifacts/content_artifact_store.py
+# 사전 생성된 이론/퀴즈 콘텐츠의 버전별 아티팩트 저장소
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
+
+# 아티팩트 종류
+ARTIFACT_KINDS = ('theory', 'quiz')
+
+# 현재 사용 중인 버전을 가리키는 파일 이름
+CURRENT_POINTER_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+
+
+def _default_artifact_dir() -> str:
+    """기본 아티팩트 경로 (backend/data/pregenerated)"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    return os.path.join(backend_dir, 'data', 'pregenerated')
+
+
+def theory_fingerprint(theory_content: Any) -> str:
+    """퀴즈가 어떤 이론 대본을 바탕으로 생성되었는지 확인하기 위한 지문"""
+    if isinstance(theory_content, (dict, list)):
+        text = json.dumps(theory_content, ensure_ascii=False, sort_keys=True)
+    else:
+        text = str(theory_content or '').strip()
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ContentArtifactStore:
+    """
+    사전 생성 콘텐츠 아티팩트 저장소
+
+    디렉토리 구조:
+        {base_dir}/CURRENT                       현재 버전 이름
+        {base_dir}/{version}/manifest.json       생성 정보 (모델 설정, 개수, 시각)
+        {base_dir}/{version}/theory/ch01_s01_beginner_first.json
+        {base_dir}/{version}/quiz/ch01_s01_beginner_first.json
+
+    - 배치 작업이 새 버전 디렉토리에 모두 기록한 뒤 CURRENT를 원자적으로 교체(publish)하므로
+      서비스 중인 워커는 항상 완성된 한 버전만 읽음
+    - 퀴즈 아티팩트는 바탕이 된 이론 대본의 지문을 함께 저장하고,
+      현재 세션의 이론 대본과 지문이 같을 때만 사용
+    - 읽은 아티팩트는 버전별로 메모리에 보관 (CURRENT가 바뀌면 자동으로 새 버전을 읽음)
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            base_dir: 아티팩트 루트 경로 (None이면 backend/data/pregenerated)
+            enabled: False면 조회 시 항상 None 반환
+        """
+        self.logger = logging.getLogger(__name__)
+        self.base_dir = base_dir or _default_artifact_dir()
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._pointer_mtime: Optional[float] = None
+        self._current_version: Optional[str] = None
+        # {(kind, file_name): artifact 또는 None}
+        self._loaded: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+
+    # ----- 키 -----
+
+    @staticmethod
+    def make_file_name(chapter: int, section: int, user_type: str, is_retry_session: bool) -> str:
+        """아티팩트 파일 이름"""
+        attempt = 'retry' if is_retry_session else 'first'
+        return f"ch{chapter:02d}_s{section:02d}_{user_type}_{attempt}.json"
+
+    # ----- 조회 -----
+
+    def get_current_version(self) -> Optional[str]:
+        """현재 버전 이름 (CURRENT 파일이 없으면 None)"""
+        pointer_path = os.path.join(self.base_dir, CURRENT_POINTER_FILE)
+        try:
+            mtime = os.stat(pointer_path).st_mtime
+        except OSError:
+            with self._lock:
+                self._pointer_mtime = None
+                self._current_version = None
+                self._loaded = {}
+            return None
+
+        with self._lock:
+            if mtime == self._pointer_mtime:
+                return self._current_version
+
+        with open(pointer_path, 'r', encoding='utf-8') as f:
+            version = f.read().strip() or None
+
+        with self._lock:
+            if version != self._current_version:
+                self._loaded = {}
+                if version:
+                    self.logger.info(f"사전 생성 콘텐츠 버전 적용: {version}")
+            self._pointer_mtime = mtime
+            self._current_version = version
+        return version
+
+    def get_theory(self, chapter: int, section: int, user_type: str, is_retry_session: bool) -> Optional[Any]:
+        """
+        현재 버전의 이론 대본 조회
+
+        Returns:
+            이론 대본 (없으면 None)
+        """
+        artifact = self._load('theory', self.make_file_name(chapter, section, user_type, is_retry_session))
+        if self.enabled:
+            workflow_tracer.record_cache('content_artifacts', hit=artifact is not None)
+        return artifact['content'] if artifact else None
+
+    def get_quiz(self, chapter: int, section: int, user_type: str, is_retry_session: bool, theory_content: Any) -> Optional[str]:
+        """
+        현재 버전의 퀴즈 대본 조회 (이론 대본 지문이 일치할 때만)
+
+        Returns:
+            퀴즈 JSON 문자열 (없거나 다른 이론 대본 기반이면 None)
+        """
+        artifact = self._load('quiz', self.make_file_name(chapter, section, user_type, is_retry_session))
+        if artifact and artifact.get('theory_fingerprint') != theory_fingerprint(theory_content):
+            artifact = None
+        if self.enabled:
+            workflow_tracer.record_cache('content_artifacts', hit=artifact is not None)
+        return artifact['content'] if artifact else None
+
+    def _load(self, kind: str, file_name: str) -> Optional[Dict[str, Any]]:
+        """현재 버전에서 아티팩트 로드 (메모리에 보관)"""
+        if not self.enabled:
+            return None
+
+        try:
+            version = self.get_current_version()
+            if not version:
+                return None
+
+            key = (kind, file_name)
+            with self._lock:
+                if key in self._loaded:
+                    return self._loaded[key]
+
+            path = os.path.join(self.base_dir, version, kind, file_name)
+            artifact = None
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    artifact = json.load(f)
+
+            with self._lock:
+                self._loaded[key] = artifact
+            return artifact
+
+        except Exception as e:
+            self.logger.warning(f"사전 생성 콘텐츠 로드 실패 ({kind}/{file_name}): {e}")
+            return None
+
+    # ----- 기록 (배치 작업용) -----
+
+    def write_artifact(self,
+                       version: str,
+                       kind: str,
+                       chapter: int,
+                       section: int,
+                       user_type: str,
+                       is_retry_session: bool,
+                       content: Any,
+                       extra: Optional[Dict[str, Any]] = None) -> str:
+        """
+        지정한 버전에 아티팩트 기록 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            기록된 파일 경로
+        """
+        if kind not in ARTIFACT_KINDS:
+            raise ValueError(f"지원하지 않는 아티팩트 종류입니다: {kind}")
+
+        directory = os.path.join(self.base_dir, version, kind)
+        os.makedirs(directory, exist_ok=True)
+
+        artifact = {
+            'chapter': chapter,
+            'section': section,
+            'user_type': user_type,
+            'is_retry_session': is_retry_session,
+            'generated_at': datetime.now().isoformat(),
+            'content': content
+        }
+        if extra:
+            artifact.update(extra)
+
+        path = os.path.join(directory, self.make_file_name(chapter, section, user_type, is_retry_session))
+        self._write_json(path, artifact)
+        return path
+
+    def write_manifest(self, version: str, manifest: Dict[str, Any]) -> None:
+        """버전 생성 정보 기록"""
+        os.makedirs(os.path.join(self.base_dir, version), exist_ok=True)
+        self._write_json(os.path.join(self.base_dir, version, MANIFEST_FILE), manifest)
+
+    def publish(self, version: str) -> None:
+        """CURRENT를 지정한 버전으로 교체"""
+        if not os.path.isdir(os.path.join(self.base_dir, version)):
+            raise ValueError(f"존재하지 않는 버전입니다: {version}")
+
+        pointer_path = os.path.join(self.base_dir, CURRENT_POINTER_FILE)
+        temp_path = pointer_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(temp_path, pointer_path)
+
+        self.logger.info(f"사전 생성 콘텐츠 버전 게시: {version}")
+
+    def list_versions(self) -> List[str]:
+        """저장된 버전 목록 (이름순)"""
+        if not os.path.isdir(self.base_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.base_dir)
+            if os.path.isfile(os.path.join(self.base_dir, name, MANIFEST_FILE))
+        )
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]) -> None:
+        """임시 파일에 쓴 뒤 원자적으로 교체"""
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+
+def create_content_artifact_store() -> ContentArtifactStore:
+    """
+    환경변수 설정으로 아티팩트 저장소 생성
+
+    환경변수:
+        CONTENT_ARTIFACTS_ENABLED: 사전 생성 콘텐츠 사용 여부 (기본: true, CURRENT가 없으면 자동으로 미사용)
+        CONTENT_ARTIFACTS_DIR: 아티팩트 루트 경로 (기본: backend/data/pregenerated)
+    """
+    enabled = env_bool('CONTENT_ARTIFACTS_ENABLED', True)
+    return ContentArtifactStore(base_dir=os.getenv('CONTENT_ARTIFACTS_DIR') or None, enabled=enabled)
+
+
+# 전역 아티팩트 저장소 인스턴스
+content_artifact_store = create_content_artifact_store()
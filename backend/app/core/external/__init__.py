@@ -6,9 +6,20 @@ ChromaDB, AI 클라이언트 등 외부 서비스와의 연동을 관리합니
 
 from .chroma_client import ChromaDBClient, get_chroma_client
 from .vector_db_setup import VectorDBSetup
+from .collection_index import CollectionIndexManager
+from .section_chunk_index import SectionChunkIndex, section_chunk_index
+from .numpy_vector_index import NumpyVectorIndex, numpy_vector_index
+from .keyword_index import KeywordIndex, keyword_index
 
 __all__ = [
     'ChromaDBClient',
     'get_chroma_client', 
-    'VectorDBSetup'
+    'VectorDBSetup',
+    'SectionChunkIndex',
+    'CollectionIndexManager',
+    'section_chunk_index',
+    'NumpyVectorIndex',
+    'numpy_vector_index',
+    'KeywordIndex',
+    'keyword_index'
 ]
\ No newline at end of file
@@ -0,0 +1,103 @@
+# backend/app/core/external/collection_index.py
+# 벡터 DB 컬렉션에서 만든 메모리 인덱스의 생성/교체 관리
+
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def _default_insertion_log_path() -> str:
+    """기본 벡터 삽입 기록 경로 (backend/data/vector_insertion_log.json)"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    return os.path.join(backend_dir, 'data', 'vector_insertion_log.json')
+
+
+class CollectionIndexManager:
+    """
+    벡터 DB 컬렉션에서 만든 메모리 인덱스 관리자
+
+    - 처음 조회할 때(또는 앱 시작 시 preload) 컬렉션에서 인덱스를 만들고 이후에는 재사용
+    - 인덱스는 생성 후 변경하지 않고, 교체는 참조 한 번의 대입으로만 하므로 조회 중 잠금이 필요 없음
+    - VectorDBSetup.setup_database가 같은 프로세스에서 실행되면 rebuild()로 새 인덱스를 만든 뒤 참조를 교체
+    - 다른 프로세스(scripts 등)에서 벡터 DB를 다시 구축한 경우는 삽입 기록 파일의 수정 시각이
+      바뀐 것을 보고 다음 조회 때 다시 만듦
+    """
+
+    def __init__(self,
+                 index_factory: Callable[[Any], Any],
+                 label: str = '컬렉션 인덱스',
+                 insertion_log_path: Optional[str] = None):
+        """
+        Args:
+            index_factory: 컬렉션을 받아 인덱스를 만드는 함수 (인덱스는 chunk_count/build_ms/get_stats() 제공)
+            label: 로그에 표시할 인덱스 이름
+            insertion_log_path: 벡터 삽입 기록 경로 (None이면 backend/data/vector_insertion_log.json)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.index_factory = index_factory
+        self.label = label
+        self.insertion_log_path = insertion_log_path or _default_insertion_log_path()
+
+        # (인덱스, 생성 당시 삽입 기록 수정 시각) - 한 번의 대입으로 함께 교체
+        self._current: Optional[Tuple[Any, Optional[float]]] = None
+        self._build_lock = threading.Lock()
+        self._builds = 0
+
+    def get(self, collection_loader: Callable[[], Any]) -> Optional[Any]:
+        """
+        현재 인덱스 반환 (없거나 벡터 DB가 다시 구축되었으면 새로 생성)
+
+        Args:
+            collection_loader: 컬렉션을 반환하는 함수 (실패 시 None)
+
+        Returns:
+            인덱스 또는 None (컬렉션을 읽을 수 없음)
+        """
+        current = self._current
+        if current is not None and current[1] == self._insertion_log_mtime():
+            return current[0]
+
+        with self._build_lock:
+            # 다른 스레드가 먼저 만들었으면 그대로 사용
+            log_mtime = self._insertion_log_mtime()
+            current = self._current
+            if current is not None and current[1] == log_mtime:
+                return current[0]
+
+            collection = collection_loader()
+            if collection is None:
+                return None
+            return self._swap(self.index_factory(collection), log_mtime)
+
+    def rebuild(self, collection) -> Any:
+        """컬렉션에서 새 인덱스를 만든 뒤 교체 (만드는 동안 조회는 이전 인덱스 사용)"""
+        with self._build_lock:
+            return self._swap(self.index_factory(collection), self._insertion_log_mtime())
+
+    def invalidate(self) -> None:
+        """인덱스 폐기 (다음 조회 때 다시 생성)"""
+        with self._build_lock:
+            self._current = None
+
+    def _swap(self, index: Any, log_mtime: Optional[float]) -> Any:
+        """새 인덱스로 참조 교체 (잠금 보유 상태에서 호출)"""
+        self._current = (index, log_mtime)
+        self._builds += 1
+        self.logger.info(
+            f"{self.label} 생성 완료 - 청크 {index.chunk_count}개, {index.build_ms:.1f}ms"
+        )
+        return index
+
+    def _insertion_log_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.insertion_log_path)
+        except OSError:
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """관리자/현재 인덱스 통계"""
+        current = self._current
+        stats = current[0].get_stats() if current is not None else {'loaded': False}
+        stats['builds'] = self._builds
+        return stats
@@ -0,0 +1,272 @@
+# backend/app/core/external/keyword_index.py
+# 청크 본문 + primary_keywords 역색인 (BM25 어휘 검색)
+
+import re
+import time
+import unicodedata
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .collection_index import CollectionIndexManager
+
+# 영문/숫자 단어와 한글 어절 (그 외 문자는 구분자)
+_WORD_PATTERN = re.compile(r'[0-9a-z]+|[가-힣]+')
+_HANGUL_PATTERN = re.compile(r'[가-힣]+')
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# primary_keywords 필드 점수 가중치 (본문보다 주제를 직접 나타내므로 높게)
+KEYWORD_FIELD_WEIGHT = 2.0
+
+# 본문에서 이 비율보다 많은 청크에 나오는 토큰은 색인하지 않음 ('니다', '하는' 같은 어미 바이그램)
+MAX_CONTENT_DF_RATIO = 0.5
+
+# 어휘 검색 결과로 인정할 최소 질문 단어 포함 비율 (바이그램 일부만 겹친 청크 제외)
+MIN_TERM_COVERAGE = 0.5
+
+# BM25 점수 → 0~1 유사도 변환 기준 (이 점수에서 0.5, 질문 단어 포함 비율을 곱함)
+LEXICAL_SIMILARITY_PIVOT = 10.0
+
+# 질문에 자주 붙지만 주제를 나타내지 않는 단어 (완전 일치 판단에서 제외)
+GENERIC_QUERY_WORDS = frozenset({
+    '기법', '방법', '개념', '뜻', '의미', '정의', '설명', '예시', '예제', '원리', '차이', '차이점',
+    '무엇', '뭐야', '뭔가요', '뭔데', '무엇인가요', '알려줘', '알려주세요', '설명해줘', '설명해주세요',
+    '이란', '란', '이', '가', '은', '는', '을', '를', '에', '대해', '대해서', '관련', '좀',
+    'what', 'is', 'the', 'a', 'an', 'of', 'how', 'does', 'do'
+})
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize('NFC', text or '').lower()
+
+
+def query_words(text: str) -> List[str]:
+    """단어 단위 분리 (영문 소문자화, 한글은 어절 그대로)"""
+    return _WORD_PATTERN.findall(_normalize(text))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    색인/검색용 토큰 분리
+
+    - 영문/숫자: 소문자 단어
+    - 한글: 음절 바이그램 (조사가 붙은 어절도 같은 토큰을 공유하도록, 한 글자 어절은 그대로)
+    """
+    tokens: List[str] = []
+    for word in query_words(text):
+        if len(word) > 1 and _HANGUL_PATTERN.fullmatch(word):
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def lexical_similarity(score: float, coverage: float) -> float:
+    """어휘 검색 점수를 0~1 유사도로 변환 (질문마다 최고점을 1로 맞추지 않는 절대 기준)"""
+    return coverage * score / (score + LEXICAL_SIMILARITY_PIVOT) if score > 0 else 0.0
+
+
+def _bm25_postings(field_tokens: Sequence[List[str]],
+                   max_df_ratio: Optional[float] = None,
+                   skipped: Optional[set] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    필드별 토큰 목록 → 토큰별 (문서 행 번호, BM25 가중치) 배열 (질의 시 더하기만 하도록 미리 계산)
+
+    max_df_ratio를 넘는 비율의 문서에 나오는 토큰은 제외하고 skipped에 추가합니다.
+    """
+    lengths = np.array([len(tokens) for tokens in field_tokens], dtype=np.float32)
+    average_length = float(lengths.mean()) if len(lengths) and lengths.mean() > 0 else 1.0
+
+    frequencies: Dict[str, Dict[int, int]] = {}
+    for row, tokens in enumerate(field_tokens):
+        for token in tokens:
+            rows = frequencies.setdefault(token, {})
+            rows[row] = rows.get(row, 0) + 1
+
+    document_count = len(field_tokens)
+    postings = {}
+    for token, rows in frequencies.items():
+        if max_df_ratio is not None and len(rows) > max_df_ratio * document_count:
+            if skipped is not None:
+                skipped.add(token)
+            continue
+        idf = np.log(1.0 + (document_count - len(rows) + 0.5) / (len(rows) + 0.5))
+        row_array = np.fromiter(rows.keys(), dtype=np.int32, count=len(rows))
+        tf = np.fromiter(rows.values(), dtype=np.float32, count=len(rows))
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[row_array] / average_length)
+        postings[token] = (row_array, (idf * tf * (BM25_K1 + 1.0) / (tf + norm)).astype(np.float32))
+    return postings
+
+
+class KeywordIndex:
+    """
+    청크 어휘 검색 역색인 (생성 후 변경되지 않음)
+
+    - 본문과 primary_keywords를 각각 BM25로 색인하고 점수는 가중합
+      (토큰별 문서 가중치를 미리 계산하여 검색은 배열 더하기만 수행)
+    - is_exact_term_query(): 질문의 주제 단어가 모두 primary_keywords에 있으면 True
+      → 임베딩 없이 어휘 검색 결과만으로 응답 가능
+    """
+
+    def __init__(self, documents: Sequence[str], metadatas: Sequence[Dict[str, Any]], build_ms: float = 0.0):
+        rows = [(doc, metadata) for doc, metadata in zip(documents, metadatas) if doc and metadata]
+        self._chunks: Tuple[Dict[str, Any], ...] = tuple(
+            MappingProxyType({
+                "content": doc,
+                "chunk_type": metadata.get("chunk_type"),
+                "content_quality_score": metadata.get("content_quality_score", 0),
+                "primary_keywords": metadata.get("primary_keywords"),
+                "source_url": metadata.get("source_url"),
+                "chapter": metadata.get("chapter"),
+                "section": metadata.get("section"),
+                "id": metadata.get("id")
+            })
+            for doc, metadata in rows
+        )
+
+        keyword_texts = [self._keywords(metadata.get("primary_keywords")) for _, metadata in rows]
+        common_tokens: set = set()
+        self._content_postings = MappingProxyType(_bm25_postings([tokenize(doc) for doc, _ in rows], MAX_CONTENT_DF_RATIO, common_tokens))
+        self._keyword_postings = MappingProxyType(_bm25_postings([tokenize(' '.join(keywords)) for keywords in keyword_texts]))
+        self._keyword_words: FrozenSet[str] = frozenset(
+            word for keywords in keyword_texts for keyword in keywords for word in query_words(keyword)
+        )
+        # 너무 흔해 색인하지 않은 본문 토큰 (질문 단어 포함 비율 계산에서 제외)
+        self._common_tokens: FrozenSet[str] = frozenset(common_tokens - set(self._keyword_postings))
+
+        self.build_ms = build_ms
+        self.built_at = time.time()
+        self.chunk_count = len(self._chunks)
+
+    @staticmethod
+    def _keywords(value: Any) -> List[str]:
+        """primary_keywords 메타데이터 (쉼표로 연결된 문자열 또는 리스트) → 키워드 목록"""
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(',')
+        return [keyword.strip() for keyword in value if keyword and keyword.strip()]
+
+    @classmethod
+    def from_collection(cls, collection) -> 'KeywordIndex':
+        """컬렉션 전체를 한 번 조회하여 역색인 생성"""
+        started = time.perf_counter()
+        results = collection.get(include=['documents', 'metadatas'])
+        return cls(
+            documents=results.get('documents') or [],
+            metadatas=results.get('metadatas') or [],
+            build_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def scores(self, query_text: str) -> np.ndarray:
+        """청크별 BM25 점수 (본문 + 키워드 필드 가중합)"""
+        scores = np.zeros(self.chunk_count, dtype=np.float32)
+        for token in dict.fromkeys(tokenize(query_text)):
+            for postings, weight in ((self._content_postings, 1.0), (self._keyword_postings, KEYWORD_FIELD_WEIGHT)):
+                posting = postings.get(token)
+                if posting is not None:
+                    scores[posting[0]] += weight * posting[1]
+        return scores
+
+    def term_coverage(self, query_text: str) -> np.ndarray:
+        """
+        청크별 질문 주제 단어 포함 비율 (0~1)
+
+        GENERIC_QUERY_WORDS를 뺀 단어마다, 단어 토큰의 절반 이상이 청크(본문 또는 키워드)에 있으면 포함으로 봅니다.
+        너무 흔해 색인하지 않은 토큰만으로 된 단어는 계산에서 제외합니다.
+        """
+        covered = np.zeros(self.chunk_count, dtype=np.float32)
+        word_count = 0
+        for word in dict.fromkeys(query_words(query_text)):
+            if word in GENERIC_QUERY_WORDS:
+                continue
+            tokens = [token for token in dict.fromkeys(tokenize(word)) if token not in self._common_tokens]
+            if not tokens:
+                continue
+            word_count += 1
+
+            matched_tokens = np.zeros(self.chunk_count, dtype=np.int32)
+            for token in tokens:
+                present = np.zeros(self.chunk_count, dtype=bool)
+                for postings in (self._content_postings, self._keyword_postings):
+                    posting = postings.get(token)
+                    if posting is not None:
+                        present[posting[0]] = True
+                matched_tokens += present
+            covered += matched_tokens * 2 >= len(tokens)
+        return covered / word_count if word_count else covered
+
+    def search(self,
+               query_text: str,
+               limit: int = 15,
+               min_coverage: float = MIN_TERM_COVERAGE) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        어휘 검색
+
+        Args:
+            query_text: 검색 쿼리
+            limit: 최대 결과 수
+            min_coverage: 최소 질문 단어 포함 비율 (term_coverage 참고)
+
+        Returns:
+            (청크 복사본, BM25 점수) 리스트 (점수 내림차순)
+            청크 복사본에는 term_coverage와 lexical_similarity(lexical_similarity 함수)가 추가됨
+        """
+        if self.chunk_count == 0 or limit <= 0:
+            return []
+
+        scores = self.scores(query_text)
+        coverage = self.term_coverage(query_text)
+        matched = np.flatnonzero((scores > 0) & (coverage > 0) & (coverage >= min_coverage))
+        # 점수가 같으면 컬렉션 순서 유지
+        matched = matched[np.argsort(-scores[matched], kind='stable')][:limit]
+
+        hits = []
+        for row in matched:
+            chunk = dict(self._chunks[row])
+            chunk["term_coverage"] = float(coverage[row])
+            chunk["lexical_similarity"] = lexical_similarity(float(scores[row]), float(coverage[row]))
+            hits.append((chunk, float(scores[row])))
+        return hits
+
+    def is_exact_term_query(self, query_text: str, max_terms: int = 3) -> bool:
+        """
+        질문이 primary_keywords 용어만으로 이루어졌는지 여부
+
+        GENERIC_QUERY_WORDS를 뺀 단어가 1~max_terms개이고, 각 단어가 키워드 단어이거나
+        키워드 단어 뒤에 조사 등이 붙은 형태(예: '프롬프트를')이면 True
+        """
+        words = [word for word in query_words(query_text) if word not in GENERIC_QUERY_WORDS]
+        if not words or len(words) > max_terms:
+            return False
+        return all(self._is_keyword_word(word) for word in words)
+
+    def _is_keyword_word(self, word: str) -> bool:
+        if word in self._keyword_words:
+            return True
+        # 한글 어절은 앞부분(2글자 이상)이 키워드 단어인지 확인
+        return bool(_HANGUL_PATTERN.fullmatch(word)) and any(
+            word[:end] in self._keyword_words for end in range(len(word) - 1, 1, -1)
+        )
+
+    def count(self) -> int:
+        return self.chunk_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        return {
+            'chunks': self.chunk_count,
+            'content_terms': len(self._content_postings),
+            'keyword_terms': len(self._keyword_postings),
+            'keyword_words': len(self._keyword_words),
+            'build_ms': round(self.build_ms, 2),
+            'built_at': self.built_at
+        }
+
+
+# 전역 키워드 역색인 관리자
+keyword_index = CollectionIndexManager(KeywordIndex.from_collection, label='키워드 역색인')
@@ -0,0 +1,164 @@
+# backend/app/core/external/numpy_vector_index.py
+# NumPy 행렬 기반 전수(brute-force) 벡터 검색 인덱스 (ChromaDB query 대체 백엔드)
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .collection_index import CollectionIndexManager
+
+# ChromaDB 거리 공간 (컬렉션 메타데이터 hnsw:space, 기본 l2 = 제곱 유클리드 거리)
+SUPPORTED_SPACES = ('l2', 'cosine', 'ip')
+
+
+class NumpyVectorIndex:
+    """
+    전수 벡터 검색 인덱스 (생성 후 변경되지 않음)
+
+    청크 수백 개 규모에서는 근사 검색(HNSW)보다 전체를 한 번에 계산하는 편이 빠르고 결과도 정확합니다.
+
+    - 임베딩: 연속된 float32 행렬 (청크 수 × 차원), 문서 벡터 제곱 노름은 미리 계산
+    - 메타데이터: 키별 열 배열 (결과로 뽑힌 행만 딕셔너리로 조립)
+    - query(): 여러 쿼리를 행렬곱 한 번으로 계산하고 argpartition으로 상위 k개 선택
+    - 거리는 컬렉션과 같은 공간으로 계산하므로 max_distance 기준을 그대로 사용 가능
+    - ChromaDB Collection.query(query_embeddings=..., n_results=...)와 같은 형식으로 응답
+    """
+
+    def __init__(self,
+                 ids: Sequence[str],
+                 embeddings: Any,
+                 documents: Sequence[str],
+                 metadatas: Sequence[Dict[str, Any]],
+                 space: str = 'l2',
+                 build_ms: float = 0.0):
+        if space not in SUPPORTED_SPACES:
+            raise ValueError(f"지원하지 않는 거리 공간: {space}")
+
+        matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            raise ValueError(f"임베딩 행렬 형태 오류: {matrix.shape}, 청크 {len(ids)}개")
+
+        if space == 'cosine':
+            # 코사인 거리는 정규화 후 내적으로 계산
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.maximum(norms, 1e-12)
+
+        self.space = space
+        self._matrix = matrix
+        self._matrix.setflags(write=False)
+        self._squared_norms = np.einsum('ij,ij->i', matrix, matrix)
+
+        self._ids = np.asarray(ids, dtype=object)
+        self._documents = np.asarray(documents, dtype=object)
+        metadata_keys = sorted({key for metadata in metadatas for key in (metadata or {})})
+        self._columns = {
+            key: np.asarray([(metadata or {}).get(key) for metadata in metadatas], dtype=object)
+            for key in metadata_keys
+        }
+
+        self.build_ms = build_ms
+        self.built_at = time.time()
+        self.chunk_count = len(ids)
+
+    @classmethod
+    def from_collection(cls, collection) -> 'NumpyVectorIndex':
+        """컬렉션의 임베딩/문서/메타데이터를 한 번 읽어 인덱스 생성"""
+        started = time.perf_counter()
+        results = collection.get(include=['embeddings', 'documents', 'metadatas'])
+        embeddings = results.get('embeddings')
+        if embeddings is None or len(embeddings) == 0:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+
+        space = (getattr(collection, 'metadata', None) or {}).get('hnsw:space', 'l2')
+        return cls(
+            ids=results.get('ids') or [],
+            embeddings=embeddings,
+            documents=results.get('documents') or [],
+            metadatas=results.get('metadatas') or [],
+            space=space,
+            build_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def distances(self, query_matrix: np.ndarray) -> np.ndarray:
+        """쿼리 × 청크 거리 행렬 (컬렉션 거리 공간 기준)"""
+        if self.space == 'cosine':
+            norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+            return 1.0 - (query_matrix / np.maximum(norms, 1e-12)) @ self._matrix.T
+        if self.space == 'ip':
+            return 1.0 - query_matrix @ self._matrix.T
+
+        # 제곱 유클리드 거리 = |q|² + |d|² - 2 q·d (부동소수점 오차로 생기는 음수는 0으로)
+        query_norms = np.einsum('ij,ij->i', query_matrix, query_matrix)
+        distances = query_norms[:, None] + self._squared_norms[None, :] - 2.0 * (query_matrix @ self._matrix.T)
+        return np.maximum(distances, 0.0)
+
+    def query(self,
+              query_embeddings: Sequence[Any],
+              n_results: int = 10,
+              max_distance: Optional[float] = None,
+              **kwargs) -> Dict[str, List[List[Any]]]:
+        """
+        다중 쿼리 정확 top-k 검색
+
+        Args:
+            query_embeddings: 쿼리 벡터 목록
+            n_results: 쿼리별 최대 결과 수
+            max_distance: 이 거리를 넘는 결과는 제외 (None이면 제외하지 않음)
+
+        Returns:
+            ChromaDB query 결과와 같은 형식 {"ids", "documents", "metadatas", "distances"} (쿼리별 리스트)
+        """
+        result: Dict[str, List[List[Any]]] = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+        if query_matrix.ndim == 1:
+            query_matrix = query_matrix[None, :]
+
+        k = min(n_results, self.chunk_count)
+        if k <= 0 or len(query_matrix) == 0:
+            for key in result:
+                result[key] = [[] for _ in range(len(query_matrix))]
+            return result
+
+        distances = self.distances(query_matrix)
+
+        # 상위 k개만 부분 정렬한 뒤 그 안에서 거리순 정렬
+        if k < self.chunk_count:
+            top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(self.chunk_count), (len(query_matrix), k))
+        top_distances = np.take_along_axis(distances, top, axis=1)
+        order = np.argsort(top_distances, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_distances = np.take_along_axis(top_distances, order, axis=1)
+
+        for rows, row_distances in zip(top, top_distances):
+            if max_distance is not None:
+                keep = row_distances <= max_distance
+                rows, row_distances = rows[keep], row_distances[keep]
+            result['ids'].append(self._ids[rows].tolist())
+            result['documents'].append(self._documents[rows].tolist())
+            result['metadatas'].append([
+                {key: column[row] for key, column in self._columns.items() if column[row] is not None}
+                for row in rows
+            ])
+            result['distances'].append(row_distances.astype(float).tolist())
+        return result
+
+    def count(self) -> int:
+        return self.chunk_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        return {
+            'chunks': self.chunk_count,
+            'dimensions': int(self._matrix.shape[1]) if self._matrix.ndim == 2 else 0,
+            'space': self.space,
+            'matrix_mb': round(self._matrix.nbytes / (1024 * 1024), 2),
+            'build_ms': round(self.build_ms, 2),
+            'built_at': self.built_at
+        }
+
+
+# 전역 NumPy 벡터 인덱스 관리자 (VECTOR_SEARCH_BACKEND=numpy일 때 사용)
+numpy_vector_index = CollectionIndexManager(NumpyVectorIndex.from_collection, label='NumPy 벡터 인덱스')
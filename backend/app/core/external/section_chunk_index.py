@@ -0,0 +1,118 @@
+# backend/app/core/external/section_chunk_index.py
+# (챕터, 섹션, 청크 타입)별 벡터 DB 청크 메모리 인덱스
+
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .collection_index import CollectionIndexManager
+
+# 청크 타입
+CORE_CONCEPT_TYPE = 'core_concept'
+OTHER_CHUNK_TYPES = ('analogy', 'practical_example', 'technical_detail')
+CHUNK_TYPES = (CORE_CONCEPT_TYPE,) + OTHER_CHUNK_TYPES
+
+# 이론/퀴즈 자료로 사용하는 최소 품질 점수
+MIN_QUALITY_SCORE = 90
+
+SectionKey = Tuple[int, int, str]
+
+
+class SectionChunkIndex:
+    """
+    섹션 청크 인덱스 (생성 후 변경되지 않음)
+
+    - 키: (chapter, section, chunk_type) → content_quality_score 내림차순으로 정렬된 청크 튜플
+    - 이론/퀴즈 자료는 벡터 유사도가 아닌 메타데이터 조건으로만 고르므로
+      컬렉션 전체를 한 번 읽어 두고 딕셔너리 조회로 응답
+    - 교체는 CollectionIndexManager가 참조를 바꾸는 방식으로만 하므로 조회 중 잠금이 필요 없음
+    """
+
+    def __init__(self, entries: Mapping[SectionKey, Tuple[Dict[str, Any], ...]], build_ms: float = 0.0):
+        self._entries = MappingProxyType(dict(entries))
+        self.build_ms = build_ms
+        self.built_at = time.time()
+        self.chunk_count = sum(len(chunks) for chunks in self._entries.values())
+
+    @classmethod
+    def from_collection(cls, collection) -> 'SectionChunkIndex':
+        """컬렉션 전체를 한 번 조회하여 인덱스 생성"""
+        started = time.perf_counter()
+        results = collection.get(include=['documents', 'metadatas'])
+        entries = cls._group(zip(results.get('documents') or [], results.get('metadatas') or []))
+        return cls(entries, build_ms=(time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def _group(rows: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[SectionKey, Tuple[Dict[str, Any], ...]]:
+        """(문서, 메타데이터) 목록을 키별로 묶고 품질 점수 내림차순 정렬"""
+        grouped: Dict[SectionKey, List[Dict[str, Any]]] = {}
+        for doc, metadata in rows:
+            if not doc or not metadata:
+                continue
+            key = (metadata.get('chapter'), metadata.get('section'), metadata.get('chunk_type'))
+            grouped.setdefault(key, []).append({
+                "content": doc,
+                "chunk_type": metadata.get("chunk_type"),
+                "content_quality_score": metadata.get("content_quality_score", 0),
+                "primary_keywords": metadata.get("primary_keywords"),
+                "source_url": metadata.get("source_url"),
+                "id": metadata.get("id")
+            })
+
+        # 점수가 같으면 컬렉션 순서 유지 (안정 정렬)
+        return {
+            key: tuple(sorted(chunks, key=lambda x: x["content_quality_score"], reverse=True))
+            for key, chunks in grouped.items()
+        }
+
+    def get_chunks(self,
+                   chapter: int,
+                   section: int,
+                   chunk_types: Iterable[str],
+                   min_quality: int = MIN_QUALITY_SCORE,
+                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        섹션의 청크 조회 (품질 점수 높은 순, 호출자가 수정해도 되도록 복사본 반환)
+
+        Args:
+            chapter: 챕터 번호
+            section: 섹션 번호
+            chunk_types: 조회할 청크 타입 (여러 개면 타입 순서대로 합친 뒤 점수순 정렬)
+            min_quality: 최소 content_quality_score
+            limit: 최대 개수 (None이면 전부)
+        """
+        chunk_types = tuple(chunk_types)
+        chunks: List[Dict[str, Any]] = []
+        for chunk_type in chunk_types:
+            for chunk in self._entries.get((chapter, section, chunk_type), ()):
+                # 점수 내림차순이므로 기준 미만이 나오면 나머지도 모두 미만
+                if chunk["content_quality_score"] < min_quality:
+                    break
+                chunks.append(chunk)
+
+        if len(chunk_types) > 1:
+            chunks.sort(key=lambda x: x["content_quality_score"], reverse=True)
+        return [dict(chunk) for chunk in chunks[:limit]]
+
+    def count(self, chapter: Optional[int] = None, section: Optional[int] = None, chunk_type: Optional[str] = None) -> int:
+        """조건에 맞는 청크 수 (None인 조건은 전체)"""
+        return sum(
+            len(chunks) for (ch, sec, ctype), chunks in self._entries.items()
+            if (chapter is None or ch == chapter)
+            and (section is None or sec == section)
+            and (chunk_type is None or ctype == chunk_type)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        return {
+            'keys': len(self._entries),
+            'sections': len({(ch, sec) for ch, sec, _ in self._entries}),
+            'chunks': self.chunk_count,
+            'build_ms': round(self.build_ms, 2),
+            'built_at': self.built_at
+        }
+
+
+# 전역 섹션 청크 인덱스 관리자
+section_chunk_index = CollectionIndexManager(SectionChunkIndex.from_collection, label='섹션 청크 인덱스')
@@ -17,6 +17,9 @@ if backend_dir not in sys.path:
 from openai import OpenAI
 from chromadb.utils import embedding_functions
 from app.core.external.chroma_client import get_chroma_client
+from app.core.external.keyword_index import keyword_index
+from app.core.external.numpy_vector_index import numpy_vector_index
+from app.core.external.section_chunk_index import section_chunk_index
 
 
 class VectorDBSetup:
@@ -78,6 +81,12 @@ class VectorDBSetup:
             # 6. 삽입 기록 저장
             self._save_insertion_log(insertion_results)
             
+            # 7. 섹션 청크 인덱스(이론/퀴즈 자료 조회용)와 키워드 역색인(QnA 어휘 검색용) 교체,
+            #    NumPy 벡터 인덱스는 다음 검색 때 다시 생성
+            section_chunk_index.rebuild(collection)
+            keyword_index.rebuild(collection)
+            numpy_vector_index.invalidate()
+            
             self.logger.info(f"벡터 데이터베이스 구축 완료 - 총 {len(insertion_results)}개 청크 삽입")
             return True
             
@@ -9,6 +9,7 @@ from app.core.langraph.state_manager import TutorState
 from app.agents.learning_supervisor.supervisor_router import supervisor_router
 from app.agents import agent_nodes
 from app.utils.common.graph_visualizer import save_tutor_workflow_graph
+from app.utils.tracing import workflow_tracer
 
 
 class TutorGraphBuilder:
@@ -38,9 +39,9 @@ class TutorGraphBuilder:
         # StateGraph 생성 (TutorState 타입 지정)
         workflow = StateGraph(TutorState)
         
-        # === 노드 등록 (agent_nodes 딕셔너리에서 자동 등록) ===
+        # === 노드 등록 (agent_nodes 딕셔너리에서 자동 등록, 노드마다 실행 구간 기록) ===
         for name, node_func in agent_nodes.items():
-            workflow.add_node(name, node_func)
+            workflow.add_node(name, workflow_tracer.wrap_node(name, node_func))
         
         # === 엔트리 포인트 (START 노드 자동 생성) ===
         workflow.set_entry_point("learning_supervisor_input")
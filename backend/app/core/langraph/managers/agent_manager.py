@@ -1,10 +1,10 @@
 # backend/app/core/langraph/managers/agent_manager.py
 # 에이전트 전환 관리 전담 모듈
 
-import copy
 from typing import Dict, Any, Optional, List, Tuple
 
 from ..state.state_definition import TutorState, VALID_VALUES
+from ..state.state_copy import copy_on_write
 
 
 class AgentManager:
@@ -39,7 +39,7 @@ class AgentManager:
         Returns:
             에이전트가 전환된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 이전 에이전트 저장
         updated_state["previous_agent"] = state.get("current_agent", "")
@@ -65,7 +65,7 @@ class AgentManager:
         if mode not in self.valid_ui_modes:
             mode = "chat"  # 기본값으로 fallback
         
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["ui_mode"] = mode
         return updated_state
     
@@ -85,7 +85,7 @@ class AgentManager:
         if intent not in self.valid_intents:
             intent = "next_step"  # 기본값으로 fallback
         
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["user_intent"] = intent
         return updated_state
     
@@ -102,7 +102,7 @@ class AgentManager:
         Returns:
             워크플로우 응답이 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["workflow_response"] = workflow_response
         return updated_state
     
@@ -119,7 +119,7 @@ class AgentManager:
         Returns:
             퀴즈 모드로 전환된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 에이전트 전환
         updated_state = self.update_agent_transition(updated_state, target_agent)
@@ -145,7 +145,7 @@ class AgentManager:
         Returns:
             채팅 모드로 전환된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 에이전트 전환 (지정된 경우만)
         if target_agent:
@@ -321,7 +321,7 @@ class AgentManager:
         Returns:
             에이전트와 UI 모드가 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 에이전트 전환
         updated_state = self.update_agent_transition(updated_state, agent)
@@ -383,7 +383,7 @@ class AgentManager:
         Returns:
             에이전트 상태가 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         updated_state.update({
             "current_agent": default_agent,
@@ -410,7 +410,7 @@ class AgentManager:
         Returns:
             폴백 처리된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 폴백 에이전트로 전환
         updated_state = self.update_agent_transition(updated_state, fallback_agent)
@@ -1,11 +1,11 @@
 # backend/app/core/langraph/managers/conversation_manager.py
 # 대화 관리 전담 모듈
 
-import copy
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 from ..state.state_definition import TutorState
+from ..state.state_copy import copy_on_write, with_appended
 
 
 class ConversationManager:
@@ -42,8 +42,6 @@ class ConversationManager:
         Returns:
             대화가 추가된 State
         """
-        updated_state = copy.deepcopy(state)
-        
         conversation_item = {
             "agent_name": agent_name,
             "message": message,
@@ -52,11 +50,8 @@ class ConversationManager:
             "session_stage": state.get("session_progress_stage", "session_start")
         }
         
-        current_conversations = updated_state.get("current_session_conversations", [])
-        current_conversations.append(conversation_item)
-        updated_state["current_session_conversations"] = current_conversations
-        
-        return updated_state
+        # 기존 대화 항목은 이전 State와 공유하고 새 리스트에 추가
+        return with_appended(state, "current_session_conversations", conversation_item)
     
     def add_user_message(self, 
                         state: TutorState, 
@@ -158,7 +153,7 @@ class ConversationManager:
         Returns:
             대화 기록이 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["current_session_conversations"] = []
         return updated_state
     
@@ -190,7 +185,7 @@ class ConversationManager:
         Returns:
             대본이 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         draft_field_map = {
             "theory_educator": "theory_draft",
@@ -241,7 +236,7 @@ class ConversationManager:
         Returns:
             대본이 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state.update({
             "theory_draft": "",
             "quiz_draft": "",
@@ -286,8 +281,6 @@ class ConversationManager:
         Returns:
             세션 요약이 추가된 State
         """
-        updated_state = copy.deepcopy(state)
-        
         session_summary = {
             "chapter": str(chapter),
             "section": str(section),
@@ -296,15 +289,8 @@ class ConversationManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        recent_summaries = updated_state.get("recent_sessions_summary", [])
-        recent_summaries.append(session_summary)
-        
         # 최대 5개까지만 유지
-        if len(recent_summaries) > 5:
-            recent_summaries = recent_summaries[-5:]
-        
-        updated_state["recent_sessions_summary"] = recent_summaries
-        return updated_state
+        return with_appended(state, "recent_sessions_summary", session_summary, max_items=5)
     
     def get_recent_session_summaries(self, 
                                    state: TutorState, 
@@ -332,7 +318,7 @@ class ConversationManager:
         Returns:
             세션 요약이 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["recent_sessions_summary"] = []
         return updated_state
     
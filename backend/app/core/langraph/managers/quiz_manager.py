@@ -1,11 +1,11 @@
 # backend/app/core/langraph/managers/quiz_manager.py
 # 퀴즈 관련 State 조작 전담 모듈
 
-import copy
 import json
 from typing import Dict, Any, List, Optional, Union
 
 from ..state.state_definition import TutorState
+from ..state.state_copy import copy_on_write
 
 
 class QuizManager:
@@ -40,7 +40,7 @@ class QuizManager:
         """
         quiz_type = self.get_quiz_type_from_section(state, chapter_data)
         
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["quiz_type"] = quiz_type
         
         return updated_state
@@ -106,7 +106,7 @@ class QuizManager:
         Returns:
             퀴즈 정보가 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 기본 퀴즈 정보 (올바른 키 사용)
         quiz_type = quiz_json.get("type", "multiple_choice")  # quiz_type → type 수정
@@ -147,14 +147,14 @@ class QuizManager:
         quiz_draft = state.get("quiz_draft", "")
         
         if not quiz_draft:
-            return copy.deepcopy(state)
+            return copy_on_write(state)
         
         try:
             quiz_json = json.loads(quiz_draft)
             return self.parse_quiz_from_json(state, quiz_json)
         except (json.JSONDecodeError, TypeError) as e:
             # JSON 파싱 실패 시 기존 State 반환
-            return copy.deepcopy(state)
+            return copy_on_write(state)
     
     def update_quiz_info(self, 
                         state: TutorState,
@@ -183,7 +183,7 @@ class QuizManager:
         Returns:
             업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 퀴즈 기본 정보
         if quiz_type is not None:
@@ -222,7 +222,7 @@ class QuizManager:
         Returns:
             사용자 답변이 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["user_answer"] = user_answer
         return updated_state
     
@@ -243,7 +243,7 @@ class QuizManager:
         Returns:
             평가 결과가 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         quiz_type = state.get("quiz_type", "multiple_choice")
         
@@ -272,7 +272,7 @@ class QuizManager:
         Returns:
             채점 결과가 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 사용자 답변 업데이트
         updated_state["user_answer"] = user_answer
@@ -303,7 +303,7 @@ class QuizManager:
         Returns:
             힌트 사용 횟수가 증가된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         current_count = state.get("hint_usage_count", 0)
         updated_state["hint_usage_count"] = current_count + 1
         return updated_state
@@ -318,7 +318,7 @@ class QuizManager:
         Returns:
             힌트 사용 횟수가 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["hint_usage_count"] = 0
         return updated_state
     
@@ -332,7 +332,7 @@ class QuizManager:
         Returns:
             퀴즈 데이터가 초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 퀴즈 관련 모든 필드 초기화
         updated_state.update({
@@ -365,7 +365,7 @@ class QuizManager:
         Returns:
             퀴즈 모드로 설정된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # UI 모드를 퀴즈로 변경
         updated_state["ui_mode"] = "quiz"
@@ -389,7 +389,7 @@ class QuizManager:
         Returns:
             채팅 모드로 복귀된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # UI 모드를 채팅으로 변경
         updated_state["ui_mode"] = "chat"
@@ -485,7 +485,7 @@ class QuizManager:
             동기화된 State (v2.0에서는 변경 없음)
         """
         # v2.0에서는 quiz_type 하나만 사용하므로 동기화 불필요
-        return copy.deepcopy(state)
+        return copy_on_write(state)
 
 
 # 전역 QuizManager 인스턴스
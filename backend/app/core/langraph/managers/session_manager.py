@@ -1,12 +1,12 @@
 # backend/app/core/langraph/managers/session_manager.py
 # 세션 진행 관리 전담 모듈
 
-import copy
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
 from ..state.state_definition import TutorState
+from ..state.state_copy import copy_on_write
 
 
 class SessionManager:
@@ -41,7 +41,7 @@ class SessionManager:
         Returns:
             업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         if next_chapter is not None:
             updated_state["current_chapter"] = next_chapter
@@ -64,7 +64,7 @@ class SessionManager:
         Returns:
             업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         if completed_agent == "theory_educator":
             updated_state["session_progress_stage"] = "theory_completed"
@@ -87,7 +87,7 @@ class SessionManager:
         Returns:
             결정이 업데이트된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         updated_state["retry_decision_result"] = decision
         return updated_state
     
@@ -106,7 +106,7 @@ class SessionManager:
         Returns:
             다음 세션이 준비된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 진행 상태 업데이트
         if next_chapter is not None:
@@ -140,7 +140,7 @@ class SessionManager:
         Returns:
             초기화된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         
         # 공통 초기화
         updated_state.update({
@@ -239,7 +239,7 @@ class SessionManager:
         Returns:
             세션 카운트가 증가된 State
         """
-        updated_state = copy.deepcopy(state)
+        updated_state = copy_on_write(state)
         current_count = state.get("current_session_count", 0)
         updated_state["current_session_count"] = current_count + 1
         return updated_state
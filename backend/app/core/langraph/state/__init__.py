@@ -9,6 +9,11 @@ from .state_definition import (
     DEFAULT_VALUES
 )
 
+from .state_copy import (
+    copy_on_write,
+    with_appended
+)
+
 from .state_factory import (
     StateFactory,
     state_factory
@@ -29,6 +34,10 @@ __all__ = [
     "VALID_VALUES",
     "DEFAULT_VALUES",
     
+    # State 복사 (구조 공유)
+    "copy_on_write",
+    "with_appended",
+    
     # State 팩토리
     "StateFactory",
     "state_factory",
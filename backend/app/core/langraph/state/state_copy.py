@@ -0,0 +1,58 @@
+# backend/app/core/langraph/state/state_copy.py
+# TutorState 복사 시 구조 공유(copy-on-write) 헬퍼
+
+from typing import Any, Optional
+
+from .state_definition import TutorState
+
+
+def copy_on_write(state: TutorState) -> TutorState:
+    """
+    업데이트용 State 복사 (구조 공유)
+
+    최상위 필드만 새 딕셔너리로 복사하고, 리스트/딕셔너리 같은 하위 값은
+    원본 State와 그대로 공유합니다. 따라서 이 복사 자체의 비용은 대화 기록 길이와 무관합니다.
+
+    규칙: 공유된 하위 값은 제자리에서 수정하지 않고, 변경이 필요하면
+    새 리스트/딕셔너리를 만들어 필드에 다시 할당합니다 (with_appended 참고).
+
+    Args:
+        state: 원본 State
+
+    Returns:
+        최상위 필드만 복사된 State
+    """
+    return dict(state)
+
+
+def with_appended(state: TutorState,
+                  field_name: str,
+                  item: Any,
+                  max_items: Optional[int] = None) -> TutorState:
+    """
+    리스트 필드에 항목을 추가한 새 State 반환
+
+    기존 리스트는 수정하지 않고 항목 참조만 복사한 새 리스트를 할당하므로,
+    이전 State와 기존 항목들은 그대로 공유됩니다.
+
+    참조 복사는 리스트 길이에 비례합니다 (추가 1회 O(n), 항목 딕셔너리는 복사하지 않음).
+    대화 기록을 읽는 쪽이 모두 일반 리스트(슬라이싱, len, 직렬화)로 다루므로
+    영속 자료구조 대신 리스트를 유지합니다. 2000개 기준 추가 1회는 수 마이크로초 수준입니다.
+
+    Args:
+        state: 원본 State
+        field_name: 리스트 필드 이름 (예: "current_session_conversations")
+        item: 추가할 항목
+        max_items: 유지할 최대 항목 수 (초과 시 오래된 항목부터 제거)
+
+    Returns:
+        항목이 추가된 State
+    """
+    updated_state = copy_on_write(state)
+    items = [*(state.get(field_name) or []), item]
+
+    if max_items is not None and len(items) > max_items:
+        items = items[-max_items:]
+
+    updated_state[field_name] = items
+    return updated_state
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 from .state_definition import TutorState, DEFAULT_VALUES
+from .state_copy import copy_on_write
 
 
 class StateFactory:
@@ -182,7 +183,7 @@ class StateFactory:
         Returns:
             병합된 State
         """
-        merged_state = copy.deepcopy(base_state)
+        merged_state = copy_on_write(base_state)
         merged_state.update(updates)
         return merged_state
     
@@ -284,7 +285,7 @@ class StateFactory:
         Returns:
             퀴즈용으로 설정된 State
         """
-        quiz_state = copy.deepcopy(state)
+        quiz_state = copy_on_write(state)
         
         # 퀴즈 모드 설정
         quiz_state.update({
@@ -321,7 +322,7 @@ class StateFactory:
         Returns:
             대본이 초기화된 State
         """
-        cleared_state = copy.deepcopy(state)
+        cleared_state = copy_on_write(state)
         cleared_state.update({
             "theory_draft": "",
             "quiz_draft": "",
@@ -340,7 +341,7 @@ class StateFactory:
         Returns:
             퀴즈 데이터가 초기화된 State
         """
-        cleared_state = copy.deepcopy(state)
+        cleared_state = copy_on_write(state)
         
         # 퀴즈 관련 모든 필드 초기화
         cleared_state.update({
@@ -375,7 +376,7 @@ class StateFactory:
         Returns:
             다음 세션이 준비된 State
         """
-        next_state = copy.deepcopy(state)
+        next_state = copy_on_write(state)
         
         # 진행 상태 업데이트
         if next_chapter is not None:
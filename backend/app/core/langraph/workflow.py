@@ -1,7 +1,6 @@
 # backend/app/core/langraph/workflow.py
 # v2.0 업데이트: 통합 워크플로우 지원, 하이브리드 UX 처리
 
-import asyncio
 import logging
 from typing import Dict, Any, Optional, AsyncIterator
 from datetime import datetime
@@ -9,6 +8,8 @@ from datetime import datetime
 from app.core.langraph.state_manager import TutorState, state_manager
 from app.core.langraph.graph_builder import get_compiled_graph
 from app.utils.common.graph_visualizer import save_tutor_workflow_graph
+from app.core.runtime import run_async
+from app.utils.tracing import workflow_tracer
 
 
 class WorkflowExecutor:
@@ -66,15 +67,22 @@ class WorkflowExecutor:
             # 실행 설정 준비
             runtime_config = self._prepare_runtime_config(config, execution_id)
             
-            # 워크플로우 실행
-            if stream:
-                final_state = await self._execute_with_streaming(
-                    compiled_graph, state, runtime_config
-                )
-            else:
-                final_state = await self._execute_standard(
-                    compiled_graph, state, runtime_config
-                )
+            # 워크플로우 실행 (노드/도구/LLM 호출 구간을 하나의 추적으로 기록)
+            with workflow_tracer.trace(
+                "workflow",
+                execution_id=execution_id,
+                user_id=state.get("user_id"),
+                user_intent=state.get("user_intent"),
+                session_stage=state.get("session_progress_stage")
+            ):
+                if stream:
+                    final_state = await self._execute_with_streaming(
+                        compiled_graph, state, runtime_config
+                    )
+                else:
+                    final_state = await self._execute_standard(
+                        compiled_graph, state, runtime_config
+                    )
             
             # 실행 통계 업데이트
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -107,17 +115,8 @@ class WorkflowExecutor:
             실행 완료된 TutorState
         """
         try:
-            # 비동기 실행을 동기로 래핑
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.execute_workflow(state, stream=False, config=config)
-                )
-                return result
-            finally:
-                loop.close()
+            # 워커 공용 백그라운드 이벤트 루프에서 실행 (요청마다 루프를 새로 만들지 않음)
+            return run_async(self.execute_workflow(state, stream=False, config=config))
                 
         except Exception as e:
             self.logger.error(f"동기 워크플로우 실행 실패: {str(e)}")
@@ -0,0 +1,32 @@
+# backend/app/core/llm/__init__.py
+"""
+LLM 클라이언트 모듈
+역할별 설정과 연결 풀을 공유하는 장기 실행 ChatOpenAI 클라이언트와
+미리 구성한 LCEL 체인 캐시, 생성 결과 캐시, LLM 호출 구간 기록 콜백을 제공합니다.
+"""
+
+from .llm_config import LLMRoleConfig, get_role_config
+from .fake_llm import FakeChatModel, LatencyDistribution, create_fake_chat_model
+from .tracing_callback import LLMTracingCallback, extract_token_usage
+from .client_registry import LLMClientRegistry, llm_registry, get_chat_model
+from .chain_cache import ChainCache, chain_cache, get_chain
+from .generation_cache import GenerationCache, generation_cache, create_generation_cache
+
+__all__ = [
+    'LLMRoleConfig',
+    'get_role_config',
+    'FakeChatModel',
+    'LatencyDistribution',
+    'create_fake_chat_model',
+    'LLMTracingCallback',
+    'extract_token_usage',
+    'LLMClientRegistry',
+    'llm_registry',
+    'get_chat_model',
+    'ChainCache',
+    'chain_cache',
+    'get_chain',
+    'GenerationCache',
+    'generation_cache',
+    'create_generation_cache'
+]
@@ -0,0 +1,94 @@
+# backend/app/core/llm/chain_cache.py
+# 미리 구성한 LCEL 체인(prompt | model | parser) 캐시
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from langchain_core.runnables import Runnable
+from langchain_openai import ChatOpenAI
+
+from .client_registry import get_chat_model
+
+
+class ChainCache:
+    """
+    LCEL 체인 캐시
+
+    - (역할, 변형 키) 조합마다 PromptTemplate/파서/체인을 한 번만 구성하고 재사용
+    - 체인은 구성 당시의 모델 클라이언트를 참조하므로, 레지스트리가 클라이언트를
+      새로 만든 경우(fork, clear, 설정 변경)에는 캐시된 체인을 버리고 다시 구성
+    - 구성된 체인은 상태가 없으므로 여러 스레드에서 동시에 invoke해도 안전
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # {(role, variant): (model, chain)}
+        self._chains: Dict[Tuple[str, Hashable], Tuple[ChatOpenAI, Runnable]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_chain(self, role: str, variant: Hashable, builder: Callable[[ChatOpenAI], Runnable]) -> Runnable:
+        """
+        캐시된 체인 반환 (없으면 builder로 구성)
+
+        Args:
+            role: LLM 역할 이름 (레지스트리에서 모델 조회에 사용)
+            variant: 프롬프트 변형을 구분하는 키 (예: (user_type, is_retry_session, content_source))
+            builder: 모델을 받아 체인을 구성하는 함수
+
+        Returns:
+            Runnable: 재사용 가능한 LCEL 체인
+        """
+        model = get_chat_model(role)
+        key = (role, variant)
+
+        with self._lock:
+            entry = self._chains.get(key)
+            if entry is not None and entry[0] is model:
+                self._hits += 1
+                return entry[1]
+
+        # 구성은 잠금 밖에서 수행 (동시에 구성되더라도 결과는 동일)
+        chain = builder(model)
+
+        with self._lock:
+            self._chains[key] = (model, chain)
+            self._misses += 1
+
+        self.logger.info(f"LCEL 체인 구성: {role} {variant}")
+        return chain
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                'cached_chains': len(self._chains),
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+    def clear(self) -> None:
+        """캐시된 체인 정리 (테스트/설정 변경용)"""
+        with self._lock:
+            self._chains = {}
+
+
+# 전역 체인 캐시 인스턴스
+chain_cache = ChainCache()
+
+
+def get_chain(role: str, variant: Hashable, builder: Callable[[ChatOpenAI], Runnable]) -> Runnable:
+    """
+    전역 캐시에서 LCEL 체인 조회 (편의 함수)
+
+    Args:
+        role: LLM 역할 이름
+        variant: 프롬프트 변형 키
+        builder: 모델을 받아 체인을 구성하는 함수
+
+    Returns:
+        Runnable: 재사용 가능한 LCEL 체인
+    """
+    return chain_cache.get_chain(role, variant, builder)
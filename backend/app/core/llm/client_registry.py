@@ -0,0 +1,199 @@
+# backend/app/core/llm/client_registry.py
+# 장기 실행 LLM 클라이언트 레지스트리
+
+import os
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from .llm_config import LLMRoleConfig, get_role_config
+from .fake_llm import FakeChatModel, create_fake_chat_model
+from .tracing_callback import LLMTracingCallback
+
+# 지원하는 LLM 제공자 (fake: OpenAI를 호출하지 않는 로컬 가짜 모델)
+SUPPORTED_PROVIDERS = ('openai', 'fake')
+
+
+class LLMClientRegistry:
+    """
+    LLM 클라이언트 레지스트리
+
+    - (model, temperature, max_tokens, streaming) 조합마다 ChatOpenAI 인스턴스를 한 번만 생성해 재사용
+    - 모든 클라이언트가 하나의 httpx 동기/비동기 연결 풀을 공유하여
+      요청마다 새 HTTP/TLS 연결을 맺지 않고 keep-alive 연결을 재사용
+    - fork 후 워커 프로세스에서는 연결 풀을 새로 생성
+    - LLM_PROVIDER=fake이면 ChatOpenAI 대신 역할별 로컬 가짜 모델(FakeChatModel) 반환
+    - 모든 클라이언트에 LLM 호출 구간/토큰 사용량 기록 콜백을 붙임 (스트리밍도 사용량 포함)
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._clients: Dict[tuple, Any] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _http_limits(self) -> httpx.Limits:
+        """공유 연결 풀 크기 설정"""
+        return httpx.Limits(
+            max_connections=int(os.getenv('LLM_HTTP_MAX_CONNECTIONS', '20')),
+            max_keepalive_connections=int(os.getenv('LLM_HTTP_MAX_KEEPALIVE', '10')),
+            keepalive_expiry=float(os.getenv('LLM_HTTP_KEEPALIVE_EXPIRY', '60'))
+        )
+
+    def _reset_if_forked_locked(self) -> None:
+        """fork된 프로세스이면 부모의 연결 풀과 클라이언트를 버리고 새로 시작"""
+        if self._pid == os.getpid():
+            return
+
+        if self._pid is not None:
+            self.logger.info("프로세스 변경 감지, LLM 클라이언트 및 연결 풀 재생성")
+
+        self._clients = {}
+        limits = self._http_limits()
+        self._http_client = httpx.Client(limits=limits)
+        self._http_async_client = httpx.AsyncClient(limits=limits)
+        self._pid = os.getpid()
+
+    def get_client(self, config: LLMRoleConfig) -> ChatOpenAI:
+        """
+        설정에 해당하는 ChatOpenAI 클라이언트 반환 (없으면 생성)
+
+        Args:
+            config: LLM 설정
+
+        Returns:
+            ChatOpenAI: 재사용 가능한 클라이언트
+        """
+        key = config.cache_key
+
+        with self._lock:
+            self._reset_if_forked_locked()
+
+            client = self._clients.get(key)
+            if client is not None:
+                self._hits += 1
+                return client
+
+            client_kwargs: Dict[str, Any] = {
+                'model': config.model,
+                'openai_api_key': os.getenv('OPENAI_API_KEY'),
+                'temperature': config.temperature,
+                'streaming': config.streaming,
+                'http_client': self._http_client,
+                'http_async_client': self._http_async_client,
+                'stream_usage': True,
+                'callbacks': [LLMTracingCallback(config.model)]
+            }
+            if config.max_tokens is not None:
+                client_kwargs['max_tokens'] = config.max_tokens
+
+            client = ChatOpenAI(**client_kwargs)
+            self._clients[key] = client
+            self._misses += 1
+
+        self.logger.info(f"LLM 클라이언트 생성: {key}")
+        return client
+
+    def get_chat_model(self,
+                       role: Optional[str] = None,
+                       model: Optional[str] = None,
+                       temperature: Optional[float] = None,
+                       max_tokens: Optional[int] = None,
+                       streaming: Optional[bool] = None) -> ChatOpenAI:
+        """
+        역할 설정(또는 직접 지정한 값)으로 클라이언트 조회
+
+        Args:
+            role: 역할 이름 (지정 시 역할 설정을 기본값으로 사용)
+            model, temperature, max_tokens, streaming: 역할 설정 대신 사용할 값
+
+        Returns:
+            ChatOpenAI: 재사용 가능한 클라이언트
+        """
+        if role is not None:
+            base = get_role_config(role)
+        else:
+            base = LLMRoleConfig(model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'), temperature=0.3)
+
+        config = LLMRoleConfig(
+            model=model if model is not None else base.model,
+            temperature=temperature if temperature is not None else base.temperature,
+            max_tokens=max_tokens if max_tokens is not None else base.max_tokens,
+            streaming=streaming if streaming is not None else base.streaming
+        )
+        if self.provider == 'fake':
+            return self._get_fake_client(role or 'default', config)
+        return self.get_client(config)
+
+    @property
+    def provider(self) -> str:
+        """현재 LLM 제공자 이름 (LLM_PROVIDER 환경변수, 기본: openai)"""
+        provider = os.getenv('LLM_PROVIDER', 'openai').strip().lower()
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"지원하지 않는 LLM 제공자입니다: {provider} (지원: {', '.join(SUPPORTED_PROVIDERS)})")
+        return provider
+
+    def _get_fake_client(self, role: str, config: LLMRoleConfig) -> FakeChatModel:
+        """역할별 가짜 모델 반환 (없으면 생성)"""
+        key = ('fake', role) + config.cache_key
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._hits += 1
+                return client
+
+            client = create_fake_chat_model(role)
+            client.callbacks = [LLMTracingCallback(role)]
+            self._clients[key] = client
+            self._misses += 1
+
+        self.logger.info(f"가짜 LLM 클라이언트 생성: {key}")
+        return client
+
+    def get_stats(self) -> Dict[str, Any]:
+        """레지스트리 통계"""
+        with self._lock:
+            return {
+                'cached_clients': len(self._clients),
+                'client_keys': [list(key) for key in self._clients],
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+    def clear(self) -> None:
+        """캐시된 클라이언트와 연결 풀 정리 (테스트/설정 변경용)"""
+        with self._lock:
+            http_client = self._http_client
+            self._clients = {}
+            self._http_client = None
+            self._http_async_client = None
+            self._pid = None
+
+        if http_client is not None:
+            http_client.close()
+
+
+# 전역 레지스트리 인스턴스
+llm_registry = LLMClientRegistry()
+
+
+def get_chat_model(role: Optional[str] = None, **overrides) -> ChatOpenAI:
+    """
+    전역 레지스트리에서 ChatOpenAI 클라이언트 조회 (편의 함수)
+
+    Args:
+        role: 역할 이름 ('theory', 'quiz', 'feedback', 'qna', 'qna_analysis', 'qna_stream', 'intent')
+        **overrides: model, temperature, max_tokens, streaming 직접 지정
+
+    Returns:
+        ChatOpenAI: 재사용 가능한 클라이언트
+    """
+    return llm_registry.get_chat_model(role, **overrides)
@@ -0,0 +1,344 @@
+# backend/app/core/llm/fake_llm.py
+# 로컬 가짜 LLM (OpenAI 호출 없이 스키마에 맞는 응답 생성)
+
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+# 지원하는 지연 분포
+SUPPORTED_DISTRIBUTIONS = ('fixed', 'uniform', 'normal', 'lognormal')
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    응답 지연 분포 (밀리초)
+
+    - fixed:200            항상 200ms
+    - uniform:100:400      100~400ms 균등 분포
+    - normal:300:50        평균 300ms, 표준편차 50ms 정규 분포 (0 미만은 0)
+    - lognormal:300:0.5    중앙값 300ms, 로그 표준편차 0.5 로그정규 분포 (긴 꼬리 재현)
+    """
+    kind: str = 'fixed'
+    first: float = 0.0
+    second: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: Optional[str]) -> 'LatencyDistribution':
+        """'종류:값[:값]' 형식 문자열 파싱 (숫자만 있으면 fixed)"""
+        if not spec or not spec.strip():
+            return cls()
+
+        parts = spec.strip().lower().split(':')
+        if len(parts) == 1:
+            return cls('fixed', float(parts[0]))
+
+        kind = parts[0]
+        if kind not in SUPPORTED_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {kind} (지원: {', '.join(SUPPORTED_DISTRIBUTIONS)})")
+
+        values = [float(value) for value in parts[1:3]]
+        if kind != 'fixed' and len(values) < 2:
+            raise ValueError(f"{kind} 분포는 값 두 개가 필요합니다: {spec}")
+        return cls(kind, values[0], values[1] if len(values) > 1 else 0.0)
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """지연 시간 한 번 추출 (밀리초)"""
+        if self.kind == 'uniform':
+            return rng.uniform(self.first, self.second)
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(self.first, self.second))
+        if self.kind == 'lognormal':
+            # first는 중앙값이므로 로그 평균은 ln(first)
+            return rng.lognormvariate(0.0, self.second) * self.first
+        return self.first
+
+
+def _extract(pattern: str, text: str, default: str) -> str:
+    """프롬프트에서 첫 번째 그룹 추출"""
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else default
+
+
+def _split_tokens(text: str) -> List[str]:
+    """스트리밍용 토큰 분할 (공백을 앞 토큰에 붙여 원문 그대로 복원되도록)"""
+    return re.findall(r'\S+\s*|\s+', text)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    로컬 가짜 ChatModel
+
+    - OpenAI를 호출하지 않고 역할(role)별 응답 스키마에 맞는 응답을 반환
+      (theory/quiz/feedback 평가/intent/qna_analysis는 JSON, 나머지는 텍스트)
+    - 같은 프롬프트에는 항상 같은 응답을 반환 (프롬프트 해시 기반 결정적 생성)
+    - 응답 전 지연 분포에서 추출한 시간만큼 대기하고,
+      스트리밍 시에는 토큰마다 token_delay_ms씩 나누어 전송
+    - bind_tools()를 지원하지만 도구를 호출하지 않고 바로 최종 답변을 반환
+    - 응답마다 공백 단위로 추정한 토큰 사용량(usage_metadata)을 함께 반환
+
+    사전 생성 배치 작업이나 부하 테스트를 비용 없이 오프라인으로 실행할 때 사용합니다.
+    LLM_PROVIDER=fake로 설정하면 레지스트리가 ChatOpenAI 대신 이 모델을 반환합니다.
+    """
+
+    role: str = "default"
+    latency_spec: str = "fixed:0"
+    token_delay_ms: float = 0.0
+    seed: Optional[int] = None
+
+    _latency: LatencyDistribution = PrivateAttr(default_factory=LatencyDistribution)
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._latency = LatencyDistribution.parse(self.latency_spec)
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tutor"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"role": self.role, "latency_spec": self.latency_spec, "token_delay_ms": self.token_delay_ms}
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> 'FakeChatModel':
+        """도구 호출 Agent 호환용 (도구를 호출하지 않으므로 자기 자신 반환)"""
+        return self
+
+    # ----- 동기 -----
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Any = None,
+                  **kwargs: Any) -> ChatResult:
+        prompt_text = self._prompt_text(messages)
+        content = self.build_response(prompt_text)
+        time.sleep(self._sample_latency_seconds())
+        return self._to_result(content, prompt_text)
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Any = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        prompt_text = self._prompt_text(messages)
+        content = self.build_response(prompt_text)
+        time.sleep(self._sample_latency_seconds())
+
+        tokens = _split_tokens(content)
+        for index, token in enumerate(tokens):
+            chunk = self._to_chunk(token, prompt_text, content if index == len(tokens) - 1 else None)
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+            if self.token_delay_ms > 0:
+                time.sleep(self.token_delay_ms / 1000.0)
+
+    # ----- 비동기 (이벤트 루프를 막지 않도록 asyncio.sleep 사용) -----
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Any = None,
+                         **kwargs: Any) -> ChatResult:
+        prompt_text = self._prompt_text(messages)
+        content = self.build_response(prompt_text)
+        await asyncio.sleep(self._sample_latency_seconds())
+        return self._to_result(content, prompt_text)
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Any = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        prompt_text = self._prompt_text(messages)
+        content = self.build_response(prompt_text)
+        await asyncio.sleep(self._sample_latency_seconds())
+
+        tokens = _split_tokens(content)
+        for index, token in enumerate(tokens):
+            chunk = self._to_chunk(token, prompt_text, content if index == len(tokens) - 1 else None)
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+            if self.token_delay_ms > 0:
+                await asyncio.sleep(self.token_delay_ms / 1000.0)
+
+    # ----- 응답 생성 -----
+
+    @staticmethod
+    def _prompt_text(messages: List[BaseMessage]) -> str:
+        return "\n".join(str(message.content) for message in messages)
+
+    def _sample_latency_seconds(self) -> float:
+        return self._latency.sample_ms(self._rng) / 1000.0
+
+    @staticmethod
+    def _usage(prompt_text: str, content: str) -> Dict[str, int]:
+        """토큰 사용량 추정 (공백 단위 토큰 수, 실제 토크나이저와는 다름)"""
+        input_tokens = len(_split_tokens(prompt_text))
+        output_tokens = len(_split_tokens(content))
+        return {'input_tokens': input_tokens, 'output_tokens': output_tokens, 'total_tokens': input_tokens + output_tokens}
+
+    def _to_result(self, content: str, prompt_text: str) -> ChatResult:
+        message = AIMessage(content=content, usage_metadata=self._usage(prompt_text, content))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _to_chunk(self, token: str, prompt_text: str, full_content: Optional[str]) -> ChatGenerationChunk:
+        """스트리밍 청크 (마지막 청크에만 전체 사용량 포함)"""
+        usage = self._usage(prompt_text, full_content) if full_content is not None else None
+        return ChatGenerationChunk(message=AIMessageChunk(content=token, usage_metadata=usage))
+
+    def build_response(self, prompt_text: str) -> str:
+        """역할별 응답 본문 생성 (같은 프롬프트면 같은 응답)"""
+        seed = int(hashlib.sha256(prompt_text.encode('utf-8')).hexdigest()[:8], 16)
+        topic = _extract(r'주제:\s*"([^"]*)"', prompt_text, "학습 주제")
+
+        if self.role == 'theory':
+            return json.dumps(self._theory_payload(topic), ensure_ascii=False)
+        if self.role == 'quiz':
+            return json.dumps(self._quiz_payload(topic, prompt_text, seed), ensure_ascii=False)
+        if self.role == 'feedback':
+            if '"evaluation"' in prompt_text:
+                return json.dumps(self._evaluation_payload(seed), ensure_ascii=False)
+            return "정답을 잘 찾으셨어요! 👍 핵심 개념을 다시 한 번 정리해 보면 더 오래 기억할 수 있어요."
+        if self.role == 'intent':
+            return json.dumps(self._intent_payload(prompt_text), ensure_ascii=False)
+        if self.role == 'qna_analysis':
+            return json.dumps(self._qna_analysis_payload(prompt_text), ensure_ascii=False)
+
+        # qna, qna_stream 등 일반 텍스트 답변
+        # 스트리밍 프롬프트는 '사용자 질문' 구역, Agent 프롬프트는 마지막 사용자 메시지가 질문
+        last_line = prompt_text.strip().splitlines()[-1] if prompt_text.strip() else "질문"
+        question = _extract(r'=== 사용자 질문 ===\s*"?([^\n"]+)"?', prompt_text, last_line[:40])
+        return (
+            f"좋은 질문이에요! '{question}'에 대해 설명해 드릴게요. "
+            "AI는 많은 데이터를 바탕으로 패턴을 학습해서 답을 만들어 냅니다. "
+            "예를 들어 우리가 자주 쓰는 번역기나 추천 서비스도 이런 원리로 동작해요. "
+            "궁금한 점이 더 있으면 언제든 물어보세요."
+        )
+
+    def _theory_payload(self, topic: str) -> Dict[str, Any]:
+        """이론 설명 대본 스키마 응답"""
+        return {
+            "chapter_info": "📚 사전 생성 콘텐츠",
+            "title": f"{topic} 📘",
+            "sections": [
+                {"type": "introduction", "content": f"안녕하세요! 오늘은 '{topic}'에 대해 알아볼게요."},
+                {
+                    "type": "definition",
+                    "title": "핵심 개념 💡",
+                    "content": f"'{topic}'의 핵심 개념을 설명합니다.",
+                    "analogy": {
+                        "concept": topic,
+                        "comparison": "일상생활의 도구",
+                        "details": ["비유 세부사항 1", "비유 세부사항 2"]
+                    }
+                },
+                {
+                    "type": "examples",
+                    "title": "실생활 예시 🌟",
+                    "items": [
+                        {"category": "일상 📱", "description": f"'{topic}' 활용 예시", "benefit": "시간 절약"}
+                    ]
+                }
+            ]
+        }
+
+    def _quiz_payload(self, topic: str, prompt_text: str, seed: int) -> Dict[str, Any]:
+        """퀴즈 스키마 응답 (프롬프트에 주관식 형식만 있으면 주관식)"""
+        is_subjective = '"type": "subjective"' in prompt_text and '"type": "multiple_choice"' not in prompt_text
+
+        if is_subjective:
+            return {
+                "quiz": {
+                    "type": "subjective",
+                    "question": f"'{topic}'을(를) 활용하는 프롬프트를 작성해보세요.",
+                    "sample_answer": f"'{topic}'에 대해 초보자도 이해할 수 있게 설명해줘.",
+                    "evaluation_criteria": ["명확성", "구체성", "목적 적합성"],
+                    "hint": "원하는 결과와 대상을 구체적으로 적어보세요."
+                }
+            }
+
+        return {
+            "quiz": {
+                "type": "multiple_choice",
+                "question": f"다음 중 '{topic}'에 대한 설명으로 옳은 것은?",
+                "options": ["첫 번째 설명", "두 번째 설명", "세 번째 설명", "네 번째 설명"],
+                "correct_answer": seed % 4 + 1,
+                "explanation": f"'{topic}'의 핵심 개념에 해당하는 설명이 정답입니다.",
+                "hint": "이론 설명의 핵심 개념을 떠올려 보세요."
+            }
+        }
+
+    def _evaluation_payload(self, seed: int) -> Dict[str, Any]:
+        """주관식 평가 스키마 응답"""
+        score = 50 + seed % 51
+        return {
+            "evaluation": {
+                "score": score,
+                "criteria_analysis": {
+                    "명확성": "요청 내용이 분명합니다.",
+                    "구체성": "조건을 조금 더 구체화할 수 있습니다.",
+                    "목적 적합성": "문제의 목적에 맞게 작성되었습니다."
+                },
+                "scoring_rationale": "세 가지 기준을 종합하여 산정했습니다."
+            },
+            "feedback": {
+                "content": f"점수: {score}점 - 핵심을 잘 담았어요! 원하는 결과 형식을 함께 적으면 더 좋아요.",
+                "next_step_recommendation": "proceed" if score >= 60 else "retry"
+            }
+        }
+
+    def _intent_payload(self, prompt_text: str) -> Dict[str, Any]:
+        """의도 분석 스키마 응답 (물음표/의문사가 있으면 question)"""
+        message = _extract(r'메시지:\s*"([^"]*)"', prompt_text, "")
+        is_question = '?' in message or any(word in message for word in ("뭐", "왜", "어떻게", "언제", "무엇"))
+        return {
+            "intent": "question" if is_question else "next_step",
+            "confidence": 0.85,
+            "reasoning": "가짜 LLM 규칙 기반 분류"
+        }
+
+    def _qna_analysis_payload(self, prompt_text: str) -> Dict[str, Any]:
+        """QnA 검색 필요 여부 분석 스키마 응답"""
+        question = _extract(r'=== 사용자 질문 ===\s*"([^"]*)"', prompt_text, "")
+        needs_search = len(question) >= 6
+        return {
+            "decision": "VECTOR_SEARCH_NEEDED" if needs_search else "NO_SEARCH_NEEDED",
+            "search_queries": [question[:30]] if needs_search else [],
+            "reasoning": "가짜 LLM 규칙 기반 판단"
+        }
+
+
+def create_fake_chat_model(role: str) -> FakeChatModel:
+    """
+    환경변수 설정으로 역할별 가짜 모델 생성
+
+    환경변수:
+        FAKE_LLM_LATENCY: 기본 응답 지연 분포 (예: fixed:200, uniform:100:400, lognormal:300:0.5)
+        FAKE_LLM_<ROLE>_LATENCY: 역할별 지연 분포 (예: FAKE_LLM_QNA_STREAM_LATENCY=normal:400:80)
+        FAKE_LLM_TOKEN_DELAY_MS: 스트리밍 토큰 간 지연 (기본: 20)
+        FAKE_LLM_SEED: 지연 추출 난수 시드 (지정 시 실행마다 같은 지연 순서)
+    """
+    latency_spec = os.getenv(f'FAKE_LLM_{role.upper()}_LATENCY') or os.getenv('FAKE_LLM_LATENCY', 'fixed:0')
+    seed = os.getenv('FAKE_LLM_SEED')
+
+    return FakeChatModel(
+        role=role,
+        latency_spec=latency_spec,
+        token_delay_ms=float(os.getenv('FAKE_LLM_TOKEN_DELAY_MS', '20')),
+        seed=int(seed) if seed else None
+    )
@@ -0,0 +1,256 @@
+# backend/app/core/llm/generation_cache.py
+# 렌더링된 프롬프트 기반(content-addressed) LLM 생성 결과 캐시
+
+import os
+import copy
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.state_store import SQLiteStateStore
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
+from .llm_config import get_role_config
+from .client_registry import llm_registry
+
+
+def _default_sqlite_path() -> str:
+    """기본 디스크 캐시 경로 (backend/data/generation_cache.sqlite3)"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    return os.path.join(backend_dir, 'data', 'generation_cache.sqlite3')
+
+
+class GenerationCache:
+    """
+    LLM 생성 결과 캐시
+
+    - 키: LLM 제공자 + 역할 + 모델 파라미터(model, temperature, max_tokens) + 렌더링된 프롬프트 전문의 SHA-256
+      → 커리큘럼 자료나 프롬프트가 바뀌면 자동으로 다른 키가 되어 무효화 관리가 필요 없음
+    - 2단계 저장소: 프로세스 메모리 LRU → SQLite 디스크(워커/재시작 간 공유)
+    - 항목마다 TTL 적용 (변형이 추가되어도 최초 저장 시각 기준으로 만료)
+    - 변형 풀 모드(variants > 1): 키마다 최대 N개의 생성 결과를 모은 뒤 무작위로 하나를 반환하여
+      같은 섹션을 다시 학습해도 다양한 설명을 볼 수 있도록 함
+    - 생성 함수가 예외를 던지면 저장하지 않음 (폴백 응답은 캐시되지 않음)
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 ttl_seconds: float = 7 * 24 * 3600,
+                 max_memory_entries: int = 512,
+                 variants: int = 1,
+                 disk_path: Optional[str] = None):
+        """
+        Args:
+            enabled: 캐시 사용 여부 (False면 항상 생성 함수 실행)
+            ttl_seconds: 항목 만료 시간 (초)
+            max_memory_entries: 메모리 LRU 최대 항목 수
+            variants: 키마다 모을 변형 개수 (1이면 첫 결과를 계속 재사용)
+            disk_path: SQLite 디스크 캐시 경로 (None이면 디스크 계층 미사용)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.variants = max(1, variants)
+
+        # {key: entry}, entry = {'expires_at': float, 'variants': [value, ...]}
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._disk: Optional[SQLiteStateStore] = None
+        if enabled and disk_path:
+            try:
+                self._disk = SQLiteStateStore('generation_cache', ttl_seconds, disk_path)
+            except Exception as e:
+                self.logger.warning(f"생성 캐시 디스크 계층 초기화 실패, 메모리 캐시만 사용: {e}")
+
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'variant_fills': 0,
+            'stores': 0,
+            'evictions': 0,
+            'errors': 0
+        }
+
+    # ----- 키 -----
+
+    def make_key(self, role: str, prompt_text: str) -> str:
+        """역할 설정과 렌더링된 프롬프트로 캐시 키 생성"""
+        config = get_role_config(role)
+        material = json.dumps(
+            [llm_registry.provider, role, config.model, config.temperature, config.max_tokens, prompt_text],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    # ----- 조회/저장 -----
+
+    def get_or_generate(self,
+                        role: str,
+                        prompt_text: str,
+                        generate: Callable[[], Any],
+                        variants: Optional[int] = None) -> Any:
+        """
+        캐시된 생성 결과 반환 (없거나 변형 풀이 덜 찼으면 생성 후 저장)
+
+        Args:
+            role: LLM 역할 이름 (모델 파라미터 조회에 사용)
+            prompt_text: 모델에 전달될 렌더링된 프롬프트 전문
+            generate: 캐시 미스 시 실행할 생성 함수 (JSON 직렬화 가능한 값 반환)
+            variants: 이 호출에 적용할 변형 개수 (None이면 기본값)
+
+        Returns:
+            생성 결과 (호출자가 수정해도 캐시에 영향이 없도록 복사본 반환)
+        """
+        if not self.enabled:
+            return generate()
+
+        pool_size = max(1, variants or self.variants)
+        key = self.make_key(role, prompt_text)
+        entry, tier = self._lookup(key)
+
+        if entry is not None and len(entry['variants']) >= pool_size:
+            with self._lock:
+                self._stats[f'{tier}_hits'] += 1
+            workflow_tracer.record_cache('generation_cache', hit=True)
+            return copy.deepcopy(random.choice(entry['variants']))
+
+        workflow_tracer.record_cache('generation_cache', hit=False)
+        value = generate()
+
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+            else:
+                self._stats['variant_fills'] += 1
+
+        self._store(key, entry, value)
+        return copy.deepcopy(value)
+
+    def _lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """메모리 → 디스크 순서로 항목 조회 (항목, 조회된 계층 이름) 반환"""
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry['expires_at'] > now:
+                    self._memory.move_to_end(key)
+                    return entry, 'memory'
+                del self._memory[key]
+
+        if self._disk is None:
+            return None, None
+
+        try:
+            entry = self._disk.get(key)
+        except Exception as e:
+            self.logger.warning(f"생성 캐시 디스크 조회 실패: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return None, None
+
+        if entry is None or entry['expires_at'] <= now:
+            return None, None
+
+        with self._lock:
+            self._put_memory_locked(key, entry)
+        return entry, 'disk'
+
+    def _store(self, key: str, entry: Optional[Dict[str, Any]], value: Any) -> None:
+        """새 결과를 변형 풀에 추가하여 두 계층에 저장"""
+        now = time.time()
+        if entry is None:
+            new_entry = {'expires_at': now + self.ttl_seconds, 'variants': [value]}
+        else:
+            # 조회한 항목은 다른 스레드와 공유되므로 새 리스트로 교체
+            new_entry = {'expires_at': entry['expires_at'], 'variants': entry['variants'] + [value]}
+
+        with self._lock:
+            self._put_memory_locked(key, new_entry)
+            self._stats['stores'] += 1
+
+        if self._disk is not None:
+            try:
+                self._disk.set(key, new_entry, ttl=max(1.0, new_entry['expires_at'] - now))
+            except Exception as e:
+                self.logger.warning(f"생성 캐시 디스크 저장 실패: {e}")
+                with self._lock:
+                    self._stats['errors'] += 1
+
+    def _put_memory_locked(self, key: str, entry: Dict[str, Any]) -> None:
+        """메모리 LRU에 저장 (잠금 보유 상태에서 호출)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    # ----- 관리 -----
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (적중률 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses'] + stats['variant_fills']
+        hits = stats['memory_hits'] + stats['disk_hits']
+        stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['enabled'] = self.enabled
+        stats['disk_enabled'] = self._disk is not None
+        stats['variants'] = self.variants
+        stats['ttl_seconds'] = self.ttl_seconds
+        return stats
+
+    def clear(self, include_disk: bool = False) -> Tuple[int, int]:
+        """
+        캐시 비우기
+
+        Returns:
+            (메모리에서 삭제된 개수, 디스크에서 삭제된 개수)
+        """
+        with self._lock:
+            memory_removed = len(self._memory)
+            self._memory.clear()
+
+        disk_removed = 0
+        if include_disk and self._disk is not None:
+            disk_removed = self._disk.clear()
+        return memory_removed, disk_removed
+
+
+def create_generation_cache() -> GenerationCache:
+    """
+    환경변수 설정으로 생성 캐시 생성
+
+    환경변수:
+        GENERATION_CACHE_ENABLED: 캐시 사용 여부 (기본: true)
+        GENERATION_CACHE_TTL_SECONDS: 항목 만료 시간 (기본: 604800 = 7일)
+        GENERATION_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본: 512)
+        GENERATION_CACHE_VARIANTS: 키마다 모을 변형 개수 (기본: 1)
+        GENERATION_CACHE_DISK_ENABLED: SQLite 디스크 계층 사용 여부 (기본: false)
+        GENERATION_CACHE_SQLITE_PATH: 디스크 캐시 경로 (기본: backend/data/generation_cache.sqlite3)
+    """
+    disk_path = None
+    if env_bool('GENERATION_CACHE_DISK_ENABLED', False):
+        disk_path = os.getenv('GENERATION_CACHE_SQLITE_PATH') or _default_sqlite_path()
+
+    return GenerationCache(
+        enabled=env_bool('GENERATION_CACHE_ENABLED', True),
+        ttl_seconds=float(os.getenv('GENERATION_CACHE_TTL_SECONDS', str(7 * 24 * 3600))),
+        max_memory_entries=int(os.getenv('GENERATION_CACHE_MAX_ENTRIES', '512')),
+        variants=int(os.getenv('GENERATION_CACHE_VARIANTS', '1')),
+        disk_path=disk_path
+    )
+
+
+# 전역 생성 캐시 인스턴스
+generation_cache = create_generation_cache()
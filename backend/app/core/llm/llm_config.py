@@ -0,0 +1,92 @@
+# backend/app/core/llm/llm_config.py
+# 역할(role)별 LLM 설정
+
+import os
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class LLMRoleConfig:
+    """
+    LLM 클라이언트 설정
+
+    같은 설정이면 같은 클라이언트를 재사용하므로, 이 값 전체가 레지스트리의 캐시 키가 됩니다.
+    """
+    model: str
+    temperature: float
+    max_tokens: Optional[int] = None
+    streaming: bool = False
+
+    @property
+    def cache_key(self) -> tuple:
+        """클라이언트 캐시 키 (model, temperature, max_tokens, streaming)"""
+        return (self.model, self.temperature, self.max_tokens, self.streaming)
+
+
+def _default_model() -> str:
+    return os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+
+
+def _default_max_tokens(default: int = 4096) -> int:
+    return int(os.getenv('OPENAI_MAX_TOKENS', str(default)))
+
+
+def _build_default_role_configs() -> Dict[str, LLMRoleConfig]:
+    """기존 각 도구 모듈에 흩어져 있던 모델 설정을 역할별로 모음"""
+    return {
+        # 이론 설명 대본 생성
+        'theory': LLMRoleConfig(_default_model(), 0.3, _default_max_tokens(2048)),
+        # 퀴즈 생성
+        'quiz': LLMRoleConfig(_default_model(), 0.4, _default_max_tokens()),
+        # 주관식 평가 및 객관식 피드백 (평가의 일관성을 위해 낮은 온도)
+        'feedback': LLMRoleConfig(_default_model(), 0.3, _default_max_tokens()),
+        # QnA Agent (일관성 있는 답변이 중요)
+        'qna': LLMRoleConfig(_default_model(), 0.3, _default_max_tokens()),
+        # QnA 스트리밍 전 검색 필요 여부 분석 (일관된 분석을 위해 온도 0)
+        'qna_analysis': LLMRoleConfig(_default_model(), 0.0),
+        # QnA 답변 토큰 스트리밍
+        'qna_stream': LLMRoleConfig(_default_model(), 0.3, _default_max_tokens(), streaming=True),
+        # 사용자 의도 분석 (애매한 경우에만 호출)
+        'intent': LLMRoleConfig('gpt-4o-mini', 0.1),
+    }
+
+
+def _apply_env_overrides(role: str, config: LLMRoleConfig) -> LLMRoleConfig:
+    """
+    역할별 환경변수 오버라이드 적용
+
+    LLM_<ROLE>_MODEL, LLM_<ROLE>_TEMPERATURE, LLM_<ROLE>_MAX_TOKENS
+    (예: LLM_QUIZ_TEMPERATURE=0.5)
+    """
+    prefix = f"LLM_{role.upper()}_"
+    overrides = {}
+
+    if os.getenv(prefix + 'MODEL'):
+        overrides['model'] = os.getenv(prefix + 'MODEL')
+    if os.getenv(prefix + 'TEMPERATURE'):
+        overrides['temperature'] = float(os.getenv(prefix + 'TEMPERATURE'))
+    if os.getenv(prefix + 'MAX_TOKENS'):
+        overrides['max_tokens'] = int(os.getenv(prefix + 'MAX_TOKENS'))
+
+    return replace(config, **overrides) if overrides else config
+
+
+def get_role_config(role: str) -> LLMRoleConfig:
+    """
+    역할 이름으로 LLM 설정 조회
+
+    Args:
+        role: 역할 이름 ('theory', 'quiz', 'feedback', 'qna', 'qna_analysis', 'qna_stream', 'intent')
+
+    Returns:
+        LLMRoleConfig: 환경변수 오버라이드가 적용된 설정
+
+    Raises:
+        KeyError: 등록되지 않은 역할인 경우
+    """
+    role_configs = _build_default_role_configs()
+    if role not in role_configs:
+        raise KeyError(f"등록되지 않은 LLM 역할입니다: {role} (사용 가능: {', '.join(role_configs)})")
+
+    return _apply_env_overrides(role, role_configs[role])
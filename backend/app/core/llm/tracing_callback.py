@@ -0,0 +1,68 @@
+# backend/app/core/llm/tracing_callback.py
+# LLM 호출 구간 및 토큰 사용량 기록 콜백
+
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from app.utils.tracing import WorkflowTracer, Span, workflow_tracer
+
+
+def extract_token_usage(response: LLMResult) -> Tuple[int, int]:
+    """
+    LLM 응답에서 (prompt_tokens, completion_tokens) 추출
+
+    메시지의 usage_metadata(스트리밍 포함)를 우선 사용하고, 없으면 llm_output의 token_usage 사용
+    """
+    prompt_tokens = completion_tokens = 0
+    found = False
+
+    for generations in response.generations or []:
+        for generation in generations:
+            usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+            if usage:
+                prompt_tokens += usage.get('input_tokens', 0) or 0
+                completion_tokens += usage.get('output_tokens', 0) or 0
+                found = True
+
+    if not found:
+        token_usage = (response.llm_output or {}).get('token_usage') or {}
+        prompt_tokens = token_usage.get('prompt_tokens', 0) or 0
+        completion_tokens = token_usage.get('completion_tokens', 0) or 0
+
+    return prompt_tokens, completion_tokens
+
+
+class LLMTracingCallback(BaseCallbackHandler):
+    """
+    LLM 호출마다 'llm.{label}' 구간을 만들고 토큰 사용량을 기록하는 콜백
+
+    레지스트리가 클라이언트를 생성할 때 붙이므로 모든 체인/Agent 호출에 자동 적용됩니다.
+    시작/종료 콜백은 run_id로 짝을 맞추며, 시작 시점의 현재 구간(노드/도구) 아래에 기록됩니다.
+    """
+
+    # 동기 콜백을 호출 스레드에서 바로 실행 (시작 시점의 현재 구간을 그대로 사용)
+    run_inline = True
+
+    def __init__(self, label: str, tracer: Optional[WorkflowTracer] = None):
+        self.label = label
+        self.tracer = tracer or workflow_tracer
+        self._spans: Dict[UUID, Span] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        span = self.tracer.start_span(f"llm.{self.label}", 'llm')
+        if span is not None:
+            self._spans[run_id] = span
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        prompt_tokens, completion_tokens = extract_token_usage(response)
+        self.tracer.record_tokens(prompt_tokens, completion_tokens, span=span)
+        self.tracer.end_span(span)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self.tracer.end_span(self._spans.pop(run_id, None), error=str(error))
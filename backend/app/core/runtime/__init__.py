@@ -0,0 +1,30 @@
+# backend/app/core/runtime/__init__.py
+"""
+실행 환경 모듈
+동기 Flask 핸들러에서 비동기 코드를 실행하기 위한 워커당 백그라운드 이벤트 루프와
+벡터 검색 전용 스레드 풀을 제공합니다.
+"""
+
+from .event_loop import (
+    BackgroundEventLoop,
+    background_loop,
+    run_async,
+    submit_async,
+    iterate_async
+)
+from .retrieval_executor import (
+    RetrievalExecutor,
+    RetrievalExecutorSaturated,
+    retrieval_executor
+)
+
+__all__ = [
+    'BackgroundEventLoop',
+    'background_loop',
+    'run_async',
+    'submit_async',
+    'iterate_async',
+    'RetrievalExecutor',
+    'RetrievalExecutorSaturated',
+    'retrieval_executor'
+]
@@ -0,0 +1,205 @@
+# backend/app/core/runtime/event_loop.py
+# 워커 프로세스당 하나의 장기 실행 백그라운드 이벤트 루프
+
+import os
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from typing import AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class BackgroundEventLoop:
+    """
+    전용 스레드에서 계속 실행되는 asyncio 이벤트 루프
+
+    동기 Flask 핸들러가 요청마다 새 이벤트 루프를 만들고 닫으면, 루프에 묶인
+    비동기 HTTP 클라이언트(OpenAI 등)의 keep-alive 연결이 매번 버려집니다.
+    이 클래스는 워커 프로세스당 하나의 루프를 유지하고, 어느 스레드에서든
+    코루틴을 제출해 Future로 결과를 받을 수 있게 합니다.
+
+    gunicorn처럼 fork 후 워커가 시작되는 환경을 위해 프로세스 ID가 바뀌면 루프를 새로 만듭니다.
+
+    LangGraph 동기 노드는 루프의 기본 executor(run_in_executor(None))에서 실행되므로
+    max_workers가 워커 프로세스당 동시에 진행할 수 있는 턴 수의 상한이 됩니다.
+    asyncio 기본값(min(32, CPU 수 + 4))에 맡기지 않고 명시적으로 설정합니다.
+    """
+
+    def __init__(self, name: str = "background-event-loop", max_workers: int = 64):
+        """
+        Args:
+            name: 루프 스레드 이름
+            max_workers: 기본 executor 스레드 수 (동기 노드/블로킹 호출 동시 실행 상한)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """루프가 없거나 fork된 프로세스이면 루프 스레드 시작"""
+        loop = self._loop
+        if loop is not None and self._pid == os.getpid() and loop.is_running():
+            return loop
+
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid() and self._loop.is_running():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"{self.name}-executor"
+            )
+            loop.set_default_executor(executor)
+            started = threading.Event()
+
+            def _run_loop() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run_loop, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+
+            self._loop = loop
+            self._executor = executor
+            self._thread = thread
+            self._pid = os.getpid()
+
+            self.logger.info(f"백그라운드 이벤트 루프 시작 (pid={self._pid}, 기본 executor 스레드 {self.max_workers}개)")
+            return loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 이벤트 루프 (필요 시 시작)"""
+        return self._ensure_started()
+
+    def is_loop_thread(self) -> bool:
+        """현재 스레드가 이벤트 루프 스레드인지 여부"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        코루틴을 루프에 제출 (스레드 안전)
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            concurrent.futures.Future: 결과를 담을 Future
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        코루틴을 루프에서 실행하고 결과를 기다림 (동기 코드용)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 결과
+
+        Raises:
+            RuntimeError: 루프 스레드 안에서 호출한 경우 (교착 상태 방지)
+            concurrent.futures.TimeoutError: 시간 초과 시 (코루틴은 취소됨)
+        """
+        if self.is_loop_thread():
+            raise RuntimeError("이벤트 루프 스레드 안에서는 run()을 호출할 수 없습니다. await를 사용하세요.")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, async_iterable: AsyncIterator[T]) -> Iterator[T]:
+        """
+        비동기 이터레이터를 동기 제너레이터로 변환 (SSE 스트리밍용)
+
+        각 항목은 백그라운드 루프에서 가져오며, 소비자가 중간에 반복을 멈추면
+        (클라이언트 연결 종료 등) 비동기 제너레이터를 루프에서 정리합니다.
+
+        Args:
+            async_iterable: 비동기 이터레이터/제너레이터
+
+        Yields:
+            비동기 이터레이터의 각 항목
+        """
+        async_iterator = async_iterable.__aiter__()
+        finished = False
+
+        try:
+            while True:
+                try:
+                    item = self.run(async_iterator.__anext__())
+                except StopAsyncIteration:
+                    finished = True
+                    break
+                yield item
+        finally:
+            aclose = getattr(async_iterator, 'aclose', None)
+            if not finished and aclose is not None:
+                try:
+                    self.run(aclose())
+                except Exception as e:
+                    self.logger.warning(f"비동기 제너레이터 정리 중 오류: {e}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """루프 종료 (테스트/종료 처리용)"""
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = None
+            self._thread = None
+            self._executor = None
+            self._pid = None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if loop is None or not loop.is_running():
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        loop.close()
+        self.logger.info("백그라운드 이벤트 루프 종료")
+
+
+def create_background_loop() -> BackgroundEventLoop:
+    """
+    환경변수 설정으로 백그라운드 이벤트 루프 생성
+
+    환경변수:
+        BACKGROUND_LOOP_MAX_WORKERS: 기본 executor 스레드 수 (기본: 64)
+            LangGraph 동기 노드가 이 풀에서 실행되므로 워커 프로세스당 동시 진행 턴 수의 상한
+    """
+    return BackgroundEventLoop(max_workers=int(os.getenv('BACKGROUND_LOOP_MAX_WORKERS', '64')))
+
+
+# 워커 프로세스 공용 인스턴스
+background_loop = create_background_loop()
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """공용 백그라운드 루프에서 코루틴 실행 후 결과 반환"""
+    return background_loop.run(coro, timeout)
+
+
+def submit_async(coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+    """공용 백그라운드 루프에 코루틴 제출 후 Future 반환"""
+    return background_loop.submit(coro)
+
+
+def iterate_async(async_iterable: AsyncIterator[T]) -> Iterator[T]:
+    """공용 백그라운드 루프에서 비동기 이터레이터를 동기적으로 순회"""
+    return background_loop.iterate(async_iterable)
@@ -0,0 +1,237 @@
+# backend/app/core/runtime/retrieval_executor.py
+# 워커 프로세스당 하나의 벡터 검색 전용 스레드 풀 (대기열 상한 + 역압)
+
+import os
+import time
+import asyncio
+import logging
+import contextvars
+import threading
+import concurrent.futures
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+
+# 비동기 호출자가 빈 자리를 기다릴 때 확인 간격 (초)
+_ASYNC_POLL_INTERVAL = 0.005
+
+
+class RetrievalExecutorSaturated(RuntimeError):
+    """실행 중 + 대기 중 작업이 상한에 도달하여 작업을 받을 수 없음"""
+
+
+class RetrievalExecutor:
+    """
+    벡터 검색 전용 스레드 풀
+
+    요청마다 ThreadPoolExecutor를 만들거나 이벤트 루프의 기본 executor에 맡기면
+    QnA 요청이 몰릴 때 검색 스레드가 제한 없이 늘어납니다.
+    이 클래스는 워커 프로세스당 하나의 풀을 유지하고 동기/비동기 검색 경로가 함께 사용합니다.
+
+    - 동시에 받을 수 있는 작업 = max_workers(실행) + max_queue(대기)
+    - 가득 차면 제출자가 queue_timeout까지 빈 자리를 기다리고(역압), 그래도 없으면
+      RetrievalExecutorSaturated 발생 (호출자는 검색 생략 등으로 처리)
+    - gunicorn처럼 fork 후 워커가 시작되는 환경을 위해 프로세스 ID가 바뀌면 풀을 새로 만듦
+    """
+
+    def __init__(self,
+                 max_workers: int = 8,
+                 max_queue: int = 32,
+                 queue_timeout: float = 2.0,
+                 name: str = "retrieval"):
+        """
+        Args:
+            max_workers: 검색 스레드 수
+            max_queue: 실행을 기다릴 수 있는 최대 작업 수
+            queue_timeout: 가득 찼을 때 제출자가 빈 자리를 기다리는 최대 시간 (초)
+            name: 스레드 이름 접두사
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = max(0.0, queue_timeout)
+        self.name = name
+
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+
+        self._in_flight = 0
+        self._active = 0
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'try_rejected': 0,
+            'waited': 0,
+            'wait_ms_total': 0.0,
+            'peak_in_flight': 0,
+            'peak_queued': 0
+        }
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """풀이 없거나 fork된 프로세스이면 새로 생성"""
+        executor = self._executor
+        if executor is not None and self._pid == os.getpid():
+            return executor
+
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+                self._pid = os.getpid()
+                self.logger.info(f"검색 스레드 풀 시작 (pid={self._pid}, 스레드 {self.max_workers}개, 대기열 {self.max_queue}개)")
+            return self._executor
+
+    # ----- 제출 -----
+
+    def submit(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> "concurrent.futures.Future[T]":
+        """
+        작업 제출 (동기 코드용)
+
+        Args:
+            fn: 실행할 함수
+            *args: 함수 인자
+            timeout: 가득 찼을 때 기다릴 최대 시간 (None이면 queue_timeout, 0이면 기다리지 않음)
+
+        Returns:
+            concurrent.futures.Future: 결과를 담을 Future
+
+        Raises:
+            RetrievalExecutorSaturated: 시간 안에 빈 자리가 나지 않은 경우
+                (timeout=0으로 기다리지 않고 포기한 경우는 대기/거부가 아닌 try_rejected로 집계)
+        """
+        wait_seconds = self.queue_timeout if timeout is None else timeout
+        if not self._slots.acquire(blocking=False):
+            if wait_seconds <= 0:
+                self._record_try_rejected()
+                raise RetrievalExecutorSaturated(f"검색 스레드 풀 포화 (실행+대기 {self.max_workers + self.max_queue}개)")
+            started = time.perf_counter()
+            acquired = self._slots.acquire(timeout=wait_seconds)
+            self._record_wait(started, acquired)
+            if not acquired:
+                raise RetrievalExecutorSaturated(f"검색 스레드 풀 포화 (실행+대기 {self.max_workers + self.max_queue}개)")
+        return self._start(fn, args)
+
+    async def run_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        작업을 풀에서 실행하고 결과를 기다림 (비동기 코드용)
+
+        가득 찼을 때도 이벤트 루프를 막지 않도록 빈 자리를 비동기로 기다립니다.
+        호출자가 결과를 기다리므로 현재 컨텍스트(턴 추적 등)를 복사해 검색 구간이 같은 턴 아래에 기록됩니다.
+
+        Raises:
+            RetrievalExecutorSaturated: queue_timeout 안에 빈 자리가 나지 않은 경우
+        """
+        if not self._slots.acquire(blocking=False):
+            started = time.perf_counter()
+            deadline = started + self.queue_timeout
+            acquired = False
+            while not acquired and time.perf_counter() < deadline:
+                await asyncio.sleep(_ASYNC_POLL_INTERVAL)
+                acquired = self._slots.acquire(blocking=False)
+            self._record_wait(started, acquired)
+            if not acquired:
+                raise RetrievalExecutorSaturated(f"검색 스레드 풀 포화 (실행+대기 {self.max_workers + self.max_queue}개)")
+        context = contextvars.copy_context()
+        return await asyncio.wrap_future(self._start(context.run, (fn,) + args))
+
+    def _start(self, fn: Callable[..., T], args: tuple) -> "concurrent.futures.Future[T]":
+        """자리를 확보한 작업을 풀에 넣음 (완료 시 자리 반환)"""
+        with self._lock:
+            self._in_flight += 1
+            self._stats['submitted'] += 1
+            self._stats['peak_in_flight'] = max(self._stats['peak_in_flight'], self._in_flight)
+            self._stats['peak_queued'] = max(self._stats['peak_queued'], self._in_flight - self.max_workers)
+
+        try:
+            future = self._get_executor().submit(self._run, fn, args)
+        except Exception:
+            self._finish(failed=True)
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _run(self, fn: Callable[..., T], args: tuple) -> T:
+        with self._lock:
+            self._active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        self._finish(failed=future.cancelled() or future.exception() is not None)
+
+    def _finish(self, failed: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._stats['failed' if failed else 'completed'] += 1
+        self._slots.release()
+
+    def _record_wait(self, started: float, acquired: bool) -> None:
+        with self._lock:
+            self._stats['waited'] += 1
+            self._stats['wait_ms_total'] += (time.perf_counter() - started) * 1000
+            if not acquired:
+                self._stats['rejected'] += 1
+        if not acquired:
+            self.logger.warning("검색 스레드 풀 포화로 검색 작업 거부")
+
+    def _record_try_rejected(self) -> None:
+        with self._lock:
+            self._stats['try_rejected'] += 1
+        self.logger.debug("검색 스레드 풀에 빈 자리가 없어 선택적 검색 작업 생략")
+
+    # ----- 지표 -----
+
+    def get_stats(self) -> Dict[str, Any]:
+        """포화 지표 (실행/대기 중 작업 수, 대기·거부 횟수, 기다리지 않고 생략한 횟수, 최대 동시 작업 수)"""
+        with self._lock:
+            stats = dict(self._stats)
+            in_flight, active = self._in_flight, self._active
+
+        stats['wait_ms_total'] = round(stats['wait_ms_total'], 2)
+        stats.update({
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'queue_timeout': self.queue_timeout,
+            'active': active,
+            'queued': max(0, in_flight - active),
+            'utilization': round(active / self.max_workers, 4),
+            'saturation': round(in_flight / (self.max_workers + self.max_queue), 4)
+        })
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료 (테스트/종료 처리용)"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._pid = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def create_retrieval_executor() -> RetrievalExecutor:
+    """
+    환경변수 설정으로 검색 스레드 풀 생성
+
+    환경변수:
+        RETRIEVAL_EXECUTOR_MAX_WORKERS: 검색 스레드 수 (기본: 8)
+        RETRIEVAL_EXECUTOR_MAX_QUEUE: 대기 가능한 최대 작업 수 (기본: 32)
+        RETRIEVAL_EXECUTOR_QUEUE_TIMEOUT: 가득 찼을 때 제출자가 기다리는 최대 시간 (초, 기본: 2.0)
+    """
+    return RetrievalExecutor(
+        max_workers=int(os.getenv('RETRIEVAL_EXECUTOR_MAX_WORKERS', '8')),
+        max_queue=int(os.getenv('RETRIEVAL_EXECUTOR_MAX_QUEUE', '32')),
+        queue_timeout=float(os.getenv('RETRIEVAL_EXECUTOR_QUEUE_TIMEOUT', '2.0'))
+    )
+
+
+# 워커 프로세스 공용 인스턴스
+retrieval_executor = create_retrieval_executor()
@@ -0,0 +1,24 @@
+# backend/app/core/state_store/__init__.py
+"""
+세션 State 저장소 모듈
+사용자별 TutorState와 QnA 스트리밍 임시 세션을 TTL과 함께 저장합니다.
+SQLite/Redis 백엔드를 사용하면 여러 워커와 서버 재시작 사이에서 State가 공유됩니다.
+"""
+
+from .base_store import StateStore
+from .memory_store import MemoryStateStore
+from .sqlite_store import SQLiteStateStore
+from .redis_store import RedisStateStore
+from .serializer import dumps_state, loads_state
+from .store_factory import create_state_store, SUPPORTED_BACKENDS
+
+__all__ = [
+    'StateStore',
+    'MemoryStateStore',
+    'SQLiteStateStore',
+    'RedisStateStore',
+    'dumps_state',
+    'loads_state',
+    'create_state_store',
+    'SUPPORTED_BACKENDS'
+]
@@ -0,0 +1,68 @@
+# backend/app/core/state_store/base_store.py
+# 세션 State 저장소 인터페이스
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class StateStore(ABC):
+    """
+    세션 State 저장소 인터페이스
+
+    - 키는 네임스페이스 안에서 고유한 문자열
+    - 모든 값은 TTL을 가지며, 만료된 값은 조회되지 않음
+    - set()을 다시 호출하면 값과 함께 만료 시각도 갱신됨 (마지막 활동 기준 만료)
+
+    메모리 저장소는 프로세스 안에서만 공유되고,
+    SQLite/Redis 저장소는 여러 워커 프로세스와 재시작 사이에서 공유됩니다.
+    """
+
+    def __init__(self, namespace: str, default_ttl: float):
+        """
+        Args:
+            namespace: 저장소 구분 이름 (예: 'tutor_state', 'qna_stream')
+            default_ttl: 기본 만료 시간 (초)
+        """
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+
+    @property
+    def backend_name(self) -> str:
+        """저장소 백엔드 이름"""
+        return self.__class__.__name__
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl이 None이면 default_ttl 사용)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """값 삭제 (삭제된 값이 있었는지 반환)"""
+
+    @abstractmethod
+    def pop(self, key: str) -> Optional[Any]:
+        """값 조회 후 삭제 (한 번만 사용하는 값용)"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """만료되지 않은 값 개수"""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """만료된 값 정리 후 정리된 개수 반환"""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """네임스페이스의 모든 값 삭제 후 삭제된 개수 반환"""
+
+    def exists(self, key: str) -> bool:
+        """만료되지 않은 값 존재 여부"""
+        return self.get(key) is not None
+
+    def _resolve_ttl(self, ttl: Optional[float]) -> float:
+        """저장 시 사용할 TTL 결정"""
+        return self.default_ttl if ttl is None else ttl
@@ -0,0 +1,74 @@
+# backend/app/core/state_store/memory_store.py
+# 프로세스 메모리 기반 State 저장소
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .base_store import StateStore
+
+
+class MemoryStateStore(StateStore):
+    """
+    프로세스 메모리 기반 State 저장소
+
+    단일 워커 개발 환경용 기본 백엔드입니다.
+    값을 복사하지 않고 참조로 저장합니다. TutorState는 copy-on-write 규칙
+    (하위 리스트/딕셔너리를 제자리에서 수정하지 않음)으로 갱신되므로 저장된 값이 바뀌지 않습니다.
+    """
+
+    def __init__(self, namespace: str, default_ttl: float):
+        super().__init__(namespace, default_ttl)
+        # {key: (expires_at, value)}
+        self._items: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if time.time() > expires_at:
+                del self._items[key]
+                return None
+
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + self._resolve_ttl(ttl)
+
+        with self._lock:
+            self._items[key] = (expires_at, value)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._items.pop(key, None) is not None
+
+    def pop(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.pop(key, None)
+
+        if item is None or time.time() > item[0]:
+            return None
+        return item[1]
+
+    def count(self) -> int:
+        now = time.time()
+        with self._lock:
+            return sum(1 for expires_at, _ in self._items.values() if expires_at >= now)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired_keys = [key for key, (expires_at, _) in self._items.items() if expires_at < now]
+            for key in expired_keys:
+                del self._items[key]
+        return len(expired_keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._items)
+            self._items.clear()
+        return removed
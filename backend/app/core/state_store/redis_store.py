@@ -0,0 +1,83 @@
+# backend/app/core/state_store/redis_store.py
+# Redis 호환 서버 기반 공유 State 저장소
+
+import math
+import logging
+from typing import Any, Optional
+
+from .base_store import StateStore
+from .serializer import dumps_state, loads_state
+
+
+class RedisStateStore(StateStore):
+    """
+    Redis 호환 서버(Redis, Valkey, KeyDB 등) 기반 공유 State 저장소
+
+    여러 호스트의 워커가 State를 공유해야 할 때 사용합니다.
+    만료는 서버의 키 TTL(SET EX)로 처리하므로 purge_expired()는 할 일이 없습니다.
+
+    redis 패키지는 이 백엔드를 사용할 때만 필요합니다.
+    get/set/delete/getdel/scan_iter를 지원하는 클라이언트 객체를 직접 넘겨도 됩니다.
+    """
+
+    def __init__(self, namespace: str, default_ttl: float, url: Optional[str] = None, client: Any = None):
+        """
+        Args:
+            namespace: 저장소 구분 이름 (키 접두사로 사용)
+            default_ttl: 기본 만료 시간 (초)
+            url: 서버 URL (예: redis://localhost:6379/0)
+            client: 이미 생성된 Redis 호환 클라이언트 (url보다 우선)
+        """
+        super().__init__(namespace, default_ttl)
+        self.logger = logging.getLogger(__name__)
+
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("Redis State 저장소를 사용하려면 redis 패키지를 설치하세요: pip install redis")
+
+            client = redis.Redis.from_url(url or 'redis://localhost:6379/0')
+
+        self._client = client
+        self._key_prefix = f"ai_tutor:state:{namespace}:"
+
+        self.logger.info(f"Redis State 저장소 초기화 완료 (namespace={namespace})")
+
+    def _make_key(self, key: str) -> str:
+        """네임스페이스 접두사를 붙인 키"""
+        return self._key_prefix + key
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self._client.get(self._make_key(key))
+        if data is None:
+            return None
+        return loads_state(data)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        # SET EX는 정수 초 단위만 받으므로 올림 처리
+        expire_seconds = max(1, math.ceil(self._resolve_ttl(ttl)))
+        self._client.set(self._make_key(key), dumps_state(value), ex=expire_seconds)
+
+    def delete(self, key: str) -> bool:
+        return self._client.delete(self._make_key(key)) > 0
+
+    def pop(self, key: str) -> Optional[Any]:
+        # GETDEL로 조회와 삭제를 원자적으로 수행
+        data = self._client.getdel(self._make_key(key))
+        if data is None:
+            return None
+        return loads_state(data)
+
+    def count(self) -> int:
+        return sum(1 for _ in self._client.scan_iter(match=self._key_prefix + '*'))
+
+    def purge_expired(self) -> int:
+        # 서버가 TTL로 직접 만료 처리
+        return 0
+
+    def clear(self) -> int:
+        keys = list(self._client.scan_iter(match=self._key_prefix + '*'))
+        if not keys:
+            return 0
+        return self._client.delete(*keys)
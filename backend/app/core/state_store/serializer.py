@@ -0,0 +1,88 @@
+# backend/app/core/state_store/serializer.py
+# TutorState 등 세션 데이터의 압축 직렬화
+
+import json
+import zlib
+from datetime import datetime, date
+from typing import Any
+
+# 직렬화 형식 구분용 1바이트 헤더
+_PLAIN_HEADER = b'j'
+_COMPRESSED_HEADER = b'z'
+
+# 이 크기 이상일 때만 압축 (작은 데이터는 압축 이득보다 CPU 비용이 큼)
+COMPRESS_THRESHOLD_BYTES = 1024
+
+# datetime/date는 JSON 기본 타입이 아니므로 태그를 붙여 보존
+_DATETIME_TAG = '__dt__'
+_DATE_TAG = '__d__'
+
+
+def _encode_default(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 인코딩"""
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # 그 외 타입은 문자열로 저장 (복원 시 문자열로 남음)
+    return str(value)
+
+
+def _decode_hook(obj: dict) -> Any:
+    """태그가 붙은 값 복원"""
+    if len(obj) == 1:
+        if _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+        if _DATE_TAG in obj:
+            return date.fromisoformat(obj[_DATE_TAG])
+    return obj
+
+
+def dumps_state(value: Any) -> bytes:
+    """
+    세션 데이터를 압축 바이트로 직렬화
+
+    공백 없는 JSON으로 인코딩한 뒤 일정 크기 이상이면 zlib으로 압축합니다.
+    대화 기록이 누적된 TutorState는 보통 원본 대비 크게 줄어듭니다.
+
+    Args:
+        value: 직렬화할 값 (dict, list, 기본 타입, datetime 포함 가능)
+
+    Returns:
+        bytes: 헤더 1바이트 + 본문
+    """
+    payload = json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=_encode_default
+    ).encode('utf-8')
+
+    if len(payload) >= COMPRESS_THRESHOLD_BYTES:
+        return _COMPRESSED_HEADER + zlib.compress(payload, 6)
+    return _PLAIN_HEADER + payload
+
+
+def loads_state(data: bytes) -> Any:
+    """
+    dumps_state()로 직렬화한 바이트 복원
+
+    Args:
+        data: 직렬화된 바이트
+
+    Returns:
+        Any: 복원된 값
+
+    Raises:
+        ValueError: 알 수 없는 형식인 경우
+    """
+    header, body = data[:1], data[1:]
+
+    if header == _COMPRESSED_HEADER:
+        body = zlib.decompress(body)
+    elif header != _PLAIN_HEADER:
+        raise ValueError(f"알 수 없는 State 직렬화 형식입니다: {header!r}")
+
+    return json.loads(body.decode('utf-8'), object_hook=_decode_hook)
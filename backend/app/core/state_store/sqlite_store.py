@@ -0,0 +1,136 @@
+# backend/app/core/state_store/sqlite_store.py
+# SQLite 파일 기반 공유 State 저장소
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Any, Optional
+
+from .base_store import StateStore
+from .serializer import dumps_state, loads_state
+
+
+class SQLiteStateStore(StateStore):
+    """
+    SQLite 파일 기반 공유 State 저장소
+
+    같은 호스트의 여러 gunicorn 워커가 하나의 DB 파일을 공유하고,
+    서버를 재시작해도 만료 전 State가 유지됩니다.
+    WAL 모드로 열어 읽기와 쓰기가 서로를 막지 않도록 합니다.
+    """
+
+    def __init__(self, namespace: str, default_ttl: float, db_path: str, busy_timeout: float = 5.0):
+        """
+        Args:
+            namespace: 저장소 구분 이름
+            default_ttl: 기본 만료 시간 (초)
+            db_path: SQLite 파일 경로
+            busy_timeout: 다른 프로세스가 쓰기 잠금을 잡고 있을 때 대기할 시간 (초)
+        """
+        super().__init__(namespace, default_ttl)
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드별로 생성
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        connection = self._get_connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state_store (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_state_store_expires ON state_store (expires_at)")
+
+        self.logger.info(f"SQLite State 저장소 초기화 완료: {db_path} (namespace={namespace})")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결 반환 (없으면 생성)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # isolation_level=None: 자동 커밋, 필요한 곳에서만 명시적으로 트랜잭션 시작
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._get_connection().execute(
+            "SELECT value FROM state_store WHERE namespace = ? AND key = ? AND expires_at >= ?",
+            (self.namespace, key, time.time())
+        ).fetchone()
+
+        if row is None:
+            return None
+        return loads_state(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + self._resolve_ttl(ttl)
+        self._get_connection().execute(
+            "INSERT OR REPLACE INTO state_store (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (self.namespace, key, sqlite3.Binary(dumps_state(value)), expires_at)
+        )
+
+    def delete(self, key: str) -> bool:
+        cursor = self._get_connection().execute(
+            "DELETE FROM state_store WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        )
+        return cursor.rowcount > 0
+
+    def pop(self, key: str) -> Optional[Any]:
+        connection = self._get_connection()
+        # 조회와 삭제 사이에 다른 워커가 같은 값을 가져가지 못하도록 쓰기 잠금을 먼저 획득
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT value, expires_at FROM state_store WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "DELETE FROM state_store WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        if row is None or time.time() > row[1]:
+            return None
+        return loads_state(row[0])
+
+    def count(self) -> int:
+        row = self._get_connection().execute(
+            "SELECT COUNT(*) FROM state_store WHERE namespace = ? AND expires_at >= ?",
+            (self.namespace, time.time())
+        ).fetchone()
+        return row[0]
+
+    def purge_expired(self) -> int:
+        cursor = self._get_connection().execute(
+            "DELETE FROM state_store WHERE namespace = ? AND expires_at < ?",
+            (self.namespace, time.time())
+        )
+        return cursor.rowcount
+
+    def clear(self) -> int:
+        cursor = self._get_connection().execute(
+            "DELETE FROM state_store WHERE namespace = ?",
+            (self.namespace,)
+        )
+        return cursor.rowcount
@@ -0,0 +1,58 @@
+# backend/app/core/state_store/store_factory.py
+# 환경변수 설정에 따른 State 저장소 생성
+
+import os
+import logging
+from typing import Optional
+
+from .base_store import StateStore
+from .memory_store import MemoryStateStore
+from .sqlite_store import SQLiteStateStore
+from .redis_store import RedisStateStore
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 백엔드 이름
+SUPPORTED_BACKENDS = ('memory', 'sqlite', 'redis')
+
+
+def _default_sqlite_path() -> str:
+    """기본 SQLite 파일 경로 (backend/data/state_store.sqlite3)"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    return os.path.join(backend_dir, 'data', 'state_store.sqlite3')
+
+
+def create_state_store(namespace: str, default_ttl: float, backend: Optional[str] = None) -> StateStore:
+    """
+    State 저장소 생성
+
+    환경변수:
+        STATE_STORE_BACKEND: memory(기본) / sqlite / redis
+        STATE_STORE_SQLITE_PATH: SQLite 파일 경로 (기본: backend/data/state_store.sqlite3)
+        STATE_STORE_REDIS_URL: Redis 호환 서버 URL (기본: redis://localhost:6379/0)
+
+    Args:
+        namespace: 저장소 구분 이름
+        default_ttl: 기본 만료 시간 (초)
+        backend: 백엔드 이름 (None이면 STATE_STORE_BACKEND 사용)
+
+    Returns:
+        StateStore: 생성된 저장소
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    backend = (backend or os.getenv('STATE_STORE_BACKEND', 'memory')).strip().lower()
+
+    if backend == 'memory':
+        store = MemoryStateStore(namespace, default_ttl)
+    elif backend == 'sqlite':
+        db_path = os.getenv('STATE_STORE_SQLITE_PATH') or _default_sqlite_path()
+        store = SQLiteStateStore(namespace, default_ttl, db_path)
+    elif backend == 'redis':
+        store = RedisStateStore(namespace, default_ttl, url=os.getenv('STATE_STORE_REDIS_URL'))
+    else:
+        raise ValueError(f"지원하지 않는 State 저장소 백엔드입니다: {backend} (지원: {', '.join(SUPPORTED_BACKENDS)})")
+
+    logger.info(f"State 저장소 생성: {namespace} → {store.backend_name} (TTL {default_ttl}초)")
+    return store
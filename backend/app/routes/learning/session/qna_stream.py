@@ -1,24 +1,35 @@
 # backend/app/routes/learning/session/qna_stream.py
 
 from flask import Blueprint, request, Response, jsonify
-import asyncio
 import json
 import logging
 import uuid
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.utils.auth.jwt_handler import require_auth, get_current_user_from_request
 from app.utils.response.error_formatter import ErrorFormatter
 from app.tools.content.qna_tools_chatgpt_stream import qna_streaming_generation_tool
+from app.core.state_store import create_state_store
+from app.core.runtime import iterate_async
 
 # Blueprint 설정
 qna_stream_bp = Blueprint('qna_stream', __name__)
 logger = logging.getLogger(__name__)
 
-# 임시 스트리밍 세션 저장소
-# NOTE: 프로덕션 환경에서는 동시성 및 확장성을 위해 Redis 같은 외부 저장소 사용을 권장합니다.
-streaming_sessions: Dict[str, Dict[str, Any]] = {}
+# 스트리밍 세션 기본 만료 시간 (초)
+STREAMING_SESSION_TTL_SECONDS = 30
+
+# 임시 스트리밍 세션 저장소 (STATE_STORE_BACKEND 설정에 따라 메모리/SQLite/Redis)
+# 준비 요청과 스트리밍 요청이 서로 다른 워커로 가도 공유 백엔드에서 조회 가능
+streaming_session_store = create_state_store('qna_stream', STREAMING_SESSION_TTL_SECONDS)
+
+
+# --- 스트리밍 세션 저장 (LearningSupervisor에서 호출) ---
+def save_streaming_session(temp_id: str, session_data: Dict[str, Any]) -> None:
+    """스트리밍 세션 저장 (session_data의 expires_at까지 유지)"""
+    ttl = max(session_data.get("expires_at", 0) - time.time(), 0) or STREAMING_SESSION_TTL_SECONDS
+    streaming_session_store.set(temp_id, session_data, ttl=ttl)
 
 
 # --- 스트리밍 실행 엔드포인트 (URL 단순화) ---
@@ -36,13 +47,13 @@ def stream_qna_response(temp_id: str):
         print(f"[QnA 스트리밍-실행] 연결 요청 수신 - ID: {temp_id}")
         
         # 1. 임시 세션 정보 조회 및 검증
-        temp_session_data = streaming_sessions.get(temp_id)
+        # 보안을 위해 한 번 사용한 세션은 조회와 동시에 제거 (같은 ID로 동시에 요청해도 한 번만 스트리밍)
+        temp_session_data = streaming_session_store.pop(temp_id)
 
         if not temp_session_data:
             return Response(_create_error_sse("INVALID_SESSION", "유효하지 않은 스트리밍 세션입니다."), mimetype='text/event-stream')
         
         if time.time() > temp_session_data["expires_at"]:
-            streaming_sessions.pop(temp_id, None) # 만료된 세션 정리
             return Response(_create_error_sse("SESSION_EXPIRED", "스트리밍 세션이 만료되었습니다."), mimetype='text/event-stream')
 
         # 2. QnA Resolver Agent 초기화 및 스트리밍 시작 State 관리
@@ -57,18 +68,16 @@ def stream_qna_response(temp_id: str):
         
         print(f"[QnA 스트리밍] QnA Agent State 초기화 완료")
 
-        # 3. 보안을 위해 한 번 사용한 세션은 즉시 제거 (State 관리 완료 후)
-        streaming_sessions.pop(temp_id, None)
-
-        # 4. 세션에서 정보 추출
+        # 3. 세션에서 정보 추출
         user_message = temp_session_data["user_message"]
         current_context = temp_session_data["context"]
+        prefetched_context = temp_session_data.get("prefetched_context")
         
         print(f"[QnA 스트리밍-실행] 세션 검증 완료, 스트리밍 시작. 질문: '{user_message[:30]}...'")
 
-        # 5. SSE 스트리밍 응답 생성 (State 관리 통합)
+        # 4. SSE 스트리밍 응답 생성 (State 관리 통합)
         return Response(
-            _generate_sse_stream_with_state_management(user_message, current_context, temp_id, qna_agent, temp_session_data),
+            _generate_sse_stream_with_state_management(user_message, current_context, temp_id, qna_agent, temp_session_data, prefetched_context),
             mimetype='text/event-stream',
             headers={
                 'Cache-Control': 'no-cache',
@@ -92,32 +101,28 @@ def stream_qna_response(temp_id: str):
 
 
 # --- State 관리가 통합된 스트리밍 Generator ---
-def _generate_sse_stream_with_state_management(user_message: str, current_context: Dict[str, Any], session_id: str, qna_agent, temp_session_data: Dict[str, Any]):
+def _generate_sse_stream_with_state_management(user_message: str, current_context: Dict[str, Any], session_id: str, qna_agent, temp_session_data: Dict[str, Any], prefetched_context: Optional[Dict[str, Any]] = None):
     """
     State 관리가 통합된 SSE 스트리밍 Generator
     - 스트리밍 완료 후 QnA Agent를 통해 최종 State 업데이트
+    - 의도 분석 중 미리 검색한 자료가 있으면 분석 단계 없이 바로 답변 스트리밍
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     chunk_count = 0
     accumulated_response = ""  # 완성된 답변 누적용
 
     try:
         yield _format_sse_data({ "type": "stream_start", "message": "QnA 답변 생성을 시작합니다...", "session_id": session_id })
         
-        stream_generator = qna_streaming_generation_tool(user_message, current_context)
-        agen = stream_generator.__aiter__()
+        stream_generator = qna_streaming_generation_tool(user_message, current_context, prefetched_context)
 
-        while True:
-            try:
-                chunk = loop.run_until_complete(agen.__anext__())
-                if chunk.strip():
-                    chunk_count += 1
-                    accumulated_response += chunk  # 답변 누적
-                    yield _format_sse_data({ "type": "content_chunk", "chunk": chunk, "chunk_id": chunk_count })
-            except StopAsyncIteration:
-                print(f"[QnA 스트리밍] 스트림 완료. 총 {chunk_count}개 청크 전송.")
-                break
+        # 워커 공용 백그라운드 이벤트 루프에서 청크를 하나씩 받아옴
+        for chunk in iterate_async(stream_generator):
+            if chunk.strip():
+                chunk_count += 1
+                accumulated_response += chunk  # 답변 누적
+                yield _format_sse_data({ "type": "content_chunk", "chunk": chunk, "chunk_id": chunk_count })
+
+        print(f"[QnA 스트리밍] 스트림 완료. 총 {chunk_count}개 청크 전송.")
     
     except Exception as e:
         print(f"[QnA 스트리밍] _generate_sse_stream 오류: {str(e)}")
@@ -143,9 +148,7 @@ def _generate_sse_stream_with_state_management(user_message: str, current_contex
         # 스트리밍 완료 신호
         yield _format_sse_data({ "type": "stream_complete", "message": "QnA 답변이 완성되었습니다.", "total_chunks": chunk_count })
         
-        # 이벤트 루프 정리
-        loop.close()
-        print(f"[QnA 스트리밍] 이벤트 루프 종료 및 SSE 스트림 최종 완료.")
+        print(f"[QnA 스트리밍] SSE 스트림 최종 완료.")
 
 
 def _format_sse_data(data: Dict[str, Any]) -> str:
@@ -163,37 +166,20 @@ def _create_error_sse(error_code: str, error_message: str) -> str:
 # --- 개발/디버깅용 헬퍼 함수들 ---
 def get_active_streaming_sessions_count():
     """현재 활성 스트리밍 세션 수 반환 (디버깅용)"""
-    current_time = time.time()
-    active_count = 0
-    expired_sessions = []
-    
-    for session_id, session_data in streaming_sessions.items():
-        if current_time <= session_data.get("expires_at", 0):
-            active_count += 1
-        else:
-            expired_sessions.append(session_id)
-    
     # 만료된 세션 정리
-    for expired_id in expired_sessions:
-        streaming_sessions.pop(expired_id, None)
+    cleaned_expired = streaming_session_store.purge_expired()
+    active_count = streaming_session_store.count()
     
     return {
         "active_sessions": active_count,
-        "cleaned_expired": len(expired_sessions),
-        "total_sessions": len(streaming_sessions)
+        "cleaned_expired": cleaned_expired,
+        "total_sessions": active_count
     }
 
 
 def cleanup_expired_sessions():
     """만료된 세션들을 정리하는 유틸리티 함수 (선택적 호출)"""
-    current_time = time.time()
-    expired_sessions = [
-        session_id for session_id, session_data in streaming_sessions.items()
-        if current_time > session_data.get("expires_at", 0)
-    ]
-    
-    for expired_id in expired_sessions:
-        streaming_sessions.pop(expired_id, None)
+    cleaned_count = streaming_session_store.purge_expired()
     
-    print(f"[QnA 스트리밍] 만료된 세션 {len(expired_sessions)}개 정리 완료")
-    return len(expired_sessions)
\ No newline at end of file
+    print(f"[QnA 스트리밍] 만료된 세션 {cleaned_count}개 정리 완료")
+    return cleaned_count
@@ -3,9 +3,11 @@
 
 from .health import health_bp
 from .version import version_bp
+from .metrics import metrics_bp
 
 # 시스템 관련 Blueprint 목록 (diagnosis와 동일한 형식)
 system_blueprints = [
     (health_bp, '/api/v1/system'),
-    (version_bp, '/api/v1/system')
+    (version_bp, '/api/v1/system'),
+    (metrics_bp, '/api/v1/system')
 ]
\ No newline at end of file
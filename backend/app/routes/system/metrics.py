@@ -0,0 +1,75 @@
+# backend/app/routes/system/metrics.py
+# 워크플로우 성능 지표 관련 라우트
+
+from flask import Blueprint, request
+
+from app.utils.auth.jwt_handler import require_auth
+from app.utils.response.formatter import success_response
+from app.utils.tracing import workflow_tracer
+
+# 성능 지표 Blueprint 생성
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics')
+@require_auth
+def get_metrics():
+    """성능 지표 엔드포인트
+
+    Returns:
+        dict: 구간(노드/도구/LLM/DB)별 소요 시간 통계, 토큰 사용량, 캐시 통계, 로컬 의도 분류기/QnA 추측 검색 통계, 검색 스레드 풀 포화 지표
+    """
+    from app.core.langraph.workflow import workflow_executor
+    from app.core.llm import llm_registry, chain_cache, generation_cache
+    from app.core.runtime import retrieval_executor
+    from app.core.external.section_chunk_index import section_chunk_index
+    from app.core.external.numpy_vector_index import numpy_vector_index
+    from app.core.external.keyword_index import keyword_index
+    from app.tools.external.query_embedding_cache import query_embedding_cache
+    from app.tools.analysis.intent_classifier import intent_classifier
+    from app.tools.analysis.intent_cache import intent_cache
+    from app.tools.content.qna_speculative_retrieval import speculative_retrieval
+
+    return success_response(
+        data={
+            "tracing": workflow_tracer.get_summary(),
+            "workflow": workflow_executor.get_execution_stats(),
+            "caches": {
+                "generation_cache": generation_cache.get_stats(),
+                "chain_cache": chain_cache.get_stats(),
+                "llm_clients": llm_registry.get_stats(),
+                "intent_cache": intent_cache.get_stats(),
+                "section_chunk_index": section_chunk_index.get_stats(),
+                "numpy_vector_index": numpy_vector_index.get_stats(),
+                "keyword_index": keyword_index.get_stats(),
+                "query_embedding_cache": query_embedding_cache.get_stats()
+            },
+            "intent_classifier": intent_classifier.get_stats() if intent_classifier is not None else {"loaded": False},
+            "qna_speculation": speculative_retrieval.get_stats(),
+            "retrieval_executor": retrieval_executor.get_stats()
+        },
+        message="성능 지표를 성공적으로 조회했습니다."
+    )
+
+
+@metrics_bp.route('/metrics/traces')
+@require_auth
+def get_traces():
+    """최근 워크플로우 추적 엔드포인트
+
+    Query Parameters:
+        limit: 반환할 추적 수 (기본: 20, 최대: 100)
+        order: recent(최신 순, 기본) 또는 slowest(느린 순)
+
+    Returns:
+        dict: 노드 → 도구 → LLM/DB 구간이 중첩된 추적 목록 (사용자 ID/의도와 오류 원문은 제거됨)
+    """
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    slowest = request.args.get('order', 'recent') == 'slowest'
+
+    return success_response(
+        data={
+            "traces": workflow_tracer.get_recent_traces(limit=limit, slowest=slowest)
+        },
+        message="워크플로우 추적을 성공적으로 조회했습니다."
+    )
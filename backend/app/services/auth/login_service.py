@@ -3,11 +3,26 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from app.utils.database.connection import fetch_one, execute_query
+from app.utils.database.connection import execute_query
+from app.utils.database.statements import register_statement, fetch_one_statement
 from app.utils.auth.password_handler import verify_password
 from app.utils.auth.jwt_handler import generate_access_token, generate_refresh_token
 from app.utils.common.exceptions import ValidationError, AuthenticationError
 
+# 로그인마다 실행되는 사용자 조회 쿼리 (등록 시 한 번만 파싱)
+AUTHENTICATE_USER_STATEMENT = register_statement(
+    'auth.authenticate_user',
+    """
+    SELECT 
+        u.user_id, u.login_id, u.username, u.email,
+        u.password_hash, u.user_type, u.diagnosis_completed,
+        up.current_chapter, up.current_section
+    FROM users u
+    LEFT JOIN user_progress up ON u.user_id = up.user_id
+    WHERE u.login_id = %s
+    """
+)
+
 
 class LoginService:
     """로그인 관련 비즈니스 로직을 처리하는 서비스"""
@@ -54,18 +69,7 @@ class LoginService:
             dict | None: 인증된 사용자 정보 또는 None
         """
         # 사용자 정보 조회 (진행 상태 포함)
-        user_data = fetch_one(
-            """
-            SELECT 
-                u.user_id, u.login_id, u.username, u.email,
-                u.password_hash, u.user_type, u.diagnosis_completed,
-                up.current_chapter, up.current_section
-            FROM users u
-            LEFT JOIN user_progress up ON u.user_id = up.user_id
-            WHERE u.login_id = %s
-            """,
-            (login_id,)
-        )
+        user_data = fetch_one_statement(AUTHENTICATE_USER_STATEMENT, (login_id,))
 
         if not user_data:
             return None
@@ -4,12 +4,28 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 from app.utils.database.connection import fetch_one, execute_query
+from app.utils.database.statements import register_statement, fetch_one_statement
 from app.utils.auth.jwt_handler import (
     decode_token, generate_access_token, generate_refresh_token,
     extract_user_from_token
 )
 from app.utils.common.exceptions import AuthenticationError
 
+# 토큰 갱신마다 실행되는 조회 쿼리 (등록 시 한 번만 파싱)
+VALIDATE_REFRESH_TOKEN_STATEMENT = register_statement(
+    'auth.validate_refresh_token',
+    """
+    SELECT 
+        uat.token_id, uat.user_id, uat.expires_at, uat.is_active,
+        u.login_id, u.username, u.user_type, u.diagnosis_completed,
+        up.current_chapter, up.current_section
+    FROM user_auth_tokens uat
+    JOIN users u ON uat.user_id = u.user_id
+    LEFT JOIN user_progress up ON u.user_id = up.user_id
+    WHERE uat.refresh_token = %s AND uat.is_active = TRUE
+    """
+)
+
 
 class TokenService:
     """토큰 관리 관련 비즈니스 로직을 처리하는 서비스"""
@@ -35,19 +51,7 @@ class TokenService:
             return None
         
         # 데이터베이스에서 토큰 유효성 확인
-        token_data = fetch_one(
-            """
-            SELECT 
-                uat.token_id, uat.user_id, uat.expires_at, uat.is_active,
-                u.login_id, u.username, u.user_type, u.diagnosis_completed,
-                up.current_chapter, up.current_section
-            FROM user_auth_tokens uat
-            JOIN users u ON uat.user_id = u.user_id
-            LEFT JOIN user_progress up ON u.user_id = up.user_id
-            WHERE uat.refresh_token = %s AND uat.is_active = TRUE
-            """,
-            (refresh_token,)
-        )
+        token_data = fetch_one_statement(VALIDATE_REFRESH_TOKEN_STATEMENT, (refresh_token,))
         
         if not token_data:
             return None
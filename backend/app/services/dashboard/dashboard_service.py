@@ -10,8 +10,9 @@ import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from app.utils.database.connection import fetch_one, fetch_all
+from app.utils.database.connection import fetch_all
 from app.utils.database.query_builder import QueryBuilder
+from app.utils.database.statements import register_statement, fetch_one_statement
 from app.utils.response.formatter import success_response, error_response
 from app.utils.response.error_formatter import ErrorFormatter
 from app.config.db_config import DatabaseQueryError
@@ -19,6 +20,29 @@ from app.config.db_config import DatabaseQueryError
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 대시보드 진입마다 실행되는 조회 쿼리 (등록 시 한 번만 파싱)
+USER_PROGRESS_STATEMENT = register_statement(
+    'dashboard.user_progress',
+    """
+    SELECT current_chapter, current_section, last_study_date
+    FROM user_progress
+    WHERE user_id = %s
+    """
+)
+
+LEARNING_STATISTICS_STATEMENT = register_statement(
+    'dashboard.learning_statistics',
+    """
+    SELECT 
+        total_study_time_seconds, total_study_sessions,
+        multiple_choice_accuracy, subjective_average_score,
+        total_multiple_choice_count, total_subjective_count,
+        last_study_date
+    FROM user_statistics
+    WHERE user_id = %s
+    """
+)
+
 
 class DashboardService:
     """대시보드 관련 비즈니스 로직을 처리하는 서비스 클래스"""
@@ -105,19 +129,7 @@ class DashboardService:
         Returns:
             Optional[Dict[str, Any]]: 사용자 진행 상태 데이터
         """
-        query_builder = QueryBuilder()
-        query, params = (query_builder
-                        .select([
-                            'current_chapter',
-                            'current_section', 
-                            'last_study_date'
-                        ])
-                        .from_table('user_progress')
-                        .where('user_id = %s', [user_id])
-                        .build())
-        
-        result = fetch_one(query, params)
-        return result
+        return fetch_one_statement(USER_PROGRESS_STATEMENT, (user_id,))
     
     @staticmethod
     def _get_learning_statistics(user_id: int) -> Optional[Dict[str, Any]]:
@@ -130,23 +142,7 @@ class DashboardService:
         Returns:
             Optional[Dict[str, Any]]: 학습 통계 데이터
         """
-        query_builder = QueryBuilder()
-        query, params = (query_builder
-                        .select([
-                            'total_study_time_seconds',
-                            'total_study_sessions',
-                            'multiple_choice_accuracy',
-                            'subjective_average_score',
-                            'total_multiple_choice_count',
-                            'total_subjective_count',
-                            'last_study_date'
-                        ])
-                        .from_table('user_statistics')
-                        .where('user_id = %s', [user_id])
-                        .build())
-        
-        result = fetch_one(query, params)
-        return result
+        return fetch_one_statement(LEARNING_STATISTICS_STATEMENT, (user_id,))
     
     @staticmethod
     def _get_completed_sessions(user_id: int) -> List[Dict[str, Any]]:
@@ -11,12 +11,12 @@ SessionService v2.4 - 학습 세션 서비스
 
 from typing import Dict, Any, Optional
 from datetime import datetime
-import copy
 import json
 import os
 
 from app.core.langraph.state_manager import state_manager, TutorState
 from app.core.langraph.workflow import execute_tutor_workflow_sync
+from app.core.state_store import create_state_store
 from app.utils.auth.jwt_handler import decode_token
 from app.utils.database.connection import fetch_one
 from app.utils.database.query_builder import QueryBuilder
@@ -40,7 +40,7 @@ class SessionService:
     학습 세션 서비스 - 사용자별 State 관리 및 워크플로우 실행
     
     주요 기능:
-    1. 사용자별 TutorState 메모리 저장 및 관리
+    1. 사용자별 TutorState 저장 및 관리 (메모리/SQLite/Redis State 저장소)
     2. 세션 시작/메시지 처리 통합 관리
     3. 워크플로우 실행 및 응답 처리
     4. 단일 세션 보장 (기존 JWT 정책 활용)
@@ -48,13 +48,13 @@ class SessionService:
     """
     
     def __init__(self):
-        # 사용자별 State 저장소 (메모리)
-        # {user_id: {"state": TutorState, "last_activity": datetime, "session_id": str}}
-        self._user_states: Dict[int, Dict[str, Any]] = {}
-        
-        # State 만료 시간 (1시간)
+        # State 만료 시간 (1시간, 마지막 활동 기준)
         self.STATE_EXPIRE_SECONDS = 3600
         
+        # 사용자별 State 저장소 (STATE_STORE_BACKEND 설정에 따라 메모리/SQLite/Redis)
+        # {str(user_id): {"state": TutorState, "last_activity": datetime, "session_id": str}}
+        self._state_store = create_state_store('tutor_state', self.STATE_EXPIRE_SECONDS)
+        
         # chapters_metadata.json 캐시 (v2.4 추가)
         self._chapters_metadata = None
     
@@ -347,7 +347,8 @@ class SessionService:
                 return error_response("AUTH_TOKEN_INVALID", "토큰에 사용자 정보가 없습니다.")
             
             # 저장된 State 확인
-            current_state = self._get_user_state(user_id)
+            user_state_data = self._get_user_state_data(user_id)
+            current_state = user_state_data["state"] if user_state_data else None
             
             if not current_state:
                 return {
@@ -367,7 +368,7 @@ class SessionService:
                 "chapter_title": self._get_chapter_title(current_state.get("current_chapter")),
                 "section_title": self._get_section_title(current_state.get("current_chapter"), current_state.get("current_section")),
                 "session_progress_stage": current_state.get("session_progress_stage"),
-                "last_activity": self._user_states[user_id]["last_activity"].isoformat()
+                "last_activity": user_state_data["last_activity"].isoformat()
             }
             
             return {
@@ -387,37 +388,33 @@ class SessionService:
     
     def _store_user_state(self, user_id: int, state: TutorState, session_id: str) -> None:
         """사용자 State 저장"""
-        self._user_states[user_id] = {
-            "state": copy.deepcopy(state),
+        self._state_store.set(str(user_id), {
+            "state": state,
             "last_activity": datetime.now(),
             "session_id": session_id
-        }
+        })
+    
+    def _get_user_state_data(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """사용자 State 레코드 조회 (만료된 State는 저장소에서 조회되지 않음)"""
+        return self._state_store.get(str(user_id))
     
     def _get_user_state(self, user_id: int) -> Optional[TutorState]:
         """사용자 State 조회 (만료 체크 포함)"""
-        if user_id not in self._user_states:
-            return None
-        
-        user_state_data = self._user_states[user_id]
-        last_activity = user_state_data["last_activity"]
-        
-        # 만료 체크
-        if (datetime.now() - last_activity).total_seconds() > self.STATE_EXPIRE_SECONDS:
-            self._clear_user_state(user_id)
+        user_state_data = self._get_user_state_data(user_id)
+        if not user_state_data:
             return None
         
         return user_state_data["state"]
     
     def _update_user_state(self, user_id: int, state: TutorState) -> None:
-        """사용자 State 업데이트"""
-        if user_id in self._user_states:
-            self._user_states[user_id]["state"] = copy.deepcopy(state)
-            self._user_states[user_id]["last_activity"] = datetime.now()
+        """사용자 State 업데이트 (만료 시각도 함께 연장)"""
+        user_state_data = self._get_user_state_data(user_id)
+        if user_state_data:
+            self._store_user_state(user_id, state, user_state_data["session_id"])
     
     def _clear_user_state(self, user_id: int) -> None:
         """사용자 State 삭제"""
-        if user_id in self._user_states:
-            del self._user_states[user_id]
+        self._state_store.delete(str(user_id))
     
     # ==========================================
     # 워크플로우 응답 처리 메서드 (v2.4 수정)
@@ -817,28 +814,15 @@ class SessionService:
     
     def get_active_sessions_count(self) -> int:
         """현재 활성 세션 수 반환"""
-        return len(self._user_states)
+        return self._state_store.count()
     
     def clear_expired_sessions(self) -> int:
         """만료된 세션 정리"""
-        expired_users = []
-        current_time = datetime.now()
-        
-        for user_id, state_data in self._user_states.items():
-            last_activity = state_data["last_activity"]
-            if (current_time - last_activity).total_seconds() > self.STATE_EXPIRE_SECONDS:
-                expired_users.append(user_id)
-        
-        for user_id in expired_users:
-            self._clear_user_state(user_id)
-        
-        return len(expired_users)
+        return self._state_store.purge_expired()
     
     def clear_all_sessions(self) -> int:
         """모든 활성 세션 정리 (테스트용)"""
-        session_count = len(self._user_states)
-        self._user_states.clear()
-        return session_count
+        return self._state_store.clear()
 
 
 # state 공유를 위한 세션 서비스 단일 인스턴스
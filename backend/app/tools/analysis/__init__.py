@@ -13,6 +13,12 @@ from .evaluation_tools import (
     create_simple_evaluation_summary
 )
 
+from .intent_classifier import (
+    IntentClassifier,
+    intent_classifier,
+    create_intent_classifier
+)
+
 # feedback_tools_chatgpt가 content 폴더로 이동됨
 
 __all__ = [
@@ -22,5 +28,10 @@ __all__ = [
     'validate_quiz_data',
     'get_user_answer_info',
     'extract_subjective_feedback',
-    'create_simple_evaluation_summary'
+    'create_simple_evaluation_summary',
+    
+    # intent_classifier
+    'IntentClassifier',
+    'intent_classifier',
+    'create_intent_classifier'
 ]
\ No newline at end of file
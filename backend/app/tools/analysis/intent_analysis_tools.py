@@ -1,13 +1,15 @@
 # backend/app/tools/analysis/intent_analysis_tools.py
 
 from typing import Dict, Any
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
-import os
 import re
 
+from app.core.llm import get_chain
+from .intent_classifier import intent_classifier
+from .intent_cache import intent_cache
+
 
 class IntentAnalysisResult(BaseModel):
     """의도 분석 결과 스키마"""
@@ -16,12 +18,51 @@ class IntentAnalysisResult(BaseModel):
     reasoning: str = Field(description="분류 근거 설명")
 
 
+# JSON 출력 파서 (상태가 없으므로 모듈 로드 시 한 번만 생성)
+_INTENT_PARSER = JsonOutputParser(pydantic_object=IntentAnalysisResult)
+
+# 프롬프트 템플릿 정의 (버전 2: 예시 중심 접근, 형식 지시문 포함하여 한 번만 생성)
+_INTENT_PROMPT = PromptTemplate(
+    template="""사용자 메시지를 next_step 또는 question으로 분류하세요.
+
+**분류 예시:**
+
+✅ **next_step 예시:**
+- "네", "좋아", "계속", "다음", "시작해주세요"
+- "퀴즈 내주세요", "문제 풀어볼게요"
+- "2챕터 시작할게요", "진행해주세요"
+- "이해했어요, 다음으로"
+- "알겠습니다"
+
+✅ **question 예시:**
+- "AI와 머신러닝의 차이가 뭐예요?"
+- "왜 그런 건가요?", "어떻게 작동하나요?"
+- "좀 더 자세히 설명해주세요"
+- "이 부분이 이해가 안 돼요"
+- "예시를 더 들어주세요"
+
+**현재 상황:**
+- 메시지: "{user_message}"
+- 진행단계: {current_stage}
+
+**판단 원칙:**
+1. 의문사(뭐, 왜, 어떻게, 언제)나 물음표(?)가 있으면 → question
+2. 긍정 응답이나 진행 요청 → next_step  
+3. 애매하면 메시지 길이 고려: 짧고 단순하면 next_step, 길고 복잡하면 question
+
+{format_instructions}""",
+    input_variables=["user_message", "current_stage", "user_type"],
+    partial_variables={"format_instructions": _INTENT_PARSER.get_format_instructions()}
+)
+
+
 def user_intent_analysis_tool(user_message: str, current_stage: str, user_type: str) -> Dict[str, Any]:
     """
     사용자 의도 분석 도구 (빠른 경로 최적화)
     
     1차: 완전 일치 키워드 기반 빠른 분류
-    2차: 애매한 경우에만 LLM 호출
+    2차: 로컬 학습 분류기 (신뢰도가 임계값 이상일 때만)
+    3차: 그래도 애매한 경우에만 LLM 호출 (같은 표현/단계/사용자 유형은 캐시된 결과 재사용)
     
     Args:
         user_message: 사용자 입력 메시지
@@ -49,13 +90,25 @@ def user_intent_analysis_tool(user_message: str, current_stage: str, user_type:
         if fast_result:
             return fast_result
         
-        # 2차: LLM 기반 정밀 분석 (애매한 경우에만)
+        # 2차: 로컬 학습 분류기 (모델 파일이 있고 확신할 때만)
+        if intent_classifier is not None:
+            local_result = intent_classifier.decide(user_message, current_stage)
+            if local_result:
+                return local_result
+        
+        # 3차: LLM 기반 정밀 분석 (애매한 경우에만, 이전에 분석한 표현이면 캐시 사용)
+        cached_result = intent_cache.get(user_message, current_stage, user_type)
+        if cached_result:
+            cached_result["reasoning"] = f"{cached_result['reasoning']} (캐시 재사용)"
+            return cached_result
+        
         result = _analyze_intent_with_llm(user_message, current_stage, user_type)
         
         # 결과 검증 및 기본값 처리
         if not result or "intent" not in result:
             return _get_fallback_result(user_message)
         
+        intent_cache.set(user_message, current_stage, user_type, result)
         return result
         
     except Exception as e:
@@ -143,52 +196,8 @@ def _analyze_intent_with_llm(user_message: str, current_stage: str, user_type: s
     Returns:
         분석 결과
     """
-    # ChatOpenAI 모델 초기화
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.1,
-        api_key=os.getenv("OPENAI_API_KEY")
-    )
-    
-    # JSON 출력 파서 설정
-    parser = JsonOutputParser(pydantic_object=IntentAnalysisResult)
-    
-    # 프롬프트 템플릿 정의 (버전 2: 예시 중심 접근)
-    prompt_template = PromptTemplate(
-        template="""사용자 메시지를 next_step 또는 question으로 분류하세요.
-
-**분류 예시:**
-
-✅ **next_step 예시:**
-- "네", "좋아", "계속", "다음", "시작해주세요"
-- "퀴즈 내주세요", "문제 풀어볼게요"
-- "2챕터 시작할게요", "진행해주세요"
-- "이해했어요, 다음으로"
-- "알겠습니다"
-
-✅ **question 예시:**
-- "AI와 머신러닝의 차이가 뭐예요?"
-- "왜 그런 건가요?", "어떻게 작동하나요?"
-- "좀 더 자세히 설명해주세요"
-- "이 부분이 이해가 안 돼요"
-- "예시를 더 들어주세요"
-
-**현재 상황:**
-- 메시지: "{user_message}"
-- 진행단계: {current_stage}
-
-**판단 원칙:**
-1. 의문사(뭐, 왜, 어떻게, 언제)나 물음표(?)가 있으면 → question
-2. 긍정 응답이나 진행 요청 → next_step  
-3. 애매하면 메시지 길이 고려: 짧고 단순하면 next_step, 길고 복잡하면 question
-
-{format_instructions}""",
-        input_variables=["user_message", "current_stage", "user_type"],
-        partial_variables={"format_instructions": parser.get_format_instructions()}
-    )
-    
-    # LCEL 파이프라인 구성
-    chain = prompt_template | llm | parser
+    # 미리 구성된 LCEL 파이프라인 조회
+    chain = get_chain('intent', 'llm_analysis', lambda llm: _INTENT_PROMPT | llm | _INTENT_PARSER)
     
     # LLM 호출 및 결과 반환
     result = chain.invoke({
@@ -0,0 +1,240 @@
+# backend/app/tools/analysis/intent_cache.py
+# 정규화된 메시지 기반 LLM 의도 분석 결과 캐시
+
+import os
+import re
+import copy
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
+from .intent_classifier import INTENT_LABELS, normalize_message
+
+if TYPE_CHECKING:
+    # app.core 패키지 초기화가 이 모듈을 다시 가져오므로 실행 시에는 가져오지 않음
+    from app.core.state_store import StateStore
+
+# 의미 없이 붙는 끝맺음 문자 (물음표는 의도에 영향을 주므로 개수만 하나로 축약)
+_TRAILING_NOISE_PATTERN = re.compile(r'[\s.!~^ㅎㅋㅠㅜ]+$')
+_QUESTION_MARKS_PATTERN = re.compile(r'\?+')
+
+# 공유 계층에서 만료 항목을 정리하는 저장 횟수 간격
+_PURGE_INTERVAL = 256
+
+
+def normalize_for_cache(message: str) -> str:
+    """
+    캐시 키용 메시지 정규화
+
+    소문자/공백 정규화에 더해 끝의 '!', '~', '.', 'ㅎㅎ', 'ㅠㅠ' 같은 꾸밈을 제거하고
+    연속된 물음표는 하나로 줄입니다. ("예시 더 알려주세요!!" == "예시 더 알려주세요")
+    """
+    text = _QUESTION_MARKS_PATTERN.sub('?', normalize_message(message))
+    return _TRAILING_NOISE_PATTERN.sub('', text) or text
+
+
+class IntentCache:
+    """
+    LLM 의도 분석 결과 캐시
+
+    - 키: (정규화 메시지, 세션 단계, 사용자 유형)의 SHA-256
+    - 2단계 저장소: 프로세스 메모리 LRU(최대 항목 수 초과 시 가장 오래 안 쓴 항목 제거)
+      → 공유 State 저장소(SQLite/Redis, 워커 간 공유, TTL 만료)
+    - LLM이 정상적으로 분류한 결과만 저장 (폴백 결과는 저장하지 않음)
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 ttl_seconds: float = 24 * 3600,
+                 max_memory_entries: int = 2048,
+                 shared_store: Optional['StateStore'] = None,
+                 shared_store_factory: Optional[Callable[[], Optional['StateStore']]] = None):
+        """
+        Args:
+            enabled: 캐시 사용 여부
+            ttl_seconds: 항목 만료 시간 (초)
+            max_memory_entries: 메모리 LRU 최대 항목 수
+            shared_store: 워커 간 공유 계층 (None이면 메모리 계층만 사용)
+            shared_store_factory: 처음 사용할 때 공유 계층을 만드는 함수 (shared_store 대신 사용)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self._shared = shared_store if enabled else None
+        self._shared_factory = shared_store_factory if enabled and shared_store is None else None
+
+        # {key: (expires_at, result)}
+        self._memory: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'shared_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'errors': 0
+        }
+
+    def _get_shared(self) -> Optional['StateStore']:
+        """공유 계층 (팩토리가 있으면 처음 호출 시 한 번만 생성)"""
+        if self._shared_factory is not None:
+            with self._lock:
+                factory, self._shared_factory = self._shared_factory, None
+                if factory is not None:
+                    self._shared = factory()
+        return self._shared
+
+    @staticmethod
+    def make_key(user_message: str, current_stage: str, user_type: str) -> str:
+        """정규화 메시지 + 단계 + 사용자 유형으로 캐시 키 생성"""
+        material = json.dumps([normalize_for_cache(user_message), current_stage, user_type], ensure_ascii=False)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, user_message: str, current_stage: str, user_type: str) -> Optional[Dict[str, Any]]:
+        """캐시된 의도 분석 결과 (없으면 None, 호출자가 수정해도 되도록 복사본 반환)"""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(user_message, current_stage, user_type)
+        result, tier = self._lookup(key)
+
+        with self._lock:
+            self._stats[f'{tier}_hits' if result is not None else 'misses'] += 1
+        workflow_tracer.record_cache('intent_cache', hit=result is not None)
+
+        return copy.deepcopy(result) if result is not None else None
+
+    def set(self, user_message: str, current_stage: str, user_type: str, result: Dict[str, Any]) -> None:
+        """LLM 의도 분석 결과 저장 (intent가 올바른 결과만)"""
+        if not self.enabled or not result or result.get('intent') not in INTENT_LABELS:
+            return
+
+        key = self.make_key(user_message, current_stage, user_type)
+        value = {'intent': result['intent'], 'confidence': result.get('confidence', 0.0), 'reasoning': result.get('reasoning', '')}
+
+        with self._lock:
+            self._put_memory_locked(key, time.time() + self.ttl_seconds, value)
+            self._stats['stores'] += 1
+            should_purge = self._stats['stores'] % _PURGE_INTERVAL == 0
+
+        shared = self._get_shared()
+        if shared is None:
+            return
+        try:
+            shared.set(key, value, ttl=self.ttl_seconds)
+            if should_purge:
+                shared.purge_expired()
+        except Exception as e:
+            self.logger.warning(f"의도 캐시 공유 계층 저장 실패: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+
+    def _lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """메모리 → 공유 계층 순서로 조회 (결과, 조회된 계층 이름) 반환"""
+        now = time.time()
+
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                if item[0] > now:
+                    self._memory.move_to_end(key)
+                    return item[1], 'memory'
+                del self._memory[key]
+
+        shared = self._get_shared()
+        if shared is None:
+            return None, 'memory'
+
+        try:
+            result = shared.get(key)
+        except Exception as e:
+            self.logger.warning(f"의도 캐시 공유 계층 조회 실패: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return None, 'shared'
+
+        if result is not None:
+            # 공유 계층 항목의 남은 만료 시간은 알 수 없으므로 메모리에는 TTL 전체로 보관
+            with self._lock:
+                self._put_memory_locked(key, now + self.ttl_seconds, result)
+        return result, 'shared'
+
+    def _put_memory_locked(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        """메모리 LRU에 저장 (잠금 보유 상태에서 호출)"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (적중률 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+
+        lookups = stats['memory_hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['shared_hits']) / lookups, 4) if lookups else 0.0
+        stats['enabled'] = self.enabled
+        shared = self._get_shared()
+        stats['shared_backend'] = shared.backend_name if shared is not None else None
+        stats['ttl_seconds'] = self.ttl_seconds
+        return stats
+
+    def clear(self, include_shared: bool = False) -> int:
+        """캐시 비우기 (메모리에서 삭제된 개수 반환)"""
+        with self._lock:
+            removed = len(self._memory)
+            self._memory.clear()
+        shared = self._get_shared() if include_shared else None
+        if shared is not None:
+            shared.clear()
+        return removed
+
+
+def create_intent_cache() -> IntentCache:
+    """
+    환경변수 설정으로 의도 캐시 생성
+
+    공유 계층은 세션 State와 같은 저장소 설정(STATE_STORE_BACKEND)을 사용하며,
+    memory 백엔드이면 메모리 LRU만 사용합니다.
+
+    환경변수:
+        INTENT_CACHE_ENABLED: 캐시 사용 여부 (기본: true)
+        INTENT_CACHE_TTL_SECONDS: 항목 만료 시간 (기본: 86400 = 1일)
+        INTENT_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본: 2048)
+        INTENT_CACHE_SHARED: 공유 계층 사용 여부 (기본: true)
+    """
+    logger = logging.getLogger(__name__)
+    enabled = env_bool('INTENT_CACHE_ENABLED', True)
+    ttl_seconds = float(os.getenv('INTENT_CACHE_TTL_SECONDS', str(24 * 3600)))
+
+    def create_shared_store() -> Optional['StateStore']:
+        # 모듈 로드 시 app.core를 가져오면 순환 import가 되므로 처음 사용할 때 생성
+        from app.core.state_store import create_state_store
+        try:
+            return create_state_store('intent_cache', ttl_seconds)
+        except Exception as e:
+            logger.warning(f"의도 캐시 공유 계층 초기화 실패, 메모리 캐시만 사용: {e}")
+            return None
+
+    use_shared = env_bool('INTENT_CACHE_SHARED', True)
+    shared_enabled = use_shared and os.getenv('STATE_STORE_BACKEND', 'memory').strip().lower() != 'memory'
+
+    return IntentCache(
+        enabled=enabled,
+        ttl_seconds=ttl_seconds,
+        max_memory_entries=int(os.getenv('INTENT_CACHE_MAX_ENTRIES', '2048')),
+        shared_store_factory=create_shared_store if shared_enabled else None
+    )
+
+
+# 전역 의도 캐시 인스턴스
+intent_cache = create_intent_cache()
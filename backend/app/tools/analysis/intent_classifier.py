@@ -0,0 +1,438 @@
+# backend/app/tools/analysis/intent_classifier.py
+# 문자 n-gram 로지스틱 회귀 기반 로컬 의도 분류기 (LLM 의도 분석 앞단)
+
+import os
+import re
+import json
+import math
+import random
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.utils.common.helpers import env_bool
+
+# 분류 대상 의도 (question이 양성 클래스)
+INTENT_LABELS = ('next_step', 'question')
+
+# 의도 분석이 필요한 세션 단계
+INTENT_STAGES = ('theory_completed', 'quiz_and_feedback_completed')
+
+MODEL_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.85
+
+# 대화 기록에서 next_step으로 판단할 수 있는 후속 에이전트
+# (evaluation_feedback_agent는 퀴즈 답변 제출 뒤에 오므로 제외)
+_NEXT_STEP_AGENTS = ('theory_educator', 'quiz_generator', 'session_manager')
+_INTENT_LOG_PATTERN = re.compile(r'^의도 분석:\s*(next_step|question)\b')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _backend_dir() -> str:
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _default_model_path() -> str:
+    """기본 모델 경로 (backend/data/intent_classifier.json)"""
+    return os.path.join(_backend_dir(), 'data', 'intent_classifier.json')
+
+
+def default_seed_examples_path() -> str:
+    """기본 시드 예시 경로 (backend/data/intent_seed_examples.json)"""
+    return os.path.join(_backend_dir(), 'data', 'intent_seed_examples.json')
+
+
+def normalize_message(message: str) -> str:
+    """소문자 변환, 앞뒤 공백 제거, 연속 공백 축약"""
+    return _WHITESPACE_PATTERN.sub(' ', (message or '').strip().lower())
+
+
+def _length_bucket(length: int) -> str:
+    if length <= 5:
+        return 'xs'
+    if length <= 15:
+        return 's'
+    if length <= 40:
+        return 'm'
+    return 'l'
+
+
+def extract_features(message: str, current_stage: str = '', ngram_range: Tuple[int, int] = (1, 4)) -> List[str]:
+    """
+    메시지 특징 추출
+
+    - 문자 n-gram (앞뒤 경계 공백 포함, 띄어쓰기 차이에 강함)
+    - 어절 unigram
+    - 메시지 길이 구간, 세션 단계
+    """
+    text = normalize_message(message)
+    padded = f" {text} "
+    min_n, max_n = ngram_range
+
+    features = set()
+    for n in range(min_n, max_n + 1):
+        for start in range(len(padded) - n + 1):
+            features.add(f"c{n}:{padded[start:start + n]}")
+    for word in text.split(' '):
+        if word:
+            features.add(f"w:{word}")
+    features.add(f"len:{_length_bucket(len(text))}")
+    if current_stage:
+        features.add(f"stage:{current_stage}")
+    return list(features)
+
+
+class IntentClassifier:
+    """
+    next_step / question 이진 로컬 분류기
+
+    - 특징: 문자 1~4-gram + 어절 + 길이 구간 + 세션 단계 (희소 이진 특징, 길이 정규화)
+    - 모델: 로지스틱 회귀 (가중치 딕셔너리 조회만으로 추론하므로 수십 마이크로초 수준)
+    - 신뢰도 = max(p, 1 - p), 임계값 미만이면 호출자가 LLM 분석으로 넘김
+    - 모델은 JSON 한 파일로 저장 (scripts/train_intent_classifier.py로 학습)
+    """
+
+    def __init__(self,
+                 weights: Dict[str, float],
+                 bias: float = 0.0,
+                 ngram_range: Tuple[int, int] = (1, 4),
+                 threshold: float = DEFAULT_THRESHOLD,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            weights: 특징별 가중치 (양수면 question 쪽)
+            bias: 절편
+            ngram_range: 문자 n-gram 범위
+            threshold: 로컬 결정에 필요한 최소 신뢰도
+            metadata: 학습 정보 (데이터 수, 평가 지표 등)
+        """
+        self.weights = weights
+        self.bias = bias
+        self.ngram_range = tuple(ngram_range)
+        self.threshold = threshold
+        self.metadata = metadata or {}
+
+        self._lock = threading.Lock()
+        self._stats = {'local_decisions': 0, 'deferred': 0}
+
+    # ----- 추론 -----
+
+    def predict_proba(self, message: str, current_stage: str = '') -> float:
+        """question일 확률"""
+        features = extract_features(message, current_stage, self.ngram_range)
+        weights = self.weights
+        score = sum(weights.get(feature, 0.0) for feature in features) / math.sqrt(len(features))
+        return _sigmoid(score + self.bias)
+
+    def classify(self, message: str, current_stage: str = '') -> Tuple[str, float]:
+        """(의도, 신뢰도) 반환"""
+        probability = self.predict_proba(message, current_stage)
+        if probability >= 0.5:
+            return 'question', probability
+        return 'next_step', 1.0 - probability
+
+    def decide(self, message: str, current_stage: str = '') -> Optional[Dict[str, Any]]:
+        """
+        임계값 이상으로 확신할 때만 의도 분석 결과 반환
+
+        Returns:
+            {"intent", "confidence", "reasoning"} 또는 None (LLM 분석 필요)
+        """
+        intent, confidence = self.classify(message, current_stage)
+        decided = confidence >= self.threshold
+
+        with self._lock:
+            self._stats['local_decisions' if decided else 'deferred'] += 1
+
+        if not decided:
+            return None
+        return {
+            "intent": intent,
+            "confidence": round(confidence, 4),
+            "reasoning": f"로컬 분류기 판단 (신뢰도 {confidence:.2f})"
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로컬 결정 / LLM 위임 횟수"""
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats['local_decisions'] + stats['deferred']
+        stats['local_rate'] = round(stats['local_decisions'] / total, 4) if total else 0.0
+        stats['loaded'] = True
+        stats['threshold'] = self.threshold
+        stats['features'] = len(self.weights)
+        stats['trained_at'] = self.metadata.get('trained_at')
+        return stats
+
+    # ----- 학습 -----
+
+    @classmethod
+    def train(cls,
+              examples: Iterable[Dict[str, Any]],
+              epochs: int = 30,
+              learning_rate: float = 2.0,
+              l2: float = 1e-5,
+              ngram_range: Tuple[int, int] = (1, 4),
+              seed: int = 42) -> 'IntentClassifier':
+        """
+        확률적 경사 하강법으로 로지스틱 회귀 학습
+
+        Args:
+            examples: {"message", "stage", "intent"} 딕셔너리 목록
+            epochs: 전체 데이터 반복 횟수
+            learning_rate: 초기 학습률 (에폭마다 감소)
+            l2: L2 정규화 계수
+            ngram_range: 문자 n-gram 범위
+            seed: 셔플 시드
+        """
+        samples = [
+            (extract_features(example['message'], example.get('stage', ''), ngram_range),
+             1.0 if example['intent'] == 'question' else 0.0)
+            for example in examples
+        ]
+        if not samples:
+            raise ValueError("학습 데이터가 없습니다")
+
+        weights: Dict[str, float] = {}
+        bias = 0.0
+        rng = random.Random(seed)
+
+        for epoch in range(epochs):
+            rng.shuffle(samples)
+            rate = learning_rate / (1.0 + epoch)
+            for features, label in samples:
+                scale = 1.0 / math.sqrt(len(features))
+                score = sum(weights.get(feature, 0.0) for feature in features) * scale + bias
+                gradient = _sigmoid(score) - label
+                step = rate * gradient * scale
+                for feature in features:
+                    weight = weights.get(feature, 0.0)
+                    weights[feature] = weight - step - rate * l2 * weight
+                bias -= rate * gradient
+
+        # 영향이 거의 없는 가중치 제거 (모델 파일 크기 축소)
+        weights = {feature: round(weight, 5) for feature, weight in weights.items() if abs(weight) >= 1e-4}
+
+        counts = {label: sum(1 for _, y in samples if (y == 1.0) == (label == 'question')) for label in INTENT_LABELS}
+        metadata = {
+            'trained_at': datetime.now().isoformat(),
+            'examples': len(samples),
+            'label_counts': counts,
+            'hyperparameters': {'epochs': epochs, 'learning_rate': learning_rate, 'l2': l2, 'seed': seed}
+        }
+        return cls(weights, round(bias, 5), ngram_range, DEFAULT_THRESHOLD, metadata)
+
+    # ----- 저장/로드 -----
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'format_version': MODEL_FORMAT_VERSION,
+            'labels': list(INTENT_LABELS),
+            'ngram_range': list(self.ngram_range),
+            'threshold': self.threshold,
+            'bias': self.bias,
+            'metadata': self.metadata,
+            'weights': self.weights
+        }
+
+    def save(self, path: str) -> None:
+        """모델을 JSON으로 원자적 저장 (서비스 중인 워커가 쓰다 만 파일을 읽지 않도록)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'IntentClassifier':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != MODEL_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 모델 형식: {data.get('format_version')}")
+        return cls(
+            weights=data['weights'],
+            bias=data.get('bias', 0.0),
+            ngram_range=tuple(data.get('ngram_range', (1, 4))),
+            threshold=data.get('threshold', DEFAULT_THRESHOLD),
+            metadata=data.get('metadata', {})
+        )
+
+
+def _sigmoid(score: float) -> float:
+    if score >= 0:
+        return 1.0 / (1.0 + math.exp(-score))
+    exp_score = math.exp(score)
+    return exp_score / (1.0 + exp_score)
+
+
+# ==========================================
+# 학습 데이터 추출
+# ==========================================
+
+def label_conversations(conversations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    대화 기록에서 의도 레이블이 붙은 사용자 메시지 추출
+
+    의도는 별도 컬럼으로 저장되지 않으므로 사용자 메시지 다음에 이어진 기록으로 판단합니다.
+    - '의도 분석: ...' 도구 기록이 있으면 그 결과
+    - QnA 에이전트 응답 또는 '질문 의도 감지' 기록 → question
+    - 퀴즈/세션 관리/이론 에이전트 응답 → next_step
+    - 그 외(퀴즈 답변 뒤의 평가 응답 등)는 학습 데이터에서 제외
+
+    Args:
+        conversations: session_conversations 행 또는 대화 로그의 conversations 항목
+            (agent_name, message_type, message_content|message, session_progress_stage|session_stage)
+    """
+    examples = []
+    pending: Optional[Dict[str, Any]] = None
+
+    for conv in conversations:
+        message_type = conv.get('message_type', '')
+        content = str(conv.get('message_content') or conv.get('message') or '').strip()
+        stage = conv.get('session_progress_stage') or conv.get('session_stage') or ''
+
+        if message_type == 'user':
+            # 감독 에이전트가 같은 메시지를 한 번 더 기록하는 경우는 무시
+            if pending is not None and pending['message'] == content:
+                continue
+            pending = {'message': content, 'stage': stage} if content and stage in INTENT_STAGES else None
+            continue
+
+        if pending is None:
+            continue
+
+        agent_name = conv.get('agent_name', '')
+        intent = None
+        matched = _INTENT_LOG_PATTERN.match(content)
+        if matched:
+            intent = matched.group(1)
+        elif agent_name == 'qna_resolver' or content.startswith('질문 의도 감지'):
+            intent = 'question'
+        elif agent_name in _NEXT_STEP_AGENTS:
+            intent = 'next_step'
+
+        # 사용자 메시지 바로 다음 기록 하나로만 판단
+        if intent:
+            examples.append({**pending, 'intent': intent})
+        pending = None
+
+    return examples
+
+
+def load_seed_examples(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """시드 예시 파일 로드 ({"examples": [{"message", "stage", "intent"}]})"""
+    with open(path or default_seed_examples_path(), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [example for example in data.get('examples', []) if example.get('intent') in INTENT_LABELS]
+
+
+def load_chat_log_examples(log_dir: str) -> List[Dict[str, Any]]:
+    """대화 로그 디렉토리(logs/user_chat_log/user*/...json)에서 레이블 추출"""
+    logger = logging.getLogger(__name__)
+    examples = []
+    if not os.path.isdir(log_dir):
+        return examples
+
+    for root, _, files in os.walk(log_dir):
+        for file_name in sorted(files):
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(root, file_name), 'r', encoding='utf-8') as f:
+                    log_data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"대화 로그 읽기 실패: {file_name} - {e}")
+                continue
+            examples.extend(label_conversations(log_data.get('conversations', [])))
+    return examples
+
+
+def load_db_examples(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """session_conversations 테이블에서 세션별로 대화를 읽어 레이블 추출 (서버 측 커서로 스트리밍)"""
+    from app.utils.database import stream_query
+
+    query = (
+        "SELECT session_id, agent_name, message_type, message_content, session_progress_stage "
+        "FROM session_conversations ORDER BY session_id, message_sequence"
+    )
+    examples = []
+    current_session = None
+    conversations: List[Dict[str, Any]] = []
+
+    for row in stream_query(query):
+        if row['session_id'] != current_session:
+            examples.extend(label_conversations(conversations))
+            if limit and len(examples) >= limit:
+                return examples[:limit]
+            current_session = row['session_id']
+            conversations = []
+        conversations.append(row)
+
+    examples.extend(label_conversations(conversations))
+    return examples[:limit] if limit else examples
+
+
+def deduplicate_examples(examples: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """(정규화 메시지, 단계)가 같은 예시는 다수결 레이블 하나로 합침"""
+    votes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for example in examples:
+        key = (normalize_message(example['message']), example.get('stage', ''))
+        entry = votes.setdefault(key, {'message': example['message'], 'stage': key[1], 'counts': {}})
+        entry['counts'][example['intent']] = entry['counts'].get(example['intent'], 0) + 1
+
+    return [
+        {'message': entry['message'], 'stage': entry['stage'], 'intent': max(entry['counts'], key=entry['counts'].get)}
+        for entry in votes.values()
+    ]
+
+
+def split_examples(examples: List[Dict[str, Any]],
+                   test_ratio: float,
+                   seed: int = 42) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """의도별 비율을 유지한 학습/평가 분할"""
+    rng = random.Random(seed)
+    train, test = [], []
+    for label in INTENT_LABELS:
+        group = [example for example in examples if example['intent'] == label]
+        rng.shuffle(group)
+        test_count = int(round(len(group) * test_ratio))
+        test.extend(group[:test_count])
+        train.extend(group[test_count:])
+    return train, test
+
+
+def create_intent_classifier() -> Optional[IntentClassifier]:
+    """
+    환경변수 설정으로 로컬 의도 분류기 로드
+
+    모델 파일이 없거나 비활성화되어 있으면 None을 반환하며, 이 경우 기존 경로(키워드 → LLM)로 동작합니다.
+
+    환경변수:
+        INTENT_CLASSIFIER_ENABLED: 사용 여부 (기본: true)
+        INTENT_CLASSIFIER_PATH: 모델 경로 (기본: backend/data/intent_classifier.json)
+        INTENT_CLASSIFIER_THRESHOLD: 로컬 결정 최소 신뢰도 (기본: 학습 시 보정한 값)
+    """
+    logger = logging.getLogger(__name__)
+    if not env_bool('INTENT_CLASSIFIER_ENABLED', True):
+        return None
+
+    path = os.getenv('INTENT_CLASSIFIER_PATH') or _default_model_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        classifier = IntentClassifier.load(path)
+    except Exception as e:
+        logger.warning(f"로컬 의도 분류기 로드 실패, LLM 분석만 사용: {e}")
+        return None
+
+    threshold = os.getenv('INTENT_CLASSIFIER_THRESHOLD')
+    if threshold:
+        classifier.threshold = float(threshold)
+    return classifier
+
+
+# 전역 로컬 의도 분류기 (모델 파일이 없으면 None)
+intent_classifier = create_intent_classifier()
@@ -6,15 +6,21 @@ from typing import Dict, Any, Tuple
 
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
+from app.core.llm import get_chain
+
 class SubjectiveEvaluationSchema(BaseModel):
     """주관식 평가 응답 스키마"""
     evaluation: Dict[str, Any] = Field(description="평가 결과")
     feedback: Dict[str, str] = Field(description="피드백 내용")
 
 
+# 출력 파서는 상태가 없으므로 모든 체인에서 공유
+_EVALUATION_PARSER = JsonOutputParser(pydantic_object=SubjectiveEvaluationSchema)
+
+
 def evaluate_subjective_with_feedback(
     quiz_data: Dict[str, Any],
     user_answer: str,
@@ -37,13 +43,8 @@ def evaluate_subjective_with_feedback(
     try:
         logger.info("ChatGPT 주관식 평가 및 피드백 생성 시작 (LCEL 파이프라인)")
         
-        # LangChain 구성 요소 초기화
-        model = _get_chatgpt_model()
-        parser = JsonOutputParser(pydantic_object=SubjectiveEvaluationSchema)
-        prompt_template = _create_evaluation_prompt_template(user_type)
-        
-        # LCEL 파이프라인 구성: prompt | model | parser
-        chain = prompt_template | model | parser
+        # 미리 구성된 LCEL 파이프라인 조회: prompt | model | parser
+        chain = _get_evaluation_chain(user_type)
         
         # 입력 데이터 준비
         input_data = _prepare_evaluation_input_data(quiz_data, user_answer)
@@ -89,12 +90,8 @@ def generate_multiple_choice_feedback(
     try:
         logger.info("ChatGPT 객관식 피드백 생성 시작")
         
-        # LangChain 구성 요소 초기화
-        model = _get_chatgpt_model()
-        prompt_template = _create_multiple_choice_feedback_prompt(user_type)
-        
-        # 간단한 체인 구성: prompt | model
-        chain = prompt_template | model
+        # 미리 구성된 간단한 체인 조회: prompt | model
+        chain = _get_multiple_choice_feedback_chain(user_type)
         
         # 입력 데이터 준비
         input_data = _prepare_mc_feedback_input_data(quiz_data, user_answer, is_correct)
@@ -110,15 +107,25 @@ def generate_multiple_choice_feedback(
         return _generate_fallback_mc_feedback(is_correct, user_type, quiz_data.get('explanation', ''))
 
 
-def _get_chatgpt_model() -> ChatOpenAI:
-    """ChatGPT 모델 초기화"""
-    import os
-    
-    return ChatOpenAI(
-        model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        temperature=0.3,  # 평가의 일관성을 위해 낮은 온도
-        max_tokens=int(os.getenv('OPENAI_MAX_TOKENS', '4096'))
+def _get_evaluation_chain(user_type: str) -> Runnable:
+    """
+    사용자 유형별 주관식 평가 LCEL 파이프라인 조회 (유형마다 최초 호출 시 한 번만 구성)
+    """
+    return get_chain(
+        'feedback',
+        ('subjective_evaluation', user_type),
+        lambda model: _create_evaluation_prompt_template(user_type) | model | _EVALUATION_PARSER
+    )
+
+
+def _get_multiple_choice_feedback_chain(user_type: str) -> Runnable:
+    """
+    사용자 유형별 객관식 피드백 체인 조회 (유형마다 최초 호출 시 한 번만 구성)
+    """
+    return get_chain(
+        'feedback',
+        ('multiple_choice_feedback', user_type),
+        lambda model: _create_multiple_choice_feedback_prompt(user_type) | model
     )
 
 
@@ -0,0 +1,154 @@
+# backend/app/tools/content/qna_speculative_retrieval.py
+# 의도 분석과 병렬로 QnA 벡터 검색을 미리 실행하는 추측 실행(speculative retrieval)
+
+import os
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from app.core.runtime.retrieval_executor import RetrievalExecutor, RetrievalExecutorSaturated, retrieval_executor
+from app.tools.external.vector_search_tools import search_qna_materials
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
+
+# 추측 실행 대상 단계 (의도 분석 후 question이면 QnA로 이어지는 단계)
+SPECULATIVE_STAGES = ('theory_completed', 'quiz_and_feedback_completed')
+
+logger = logging.getLogger(__name__)
+
+
+class SpeculativeRetrieval:
+    """
+    진행 중인 추측 검색 한 건
+
+    - collect(): question으로 판정되었을 때 결과를 기다려 반환 (대기 시간 초과/실패 시 None)
+    - discard(): next_step으로 판정되었을 때 결과 폐기 (아직 시작 전이면 취소)
+    """
+
+    def __init__(self, manager: 'SpeculativeRetrievalManager', query: str, future: Future):
+        self._manager = manager
+        self.query = query
+        self._future = future
+
+    def collect(self) -> Optional[Dict[str, Any]]:
+        """
+        검색 결과를 QnA 스트리밍 세션에 넘길 형태로 반환
+
+        Returns:
+            {"query": str, "vector_results": list} 또는 None (호출자는 기존 분석 경로 사용)
+        """
+        try:
+            results: List[Dict[str, Any]] = self._future.result(timeout=self._manager.wait_seconds)
+        except FutureTimeoutError:
+            self._future.cancel()
+            self._manager._count('timeouts')
+            logger.info(f"추측 검색 대기 시간 초과, 기존 분석 경로 사용: '{self.query[:30]}'")
+            return None
+        except Exception as e:
+            self._manager._count('errors')
+            logger.warning(f"추측 검색 실패, 기존 분석 경로 사용: {e}")
+            return None
+
+        self._manager._count('used')
+        return {"query": self.query, "vector_results": results}
+
+    def discard(self) -> None:
+        """결과 폐기 (next_step 판정)"""
+        self._future.cancel()
+        self._manager._count('discarded')
+
+
+class SpeculativeRetrievalManager:
+    """
+    QnA 컨텍스트 추측 검색 관리자
+
+    theory_completed / quiz_and_feedback_completed 단계의 사용자 메시지는 의도 분석 결과에 따라
+    QnA로 이어질 수 있으므로, 의도 분석(LLM 왕복)과 동시에 원문 질문으로 벡터 검색을 시작합니다.
+    question이면 QnA 스트리밍이 분석 LLM 호출 없이 이 결과로 바로 답변을 시작하고,
+    next_step이면 결과를 버립니다.
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 wait_seconds: float = 1.0,
+                 min_length: int = 4,
+                 executor: Optional[RetrievalExecutor] = None):
+        """
+        Args:
+            enabled: 추측 검색 사용 여부
+            wait_seconds: question 판정 후 검색 완료를 기다릴 최대 시간 (초)
+            min_length: 이 길이 미만의 메시지("네", "다음" 등)는 추측하지 않음
+            executor: 검색을 실행할 스레드 풀 (None이면 공용 검색 스레드 풀)
+        """
+        self.enabled = enabled
+        self.wait_seconds = wait_seconds
+        self.min_length = min_length
+        self._executor = executor or retrieval_executor
+
+        self._lock = threading.Lock()
+        self._stats = {'started': 0, 'skipped': 0, 'rejected': 0, 'used': 0, 'discarded': 0, 'timeouts': 0, 'errors': 0}
+
+    def start(self, user_message: str, current_stage: str) -> Optional[SpeculativeRetrieval]:
+        """
+        추측 검색 시작
+
+        Returns:
+            SpeculativeRetrieval 또는 None (비활성화/대상 아님/검색 스레드 풀 포화)
+        """
+        if not self.enabled or current_stage not in SPECULATIVE_STAGES:
+            return None
+
+        query = (user_message or '').strip()
+        if len(query) < self.min_length:
+            self._count('skipped')
+            return None
+
+        # 폐기된 검색이 턴 추적 종료 후에 끝날 수 있으므로 턴 추적과 분리된 구간으로 집계만 함
+        # 추측 실행이 요청 처리를 늦추면 안 되므로 풀이 가득 차 있으면 기다리지 않고 생략
+        try:
+            future = self._executor.submit(self._search, query, timeout=0)
+        except RetrievalExecutorSaturated:
+            self._count('rejected')
+            return None
+        self._count('started')
+        return SpeculativeRetrieval(self, query, future)
+
+    @staticmethod
+    def _search(query: str) -> List[Dict[str, Any]]:
+        with workflow_tracer.span('qna.speculative_retrieval', 'tool'):
+            return search_qna_materials(query)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """추측 검색 통계 (사용률 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+        settled = stats['used'] + stats['discarded'] + stats['timeouts'] + stats['errors']
+        stats['use_rate'] = round(stats['used'] / settled, 4) if settled else 0.0
+        stats['enabled'] = self.enabled
+        stats['wait_seconds'] = self.wait_seconds
+        return stats
+
+
+def create_speculative_retrieval_manager() -> SpeculativeRetrievalManager:
+    """
+    환경변수 설정으로 추측 검색 관리자 생성
+
+    환경변수:
+        QNA_SPECULATIVE_RETRIEVAL_ENABLED: 사용 여부 (기본: true)
+        QNA_SPECULATIVE_WAIT_SECONDS: question 판정 후 검색 완료 대기 시간 (기본: 1.0)
+        QNA_SPECULATIVE_MIN_LENGTH: 추측 대상 최소 메시지 길이 (기본: 4)
+    """
+    return SpeculativeRetrievalManager(
+        enabled=env_bool('QNA_SPECULATIVE_RETRIEVAL_ENABLED', True),
+        wait_seconds=float(os.getenv('QNA_SPECULATIVE_WAIT_SECONDS', '1.0')),
+        min_length=int(os.getenv('QNA_SPECULATIVE_MIN_LENGTH', '4'))
+    )
+
+
+# 전역 추측 검색 관리자
+speculative_retrieval = create_speculative_retrieval_manager()
@@ -10,6 +10,7 @@ from langchain_openai import ChatOpenAI
 from langchain.agents import create_tool_calling_agent, AgentExecutor
 from langchain_core.prompts import ChatPromptTemplate
 
+from app.core.llm import get_chat_model
 from app.tools.external.vector_search_tools import search_qna_materials
 
 
@@ -239,20 +240,12 @@ def _create_agent_prompt_template(context_metadata: Dict[str, Any], current_cont
 
 def _get_chatgpt_model() -> ChatOpenAI:
     """
-    ChatGPT 모델 초기화 (Agent용)
+    ChatGPT 모델 조회 (Agent용, 공유 LLM 클라이언트 레지스트리 사용)
     
     Returns:
         ChatOpenAI 모델 객체
     """
-    
-    model = ChatOpenAI(
-        model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        temperature=0.3,  # QnA는 일관성 있는 답변이 중요
-        max_tokens=int(os.getenv('OPENAI_MAX_TOKENS', '4096'))
-    )
-    
-    return model
+    return get_chat_model('qna')
 
 
 def _generate_error_response(user_question: str, error_msg: str) -> str:
@@ -4,27 +4,33 @@ import logging
 import os
 import json
 import asyncio
-from typing import Dict, Any, List, AsyncGenerator
+from typing import Dict, Any, List, AsyncGenerator, Optional
 from app.tools.external.vector_search_tools import search_qna_materials_parallel
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 
+from app.core.llm import get_chat_model
+from app.core.runtime.retrieval_executor import retrieval_executor
+
 from app.tools.external.vector_search_tools import search_qna_materials
 
 logger = logging.getLogger(__name__)
 
 
-async def qna_streaming_generation_tool(user_question: str, current_context: Dict[str, Any] = None) -> AsyncGenerator[str, None]:
+async def qna_streaming_generation_tool(user_question: str,
+                                       current_context: Dict[str, Any] = None,
+                                       prefetched_context: Optional[Dict[str, Any]] = None) -> AsyncGenerator[str, None]:
     """
     Agent + ChatGPT 스트리밍 분리 방식 QnA 답변 생성
     
     Phase 1: Agent가 컨텍스트 준비 (빠른 분석 + 병렬 벡터 검색)
+             의도 분석과 병렬로 미리 검색한 자료가 있으면 분석 LLM 호출 없이 그 결과 사용
     Phase 2: ChatGPT 직접 스트리밍 (실제 토큰 단위)
     
     Args:
         user_question: 사용자 질문
         current_context: 현재 학습 컨텍스트
+        prefetched_context: 미리 검색한 자료 {"query", "vector_results"} (없으면 None)
         
     Yields:
         str: 실시간 스트리밍 토큰
@@ -33,11 +39,15 @@ async def qna_streaming_generation_tool(user_question: str, current_context: Dic
     print(f"[QnA 스트리밍] Phase 1: Agent 컨텍스트 분석 시작")
     
     try:
-        # 1. QnA 컨텍스트 메타데이터 로드
-        context_metadata = _load_qna_context_metadata()
-        
-        # Phase 1: Agent가 빠르게 컨텍스트 준비 (병렬 벡터 검색)
-        agent_context = await _run_agent_for_context(user_question, current_context, context_metadata)
+        if prefetched_context is not None:
+            # Phase 1 생략: 의도 분석 중 미리 검색한 자료 사용 (관련 자료가 없으면 일반 답변)
+            agent_context = _build_prefetched_agent_context(prefetched_context)
+        else:
+            # 1. QnA 컨텍스트 메타데이터 로드
+            context_metadata = _load_qna_context_metadata()
+            
+            # Phase 1: Agent가 빠르게 컨텍스트 준비 (병렬 벡터 검색)
+            agent_context = await _run_agent_for_context(user_question, current_context, context_metadata)
         
         logger.info(f"Agent 분석 완료 - 결정: {agent_context['reasoning']}")
         print(f"[QnA 스트리밍] Agent 결정: {agent_context['reasoning']}")
@@ -128,11 +138,7 @@ async def _run_agent_for_context(user_question: str, current_context: Dict[str,
 JSON만 응답하세요."""
 
         # 빠른 분석 실행 (스트리밍 X)
-        model = ChatOpenAI(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-            temperature=0,  # 일관된 분석을 위해 낮은 온도
-            streaming=False  # 스트리밍 비활성화
-        )
+        model = get_chat_model('qna_analysis')  # 온도 0, 스트리밍 비활성화
         
         result = await model.ainvoke([HumanMessage(content=analysis_prompt)])
         decision_data = json.loads(result.content.strip())
@@ -145,13 +151,13 @@ JSON만 응답하세요."""
             if search_queries:
                 print(f"[QnA 분석] 병렬 벡터 검색 실행 - 쿼리 {len(search_queries)}개: {search_queries}")
                 
-                # 병렬 벡터 검색 실행
-                vector_results = search_qna_materials_parallel(search_queries)
+                # 병렬 벡터 검색 실행 (이벤트 루프를 막지 않도록 공용 검색 스레드 풀에서 실행)
+                vector_results = await retrieval_executor.run_async(search_qna_materials_parallel, search_queries)
                 print(f"[QnA 분석] 병렬 벡터 검색 결과: 총 {len(vector_results)}개")
             else:
                 # 쿼리가 없으면 원본 질문으로 단일 검색
                 print(f"[QnA 분석] 단일 벡터 검색 실행 - 쿼리: '{user_question}'")
-                vector_results = search_qna_materials(user_question)
+                vector_results = await retrieval_executor.run_async(search_qna_materials, user_question)
         
         return {
             "should_use_vector_search": decision_data["decision"] == "VECTOR_SEARCH_NEEDED",
@@ -166,7 +172,7 @@ JSON만 응답하세요."""
         return {
             "should_use_vector_search": True,  # 안전하게 검색 실행
             "search_queries": [user_question],     # 원본 질문을 검색 쿼리로 사용
-            "vector_results": search_qna_materials(user_question),
+            "vector_results": await retrieval_executor.run_async(search_qna_materials, user_question),
             "reasoning": "JSON 파싱 실패로 안전한 기본값 적용"
         }
     
@@ -181,6 +187,23 @@ JSON만 응답하세요."""
         }
 
 
+def _build_prefetched_agent_context(prefetched_context: Dict[str, Any]) -> Dict:
+    """
+    미리 검색한 자료를 Agent 분석 결과 형태로 변환
+    
+    검색은 거리 임계값으로 걸러지므로, 관련 자료가 하나도 없으면 분석 단계의
+    NO_SEARCH_NEEDED와 같이 일반 답변 프롬프트를 사용합니다.
+    """
+    vector_results = prefetched_context.get("vector_results") or []
+    query = prefetched_context.get("query", "")
+    return {
+        "should_use_vector_search": bool(vector_results),
+        "search_queries": [query] if query else [],
+        "vector_results": vector_results,
+        "reasoning": f"의도 분석과 병렬로 미리 검색한 자료 사용 ({len(vector_results)}개, 분석 LLM 호출 생략)"
+    }
+
+
 async def _parallel_vector_search(search_queries: List[str]) -> List[Dict]:
     """
     병렬 벡터 검색 실행 및 결과 통합
@@ -218,9 +241,9 @@ async def _parallel_vector_search(search_queries: List[str]) -> List[Dict]:
                         seen_contents.add(content)
                         combined_results.append(result)
         
-        # 유사도 점수 기준 정렬 (상위 5개만)
+        # 융합 점수(하이브리드 검색) 또는 유사도 점수 기준 정렬 (상위 5개만)
         combined_results.sort(
-            key=lambda x: x.get('similarity_score', 0), 
+            key=lambda x: x.get('fusion_score', x.get('similarity_score', 0)), 
             reverse=True
         )
         
@@ -245,10 +268,8 @@ async def _async_vector_search(query: str) -> List[Dict]:
         벡터 검색 결과
     """
     try:
-        # search_qna_materials가 동기 함수이므로 asyncio.to_thread 사용
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, search_qna_materials, query)
-        return result
+        # search_qna_materials가 동기 함수이므로 공용 검색 스레드 풀에서 실행
+        return await retrieval_executor.run_async(search_qna_materials, query)
     except Exception as e:
         logger.error(f"비동기 벡터 검색 실패 (쿼리: '{query}'): {str(e)}")
         return []
@@ -322,12 +343,7 @@ async def _stream_final_answer(user_question: str, agent_context: Dict, current_
 친근하고 이해하기 쉽게 답변해주세요."""
 
         # ChatGPT 직접 스트리밍
-        model = ChatOpenAI(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-            temperature=0.3,
-            streaming=True,  # 스트리밍 활성화
-            max_tokens=int(os.getenv('OPENAI_MAX_TOKENS', '4096'))
-        )
+        model = get_chat_model('qna_stream')  # 스트리밍 활성화
         
         # 실제 토큰 단위 스트리밍
         async for chunk in model.astream([HumanMessage(content=prompt)]):
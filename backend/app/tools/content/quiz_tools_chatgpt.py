@@ -6,20 +6,27 @@ from typing import Dict, Any
 
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
+from app.core.llm import get_chain, generation_cache
+
 class QuizSchema(BaseModel):
     """간소화된 퀴즈 응답 스키마"""
     quiz: Dict[str, Any] = Field(description="퀴즈 정보")
 
 
+# 출력 파서는 상태가 없으므로 모든 체인에서 공유
+_QUIZ_PARSER = JsonOutputParser(pydantic_object=QuizSchema)
+
+
 def quiz_generation_tool(
     section_data: Dict[str, Any],
     user_type: str,
     is_retry_session: bool = False,
     theory_content: str = "",
-    content_source: str = "fallback"
+    content_source: str = "fallback",
+    raise_on_error: bool = False
 ) -> str:
     """
     ChatGPT를 활용한 사용자 맞춤형 퀴즈 생성 (LangChain LCEL 사용)
@@ -30,6 +37,7 @@ def quiz_generation_tool(
         is_retry_session: 재학습 여부
         theory_content: 이론 설명 내용 (theory_draft)
         content_source: 데이터 소스 ("theory_draft" or "fallback")
+        raise_on_error: True면 폴백 응답 대신 예외를 그대로 전달 (사전 생성 배치 작업용)
         
     Returns:
         생성된 퀴즈 JSON 문자열
@@ -50,37 +58,34 @@ def quiz_generation_tool(
             quiz_type = section_data.get('quiz_type') or section_data.get('quiz', {}).get('type', 'multiple_choice')
             logger.info(f"폴백 모드 - 퀴즈 타입: {quiz_type}")
         
-        # LangChain 구성 요소 초기화
-        model = _get_chatgpt_model()
-        parser = JsonOutputParser(pydantic_object=QuizSchema)
-        prompt_template = _create_prompt_template(quiz_type, user_type, is_retry_session, content_source)
-        
-        # LCEL 파이프라인 구성: prompt | model | parser
-        chain = prompt_template | model | parser
+        # 미리 구성된 LCEL 파이프라인 조회: prompt | model | parser
+        chain = _get_quiz_chain(quiz_type, user_type, is_retry_session, content_source)
         
         # 입력 데이터 준비
         input_data = _prepare_input_data(section_data, quiz_type, theory_content, content_source)
         
-        # 파이프라인 실행
-        result = chain.invoke(input_data)
+        # 렌더링된 프롬프트 기준 생성 캐시 조회 (미스 시에만 파이프라인 실행)
+        prompt_text = chain.first.format(**input_data)
+        result = generation_cache.get_or_generate('quiz', prompt_text, lambda: chain.invoke(input_data))
         
         logger.info("ChatGPT 퀴즈 생성 파이프라인 완료")
         return json.dumps(result, ensure_ascii=False, indent=2)
         
     except Exception as e:
+        if raise_on_error:
+            raise
         logger.error(f"ChatGPT 퀴즈 생성 실패: {str(e)}")
         return _generate_fallback_response(section_data, quiz_type, str(e))
 
 
-def _get_chatgpt_model() -> ChatOpenAI:
-    """ChatGPT 모델 초기화"""
-    import os
-    
-    return ChatOpenAI(
-        model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        temperature=0.4,
-        max_tokens=int(os.getenv('OPENAI_MAX_TOKENS', '4096'))
+def _get_quiz_chain(quiz_type: str, user_type: str, is_retry_session: bool, content_source: str) -> Runnable:
+    """
+    프롬프트 변형별 LCEL 파이프라인 조회 (변형마다 최초 호출 시 한 번만 구성)
+    """
+    return get_chain(
+        'quiz',
+        (quiz_type, user_type, is_retry_session, content_source),
+        lambda model: _create_prompt_template(quiz_type, user_type, is_retry_session, content_source) | model | _QUIZ_PARSER
     )
 
 
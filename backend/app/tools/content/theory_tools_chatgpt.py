@@ -6,7 +6,12 @@ from typing import Dict, Any, List, Optional
 
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable
+
+from app.core.llm import get_chain, generation_cache
+
+# 출력 파서는 상태가 없으므로 모든 체인에서 공유
+_JSON_PARSER = JsonOutputParser()
 
 
 def theory_generation_tool(
@@ -15,7 +20,8 @@ def theory_generation_tool(
     user_type: str = "beginner",
     section_data: Optional[Dict[str, Any]] = None,
     is_retry_session: bool = False,
-    content_source: str = "vector"
+    content_source: str = "vector",
+    raise_on_error: bool = False
 ) -> Dict[str, Any]:
     """
     벡터 DB 기반 사용자 맞춤형 이론 설명 대본 생성 (구조화된 JSON 형태)
@@ -27,6 +33,7 @@ def theory_generation_tool(
         section_data: 폴백용 상세 섹션 데이터 (content_source가 "fallback"일 때만 사용)
         is_retry_session: 재학습 여부
         content_source: 콘텐츠 소스 ("vector" or "fallback")
+        raise_on_error: True면 폴백 응답 대신 예외를 그대로 전달 (사전 생성 배치 작업용)
         
     Returns:
         구조화된 이론 설명 대본 (JSON 형태)
@@ -37,13 +44,8 @@ def theory_generation_tool(
     try:
         logger.info(f"ChatGPT 이론 생성 도구 시작 (소스: {content_source}, LCEL 파이프라인)")
         
-        # LangChain 구성 요소 초기화
-        model = _get_chatgpt_model()
-        parser = JsonOutputParser()
-        prompt_template = _create_prompt_template(user_type, is_retry_session, content_source)
-        
-        # LCEL 파이프라인 구성: prompt | model | parser
-        chain = prompt_template | model | parser
+        # 미리 구성된 LCEL 파이프라인 조회: prompt | model | parser
+        chain = _get_theory_chain(user_type, is_retry_session, content_source)
         
         # 입력 데이터 준비 (벡터 기반 vs 폴백)
         if content_source == "vector":
@@ -51,40 +53,54 @@ def theory_generation_tool(
         else:  # fallback
             input_data = _prepare_fallback_input_data(section_metadata, section_data)
         
-        # 파이프라인 실행
-        result = chain.invoke(input_data)
+        # 렌더링된 프롬프트 기준 생성 캐시 조회 (미스 시에만 파이프라인 실행)
+        prompt_text = chain.first.format(**input_data)
+        result = generation_cache.get_or_generate(
+            'theory',
+            prompt_text,
+            lambda: _invoke_theory_chain(chain, input_data)
+        )
         
-        # JSON 파싱 검증
-        if isinstance(result, dict):
-            logger.info(f"ChatGPT 이론 생성 파이프라인 완료 (소스: {content_source})")
-            return result
-        else:
-            # 문자열로 반환된 경우 JSON 파싱 시도
-            try:
-                parsed_result = json.loads(result)
-                logger.info(f"ChatGPT 이론 생성 파이프라인 완료 (소스: {content_source})")
-                return parsed_result
-            except json.JSONDecodeError:
-                logger.error("JSON 파싱 실패, 폴백 응답 생성")
-                return _generate_fallback_response(section_metadata, "JSON 파싱 실패")
+        logger.info(f"ChatGPT 이론 생성 파이프라인 완료 (소스: {content_source})")
+        return result
+        
+    except json.JSONDecodeError:
+        if raise_on_error:
+            raise
+        logger.error("JSON 파싱 실패, 폴백 응답 생성")
+        return _generate_fallback_response(section_metadata, "JSON 파싱 실패")
         
     except Exception as e:
+        if raise_on_error:
+            raise
         logger.error(f"ChatGPT 이론 설명 생성 실패: {str(e)}")
         return _generate_fallback_response(section_metadata, str(e))
 
 
-def _get_chatgpt_model() -> ChatOpenAI:
-    """ChatGPT 모델 초기화"""
-    import os
-    
-    return ChatOpenAI(
-        model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        temperature=0.3,
-        max_tokens=int(os.getenv('OPENAI_MAX_TOKENS', '2048'))
+def _get_theory_chain(user_type: str, is_retry_session: bool, content_source: str) -> Runnable:
+    """
+    프롬프트 변형별 LCEL 파이프라인 조회 (변형마다 최초 호출 시 한 번만 구성)
+    """
+    return get_chain(
+        'theory',
+        (user_type, is_retry_session, content_source),
+        lambda model: _create_prompt_template(user_type, is_retry_session, content_source) | model | _JSON_PARSER
     )
 
 
+def _invoke_theory_chain(chain: Runnable, input_data: Dict[str, str]) -> Dict[str, Any]:
+    """
+    파이프라인 실행 및 JSON 파싱 검증 (문자열로 반환된 경우 JSON 파싱 시도)
+    
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시 (캐시에 저장되지 않음)
+    """
+    result = chain.invoke(input_data)
+    if isinstance(result, dict):
+        return result
+    return json.loads(result)
+
+
 def _create_prompt_template(user_type: str, is_retry_session: bool, content_source: str) -> PromptTemplate:
     """
     벡터 기반 또는 폴백 기반 PromptTemplate 생성 (구조화된 JSON 출력)
@@ -0,0 +1,145 @@
+# backend/app/tools/external/query_embedding_cache.py
+# QnA 검색 쿼리 임베딩 캐시 및 일괄 임베딩
+
+import os
+import re
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 임베딩 함수 형식: 텍스트 목록 → 같은 순서의 벡터 목록 (ChromaDB EmbeddingFunction과 동일)
+EmbeddingFunction = Callable[[List[str]], Sequence[Any]]
+
+
+def normalize_query(text: str) -> str:
+    """임베딩 캐시 키용 쿼리 정규화 (유니코드 NFC + 공백 정리)"""
+    return _WHITESPACE_PATTERN.sub(' ', unicodedata.normalize('NFC', text or '')).strip()
+
+
+class QueryEmbeddingCache:
+    """
+    검색 쿼리 임베딩 캐시
+
+    - 키: 정규화된 쿼리 텍스트, 값: float32 벡터 (text-embedding-3-large 기준 약 12KB)
+    - 메모리 LRU (최대 항목 수 초과 시 가장 오래 안 쓴 항목 제거)
+    - embed()는 여러 쿼리 중 캐시에 없는 것만 모아 임베딩 함수를 한 번만 호출
+    """
+
+    def __init__(self, enabled: bool = True, max_entries: int = 1024):
+        """
+        Args:
+            enabled: 캐시 사용 여부 (False여도 일괄 임베딩은 동작)
+            max_entries: 메모리 LRU 최대 항목 수
+        """
+        self.logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self.max_entries = max_entries
+
+        self._entries: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'embed_calls': 0,
+            'embedded_texts': 0,
+            'evictions': 0
+        }
+
+    def embed(self, queries: List[str], embedding_function: EmbeddingFunction) -> List[np.ndarray]:
+        """
+        쿼리 목록의 임베딩 반환 (입력 순서 유지)
+
+        캐시에 없는 쿼리만 중복을 제거해 한 번의 임베딩 호출로 처리합니다.
+
+        Args:
+            queries: 검색 쿼리 목록
+            embedding_function: 캐시 미스 쿼리를 임베딩할 함수
+
+        Returns:
+            쿼리별 float32 벡터 목록
+        """
+        keys = [normalize_query(query) for query in queries]
+        found: Dict[str, np.ndarray] = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key) if self.enabled else None
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+            hits = sum(1 for key in keys if key in found)
+            self._stats['hits'] += hits
+            self._stats['misses'] += len(keys) - hits
+
+        for key in keys:
+            workflow_tracer.record_cache('query_embedding', hit=key in found)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            with workflow_tracer.span('vector_search.embed', 'tool'):
+                vectors = embedding_function(missing)
+            if len(vectors) != len(missing):
+                raise ValueError(f"임베딩 개수 불일치: 요청 {len(missing)}개, 응답 {len(vectors)}개")
+
+            with self._lock:
+                self._stats['embed_calls'] += 1
+                self._stats['embedded_texts'] += len(missing)
+                for key, vector in zip(missing, vectors):
+                    found[key] = np.asarray(vector, dtype=np.float32)
+                    if self.enabled:
+                        self._put_locked(key, found[key])
+
+        return [found[key] for key in keys]
+
+    def _put_locked(self, key: str, vector: np.ndarray) -> None:
+        """LRU에 저장 (잠금 보유 상태에서 호출)"""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (적중률 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['enabled'] = self.enabled
+        return stats
+
+    def clear(self) -> int:
+        """캐시 비우기 (삭제된 개수 반환)"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+
+def create_query_embedding_cache() -> QueryEmbeddingCache:
+    """
+    환경변수 설정으로 쿼리 임베딩 캐시 생성
+
+    환경변수:
+        QUERY_EMBEDDING_CACHE_ENABLED: 캐시 사용 여부 (기본: true)
+        QUERY_EMBEDDING_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본: 1024)
+    """
+    return QueryEmbeddingCache(
+        enabled=env_bool('QUERY_EMBEDDING_CACHE_ENABLED', True),
+        max_entries=int(os.getenv('QUERY_EMBEDDING_CACHE_MAX_ENTRIES', '1024'))
+    )
+
+
+# 전역 쿼리 임베딩 캐시 인스턴스
+query_embedding_cache = create_query_embedding_cache()
@@ -2,14 +2,37 @@
 
 import logging
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from chromadb.utils import embedding_functions
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
 from app.core.external.chroma_client import get_chroma_client
+from app.core.runtime.retrieval_executor import retrieval_executor
+from app.core.external.numpy_vector_index import numpy_vector_index
+from app.core.external.keyword_index import MIN_TERM_COVERAGE, KeywordIndex, keyword_index
+from app.core.external.section_chunk_index import (
+    CHUNK_TYPES,
+    CORE_CONCEPT_TYPE,
+    OTHER_CHUNK_TYPES,
+    SectionChunkIndex,
+    section_chunk_index
+)
+from app.tools.external.query_embedding_cache import query_embedding_cache
 
+from app.utils.common.helpers import env_bool
+from app.utils.tracing import workflow_tracer
 
+# QnA 벡터 검색 백엔드 (chroma: ChromaDB 컬렉션 / numpy: 메모리 행렬 전수 검색)
+VECTOR_SEARCH_BACKEND = os.getenv('VECTOR_SEARCH_BACKEND', 'chroma').strip().lower()
+
+# QnA 하이브리드 검색 (키워드 역색인 BM25 + 벡터 검색, 순위 역수 융합)
+HYBRID_SEARCH_ENABLED = env_bool('HYBRID_SEARCH_ENABLED', True)
+HYBRID_SEARCH_RRF_K = int(os.getenv('HYBRID_SEARCH_RRF_K', '60'))
+# 질문이 primary_keywords 용어만으로 이루어졌으면 임베딩 없이 어휘 검색 결과로 응답 (0이면 사용 안 함)
+HYBRID_SEARCH_SHORTCUT_MAX_TERMS = int(os.getenv('HYBRID_SEARCH_SHORTCUT_MAX_TERMS', '3'))
+
+
+@workflow_tracer.traced('vector_search.theory')
 def search_theory_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
     """
     이론 생성용 벡터 자료 검색
@@ -28,18 +51,18 @@ def search_theory_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
     try:
         logger.info(f"이론 생성용 벡터 검색 시작 - 챕터 {chapter} 섹션 {section}")
         
-        # ChromaDB 컬렉션 가져오기
-        collection = _get_collection()
-        if not collection:
+        # 섹션 청크 인덱스 가져오기
+        index = _get_section_chunk_index()
+        if not index:
             logger.warning("ChromaDB 컬렉션을 찾을 수 없음")
             return []
         
         # 1단계: core_concept 청크 검색 (최대 3개)
-        core_chunks = _search_core_concept_chunks(collection, chapter, section)
+        core_chunks = _search_core_concept_chunks(index, chapter, section)
         logger.info(f"core_concept 청크 {len(core_chunks)}개 발견")
         
         # 2단계: 기타 청크 타입 검색 (2개)
-        other_chunks = _search_other_chunks(collection, chapter, section)
+        other_chunks = _search_other_chunks(index, chapter, section)
         logger.info(f"기타 청크 {len(other_chunks)}개 발견")
         
         # 결과 합치기
@@ -53,6 +76,7 @@ def search_theory_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
         return []
 
 
+@workflow_tracer.traced('vector_search.quiz')
 def search_quiz_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
     """
     퀴즈 생성용 벡터 자료 검색
@@ -71,54 +95,14 @@ def search_quiz_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
     try:
         logger.info(f"퀴즈 생성용 벡터 검색 시작 - 챕터 {chapter} 섹션 {section}")
         
-        # ChromaDB 컬렉션 가져오기
-        collection = _get_collection()
-        if not collection:
+        # 섹션 청크 인덱스 가져오기
+        index = _get_section_chunk_index()
+        if not index:
             logger.warning("ChromaDB 컬렉션을 찾을 수 없음")
             return []
         
-        # core_concept 제외한 모든 타입 검색
-        other_chunk_types = ["analogy", "practical_example", "technical_detail"]
-        all_chunks = []
-        
-        for chunk_type in other_chunk_types:
-            try:
-                # ChromaDB 최신 문법 사용
-                results = collection.get(
-                    where={
-                        "$and": [
-                            {"chapter": {"$eq": chapter}},
-                            {"section": {"$eq": section}},
-                            {"chunk_type": {"$eq": chunk_type}}
-                        ]
-                    }
-                )
-                
-                if results["documents"]:
-                    documents = results["documents"]
-                    metadatas = results["metadatas"]
-                    
-                    for doc, metadata in zip(documents, metadatas):
-                        quality_score = metadata.get("content_quality_score", 0)
-                        
-                        if quality_score >= 90:  # 90점 이상만
-                            chunk_data = {
-                                "content": doc,
-                                "chunk_type": metadata["chunk_type"],
-                                "content_quality_score": quality_score,
-                                "primary_keywords": metadata["primary_keywords"],
-                                "source_url": metadata["source_url"],
-                                "id": metadata["id"]
-                            }
-                            all_chunks.append(chunk_data)
-                            
-            except Exception as e:
-                logger.warning(f"{chunk_type} 검색 실패: {str(e)}")
-                continue
-        
-        # content_quality_score 높은 순으로 정렬 후 상위 3개 선택
-        all_chunks.sort(key=lambda x: x["content_quality_score"], reverse=True)
-        result_chunks = all_chunks[:3]
+        # core_concept 제외한 모든 타입 중 90점 이상, content_quality_score 높은 순으로 상위 3개 선택
+        result_chunks = index.get_chunks(chapter, section, OTHER_CHUNK_TYPES, limit=3)
         
         logger.info(f"퀴즈 생성용 벡터 검색 완료 - 총 {len(result_chunks)}개 청크 반환")
         return result_chunks
@@ -128,12 +112,15 @@ def search_quiz_materials(chapter: int, section: int) -> List[Dict[str, Any]]:
         return []
 
 
+@workflow_tracer.traced('vector_search.qna')
 def search_qna_materials(query_text: str, max_distance: float = 1.2) -> List[Dict[str, Any]]:
     """
     QnA용 벡터 자료 검색 (개선된 RAG 시스템)
     - 거리 기반 필터링 (낮은 거리 = 높은 유사도)
     - 실용적인 거리 임계값 (기본값 1.2)
     - 정규화된 유사도 점수 제공
+    - 쿼리 임베딩은 캐시 재사용 (같은 질문 반복 시 임베딩 호출 없음)
+    - 키워드 역색인 어휘 검색과 융합 (primary_keywords 용어만으로 된 질문은 임베딩 없이 응답)
     
     Args:
         query_text: 사용자 질문 텍스트
@@ -148,54 +135,11 @@ def search_qna_materials(query_text: str, max_distance: float = 1.2) -> List[Dic
         logger.info(f"QnA용 벡터 검색 시작 - 질문: {query_text[:50]}...")
         logger.info(f"최대 거리 임계값: {max_distance}")
         
-        # ChromaDB 컬렉션 가져오기
-        collection = _get_collection()
-        if not collection:
-            logger.warning("ChromaDB 컬렉션을 찾을 수 없음")
+        results_per_query = _query_qna_materials([query_text], max_distance)
+        if results_per_query is None:
             return []
         
-        # 벡터 유사도 검색 실행
-        results = collection.query(
-            query_texts=[query_text],
-            n_results=15  # 충분한 후보 확보
-        )
-        
-        filtered_chunks = []
-        
-        if results["documents"] and results["documents"][0]:
-            documents = results["documents"][0]
-            metadatas = results["metadatas"][0]
-            distances = results["distances"][0]
-            
-            logger.info(f"원시 검색 결과: {len(documents)}개")
-            
-            for i, (doc, metadata, distance) in enumerate(zip(documents, metadatas, distances)):
-                # 거리 기반 필터링
-                if distance <= max_distance:
-                    # 정규화된 유사도 점수 (0~1 범위)
-                    similarity_score = max(0, 1 - (distance / max_distance))
-                    
-                    chunk_data = {
-                        "content": doc,
-                        "chunk_type": metadata["chunk_type"],
-                        "content_quality_score": metadata["content_quality_score"],
-                        "primary_keywords": metadata["primary_keywords"],
-                        "source_url": metadata["source_url"],
-                        "chapter": metadata["chapter"],
-                        "section": metadata["section"],
-                        "id": metadata["id"],
-                        "distance": distance,
-                        "similarity_score": similarity_score,
-                        "search_rank": i + 1
-                    }
-                    filtered_chunks.append(chunk_data)
-                    
-                    logger.debug(f"순위 {i+1}: 거리={distance:.3f}, 유사도={similarity_score:.3f}")
-                    
-                    # 최대 5개까지만
-                    if len(filtered_chunks) >= 5:
-                        break
-        
+        filtered_chunks = results_per_query[0]
         logger.info(f"QnA용 벡터 검색 완료 - 총 {len(filtered_chunks)}개 청크 반환")
         return filtered_chunks
         
@@ -204,20 +148,209 @@ def search_qna_materials(query_text: str, max_distance: float = 1.2) -> List[Dic
         return []
 
 
+def _query_qna_materials(query_texts: List[str], max_distance: float = 1.2) -> Optional[List[List[Dict[str, Any]]]]:
+    """
+    여러 쿼리를 한 번에 검색
+    - 키워드 역색인 어휘 검색 후, primary_keywords 용어만으로 된 쿼리는 임베딩 없이 어휘 결과로 응답
+    - 나머지 쿼리 중 캐시에 없는 것만 모아 임베딩 한 번 호출
+    - query_embeddings로 다중 쿼리 검색 한 번 호출 (ChromaDB 컬렉션 또는 NumPy 인덱스)
+    - 어휘/벡터 결과는 순위 역수 융합(RRF)으로 합침
+    
+    Args:
+        query_texts: 검색 쿼리 리스트
+        max_distance: 최대 허용 거리
+        
+    Returns:
+        쿼리별 필터링된 청크 리스트 (컬렉션이 없으면 None)
+    """
+    index = _get_keyword_index() if HYBRID_SEARCH_ENABLED else None
+    with workflow_tracer.span('vector_search.lexical', 'tool'):
+        lexical_hits = [index.search(query, min_coverage=0.0) if index else [] for query in query_texts]
+    
+    # 어휘 검색만으로 응답할 쿼리
+    shortcut = [
+        bool(hits) and HYBRID_SEARCH_SHORTCUT_MAX_TERMS > 0
+        and index.is_exact_term_query(query, HYBRID_SEARCH_SHORTCUT_MAX_TERMS)
+        for query, hits in zip(query_texts, lexical_hits)
+    ]
+    if index:
+        for skipped in shortcut:
+            workflow_tracer.record_cache('lexical_shortcut', hit=skipped)
+    
+    vector_queries = [query for query, skipped in zip(query_texts, shortcut) if not skipped]
+    vector_results = iter(_query_vector_candidates(vector_queries, max_distance) if vector_queries else [])
+    
+    results_per_query = []
+    for query, hits, skipped in zip(query_texts, lexical_hits, shortcut):
+        if skipped:
+            results_per_query.append(_fuse_qna_results([], hits))
+            continue
+        
+        candidates = next(vector_results, [])
+        if candidates is None:
+            return None
+        # 벡터 쪽에 거리 기준을 통과한 결과가 없으면 관련 자료가 없는 질문(인사, 잡담 등)으로 보고
+        # 어휘 결과만으로 채우지 않음 (키워드 용어만으로 된 질문은 위에서 처리)
+        if not candidates:
+            results_per_query.append([])
+        elif index:
+            results_per_query.append(_fuse_qna_results(candidates, hits))
+        else:
+            results_per_query.append(candidates[:5])
+    return results_per_query
+
+
+def _query_vector_candidates(query_texts: List[str], max_distance: float) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    벡터 검색 후보 (쿼리별 max_distance 이하 전체, 거리순)
+    
+    Returns:
+        쿼리별 후보 리스트 (컬렉션이 없으면 각 항목이 None)
+    """
+    # 검색 대상 가져오기
+    searcher = _get_qna_searcher()
+    if searcher is None:
+        logging.getLogger(__name__).warning("ChromaDB 컬렉션을 찾을 수 없음")
+        return [None] * len(query_texts)
+    
+    query_embeddings = query_embedding_cache.embed(query_texts, _get_embedding_function())
+    
+    # 벡터 유사도 검색 실행
+    results = searcher.query(
+        query_embeddings=query_embeddings,
+        n_results=15  # 충분한 후보 확보
+    )
+    
+    documents = results["documents"] or []
+    metadatas = results["metadatas"] or []
+    distances = results["distances"] or []
+    
+    candidates = [
+        _filter_qna_results(docs, metas, dists, max_distance, limit=None)
+        for docs, metas, dists in zip(documents, metadatas, distances)
+    ]
+    return candidates + [[] for _ in range(len(query_texts) - len(candidates))]
+
+
+def _fuse_qna_results(vector_chunks: List[Dict[str, Any]],
+                      lexical_hits: List[Tuple[Dict[str, Any], float]],
+                      limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    벡터/어휘 검색 결과를 순위 역수 융합(RRF)으로 합침
+    - fusion_score = Σ 1 / (HYBRID_SEARCH_RRF_K + 순위)
+    - 벡터 결과에 있는 청크는 거리/유사도 유지
+    - 어휘 결과에만 있는 청크는 질문 단어 포함 비율이 MIN_TERM_COVERAGE 이상일 때만 추가,
+      유사도는 lexical_similarity (BM25 점수와 질문 단어 포함 비율 기준)
+    
+    Args:
+        vector_chunks: 거리순 벡터 검색 후보
+        lexical_hits: (청크, BM25 점수) 리스트 (점수순)
+        limit: 최대 결과 수
+    """
+    fused: Dict[Any, Dict[str, Any]] = {}
+    
+    for rank, chunk in enumerate(vector_chunks, start=1):
+        entry = dict(chunk)
+        entry["fusion_score"] = 1.0 / (HYBRID_SEARCH_RRF_K + rank)
+        entry["retrieval"] = "vector"
+        fused[chunk["id"] or chunk["content"]] = entry
+    
+    for rank, (chunk, score) in enumerate(lexical_hits, start=1):
+        key = chunk["id"] or chunk["content"]
+        entry = fused.get(key)
+        if entry is None:
+            if chunk["term_coverage"] < MIN_TERM_COVERAGE:
+                continue
+            entry = dict(chunk)
+            entry.update({
+                "distance": None,
+                "similarity_score": chunk["lexical_similarity"],
+                "fusion_score": 0.0,
+                "retrieval": "keyword"
+            })
+            fused[key] = entry
+        else:
+            entry["retrieval"] = "hybrid"
+        entry["lexical_score"] = score
+        entry["fusion_score"] += 1.0 / (HYBRID_SEARCH_RRF_K + rank)
+    
+    # 점수가 같으면 벡터 결과 순서 유지 (안정 정렬)
+    results = sorted(fused.values(), key=lambda x: x["fusion_score"], reverse=True)[:limit]
+    for rank, entry in enumerate(results, start=1):
+        entry["search_rank"] = rank
+    return results
+
+
+def _filter_qna_results(documents: List[str],
+                        metadatas: List[Dict],
+                        distances: List[float],
+                        max_distance: float,
+                        limit: Optional[int] = 5) -> List[Dict[str, Any]]:
+    """
+    쿼리 하나의 원시 검색 결과를 거리 기준으로 필터링
+    - max_distance 이하만, 최대 limit개 (None이면 전부)
+    """
+    logger = logging.getLogger(__name__)
+    filtered_chunks = []
+    
+    if documents:
+        logger.info(f"원시 검색 결과: {len(documents)}개")
+        
+        for i, (doc, metadata, distance) in enumerate(zip(documents, metadatas, distances)):
+            # 거리 기반 필터링
+            if distance <= max_distance:
+                # 정규화된 유사도 점수 (0~1 범위)
+                similarity_score = max(0, 1 - (distance / max_distance))
+                
+                chunk_data = {
+                    "content": doc,
+                    "chunk_type": metadata["chunk_type"],
+                    "content_quality_score": metadata["content_quality_score"],
+                    "primary_keywords": metadata["primary_keywords"],
+                    "source_url": metadata["source_url"],
+                    "chapter": metadata["chapter"],
+                    "section": metadata["section"],
+                    "id": metadata["id"],
+                    "distance": distance,
+                    "similarity_score": similarity_score,
+                    "search_rank": i + 1
+                }
+                filtered_chunks.append(chunk_data)
+                
+                logger.debug(f"순위 {i+1}: 거리={distance:.3f}, 유사도={similarity_score:.3f}")
+                
+                # 최대 limit개까지만
+                if limit is not None and len(filtered_chunks) >= limit:
+                    break
+    
+    return filtered_chunks
+
+
+_embedding_function = None
+_embedding_function_lock = threading.Lock()
+
+
+def _get_embedding_function():
+    """OpenAI 임베딩 함수 (프로세스당 하나만 생성하여 재사용)"""
+    global _embedding_function
+    if _embedding_function is None:
+        with _embedding_function_lock:
+            if _embedding_function is None:
+                _embedding_function = embedding_functions.OpenAIEmbeddingFunction(
+                    api_key=os.getenv('OPENAI_API_KEY'),
+                    model_name="text-embedding-3-large"
+                )
+    return _embedding_function
+
+
 def _get_collection():
     """AI 튜터 컬렉션 조회"""
     try:
         chroma_client = get_chroma_client()
         
-        # OpenAI 임베딩 함수 설정
-        embedding_function = embedding_functions.OpenAIEmbeddingFunction(
-            api_key=os.getenv('OPENAI_API_KEY'),
-            model_name="text-embedding-3-large"
-        )
-        
         collection = chroma_client.get_collection(
             collection_name="ai_tutor_contents",
-            embedding_function=embedding_function
+            embedding_function=_get_embedding_function()
         )
         
         return collection
@@ -227,111 +360,88 @@ def _get_collection():
         return None
 
 
-def _search_core_concept_chunks(collection, chapter: int, section: int) -> List[Dict[str, Any]]:
+def _get_section_chunk_index() -> Optional[SectionChunkIndex]:
+    """섹션 청크 인덱스 조회 (처음 호출 시 또는 벡터 DB 재구축 후 컬렉션에서 생성)"""
+    try:
+        return section_chunk_index.get(_get_collection)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"섹션 청크 인덱스 생성 실패: {str(e)}")
+        return None
+
+
+def _get_keyword_index() -> Optional[KeywordIndex]:
+    """키워드 역색인 조회 (처음 호출 시 또는 벡터 DB 재구축 후 컬렉션에서 생성, 실패 시 벡터 검색만 사용)"""
+    try:
+        return keyword_index.get(_get_collection)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"키워드 역색인 생성 실패: {str(e)}")
+        return None
+
+
+def _get_qna_searcher():
+    """
+    QnA 검색 대상 조회
+    - VECTOR_SEARCH_BACKEND=numpy: 컬렉션 임베딩으로 만든 NumPy 인덱스 (생성 실패 시 ChromaDB로 폴백)
+    - 그 외: ChromaDB 컬렉션
+    """
+    if VECTOR_SEARCH_BACKEND == 'numpy':
+        try:
+            index = numpy_vector_index.get(_get_collection)
+            if index is not None:
+                return index
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"NumPy 벡터 인덱스 생성 실패, ChromaDB 검색 사용: {str(e)}")
+    return _get_collection()
+
+
+def preload_vector_search_indexes() -> bool:
+    """
+    앱 시작 시 메모리 인덱스를 미리 생성 (첫 요청에서 컬렉션 전체를 읽지 않도록)
+    - 섹션 청크 인덱스 (이론/퀴즈 자료)
+    - HYBRID_SEARCH_ENABLED면 키워드 역색인 (QnA 어휘 검색)
+    - VECTOR_SEARCH_BACKEND=numpy면 NumPy 벡터 인덱스 (QnA 검색)
+    
+    Returns:
+        생성 성공 여부
+    """
+    loaded = _get_section_chunk_index() is not None
+    if HYBRID_SEARCH_ENABLED:
+        loaded = _get_keyword_index() is not None and loaded
+    if VECTOR_SEARCH_BACKEND == 'numpy':
+        loaded = _get_qna_searcher() is not None and loaded
+    return loaded
+
+
+def _search_core_concept_chunks(index: SectionChunkIndex, chapter: int, section: int) -> List[Dict[str, Any]]:
     """
     core_concept 청크 검색
     - content_quality_score 90점 이상
     - 최대 3개
     """
     try:
-        # ChromaDB 최신 문법 사용
-        results = collection.get(
-            where={
-                "$and": [
-                    {"chapter": {"$eq": chapter}},
-                    {"section": {"$eq": section}},
-                    {"chunk_type": {"$eq": "core_concept"}}
-                ]
-            }
-        )
-        
-        # content_quality_score 90점 이상 필터링
-        filtered_chunks = []
-        
-        if results["documents"]:
-            documents = results["documents"]
-            metadatas = results["metadatas"]
-            
-            for doc, metadata in zip(documents, metadatas):
-                quality_score = metadata.get("content_quality_score", 0)
-                
-                if quality_score >= 90:  # 90점 이상만
-                    chunk_data = {
-                        "content": doc,
-                        "chunk_type": metadata["chunk_type"],
-                        "content_quality_score": quality_score,
-                        "primary_keywords": metadata["primary_keywords"],
-                        "source_url": metadata["source_url"],
-                        "id": metadata["id"]
-                    }
-                    filtered_chunks.append(chunk_data)
-        
-        # content_quality_score 높은 순으로 정렬 후 최대 3개
-        filtered_chunks.sort(key=lambda x: x["content_quality_score"], reverse=True)
-        return filtered_chunks[:3]
+        return index.get_chunks(chapter, section, (CORE_CONCEPT_TYPE,), limit=3)
         
     except Exception as e:
         logging.getLogger(__name__).error(f"core_concept 검색 실패: {str(e)}")
         return []
 
 
-def _search_other_chunks(collection, chapter: int, section: int) -> List[Dict[str, Any]]:
+def _search_other_chunks(index: SectionChunkIndex, chapter: int, section: int) -> List[Dict[str, Any]]:
     """
     기타 청크 타입 검색 (analogy, practical_example, technical_detail)
-    - content_quality_score 높은 순으로 2개
+    - content_quality_score 90점 이상, 높은 순으로 2개
     """
     try:
-        # core_concept 제외한 모든 타입의 청크 가져오기
-        other_chunk_types = ["analogy", "practical_example", "technical_detail"]
-        
-        all_other_chunks = []
-        
-        # 각 청크 타입별로 조회
-        for chunk_type in other_chunk_types:
-            try:
-                results = collection.get(
-                    where={
-                        "$and": [
-                            {"chapter": {"$eq": chapter}},
-                            {"section": {"$eq": section}},
-                            {"chunk_type": {"$eq": chunk_type}}
-                        ]
-                    }
-                )
-                
-                if results["documents"]:
-                    documents = results["documents"]
-                    metadatas = results["metadatas"]
-                    
-                    for doc, metadata in zip(documents, metadatas):
-                        quality_score = metadata.get("content_quality_score", 0)
-                        
-                        if quality_score >= 90:  # 90점 이상만
-                            chunk_data = {
-                                "content": doc,
-                                "chunk_type": metadata["chunk_type"],
-                                "content_quality_score": quality_score,
-                                "primary_keywords": metadata["primary_keywords"],
-                                "source_url": metadata["source_url"],
-                                "id": metadata["id"]
-                            }
-                            all_other_chunks.append(chunk_data)
-                            
-            except Exception as e:
-                logging.getLogger(__name__).warning(f"{chunk_type} 검색 실패: {str(e)}")
-                continue
-        
-        # content_quality_score 높은 순으로 정렬 후 상위 2개 선택
-        all_other_chunks.sort(key=lambda x: x["content_quality_score"], reverse=True)
-        return all_other_chunks[:2]
+        return index.get_chunks(chapter, section, OTHER_CHUNK_TYPES, limit=2)
         
     except Exception as e:
         logging.getLogger(__name__).error(f"기타 청크 검색 실패: {str(e)}")
         return []
 
+@workflow_tracer.traced('vector_search.qna_parallel')
 def search_qna_materials_parallel(search_queries: List[str]) -> List[Dict]:
     """
-    병렬 벡터 검색 실행 및 결과 통합 (동기 버전)
+    다중 쿼리 벡터 검색 실행 및 결과 통합 (동기 버전)
     
     Args:
         search_queries: 검색 쿼리 리스트 (최대 3개)
@@ -344,28 +454,17 @@ def search_qna_materials_parallel(search_queries: List[str]) -> List[Dict]:
     try:
         logger.info(f"병렬 벡터 검색 시작 - 쿼리 {len(search_queries)}개")
         
-        # ThreadPoolExecutor를 사용한 병렬 실행
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # 최대 3개 쿼리로 제한
-            limited_queries = search_queries[:3]
-            
-            # 병렬 검색 실행
-            future_to_query = {
-                executor.submit(search_qna_materials, query): query 
-                for query in limited_queries
-            }
-            
-            # 결과 수집
-            all_results = []
-            for future in future_to_query:
-                query = future_to_query[future]
-                try:
-                    results = future.result(timeout=10)  # 10초 타임아웃
-                    if results:
-                        all_results.extend(results)
-                        logger.info(f"쿼리 '{query}' 검색 완료: {len(results)}개 결과")
-                except Exception as e:
-                    logger.warning(f"쿼리 '{query}' 검색 실패: {str(e)}")
+        # 최대 3개 쿼리로 제한, 임베딩 한 번 + 다중 쿼리 검색 한 번으로 처리
+        limited_queries = search_queries[:3]
+        results_per_query = _query_qna_materials(limited_queries)
+        if results_per_query is None:
+            return []
+        
+        all_results = []
+        for query, results in zip(limited_queries, results_per_query):
+            if results:
+                all_results.extend(results)
+                logger.info(f"쿼리 '{query}' 검색 완료: {len(results)}개 결과")
         
         # 결과 통합 및 중복 제거
         combined_results = _combine_and_deduplicate_results(all_results)
@@ -405,9 +504,9 @@ def _combine_and_deduplicate_results(all_results: List[Dict]) -> List[Dict]:
             seen_contents.add(content)
             unique_results.append(result)
     
-    # 유사도 점수 기준 정렬 (상위 5개만)
+    # 융합 점수(하이브리드 검색) 또는 유사도 점수 기준 정렬 (상위 5개만)
     unique_results.sort(
-        key=lambda x: x.get('similarity_score', x.get('content_quality_score', 0)), 
+        key=lambda x: x.get('fusion_score', x.get('similarity_score', x.get('content_quality_score', 0))), 
         reverse=True
     )
     
@@ -429,27 +528,8 @@ async def search_qna_materials_parallel_async(search_queries: List[str]) -> List
     try:
         logger.info(f"비동기 병렬 벡터 검색 시작 - 쿼리 {len(search_queries)}개")
         
-        # 비동기 검색 작업 생성
-        search_tasks = [
-            _async_vector_search_wrapper(query) 
-            for query in search_queries[:3]  # 최대 3개로 제한
-        ]
-        
-        # 병렬 실행
-        all_results = await asyncio.gather(*search_tasks, return_exceptions=True)
-        
-        # 결과 통합
-        combined_results = []
-        for i, results in enumerate(all_results):
-            if isinstance(results, Exception):
-                logger.warning(f"검색 쿼리 '{search_queries[i]}' 실패: {str(results)}")
-                continue
-                
-            if isinstance(results, list) and results:
-                combined_results.extend(results)
-        
-        # 중복 제거 및 정렬
-        final_results = _combine_and_deduplicate_results(combined_results)
+        # 최대 3개 쿼리를 한 번의 다중 쿼리 검색으로 공용 검색 스레드 풀에서 실행 (통합/중복 제거 포함)
+        final_results = await retrieval_executor.run_async(search_qna_materials_parallel, search_queries[:3])
         
         logger.info(f"비동기 병렬 벡터 검색 완료 - 총 {len(final_results)}개 결과")
         return final_results
@@ -475,10 +555,8 @@ async def _async_vector_search_wrapper(query: str) -> List[Dict]:
     logger = logging.getLogger(__name__)
     
     try:
-        # search_qna_materials가 동기 함수이므로 asyncio.to_thread 사용
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, search_qna_materials, query)
-        return result
+        # search_qna_materials가 동기 함수이므로 공용 검색 스레드 풀에서 실행 (포화 시 예외)
+        return await retrieval_executor.run_async(search_qna_materials, query)
     except Exception as e:
         logger.error(f"비동기 벡터 검색 실패 (쿼리: '{query}'): {str(e)}")
         return []
@@ -497,42 +575,16 @@ def get_vector_search_statistics(chapter: int = None, section: int = None) -> Di
         검색 통계 정보
     """
     try:
-        collection = _get_collection()
-        if not collection:
+        index = _get_section_chunk_index()
+        if not index:
             return {"error": "컬렉션을 찾을 수 없음"}
         
-        # 검색 조건 설정
-        where_conditions = []
-        if chapter:
-            where_conditions.append({"chapter": {"$eq": chapter}})
-        if section:
-            where_conditions.append({"section": {"$eq": section}})
-        
-        # 전체 조건
-        if where_conditions:
-            where_condition = {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
-        else:
-            where_condition = None
-        
         # 청크 타입별 개수 조회
-        chunk_type_counts = {}
-        for chunk_type in ["core_concept", "analogy", "practical_example", "technical_detail"]:
-            type_conditions = where_conditions + [{"chunk_type": {"$eq": chunk_type}}]
-            type_condition = {"$and": type_conditions} if len(type_conditions) > 1 else type_conditions[0]
-            
-            try:
-                type_results = collection.get(where=type_condition)
-                count = len(type_results["documents"]) if type_results["documents"] else 0
-                chunk_type_counts[chunk_type] = count
-            except Exception:
-                chunk_type_counts[chunk_type] = 0
-        
-        # 전체 개수 조회
-        if where_condition:
-            total_results = collection.get(where=where_condition)
-            total_count = len(total_results["documents"]) if total_results["documents"] else 0
-        else:
-            total_count = collection.count()
+        chunk_type_counts = {
+            chunk_type: index.count(chapter or None, section or None, chunk_type)
+            for chunk_type in CHUNK_TYPES
+        }
+        total_count = index.count(chapter or None, section or None)
         
         return {
             "total_chunks": total_count,
@@ -5,6 +5,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List
 from app.core.langraph.state_manager import TutorState
+from app.utils.tracing import workflow_tracer
 
 
 class ChatLogger:
@@ -36,6 +37,7 @@ class ChatLogger:
         # 기본 디렉토리 생성
         self._ensure_directory_exists(self.base_path)
     
+    @workflow_tracer.traced('chat_log.write')
     def save_session_log(self, state: TutorState, session_complete: bool = False) -> str:
         """
         세션 대화 로그를 JSON 파일로 저장
@@ -4,9 +4,24 @@
 자주 사용되는 유틸리티 함수들을 정의합니다.
 """
 
+import os
 import uuid
 from datetime import datetime
 
+# 참으로 해석하는 환경변수 값 (소문자 비교)
+TRUTHY_ENV_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    환경변수 불리언 값 조회
+    값이 없거나 비어 있으면 default, 그 외에는 TRUTHY_ENV_VALUES에 있으면 True를 반환합니다.
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in TRUTHY_ENV_VALUES
+
 
 def generate_unique_id():
     """
@@ -10,7 +10,7 @@ from .query_builder import QueryBuilder
 from .transaction import TransactionManager
 
 # 기본 쿼리 실행 함수들
-from .connection import execute_query, fetch_one, fetch_all
+from .connection import execute_query, fetch_one, fetch_all, execute_batch_queries, run_with_retry
 
 # CRUD 헬퍼 함수들
 from .query_builder import (
@@ -24,6 +24,19 @@ from .query_builder import (
 # 트랜잭션 실행 함수들
 from .transaction import execute_transaction, execute_batch_insert
 
+# 이름 있는 쿼리 레지스트리 및 스트리밍 조회
+from .statements import (
+    PreparedStatement,
+    StatementRegistry,
+    statement_registry,
+    register_statement,
+    fetch_one_statement,
+    fetch_all_statement,
+    execute_statement,
+    stream_query,
+    stream_statement
+)
+
 __all__ = [
     # 클래스들
     'DatabaseConnection', 
@@ -34,6 +47,8 @@ __all__ = [
     'execute_query',
     'fetch_one', 
     'fetch_all',
+    'execute_batch_queries',
+    'run_with_retry',
     
     # CRUD 헬퍼 함수들
     'insert_record',
@@ -44,5 +59,16 @@ __all__ = [
     
     # 트랜잭션 실행 함수들
     'execute_transaction',
-    'execute_batch_insert'
+    'execute_batch_insert',
+    
+    # 이름 있는 쿼리 레지스트리 및 스트리밍 조회
+    'PreparedStatement',
+    'StatementRegistry',
+    'statement_registry',
+    'register_statement',
+    'fetch_one_statement',
+    'fetch_all_statement',
+    'execute_statement',
+    'stream_query',
+    'stream_statement'
 ]
\ No newline at end of file
@@ -9,137 +9,76 @@ from pymysql.connections import Connection
 from pymysql.cursors import DictCursor
 import pymysql
 
+from ...config import db_config as db_config_module
+from ..tracing import workflow_tracer
 from ...config.db_config import (
     get_db_connection, 
-    DatabaseConnectionError, 
     DatabaseQueryError, 
-    DatabaseIntegrityError,
-    db_config,
-    connection_manager
+    DatabaseIntegrityError
 )
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 재시도 대상 오류 (연결 끊김 등 일시적인 오류)
+RETRYABLE_ERRORS = (pymysql.OperationalError, pymysql.InterfaceError)
+
+def _get_db_config():
+    """전역 데이터베이스 설정 반환 (필요 시 초기화)"""
+    if db_config_module.db_config is None:
+        db_config_module.init_db_config()
+    return db_config_module.db_config
+
+def _get_retry_policy() -> Tuple[int, float]:
+    """설정에서 (최대 시도 횟수, 재시도 간격) 반환"""
+    config = _get_db_config()
+    if not config.enable_auto_reconnect:
+        return 1, 0.0
+    return max(1, config.max_reconnect_attempts), config.reconnect_delay
+
 class DatabaseConnection:
     """
     데이터베이스 연결 클래스 v2.0
-    MySQL 연결의 생성, 관리, 해제 및 자동 재연결을 담당합니다.
+    연결 풀에서 연결 하나를 빌려 쓰는 호환용 래퍼입니다.
+    연결 생성, 상태 확인(ping), 재연결은 모두 연결 풀(DatabaseConnectionManager)이 담당합니다.
     """
 
     def __init__(self, config=None):
         """데이터베이스 연결 초기화"""
-        from ...config.db_config import db_config, init_db_config
-        
-        if config is None:
-            if db_config is None:
-                init_db_config()
-            self.config = db_config
-        else:
-            self.config = config
-        
+        self.config = config if config is not None else _get_db_config()
         self.connection = None
-        self._last_ping_time = 0
-        self._ping_interval = 30  # 30초마다 ping
         self._connection_lock = threading.Lock()
 
     def connect(self) -> Connection:
         """
-        데이터베이스 연결 생성 v2.0
+        연결 풀에서 연결 획득 v2.0
         
         Returns:
             Connection: PyMySQL 연결 객체
             
         Raises:
-            DatabaseConnectionError: 연결 실패 시
+            DatabaseConnectionError: 연결 획득 실패 시
         """
         with self._connection_lock:
-            try:
-                if self.connection and self.connection.open:
-                    # 주기적 ping으로 연결 상태 확인
-                    current_time = time.time()
-                    if current_time - self._last_ping_time > self._ping_interval:
-                        if self._ping_connection():
-                            self._last_ping_time = current_time
-                            return self.connection
-                        else:
-                            logger.warning("기존 연결이 비정상 상태입니다. 재연결을 시도합니다.")
-                            self._close_connection()
-                    else:
-                        return self.connection
-                
-                # 새 연결 생성 (재시도 로직 포함)
-                self.connection = self._create_connection_with_retry()
-                self._last_ping_time = time.time()
-                logger.info("데이터베이스 연결이 생성되었습니다.")
-                return self.connection
-                
-            except Exception as e:
-                error_msg = f"데이터베이스 연결 실패: {e}"
-                logger.error(error_msg)
-                raise DatabaseConnectionError(error_msg, e)
-
-    def _create_connection_with_retry(self) -> Connection:
-        """재시도 로직이 포함된 연결 생성"""
-        attempts = 0
-        last_error = None
-        
-        while attempts < self.config.max_reconnect_attempts:
-            try:
-                connection = pymysql.connect(**self.config.get_connection_params())
-                logger.debug(f"연결 생성 성공 (시도: {attempts + 1})")
-                return connection
-                
-            except pymysql.Error as e:
-                attempts += 1
-                last_error = e
-                logger.warning(f"연결 생성 시도 {attempts}/{self.config.max_reconnect_attempts} 실패: {e}")
-                
-                if attempts < self.config.max_reconnect_attempts:
-                    time.sleep(self.config.reconnect_delay)
-        
-        raise DatabaseConnectionError(f"연결 생성 실패 (최대 시도 횟수 초과): {last_error}")
-
-    def _ping_connection(self) -> bool:
-        """연결 상태 ping 확인"""
-        try:
-            if not self.connection or not self.connection.open:
-                return False
-            
-            self.connection.ping(reconnect=False)
-            
-            # 추가 헬스체크 (설정된 경우)
-            if self.config.enable_health_check:
-                with self.connection.cursor() as cursor:
-                    cursor.execute(self.config.health_check_query)
-                    cursor.fetchone()
-            
-            return True
-            
-        except Exception as e:
-            logger.debug(f"연결 ping 실패: {e}")
-            return False
-
-    def _close_connection(self) -> None:
-        """내부 연결 종료"""
-        try:
-            if self.connection and self.connection.open:
-                self.connection.close()
-        except Exception as e:
-            logger.warning(f"연결 종료 중 오류: {e}")
-        finally:
-            self.connection = None
+            if self.connection is None:
+                _get_db_config()
+                self.connection = db_config_module.connection_manager.get_connection()
+            return self.connection
 
     def disconnect(self) -> None:
         """
-        데이터베이스 연결 해제 v2.0
+        빌린 연결을 연결 풀로 반환 v2.0
         """
         with self._connection_lock:
+            if self.connection is None:
+                return
             try:
-                self._close_connection()
-                logger.info("데이터베이스 연결이 해제되었습니다.")
+                db_config_module.connection_manager.return_connection(self.connection)
+                logger.debug("연결이 풀로 반환되었습니다.")
             except Exception as e:
-                logger.warning(f"연결 해제 중 오류: {e}")
+                logger.warning(f"연결 반환 중 오류: {e}")
+            finally:
+                self.connection = None
 
     def is_connected(self) -> bool:
         """
@@ -149,17 +88,17 @@ class DatabaseConnection:
             bool: 연결 상태 (True: 연결됨, False: 연결 안됨)
         """
         with self._connection_lock:
-            return self._ping_connection()
+            return self.connection is not None and bool(self.connection.open)
 
     def reconnect(self) -> Connection:
         """
         연결 재시도 v2.0
         
         Returns:
-            Connection: 재연결된 PyMySQL 연결 객체
+            Connection: 풀에서 새로 획득한 PyMySQL 연결 객체
             
         Raises:
-            DatabaseConnectionError: 재연결 실패 시
+            DatabaseConnectionError: 연결 획득 실패 시
         """
         logger.info("데이터베이스 재연결을 시도합니다.")
         self.disconnect()
@@ -167,48 +106,108 @@ class DatabaseConnection:
 
     def execute_with_retry(self, operation: Callable, *args, **kwargs) -> Any:
         """
-        자동 재연결이 포함된 작업 실행
+        자동 재연결이 포함된 작업 실행 (풀 기반 실행 엔진 사용)
         
         Args:
-            operation: 실행할 함수
+            operation: 실행할 함수 (첫 번째 인자로 연결을 받음)
             *args, **kwargs: 함수 인자들
             
         Returns:
             Any: 작업 결과
             
         Raises:
-            DatabaseConnectionError: 재연결 실패 시
             DatabaseQueryError: 쿼리 실행 실패 시
         """
-        attempts = 0
-        last_error = None
-        
-        while attempts < self.config.max_reconnect_attempts:
-            try:
-                # 연결 확인 및 생성
-                connection = self.connect()
-                
-                # 작업 실행
-                return operation(connection, *args, **kwargs)
-                
-            except (pymysql.OperationalError, pymysql.InterfaceError) as e:
-                # 연결 관련 오류 - 재시도
-                attempts += 1
-                last_error = e
-                logger.warning(f"연결 오류로 재시도 {attempts}/{self.config.max_reconnect_attempts}: {e}")
-                
-                # 연결 초기화
-                self.disconnect()
-                
-                if attempts < self.config.max_reconnect_attempts:
-                    time.sleep(self.config.reconnect_delay)
+        return run_with_retry(lambda connection: operation(connection, *args, **kwargs))
+
+# ================================
+# 풀 기반 재시도 실행 엔진
+# ================================
+
+def run_with_retry(
+    operation: Callable[[Connection], Any],
+    query: Optional[str] = None,
+    params: Optional[Union[Tuple, Dict, List]] = None,
+    max_retries: Optional[int] = None,
+    error_label: str = "쿼리 실행"
+) -> Any:
+    """
+    풀링된 연결로 작업을 실행하고 연결 오류 시 재시도하는 공통 실행 엔진
+    
+    모든 쿼리 헬퍼는 이 함수를 통해 실행됩니다. 매 시도마다 풀에서 연결을 빌리고
+    (get_db_connection), 작업이 성공하면 커밋, 실패하면 롤백 후 풀로 반환합니다.
+    
+    Args:
+        operation: 연결을 받아 작업을 수행하는 함수
+        query: 오류 정보에 기록할 SQL 쿼리
+        params: 오류 정보에 기록할 쿼리 파라미터
+        max_retries: 최대 시도 횟수 (None이면 DB_MAX_RECONNECT_ATTEMPTS 설정 사용)
+        error_label: 로그/오류 메시지에 사용할 작업 이름
+    
+    Returns:
+        Any: operation의 반환값
+    
+    Raises:
+        DatabaseQueryError: 쿼리 실행 실패 시
+        DatabaseIntegrityError: 무결성 제약 위반 시
+    """
+    # 워크플로우 추적 중이면 현재 노드/도구 구간 아래에 DB 작업 구간으로 기록
+    with workflow_tracer.span("db", "db", operation=error_label):
+        return _run_with_retry(operation, query, params, max_retries, error_label)
+
+
+def _run_with_retry(
+    operation: Callable[[Connection], Any],
+    query: Optional[str],
+    params: Optional[Union[Tuple, Dict, List]],
+    max_retries: Optional[int],
+    error_label: str
+) -> Any:
+    """run_with_retry의 실제 실행 (재시도 루프)"""
+    default_retries, retry_delay = _get_retry_policy()
+    if max_retries is None:
+        max_retries = default_retries
+    
+    attempts = 0
+    last_error = None
+    
+    while attempts < max_retries:
+        try:
+            with get_db_connection() as connection:
+                return operation(connection)
                 
-            except Exception as e:
-                # 다른 오류는 즉시 발생
-                logger.error(f"작업 실행 중 오류: {e}")
-                raise
+        except pymysql.IntegrityError as e:
+            # 무결성 오류는 재시도하지 않음
+            error_msg = f"데이터베이스 무결성 오류: {e}"
+            logger.error(error_msg)
+            raise DatabaseIntegrityError(error_msg, original_error=e)
+            
+        except RETRYABLE_ERRORS as e:
+            # 연결 관련 오류 - 재시도
+            attempts += 1
+            last_error = e
+            logger.warning(f"연결 오류로 {error_label} 재시도 {attempts}/{max_retries}: {e}")
+            
+            if attempts < max_retries:
+                time.sleep(retry_delay)
         
-        raise DatabaseConnectionError(f"자동 재연결 실패 (최대 시도 횟수 초과): {last_error}")
+        except (DatabaseQueryError, DatabaseIntegrityError):
+            raise
+            
+        except pymysql.Error as e:
+            error_msg = f"데이터베이스 {error_label} 오류: {e}"
+            logger.error(error_msg)
+            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
+            
+        except Exception as e:
+            error_msg = f"예상치 못한 {error_label} 오류: {e}"
+            logger.error(error_msg)
+            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
+    
+    # 최대 재시도 횟수 초과
+    error_msg = f"{error_label} 실패 (최대 재시도 횟수 초과): {last_error}"
+    logger.error(error_msg)
+    raise DatabaseQueryError(error_msg, query=query, params=params, original_error=last_error)
 
 # ================================
 # 기본 쿼리 실행 함수들
@@ -218,7 +217,7 @@ def execute_query_with_retry(
     query: str, 
     params: Optional[Union[Tuple, Dict, List]] = None,
     fetch_result: bool = False,
-    max_retries: int = 3
+    max_retries: Optional[int] = None
 ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]], int]]:
     """
     자동 재연결이 포함된 SQL 쿼리 실행 함수 v2.0
@@ -227,7 +226,7 @@ def execute_query_with_retry(
         query (str): 실행할 SQL 쿼리
         params (Optional[Union[Tuple, Dict, List]]): 쿼리 파라미터
         fetch_result (bool): 결과를 반환할지 여부
-        max_retries (int): 최대 재시도 횟수
+        max_retries (Optional[int]): 최대 재시도 횟수 (None이면 설정값 사용)
     
     Returns:
         Optional[Union[Dict, List[Dict], int]]: 
@@ -259,44 +258,7 @@ def execute_query_with_retry(
                 logger.debug(f"쿼리 실행 완료: {affected_rows}개 행 영향")
                 return affected_rows
     
-    # 재시도 로직
-    attempts = 0
-    last_error = None
-    
-    while attempts < max_retries:
-        try:
-            with get_db_connection() as connection:
-                return _execute_operation(connection)
-                
-        except pymysql.IntegrityError as e:
-            # 무결성 오류는 재시도하지 않음
-            error_msg = f"데이터베이스 무결성 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseIntegrityError(error_msg, original_error=e)
-            
-        except (pymysql.OperationalError, pymysql.InterfaceError) as e:
-            # 연결 관련 오류 - 재시도
-            attempts += 1
-            last_error = e
-            logger.warning(f"연결 오류로 쿼리 재시도 {attempts}/{max_retries}: {e}")
-            
-            if attempts < max_retries:
-                time.sleep(1.0)  # 1초 대기
-            
-        except pymysql.Error as e:
-            error_msg = f"데이터베이스 쿼리 실행 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-            
-        except Exception as e:
-            error_msg = f"예상치 못한 쿼리 실행 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-    
-    # 최대 재시도 횟수 초과
-    error_msg = f"쿼리 실행 실패 (최대 재시도 횟수 초과): {last_error}"
-    logger.error(error_msg)
-    raise DatabaseQueryError(error_msg, query=query, params=params, original_error=last_error)
+    return run_with_retry(_execute_operation, query, params, max_retries, "쿼리 실행")
 
 def execute_query(
     query: str, 
@@ -319,7 +281,7 @@ def execute_query(
 def fetch_one_with_retry(
     query: str, 
     params: Optional[Union[Tuple, Dict, List]] = None,
-    max_retries: int = 3
+    max_retries: Optional[int] = None
 ) -> Optional[Dict[str, Any]]:
     """
     자동 재연결이 포함된 단일 레코드 조회 함수 v2.0
@@ -327,7 +289,7 @@ def fetch_one_with_retry(
     Args:
         query (str): SELECT 쿼리
         params (Optional[Union[Tuple, Dict, List]]): 쿼리 파라미터
-        max_retries (int): 최대 재시도 횟수
+        max_retries (Optional[int]): 최대 재시도 횟수 (None이면 설정값 사용)
     
     Returns:
         Optional[Dict[str, Any]]: 조회된 레코드 또는 None
@@ -347,43 +309,12 @@ def fetch_one_with_retry(
             
             return result
     
-    # 재시도 로직
-    attempts = 0
-    last_error = None
-    
-    while attempts < max_retries:
-        try:
-            with get_db_connection() as connection:
-                return _fetch_operation(connection)
-                
-        except (pymysql.OperationalError, pymysql.InterfaceError) as e:
-            # 연결 관련 오류 - 재시도
-            attempts += 1
-            last_error = e
-            logger.warning(f"연결 오류로 조회 재시도 {attempts}/{max_retries}: {e}")
-            
-            if attempts < max_retries:
-                time.sleep(1.0)
-                
-        except pymysql.Error as e:
-            error_msg = f"단일 레코드 조회 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-            
-        except Exception as e:
-            error_msg = f"예상치 못한 단일 레코드 조회 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-    
-    # 최대 재시도 횟수 초과
-    error_msg = f"단일 레코드 조회 실패 (최대 재시도 횟수 초과): {last_error}"
-    logger.error(error_msg)
-    raise DatabaseQueryError(error_msg, query=query, params=params, original_error=last_error)
+    return run_with_retry(_fetch_operation, query, params, max_retries, "단일 레코드 조회")
 
 def fetch_all_with_retry(
     query: str, 
     params: Optional[Union[Tuple, Dict, List]] = None,
-    max_retries: int = 3
+    max_retries: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     자동 재연결이 포함된 다중 레코드 조회 함수 v2.0
@@ -391,7 +322,7 @@ def fetch_all_with_retry(
     Args:
         query (str): SELECT 쿼리
         params (Optional[Union[Tuple, Dict, List]]): 쿼리 파라미터
-        max_retries (int): 최대 재시도 횟수
+        max_retries (Optional[int]): 최대 재시도 횟수 (None이면 설정값 사용)
     
     Returns:
         List[Dict[str, Any]]: 조회된 레코드 리스트
@@ -407,38 +338,7 @@ def fetch_all_with_retry(
             logger.debug(f"다중 레코드 조회 성공: {len(results)}개 행")
             return results
     
-    # 재시도 로직
-    attempts = 0
-    last_error = None
-    
-    while attempts < max_retries:
-        try:
-            with get_db_connection() as connection:
-                return _fetch_all_operation(connection)
-                
-        except (pymysql.OperationalError, pymysql.InterfaceError) as e:
-            # 연결 관련 오류 - 재시도
-            attempts += 1
-            last_error = e
-            logger.warning(f"연결 오류로 조회 재시도 {attempts}/{max_retries}: {e}")
-            
-            if attempts < max_retries:
-                time.sleep(1.0)
-                
-        except pymysql.Error as e:
-            error_msg = f"다중 레코드 조회 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-            
-        except Exception as e:
-            error_msg = f"예상치 못한 다중 레코드 조회 오류: {e}"
-            logger.error(error_msg)
-            raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
-    
-    # 최대 재시도 횟수 초과
-    error_msg = f"다중 레코드 조회 실패 (최대 재시도 횟수 초과): {last_error}"
-    logger.error(error_msg)
-    raise DatabaseQueryError(error_msg, query=query, params=params, original_error=last_error)
+    return run_with_retry(_fetch_all_operation, query, params, max_retries, "다중 레코드 조회")
 
 def fetch_one(
     query: str, 
@@ -490,42 +390,58 @@ def execute_batch_queries(
     
     Raises:
         DatabaseQueryError: 쿼리 실행 실패 시
+    
+    연결 오류로 재시도할 때:
+        - 트랜잭션 사용: 이전 시도가 롤백되었으므로 처음부터 다시 실행
+        - 트랜잭션 미사용(자동 커밋): 이미 커밋된 쿼리는 다시 실행하지 않고 남은 쿼리부터 실행하며,
+          실행 도중 연결이 끊긴 쿼리는 커밋 여부를 알 수 없으므로 재시도하지 않고 오류 발생
     """
-    results = []
+    results: List[Any] = []
+    in_flight: Optional[int] = None
     
-    try:
-        with get_db_connection() as connection:
-            if not use_transaction:
-                connection.autocommit(True)
-            
-            try:
-                for query, params in queries:
-                    with connection.cursor() as cursor:
-                        affected_rows = cursor.execute(query, params)
-                        
-                        # SELECT 쿼리인지 확인
-                        query_type = query.strip().upper().split()[0]
-                        if query_type == 'SELECT':
-                            result = cursor.fetchall()
-                        else:
-                            result = affected_rows
-                        
-                        results.append(result)
-                
-                if use_transaction:
-                    connection.commit()
+    def _batch_operation(connection: Connection) -> List[Any]:
+        nonlocal in_flight
+        
+        if use_transaction:
+            results.clear()
+        elif in_flight is not None:
+            raise DatabaseQueryError(
+                f"배치 쿼리 {in_flight + 1}번째 실행 중 연결이 끊겨 커밋 여부를 알 수 없어 재시도하지 않음 "
+                f"(완료 {len(results)}/{len(queries)}개)",
+                query=queries[in_flight][0], params=queries[in_flight][1]
+            )
+        
+        if not use_transaction:
+            connection.autocommit(True)
+        
+        try:
+            for index in range(len(results), len(queries)):
+                query, params = queries[index]
+                with connection.cursor() as cursor:
+                    in_flight = index
+                    affected_rows = cursor.execute(query, params)
                     
-                logger.info(f"배치 쿼리 실행 완료: {len(queries)}개 쿼리")
-                return results
-                
-            except Exception as e:
-                if use_transaction:
-                    connection.rollback()
-                raise
-            finally:
-                if not use_transaction:
-                    connection.autocommit(False)
+                    # SELECT 쿼리인지 확인
+                    query_type = query.strip().upper().split()[0]
+                    if query_type == 'SELECT':
+                        result = cursor.fetchall()
+                    else:
+                        result = affected_rows
                     
+                    results.append(result)
+                in_flight = None
+            
+            return results
+        finally:
+            if not use_transaction:
+                connection.autocommit(False)
+    
+    try:
+        # 커밋/롤백은 get_db_connection 컨텍스트에서 처리
+        run_with_retry(_batch_operation, error_label="배치 쿼리 실행")
+        logger.info(f"배치 쿼리 실행 완료: {len(queries)}개 쿼리")
+        return results
+        
     except Exception as e:
         error_msg = f"배치 쿼리 실행 오류: {e}"
         logger.error(error_msg)
@@ -547,17 +463,13 @@ def check_connection_health() -> Dict[str, Any]:
     
     try:
         # 기본 연결 테스트
-        with get_db_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1 as test")
-                result = cursor.fetchone()
-                
-                if result and result.get('test') == 1:
-                    health_info['connection_test'] = True
+        result = fetch_one("SELECT 1 as test")
+        if result and result.get('test') == 1:
+            health_info['connection_test'] = True
         
         # 연결 풀 통계
-        if connection_manager:
-            health_info['pool_stats'] = connection_manager.get_pool_stats()
+        if db_config_module.connection_manager:
+            health_info['pool_stats'] = db_config_module.connection_manager.get_pool_stats()
         
         health_info['is_healthy'] = health_info['connection_test']
         logger.debug("연결 상태 확인 완료")
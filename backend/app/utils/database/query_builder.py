@@ -3,13 +3,12 @@
 
 import logging
 from typing import Optional, List, Dict, Any, Union, Tuple
-import pymysql
 
 from ...config.db_config import (
-    get_db_connection, 
     DatabaseQueryError, 
     DatabaseIntegrityError
 )
+from .connection import run_with_retry
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -279,7 +278,7 @@ def insert_record(
         query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
         values = tuple(data.values())
         
-        with get_db_connection() as connection:
+        def _insert_operation(connection) -> Optional[int]:
             with connection.cursor() as cursor:
                 cursor.execute(query, values)
                 
@@ -290,15 +289,11 @@ def insert_record(
                 else:
                     logger.debug(f"레코드 삽입 성공: {table} 테이블")
                     return None
+        
+        return run_with_retry(_insert_operation, query, values, error_label=f"레코드 삽입 ({table})")
                     
-    except pymysql.IntegrityError as e:
-        error_msg = f"레코드 삽입 무결성 오류 ({table}): {e}"
-        logger.error(error_msg)
-        raise DatabaseIntegrityError(error_msg)
-    except pymysql.Error as e:
-        error_msg = f"레코드 삽입 오류 ({table}): {e}"
-        logger.error(error_msg)
-        raise DatabaseQueryError(error_msg)
+    except (DatabaseIntegrityError, DatabaseQueryError):
+        raise
     except Exception as e:
         error_msg = f"예상치 못한 레코드 삽입 오류 ({table}): {e}"
         logger.error(error_msg)
@@ -339,20 +334,16 @@ def update_record(
         if where_params:
             params.extend(where_params)
         
-        with get_db_connection() as connection:
+        def _update_operation(connection) -> int:
             with connection.cursor() as cursor:
                 affected_rows = cursor.execute(query, params)
                 logger.debug(f"레코드 업데이트 성공: {table} 테이블, {affected_rows}개 행 영향")
                 return affected_rows
+        
+        return run_with_retry(_update_operation, query, params, error_label=f"레코드 업데이트 ({table})")
                 
-    except pymysql.IntegrityError as e:
-        error_msg = f"레코드 업데이트 무결성 오류 ({table}): {e}"
-        logger.error(error_msg)
-        raise DatabaseIntegrityError(error_msg)
-    except pymysql.Error as e:
-        error_msg = f"레코드 업데이트 오류 ({table}): {e}"
-        logger.error(error_msg)
-        raise DatabaseQueryError(error_msg)
+    except (DatabaseIntegrityError, DatabaseQueryError):
+        raise
     except Exception as e:
         error_msg = f"예상치 못한 레코드 업데이트 오류 ({table}): {e}"
         logger.error(error_msg)
@@ -380,16 +371,16 @@ def delete_record(
     try:
         query = f"DELETE FROM {table} WHERE {where_clause}"
         
-        with get_db_connection() as connection:
+        def _delete_operation(connection) -> int:
             with connection.cursor() as cursor:
                 affected_rows = cursor.execute(query, where_params)
                 logger.debug(f"레코드 삭제 성공: {table} 테이블, {affected_rows}개 행 삭제")
                 return affected_rows
+        
+        return run_with_retry(_delete_operation, query, where_params, error_label=f"레코드 삭제 ({table})")
                 
-    except pymysql.Error as e:
-        error_msg = f"레코드 삭제 오류 ({table}): {e}"
-        logger.error(error_msg)
-        raise DatabaseQueryError(error_msg)
+    except (DatabaseIntegrityError, DatabaseQueryError):
+        raise
     except Exception as e:
         error_msg = f"예상치 못한 레코드 삭제 오류 ({table}): {e}"
         logger.error(error_msg)
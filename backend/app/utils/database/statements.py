@@ -0,0 +1,293 @@
+# backend/app/utils/database/statements.py
+# 이름 있는 쿼리(Statement) 레지스트리 및 스트리밍 조회 함수들
+
+import re
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Union, Tuple, Iterator
+
+from pymysql.cursors import SSDictCursor
+
+from ...config.db_config import get_db_connection, DatabaseQueryError
+from .connection import run_with_retry
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# %(name)s 형태의 이름 있는 파라미터
+_NAMED_PARAM_PATTERN = re.compile(r'%\((\w+)\)s')
+
+# 기본 스트리밍 배치 크기
+DEFAULT_STREAM_BATCH_SIZE = 500
+
+@dataclass(frozen=True)
+class PreparedStatement:
+    """
+    등록 시점에 한 번만 파싱된 쿼리
+
+    PyMySQL은 서버 측 prepared statement(COM_STMT_PREPARE)를 지원하지 않으므로,
+    SQL 공백 정규화와 이름 있는 파라미터 → 위치 파라미터 변환을 등록 시점에 미리 수행하고
+    요청 시에는 파라미터 바인딩만 합니다.
+    """
+    name: str
+    sql: str
+    param_names: Tuple[str, ...] = ()
+    param_count: int = 0
+
+    def bind(self, params: Optional[Union[Tuple, List, Dict[str, Any]]] = None) -> Optional[Tuple]:
+        """
+        파라미터를 위치 파라미터 튜플로 변환
+
+        Args:
+            params: 위치 파라미터(튜플/리스트) 또는 이름 있는 파라미터(딕셔너리)
+
+        Returns:
+            Optional[Tuple]: cursor.execute에 전달할 파라미터
+
+        Raises:
+            ValueError: 파라미터 개수나 이름이 맞지 않는 경우
+        """
+        if isinstance(params, dict):
+            if not self.param_names:
+                raise ValueError(f"'{self.name}' 쿼리는 이름 있는 파라미터를 사용하지 않습니다")
+            try:
+                return tuple(params[name] for name in self.param_names)
+            except KeyError as e:
+                raise ValueError(f"'{self.name}' 쿼리에 필요한 파라미터가 없습니다: {e}")
+
+        if params is None:
+            params = ()
+        elif not isinstance(params, (list, tuple)):
+            params = (params,)
+
+        if len(params) != self.param_count:
+            raise ValueError(
+                f"'{self.name}' 쿼리 파라미터 개수 불일치 (필요: {self.param_count}, 전달: {len(params)})"
+            )
+        return tuple(params) if params else None
+
+class StatementRegistry:
+    """
+    이름 있는 쿼리 레지스트리
+    자주 실행되는 쿼리를 한 번만 선언/파싱하고 이름으로 재사용합니다.
+    """
+
+    def __init__(self):
+        """레지스트리 초기화"""
+        self._statements: Dict[str, PreparedStatement] = {}
+        self._execution_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, sql: str) -> PreparedStatement:
+        """
+        쿼리 등록
+
+        Args:
+            name: 쿼리 이름 (예: 'auth.validate_refresh_token')
+            sql: SQL 문 (%s 위치 파라미터 또는 %(name)s 이름 있는 파라미터)
+
+        Returns:
+            PreparedStatement: 파싱된 쿼리
+
+        Raises:
+            ValueError: 같은 이름으로 다른 SQL이 이미 등록된 경우, 파라미터 형식을 섞어 쓴 경우
+        """
+        # 공백 정규화 (들여쓰기/줄바꿈 제거로 전송 바이트 감소)
+        normalized_sql = ' '.join(sql.split())
+
+        param_names = tuple(_NAMED_PARAM_PATTERN.findall(normalized_sql))
+        if param_names:
+            if '%s' in _NAMED_PARAM_PATTERN.sub('', normalized_sql):
+                raise ValueError(f"'{name}' 쿼리에 %s와 %(name)s 파라미터를 함께 사용할 수 없습니다")
+            normalized_sql = _NAMED_PARAM_PATTERN.sub('%s', normalized_sql)
+            param_count = len(param_names)
+        else:
+            param_count = normalized_sql.count('%s')
+
+        statement = PreparedStatement(
+            name=name,
+            sql=normalized_sql,
+            param_names=param_names,
+            param_count=param_count
+        )
+
+        with self._lock:
+            existing = self._statements.get(name)
+            if existing is not None:
+                if existing.sql != statement.sql:
+                    raise ValueError(f"'{name}' 이름으로 다른 쿼리가 이미 등록되어 있습니다")
+                return existing
+
+            self._statements[name] = statement
+            self._execution_counts[name] = 0
+
+        logger.debug(f"쿼리 등록: {name}")
+        return statement
+
+    def get(self, name_or_statement: Union[str, PreparedStatement]) -> PreparedStatement:
+        """
+        등록된 쿼리 조회
+
+        Raises:
+            KeyError: 등록되지 않은 이름인 경우
+        """
+        if isinstance(name_or_statement, PreparedStatement):
+            return name_or_statement
+
+        statement = self._statements.get(name_or_statement)
+        if statement is None:
+            raise KeyError(f"등록되지 않은 쿼리입니다: {name_or_statement}")
+        return statement
+
+    def record_execution(self, name: str) -> None:
+        """실행 횟수 기록"""
+        with self._lock:
+            self._execution_counts[name] = self._execution_counts.get(name, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """등록된 쿼리 및 실행 횟수 반환"""
+        with self._lock:
+            return {
+                'registered_statements': len(self._statements),
+                'execution_counts': dict(self._execution_counts)
+            }
+
+# 전역 레지스트리
+statement_registry = StatementRegistry()
+
+def register_statement(name: str, sql: str) -> PreparedStatement:
+    """전역 레지스트리에 쿼리 등록"""
+    return statement_registry.register(name, sql)
+
+def _prepare(
+    statement: Union[str, PreparedStatement],
+    params: Optional[Union[Tuple, List, Dict[str, Any]]]
+) -> Tuple[PreparedStatement, Optional[Tuple]]:
+    """쿼리 조회 + 파라미터 바인딩"""
+    prepared = statement_registry.get(statement)
+    bound_params = prepared.bind(params)
+    statement_registry.record_execution(prepared.name)
+    return prepared, bound_params
+
+# ================================
+# 등록된 쿼리 실행 함수들
+# ================================
+
+def fetch_one_statement(
+    statement: Union[str, PreparedStatement],
+    params: Optional[Union[Tuple, List, Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    등록된 쿼리로 단일 레코드 조회
+
+    Args:
+        statement: 쿼리 이름 또는 PreparedStatement
+        params: 쿼리 파라미터
+
+    Returns:
+        Optional[Dict[str, Any]]: 조회된 레코드 또는 None
+    """
+    prepared, bound_params = _prepare(statement, params)
+
+    def _fetch_operation(connection) -> Optional[Dict[str, Any]]:
+        with connection.cursor() as cursor:
+            cursor.execute(prepared.sql, bound_params)
+            return cursor.fetchone()
+
+    return run_with_retry(_fetch_operation, prepared.sql, bound_params, error_label=f"{prepared.name} 조회")
+
+def fetch_all_statement(
+    statement: Union[str, PreparedStatement],
+    params: Optional[Union[Tuple, List, Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    등록된 쿼리로 다중 레코드 조회
+
+    Args:
+        statement: 쿼리 이름 또는 PreparedStatement
+        params: 쿼리 파라미터
+
+    Returns:
+        List[Dict[str, Any]]: 조회된 레코드 리스트
+    """
+    prepared, bound_params = _prepare(statement, params)
+
+    def _fetch_all_operation(connection) -> List[Dict[str, Any]]:
+        with connection.cursor() as cursor:
+            cursor.execute(prepared.sql, bound_params)
+            return list(cursor.fetchall())
+
+    return run_with_retry(_fetch_all_operation, prepared.sql, bound_params, error_label=f"{prepared.name} 조회")
+
+def execute_statement(
+    statement: Union[str, PreparedStatement],
+    params: Optional[Union[Tuple, List, Dict[str, Any]]] = None
+) -> int:
+    """
+    등록된 쿼리로 INSERT/UPDATE/DELETE 실행
+
+    Returns:
+        int: 영향받은 행 수
+    """
+    prepared, bound_params = _prepare(statement, params)
+
+    def _execute_operation(connection) -> int:
+        with connection.cursor() as cursor:
+            return cursor.execute(prepared.sql, bound_params)
+
+    return run_with_retry(_execute_operation, prepared.sql, bound_params, error_label=f"{prepared.name} 실행")
+
+def stream_query(
+    query: str,
+    params: Optional[Union[Tuple, Dict, List]] = None,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    서버 측 커서(SSDictCursor)로 대량 결과를 스트리밍 조회
+
+    결과 전체를 메모리에 올리지 않고 batch_size 단위로 읽어 한 행씩 반환합니다.
+    반복이 끝날 때까지 풀의 연결 하나를 점유하며, 스트리밍 도중에는 재시도하지 않습니다.
+
+    Args:
+        query: SELECT 쿼리
+        params: 쿼리 파라미터
+        batch_size: 한 번에 읽을 행 수
+
+    Yields:
+        Dict[str, Any]: 조회된 레코드
+
+    Raises:
+        DatabaseQueryError: 쿼리 실행 실패 시
+    """
+    try:
+        with get_db_connection() as connection:
+            with connection.cursor(SSDictCursor) as cursor:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+    except GeneratorExit:
+        raise
+    except DatabaseQueryError:
+        raise
+    except Exception as e:
+        error_msg = f"스트리밍 조회 오류: {e}"
+        logger.error(error_msg)
+        raise DatabaseQueryError(error_msg, query=query, params=params, original_error=e)
+
+def stream_statement(
+    statement: Union[str, PreparedStatement],
+    params: Optional[Union[Tuple, List, Dict[str, Any]]] = None,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    등록된 쿼리를 서버 측 커서로 스트리밍 조회
+
+    Yields:
+        Dict[str, Any]: 조회된 레코드
+    """
+    prepared, bound_params = _prepare(statement, params)
+    return stream_query(prepared.sql, bound_params, batch_size)
@@ -6,14 +6,22 @@ from typing import List, Dict, Any, Union, Tuple, Optional
 import pymysql
 
 from ...config.db_config import (
-    get_db_connection, 
     DatabaseQueryError, 
     DatabaseIntegrityError
 )
+from .connection import run_with_retry
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 다중 행 INSERT 크기 제한 (max_allowed_packet 조회 실패 시 MySQL 기본값 4MB 사용)
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+PACKET_SAFETY_RATIO = 0.9
+_max_allowed_packet: Optional[int] = None
+
+# 다중 행 INSERT의 ID 간격 (auto_increment_increment, 조회 실패 시 행마다 INSERT하여 ID 확인)
+_auto_increment_increment: Optional[int] = None
+
 class TransactionManager:
     """
     트랜잭션 관리 클래스
@@ -215,104 +223,169 @@ def execute_transaction(operations: List[Dict[str, Any]]) -> List[Any]:
     if not operations:
         raise ValueError("실행할 작업이 없습니다")
     
-    results = []
-    
-    try:
-        with get_db_connection() as connection:
-            # 트랜잭션 시작 (autocommit=False가 기본값)
-            for operation in operations:
-                op_type = operation.get('type')
-                
-                if op_type == 'query':
-                    # 직접 쿼리 실행
-                    query = operation['query']
-                    params = operation.get('params')
-                    
-                    with connection.cursor() as cursor:
-                        affected_rows = cursor.execute(query, params)
-                        
-                        # SELECT 쿼리인지 확인
-                        if query.strip().upper().startswith('SELECT'):
-                            result = cursor.fetchall()
-                        else:
-                            result = affected_rows
-                        
-                        results.append(result)
+    def _transaction_operation(connection) -> List[Any]:
+        # 재시도 시 이전 시도의 결과가 섞이지 않도록 매 시도마다 새로 수집
+        results = []
+        
+        # 트랜잭션 시작 (autocommit=False가 기본값)
+        for operation in operations:
+            op_type = operation.get('type')
+            
+            if op_type == 'query':
+                # 직접 쿼리 실행
+                query = operation['query']
+                params = operation.get('params')
                 
-                elif op_type == 'insert':
-                    # INSERT 작업
-                    table = operation['table']
-                    data = operation['data']
-                    return_id = operation.get('return_id', True)
+                with connection.cursor() as cursor:
+                    affected_rows = cursor.execute(query, params)
                     
-                    columns = ', '.join(data.keys())
-                    placeholders = ', '.join(['%s'] * len(data))
-                    query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-                    values = tuple(data.values())
+                    # SELECT 쿼리인지 확인
+                    if query.strip().upper().startswith('SELECT'):
+                        result = cursor.fetchall()
+                    else:
+                        result = affected_rows
                     
-                    with connection.cursor() as cursor:
-                        cursor.execute(query, values)
-                        result = cursor.lastrowid if return_id else cursor.rowcount
-                        results.append(result)
+                    results.append(result)
+            
+            elif op_type == 'insert':
+                # INSERT 작업
+                table = operation['table']
+                data = operation['data']
+                return_id = operation.get('return_id', True)
                 
-                elif op_type == 'update':
-                    # UPDATE 작업
-                    table = operation['table']
-                    data = operation['data']
-                    where_clause = operation['where_clause']
-                    where_params = operation.get('params', [])
-                    
-                    set_clause = ', '.join([f"{key} = %s" for key in data.keys()])
-                    query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-                    
-                    params = list(data.values())
-                    if where_params:
-                        params.extend(where_params)
-                    
-                    with connection.cursor() as cursor:
-                        affected_rows = cursor.execute(query, params)
-                        results.append(affected_rows)
+                columns = ', '.join(data.keys())
+                placeholders = ', '.join(['%s'] * len(data))
+                query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+                values = tuple(data.values())
                 
-                elif op_type == 'delete':
-                    # DELETE 작업
-                    table = operation['table']
-                    where_clause = operation['where_clause']
-                    where_params = operation.get('params')
-                    
-                    query = f"DELETE FROM {table} WHERE {where_clause}"
-                    
-                    with connection.cursor() as cursor:
-                        affected_rows = cursor.execute(query, where_params)
-                        results.append(affected_rows)
+                with connection.cursor() as cursor:
+                    cursor.execute(query, values)
+                    result = cursor.lastrowid if return_id else cursor.rowcount
+                    results.append(result)
+            
+            elif op_type == 'update':
+                # UPDATE 작업
+                table = operation['table']
+                data = operation['data']
+                where_clause = operation['where_clause']
+                where_params = operation.get('params', [])
+                
+                set_clause = ', '.join([f"{key} = %s" for key in data.keys()])
+                query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+                
+                params = list(data.values())
+                if where_params:
+                    params.extend(where_params)
                 
-                else:
-                    raise ValueError(f"지원하지 않는 작업 타입: {op_type}")
+                with connection.cursor() as cursor:
+                    affected_rows = cursor.execute(query, params)
+                    results.append(affected_rows)
             
-            # 모든 작업이 성공하면 커밋 (컨텍스트 매니저에서 자동 처리)
-            logger.info(f"트랜잭션 실행 성공: {len(operations)}개 작업 완료")
-            return results
+            elif op_type == 'delete':
+                # DELETE 작업
+                table = operation['table']
+                where_clause = operation['where_clause']
+                where_params = operation.get('params')
+                
+                query = f"DELETE FROM {table} WHERE {where_clause}"
+                
+                with connection.cursor() as cursor:
+                    affected_rows = cursor.execute(query, where_params)
+                    results.append(affected_rows)
+            
+            else:
+                raise ValueError(f"지원하지 않는 작업 타입: {op_type}")
+        
+        return results
+    
+    try:
+        # 모든 작업이 성공하면 커밋, 실패하면 롤백 (get_db_connection 컨텍스트에서 자동 처리)
+        results = run_with_retry(_transaction_operation, error_label="트랜잭션 실행")
+        logger.info(f"트랜잭션 실행 성공: {len(operations)}개 작업 완료")
+        return results
             
     except Exception as e:
-        # 오류 발생 시 롤백 (컨텍스트 매니저에서 자동 처리)
         error_msg = f"트랜잭션 실행 오류: {e}"
         logger.error(error_msg)
         raise DatabaseQueryError(error_msg)
 
+def _get_max_allowed_packet(connection) -> int:
+    """
+    서버의 max_allowed_packet 값 조회 (프로세스당 한 번만 조회 후 캐시)
+    
+    Args:
+        connection: 데이터베이스 연결
+        
+    Returns:
+        int: 최대 패킷 크기 (바이트)
+    """
+    global _max_allowed_packet
+    
+    if _max_allowed_packet is None:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT @@max_allowed_packet AS max_allowed_packet")
+                row = cursor.fetchone()
+                _max_allowed_packet = int(row['max_allowed_packet'])
+        except Exception as e:
+            logger.warning(f"max_allowed_packet 조회 실패, 기본값 사용: {e}")
+            return DEFAULT_MAX_ALLOWED_PACKET
+    
+    return _max_allowed_packet
+
+def _get_auto_increment_increment(connection) -> Optional[int]:
+    """
+    서버의 auto_increment_increment 값 조회 (프로세스당 한 번만 조회 후 캐시)
+    
+    복제 구성(Galera, Group Replication 등)에서는 1보다 클 수 있으므로
+    다중 행 INSERT의 ID를 계산할 때 이 값을 간격으로 사용합니다.
+    
+    Args:
+        connection: 데이터베이스 연결
+        
+    Returns:
+        Optional[int]: ID 간격 (조회 실패 시 None)
+    """
+    global _auto_increment_increment
+    
+    if _auto_increment_increment is None:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT @@auto_increment_increment AS auto_increment_increment")
+                row = cursor.fetchone()
+                _auto_increment_increment = int(row['auto_increment_increment'])
+        except Exception as e:
+            logger.warning(f"auto_increment_increment 조회 실패, 행마다 INSERT하여 ID 확인: {e}")
+            return None
+    
+    return _auto_increment_increment
+
 def execute_batch_insert(
     table: str, 
     data_list: List[Dict[str, Any]],
-    batch_size: int = 100
+    batch_size: int = 100,
+    return_ids: bool = True,
+    max_packet_bytes: Optional[int] = None
 ) -> List[int]:
     """
-    배치 삽입 함수 - 대량의 데이터를 효율적으로 삽입
+    배치 삽입 함수 - 대량의 데이터를 다중 행 INSERT로 효율적으로 삽입
+    
+    INSERT INTO ... VALUES (...), (...), ... 형태의 문장으로 묶어 실행하며,
+    한 문장은 batch_size 행과 서버의 max_allowed_packet을 넘지 않도록 나뉩니다.
+    모든 문장은 하나의 트랜잭션으로 실행됩니다.
     
     Args:
         table (str): 테이블 명
         data_list (List[Dict[str, Any]]): 삽입할 데이터 리스트
-        batch_size (int): 배치 크기
+        batch_size (int): 한 문장에 포함할 최대 행 수
+        return_ids (bool): 삽입된 레코드 ID 반환 여부
+        max_packet_bytes (Optional[int]): 한 문장의 최대 크기 (None이면 서버 설정에서 조회)
     
     Returns:
-        List[int]: 삽입된 레코드들의 ID 리스트
+        List[int]: 삽입된 레코드들의 ID 리스트 (return_ids=False이면 빈 리스트)
+            다중 행 INSERT는 auto_increment_increment 간격의 AUTO_INCREMENT 값을 할당하므로
+            각 문장의 첫 ID(lastrowid)부터 행 수만큼의 범위로 계산합니다.
+            auto_increment_increment를 조회하지 못하면 행마다 INSERT하여 lastrowid를 그대로 사용합니다.
     
     Raises:
         DatabaseQueryError: 배치 삽입 실패 시
@@ -320,36 +393,67 @@ def execute_batch_insert(
     if not data_list:
         raise ValueError("삽입할 데이터가 없습니다")
     
-    inserted_ids = []
+    # 첫 번째 데이터로 컬럼 구조 확인
+    column_names = list(data_list[0].keys())
+    column_set = set(column_names)
+    for data in data_list:
+        # 모든 데이터가 같은 컬럼 구조를 가지는지 확인
+        if set(data.keys()) != column_set:
+            raise ValueError("모든 데이터가 동일한 컬럼 구조를 가져야 합니다")
     
-    try:
-        with get_db_connection() as connection:
-            # 첫 번째 데이터로 컬럼 구조 확인
-            first_data = data_list[0]
-            columns = ', '.join(first_data.keys())
-            placeholders = ', '.join(['%s'] * len(first_data))
-            query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+    columns = ', '.join(column_names)
+    insert_prefix = f"INSERT INTO {table} ({columns}) VALUES "
+    row_template = '(' + ', '.join(['%s'] * len(column_names)) + ')'
+    
+    def _batch_insert_operation(connection) -> List[int]:
+        inserted_ids = []
+        packet_limit = max_packet_bytes or int(_get_max_allowed_packet(connection) * PACKET_SAFETY_RATIO)
+        id_step = _get_auto_increment_increment(connection) if return_ids else 1
+        # 간격을 모르면 행마다 INSERT (문장별 lastrowid가 곧 해당 행의 ID)
+        rows_per_statement = batch_size if id_step is not None else 1
+        id_step = id_step or 1
+        statement_count = 0
+        
+        with connection.cursor() as cursor:
+            def _flush(rows: List[str]) -> None:
+                nonlocal statement_count
+                cursor.execute(insert_prefix + ', '.join(rows))
+                statement_count += 1
+                if return_ids:
+                    first_id = cursor.lastrowid
+                    inserted_ids.extend(range(first_id, first_id + len(rows) * id_step, id_step))
+            
+            pending_rows: List[str] = []
+            pending_bytes = len(insert_prefix.encode('utf-8'))
             
-            # 배치 단위로 처리
-            for i in range(0, len(data_list), batch_size):
-                batch = data_list[i:i + batch_size]
+            for data in data_list:
+                # 값 이스케이프는 행마다 한 번만 수행
+                row_sql = cursor.mogrify(row_template, tuple(data[column] for column in column_names))
+                row_bytes = len(row_sql.encode('utf-8')) + 2  # ", " 구분자
                 
-                with connection.cursor() as cursor:
-                    for data in batch:
-                        # 모든 데이터가 같은 컬럼 구조를 가지는지 확인
-                        if set(data.keys()) != set(first_data.keys()):
-                            raise ValueError("모든 데이터가 동일한 컬럼 구조를 가져야 합니다")
-                        
-                        values = tuple(data.values())
-                        cursor.execute(query, values)
-                        inserted_ids.append(cursor.lastrowid)
+                if pending_rows and (
+                        len(pending_rows) >= rows_per_statement or pending_bytes + row_bytes > packet_limit):
+                    _flush(pending_rows)
+                    pending_rows = []
+                    pending_bytes = len(insert_prefix.encode('utf-8'))
                 
-                logger.debug(f"배치 삽입 완료: {len(batch)}개 레코드")
+                pending_rows.append(row_sql)
+                pending_bytes += row_bytes
             
-            logger.info(f"배치 삽입 성공: {table} 테이블, 총 {len(data_list)}개 레코드")
-            return inserted_ids
+            if pending_rows:
+                _flush(pending_rows)
+        
+        logger.debug(f"배치 삽입 완료: {len(data_list)}개 레코드, {statement_count}개 INSERT 문")
+        return inserted_ids
+    
+    try:
+        inserted_ids = run_with_retry(_batch_insert_operation, query=insert_prefix, error_label="배치 삽입")
+        logger.info(f"배치 삽입 성공: {table} 테이블, 총 {len(data_list)}개 레코드")
+        return inserted_ids
             
+    except (DatabaseIntegrityError, DatabaseQueryError):
+        raise
     except Exception as e:
         error_msg = f"배치 삽입 오류 ({table}): {e}"
         logger.error(error_msg)
-        raise DatabaseQueryError(error_msg)
\ No newline at end of file
+        raise DatabaseQueryError(error_msg)
@@ -0,0 +1,15 @@
+# backend/app/utils/tracing/__init__.py
+"""
+워크플로우 구간 추적 모듈
+LangGraph 노드와 그 안의 벡터 검색, LLM 호출, DB 작업, 대화 로그 저장 시간을
+구간(span) 단위로 기록하고 토큰 사용량과 캐시 적중을 함께 집계합니다.
+"""
+
+from .workflow_tracer import Span, WorkflowTracer, workflow_tracer, create_workflow_tracer
+
+__all__ = [
+    'Span',
+    'WorkflowTracer',
+    'workflow_tracer',
+    'create_workflow_tracer'
+]
@@ -0,0 +1,404 @@
+# backend/app/utils/tracing/workflow_tracer.py
+# LangGraph 워크플로우 구간(span) 추적기
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from app.utils.common.helpers import env_bool
+
+# 구간 종류
+SPAN_KINDS = ('workflow', 'node', 'tool', 'llm', 'db')
+
+# 추적 조회 시 제거할 사용자 관련 속성 (추적 API 응답에 노출하지 않음)
+REDACTED_TRACE_ATTRIBUTES = frozenset({'user_id', 'user_intent'})
+
+# 추적 조회 시 오류 메시지 대신 표시할 값 (원문은 서버 로그에만 남김)
+REDACTED_ERROR = '[redacted]'
+
+# 현재 실행 중인 구간 (스레드/비동기 태스크마다 독립, LangGraph 노드 실행 시 컨텍스트가 복사됨)
+_current_span: ContextVar[Optional['Span']] = ContextVar('workflow_current_span', default=None)
+
+
+def _redact_trace(trace: Dict[str, Any]) -> Dict[str, Any]:
+    """추적 딕셔너리에서 사용자 관련 속성과 오류 원문을 제거한 복사본 (하위 구간 포함)"""
+    redacted = dict(trace)
+    if 'attributes' in redacted:
+        redacted['attributes'] = {
+            key: value for key, value in redacted['attributes'].items() if key not in REDACTED_TRACE_ATTRIBUTES
+        }
+    if 'error' in redacted:
+        redacted['error'] = REDACTED_ERROR
+    if 'children' in redacted:
+        redacted['children'] = [_redact_trace(child) for child in redacted['children']]
+    return redacted
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값 목록의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class Span:
+    """
+    실행 구간 하나
+
+    - 시간: 시작 시각(epoch)과 소요 시간(ms)
+    - attributes: 구간별 부가 정보 (예: DB 작업 이름, LLM 모델)
+    - 토큰/캐시 적중은 구간 자신의 값만 저장하고, 조회 시 하위 구간까지 합산
+    """
+
+    __slots__ = ('name', 'kind', 'parent', 'children', 'attributes', 'started_at', '_started',
+                 'duration_ms', 'error', 'prompt_tokens', 'completion_tokens', 'cache_hits', 'cache_misses')
+
+    def __init__(self, name: str, kind: str, parent: Optional['Span'] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.children: List['Span'] = []
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_hits: Dict[str, int] = {}
+        self.cache_misses: Dict[str, int] = {}
+
+        if parent is not None:
+            parent.children.append(self)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """구간 종료"""
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        if error:
+            self.error = error
+
+    def iter_tree(self) -> Iterator['Span']:
+        """자신과 모든 하위 구간 순회"""
+        yield self
+        for child in list(self.children):
+            yield from child.iter_tree()
+
+    def totals(self) -> Dict[str, Any]:
+        """하위 구간까지 합산한 토큰/캐시 적중 수"""
+        prompt_tokens = completion_tokens = 0
+        cache_hits: Dict[str, int] = {}
+        cache_misses: Dict[str, int] = {}
+        for span in self.iter_tree():
+            prompt_tokens += span.prompt_tokens
+            completion_tokens += span.completion_tokens
+            for name, count in span.cache_hits.items():
+                cache_hits[name] = cache_hits.get(name, 0) + count
+            for name, count in span.cache_misses.items():
+                cache_misses[name] = cache_misses.get(name, 0) + count
+        return {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'cache_hits': cache_hits,
+            'cache_misses': cache_misses
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (하위 구간 포함)"""
+        data = {
+            'name': self.name,
+            'kind': self.kind,
+            'started_at': self.started_at,
+            'duration_ms': round(self.duration_ms, 3) if self.duration_ms is not None else None,
+            **self.totals()
+        }
+        if self.attributes:
+            data['attributes'] = self.attributes
+        if self.error:
+            data['error'] = self.error
+        if self.children:
+            data['children'] = [child.to_dict() for child in list(self.children)]
+        return data
+
+
+class WorkflowTracer:
+    """
+    워크플로우 구간 추적기
+
+    - 워크플로우 실행 1회 = 추적(trace) 1개, 그 아래에 노드 → 도구(벡터 검색, DB, 대화 로그) → LLM 호출 구간이 중첩
+    - 현재 구간은 ContextVar로 전달하므로 호출 경로에 인자를 추가할 필요 없음
+    - 완료된 추적은 최근 N개를 보관하고, 구간 이름별로 소요 시간 표본(최근 M개)과 토큰/캐시 통계를 집계
+    - 추적 밖에서 실행된 구간(예: QnA 스트리밍의 LLM 호출)은 집계에만 반영
+    - 느린 턴(slow_turn_ms 초과)은 노드별 소요 시간을 경고 로그로 남김
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 history_size: int = 100,
+                 sample_size: int = 1000,
+                 slow_turn_ms: float = 0.0):
+        """
+        Args:
+            enabled: 추적 사용 여부 (False면 구간을 만들지 않음)
+            history_size: 보관할 최근 추적 수
+            sample_size: 구간 이름별로 보관할 소요 시간 표본 수 (백분위수 계산용)
+            slow_turn_ms: 이 시간을 넘긴 워크플로우 실행을 경고 로그로 남김 (0이면 미사용)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self.history_size = history_size
+        self.sample_size = sample_size
+        self.slow_turn_ms = slow_turn_ms
+
+        self._lock = threading.Lock()
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._aggregates: Dict[str, Dict[str, Any]] = {}
+        self._trace_count = 0
+
+    # ----- 구간 생성 -----
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """워크플로우 실행 1회를 최상위 구간으로 추적"""
+        if not self.enabled:
+            yield None
+            return
+
+        root = Span(name, 'workflow', None, attributes)
+        token = _current_span.set(root)
+        error = None
+        try:
+            yield root
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            root.finish(error)
+            self._finish_trace(root)
+
+    @contextmanager
+    def span(self, name: str, kind: str = 'tool', **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        현재 구간 아래에 하위 구간 생성
+
+        추적 중이 아니면 상위 없이 생성되어 집계에만 반영됩니다.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = Span(name, kind, parent, attributes)
+        token = _current_span.set(span)
+        error = None
+        try:
+            yield span
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.finish(error)
+            if parent is None:
+                self._record_spans([span])
+
+    def start_span(self, name: str, kind: str = 'tool', **attributes: Any) -> Optional[Span]:
+        """
+        현재 구간 아래에 하위 구간을 시작만 함 (콜백처럼 시작/종료 지점이 분리된 경우)
+
+        반환된 구간은 end_span()으로 종료해야 하며, 현재 구간으로 설정되지 않습니다.
+        """
+        if not self.enabled:
+            return None
+        return Span(name, kind, _current_span.get(), attributes)
+
+    def end_span(self, span: Optional[Span], error: Optional[str] = None) -> None:
+        """start_span()으로 시작한 구간 종료"""
+        if span is None:
+            return
+        span.finish(error)
+        if span.parent is None:
+            self._record_spans([span])
+
+    def traced(self, name: str, kind: str = 'tool') -> Callable[[Callable], Callable]:
+        """함수 실행을 하위 구간으로 기록하는 데코레이터"""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, kind):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def wrap_node(self, name: str, func: Callable) -> Callable:
+        """LangGraph 노드 함수를 노드 구간으로 감싸기"""
+        @wraps(func)
+        def traced_node(state):
+            with self.span(name, 'node'):
+                return func(state)
+        return traced_node
+
+    # ----- 현재 구간 기록 -----
+
+    def current_span(self) -> Optional[Span]:
+        """현재 구간 (추적 중이 아니면 None)"""
+        return _current_span.get()
+
+    def annotate(self, **attributes: Any) -> None:
+        """현재 구간에 부가 정보 추가"""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def record_tokens(self, prompt_tokens: int, completion_tokens: int, span: Optional[Span] = None) -> None:
+        """구간(기본: 현재 구간)에 LLM 토큰 사용량 기록"""
+        span = span or _current_span.get()
+        if span is not None:
+            span.prompt_tokens += prompt_tokens or 0
+            span.completion_tokens += completion_tokens or 0
+
+    def record_cache(self, cache_name: str, hit: bool) -> None:
+        """현재 구간에 캐시 적중/미스 기록"""
+        span = _current_span.get()
+        if span is None:
+            return
+        counter = span.cache_hits if hit else span.cache_misses
+        counter[cache_name] = counter.get(cache_name, 0) + 1
+
+    # ----- 집계 -----
+
+    def _finish_trace(self, root: Span) -> None:
+        """완료된 추적 보관 및 집계 반영"""
+        trace = root.to_dict()
+        spans = list(root.iter_tree())
+
+        with self._lock:
+            self._traces.append(trace)
+            self._trace_count += 1
+        self._record_spans(spans)
+
+        if self.slow_turn_ms and root.duration_ms and root.duration_ms > self.slow_turn_ms:
+            breakdown = ', '.join(
+                f"{child.name}={child.duration_ms:.0f}ms" for child in root.children if child.duration_ms is not None
+            )
+            self.logger.warning(f"느린 워크플로우 실행 ({root.duration_ms:.0f}ms): {breakdown}")
+
+    def _record_spans(self, spans: List[Span]) -> None:
+        """구간 이름별 통계에 반영 (토큰/캐시는 구간 자신의 값만 합산하여 중복 집계 방지)"""
+        with self._lock:
+            for span in spans:
+                aggregate = self._aggregates.get(span.name)
+                if aggregate is None:
+                    aggregate = {
+                        'kind': span.kind,
+                        'count': 0,
+                        'errors': 0,
+                        'total_ms': 0.0,
+                        'max_ms': 0.0,
+                        'samples': deque(maxlen=self.sample_size),
+                        'prompt_tokens': 0,
+                        'completion_tokens': 0,
+                        'cache_hits': 0,
+                        'cache_misses': 0
+                    }
+                    self._aggregates[span.name] = aggregate
+
+                duration = span.duration_ms or 0.0
+                aggregate['count'] += 1
+                aggregate['errors'] += 1 if span.error else 0
+                aggregate['total_ms'] += duration
+                aggregate['max_ms'] = max(aggregate['max_ms'], duration)
+                aggregate['samples'].append(duration)
+                aggregate['prompt_tokens'] += span.prompt_tokens
+                aggregate['completion_tokens'] += span.completion_tokens
+                aggregate['cache_hits'] += sum(span.cache_hits.values())
+                aggregate['cache_misses'] += sum(span.cache_misses.values())
+
+    # ----- 조회 -----
+
+    def get_summary(self) -> Dict[str, Any]:
+        """구간 이름별 통계 (횟수, 평균/최대, p50/p95/p99, 토큰, 캐시 적중)"""
+        with self._lock:
+            aggregates = {name: dict(aggregate, samples=sorted(aggregate['samples']))
+                          for name, aggregate in self._aggregates.items()}
+            trace_count = self._trace_count
+
+        spans = {}
+        for name, aggregate in sorted(aggregates.items()):
+            samples = aggregate.pop('samples')
+            count = aggregate['count']
+            spans[name] = {
+                **aggregate,
+                'total_ms': round(aggregate['total_ms'], 3),
+                'max_ms': round(aggregate['max_ms'], 3),
+                'mean_ms': round(aggregate['total_ms'] / count, 3) if count else 0.0,
+                'p50_ms': round(_percentile(samples, 50), 3),
+                'p95_ms': round(_percentile(samples, 95), 3),
+                'p99_ms': round(_percentile(samples, 99), 3)
+            }
+
+        return {
+            'enabled': self.enabled,
+            'traces_recorded': trace_count,
+            'sample_size': self.sample_size,
+            'total_prompt_tokens': sum(span['prompt_tokens'] for span in spans.values()),
+            'total_completion_tokens': sum(span['completion_tokens'] for span in spans.values()),
+            'spans': spans
+        }
+
+    def get_recent_traces(self, limit: int = 20, slowest: bool = False, redact: bool = True) -> List[Dict[str, Any]]:
+        """
+        최근 추적 목록
+
+        Args:
+            limit: 반환할 추적 수
+            slowest: True면 보관 중인 추적 중 느린 순서, False면 최신 순서
+            redact: True면 사용자 관련 속성(REDACTED_TRACE_ATTRIBUTES)과 오류 원문 제거
+        """
+        with self._lock:
+            traces = list(self._traces)
+
+        if slowest:
+            traces.sort(key=lambda trace: trace.get('duration_ms') or 0.0, reverse=True)
+        else:
+            traces.reverse()
+        traces = traces[:max(0, limit)]
+        return [_redact_trace(trace) for trace in traces] if redact else traces
+
+    def reset(self) -> None:
+        """보관한 추적과 집계 초기화"""
+        with self._lock:
+            self._traces.clear()
+            self._aggregates = {}
+            self._trace_count = 0
+
+
+def create_workflow_tracer() -> WorkflowTracer:
+    """
+    환경변수 설정으로 워크플로우 추적기 생성
+
+    환경변수:
+        WORKFLOW_TRACING_ENABLED: 구간 추적 사용 여부 (기본: true)
+        WORKFLOW_TRACE_HISTORY: 보관할 최근 추적 수 (기본: 100)
+        WORKFLOW_TRACE_SAMPLE_SIZE: 구간 이름별 소요 시간 표본 수 (기본: 1000)
+        WORKFLOW_SLOW_TURN_MS: 경고 로그를 남길 느린 실행 기준 (기본: 0 = 미사용)
+    """
+    return WorkflowTracer(
+        enabled=env_bool('WORKFLOW_TRACING_ENABLED', True),
+        history_size=int(os.getenv('WORKFLOW_TRACE_HISTORY', '100')),
+        sample_size=int(os.getenv('WORKFLOW_TRACE_SAMPLE_SIZE', '1000')),
+        slow_turn_ms=float(os.getenv('WORKFLOW_SLOW_TURN_MS', '0'))
+    )
+
+
+# 전역 워크플로우 추적기 인스턴스
+workflow_tracer = create_workflow_tracer()
@@ -0,0 +1,268 @@
+# backend/scripts/benchmark_intent_classifier.py
+# 의도 분석 경로 정확도/지연 시간 비교 벤치마크 스크립트
+#
+# 기존 경로(완전 일치 키워드 → LLM)와 새 경로(완전 일치 키워드 → 로컬 분류기 → 신뢰도 미달 시 LLM)를
+# 같은 평가 데이터로 비교하여 정확도, LLM 호출 수, 메시지당 지연 시간(p50/p95), 로컬 분류기 추론 시간을 출력합니다.
+# 메시지마다 LLM은 한 번만 호출하고 그 결과와 소요 시간을 두 경로 계산에 함께 사용합니다.
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, List
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+DEFAULT_LOG_DIR = os.path.join(project_root, 'logs', 'user_chat_log')
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def latency_summary(values_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(values_ms)
+    return {
+        'mean_ms': round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 50), 3),
+        'p95_ms': round(percentile(ordered, 95), 3),
+        'p99_ms': round(percentile(ordered, 99), 3)
+    }
+
+
+def measure_classifier_latency(classifier, examples: List[Dict[str, Any]], repeat: int) -> Dict[str, float]:
+    """로컬 분류기 한 번 추론 시간 (마이크로초)"""
+    samples = []
+    for _ in range(repeat):
+        for example in examples:
+            started = time.perf_counter()
+            classifier.classify(example['message'], example['stage'])
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    return {
+        'calls': len(samples),
+        'mean_us': round(sum(samples) / len(samples), 2),
+        'p50_us': round(percentile(samples, 50), 2),
+        'p99_us': round(percentile(samples, 99), 2)
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """두 경로 비교 결과 딕셔너리 반환"""
+    # 에이전트 모듈의 순환 import를 피하기 위해 워크플로우 패키지를 먼저 로드
+    import app.core.langraph  # noqa: F401
+    from app.core.llm import llm_registry
+    from app.tools.analysis import intent_analysis_tools
+    from app.tools.analysis.intent_classifier import (
+        IntentClassifier,
+        deduplicate_examples,
+        load_chat_log_examples,
+        load_db_examples,
+        load_seed_examples,
+        split_examples
+    )
+
+    examples = load_seed_examples(args.seed_file) if not args.no_seed else []
+    if args.log_dir:
+        examples += load_chat_log_examples(args.log_dir)
+    if args.from_db:
+        examples += load_db_examples(args.db_limit)
+    examples = deduplicate_examples(examples)
+
+    # 모델을 지정하지 않으면 학습용 분할로 새로 학습 (평가 데이터는 학습에 쓰지 않음)
+    # 저장된 모델은 train_intent_classifier.py가 전체 데이터로 학습하므로, 같은 데이터로 평가하면
+    # 학습 데이터 안에서의 일치율일 뿐 정확도가 아님 → --holdout-file이 없으면 in_sample로 표시
+    train, test = split_examples(examples, args.test_ratio, args.seed)
+    in_sample = False
+    if args.model:
+        classifier = IntentClassifier.load(args.model)
+        if args.holdout_file:
+            test = deduplicate_examples(load_seed_examples(args.holdout_file))
+        else:
+            test = examples
+            in_sample = True
+    else:
+        classifier = IntentClassifier.train(train, seed=args.seed)
+    if args.threshold is not None:
+        classifier.threshold = args.threshold
+    if args.limit:
+        test = test[:args.limit]
+
+    print(f"🤖 LLM 제공자: {llm_registry.provider}")
+    print(f"🧮 평가 데이터 {len(test)}개 (학습 {len(train) if not args.model else '-'}개), 임계값 {classifier.threshold:.2f}")
+    if in_sample:
+        print("⚠️  --model을 --holdout-file 없이 사용: 평가 데이터가 모델 학습에 포함되어 있어 정확도 대신 학습 데이터 내 일치율로 표시합니다.")
+    print()
+
+    rows = []
+    for index, example in enumerate(test, 1):
+        message, stage, expected = example['message'], example['stage'], example['intent']
+
+        started = time.perf_counter()
+        keyword_result = intent_analysis_tools._analyze_with_exact_keywords(message)
+        keyword_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        local_result = classifier.decide(message, stage)
+        local_ms = (time.perf_counter() - started) * 1000
+
+        # 키워드로 끝나지 않는 메시지만 LLM 호출 (기존 경로에서 필요, 새 경로에서는 위임 시 필요)
+        llm_result, llm_ms = None, 0.0
+        if keyword_result is None:
+            started = time.perf_counter()
+            try:
+                llm_result = intent_analysis_tools._analyze_intent_with_llm(message, stage, args.user_type)
+            except Exception as e:
+                print(f"⚠️  LLM 분석 실패, 폴백 사용: {e}")
+            if not llm_result or 'intent' not in llm_result:
+                llm_result = intent_analysis_tools._get_fallback_result(message)
+            llm_ms = (time.perf_counter() - started) * 1000
+
+        current_intent = (keyword_result or llm_result)['intent']
+        current_ms = keyword_ms + llm_ms
+
+        if keyword_result:
+            new_intent, new_source, new_ms = keyword_result['intent'], 'keyword', keyword_ms
+        elif local_result:
+            new_intent, new_source, new_ms = local_result['intent'], 'local', keyword_ms + local_ms
+        else:
+            new_intent, new_source, new_ms = llm_result['intent'], 'llm', keyword_ms + local_ms + llm_ms
+
+        rows.append({
+            'message': message, 'stage': stage, 'expected': expected,
+            'current_intent': current_intent, 'current_ms': current_ms, 'current_llm': keyword_result is None,
+            'new_intent': new_intent, 'new_ms': new_ms, 'new_source': new_source
+        })
+        if index % 20 == 0:
+            print(f"   {index}/{len(test)} 처리")
+
+    # 학습 데이터로 평가한 값은 정확도로 보고하지 않음
+    accuracy_key = 'in_sample_match_rate' if in_sample else 'accuracy'
+
+    def path_summary(prefix: str, used_llm) -> Dict[str, Any]:
+        correct = sum(1 for row in rows if row[f'{prefix}_intent'] == row['expected'])
+        return {
+            accuracy_key: round(correct / len(rows), 4) if rows else 0.0,
+            'llm_calls': sum(1 for row in rows if used_llm(row)),
+            **latency_summary([row[f'{prefix}_ms'] for row in rows])
+        }
+
+    sources = {source: sum(1 for row in rows if row['new_source'] == source) for source in ('keyword', 'local', 'llm')}
+    local_rows = [row for row in rows if row['new_source'] == 'local']
+
+    return {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'provider': llm_registry.provider,
+        'threshold': classifier.threshold,
+        'examples': len(rows),
+        'in_sample': in_sample,
+        # 저장된 모델의 학습 시 평가 결과 (학습용 분할로 학습한 모델을 평가용 분할로 측정한 값)
+        'model_evaluation': classifier.metadata.get('evaluation') if args.model else None,
+        'current_path': path_summary('current', lambda row: row['current_llm']),
+        'new_path': path_summary('new', lambda row: row['new_source'] == 'llm'),
+        'new_path_sources': sources,
+        f'local_decision_{accuracy_key}': (
+            round(sum(1 for row in local_rows if row['new_intent'] == row['expected']) / len(local_rows), 4)
+            if local_rows else None
+        ),
+        'classifier_latency': measure_classifier_latency(classifier, test, args.repeat),
+        'disagreements': [
+            {key: row[key] for key in ('message', 'stage', 'expected', 'current_intent', 'new_intent', 'new_source')}
+            for row in rows if row['new_intent'] != row['current_intent']
+        ]
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """결과 표 출력"""
+    in_sample = result['in_sample']
+    accuracy_key = 'in_sample_match_rate' if in_sample else 'accuracy'
+    accuracy_title = '일치율*' if in_sample else '정확도'
+
+    print(f"=== 의도 분석 경로 비교 ({result['provider']}, 메시지 {result['examples']}개, 임계값 {result['threshold']:.2f}) ===")
+    print(f"{'경로':<14} | {accuracy_title:>8} | {'LLM 호출':>8} | {'평균(ms)':>10} | {'p50(ms)':>10} | {'p95(ms)':>10}")
+    print('-' * 76)
+    for title, key in (('기존 (키워드→LLM)', 'current_path'), ('새 경로', 'new_path')):
+        summary = result[key]
+        print(f"{title:<14} | {summary[accuracy_key]:>8.1%} | {summary['llm_calls']:>8} | "
+              f"{summary['mean_ms']:>10.2f} | {summary['p50_ms']:>10.2f} | {summary['p95_ms']:>10.2f}")
+
+    sources = result['new_path_sources']
+    print()
+    print(f"새 경로 결정 출처: 키워드 {sources['keyword']}개, 로컬 분류기 {sources['local']}개, LLM {sources['llm']}개")
+    local_rate = result[f'local_decision_{accuracy_key}']
+    if local_rate is not None:
+        print(f"로컬 분류기 결정 {accuracy_title}: {local_rate:.1%}")
+    if in_sample:
+        print("* 학습 데이터 내 일치율 (정확도 아님). 보지 않은 데이터로 평가하려면 --holdout-file을 지정하세요.")
+        evaluation = result['model_evaluation']
+        if evaluation and 'accuracy' in evaluation:
+            calibration = evaluation.get('calibration') or {}
+            local_accuracy = calibration.get('local_accuracy')
+            print(f"  모델 학습 시 평가용 분할 정확도: {evaluation['accuracy']:.1%} ({evaluation.get('examples')}개)"
+                  + (f", 로컬 결정 정확도 {local_accuracy:.1%}" if local_accuracy is not None else ""))
+    latency = result['classifier_latency']
+    print(f"로컬 분류기 추론: 평균 {latency['mean_us']}µs, p50 {latency['p50_us']}µs, p99 {latency['p99_us']}µs ({latency['calls']}회)")
+
+    if result['disagreements']:
+        print()
+        print(f"두 경로의 판단이 다른 메시지 {len(result['disagreements'])}개:")
+        for row in result['disagreements'][:10]:
+            print(f"  - '{row['message']}' 정답 {row['expected']} / 기존 {row['current_intent']} / 새 경로 {row['new_intent']} ({row['new_source']})")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='의도 분석 경로 정확도/지연 시간 비교')
+    parser.add_argument('--model', help='평가할 모델 파일 (기본: 학습용 분할로 새로 학습)')
+    parser.add_argument('--holdout-file', help='--model 평가에 사용할, 모델 학습에 쓰지 않은 예시 파일 (시드 예시 형식)')
+    parser.add_argument('--threshold', type=float, help='신뢰도 임계값 덮어쓰기')
+    parser.add_argument('--log-dir', default=DEFAULT_LOG_DIR, help='대화 로그 디렉토리 (빈 값이면 사용 안 함)')
+    parser.add_argument('--from-db', action='store_true', help='session_conversations 테이블에서도 레이블 추출')
+    parser.add_argument('--db-limit', type=int, help='DB에서 가져올 최대 예시 수')
+    parser.add_argument('--seed-file', help='시드 예시 파일 (기본: data/intent_seed_examples.json)')
+    parser.add_argument('--no-seed', action='store_true', help='시드 예시를 사용하지 않음')
+    parser.add_argument('--test-ratio', type=float, default=0.3, help='평가용 데이터 비율')
+    parser.add_argument('--limit', type=int, help='평가할 최대 메시지 수 (LLM 비용 제한)')
+    parser.add_argument('--user-type', default='beginner', help='LLM 분석에 전달할 사용자 유형')
+    parser.add_argument('--repeat', type=int, default=200, help='분류기 추론 시간 측정 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='분할 시드')
+    parser.add_argument('--fake-llm', action='store_true', help='OpenAI 대신 로컬 가짜 LLM 사용 (테스트용)')
+    parser.add_argument('--fake-latency', default='lognormal:600:0.4', help='가짜 LLM 응답 지연 분포')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    # 클라이언트 레지스트리가 생성되기 전에 제공자를 지정
+    if args.fake_llm:
+        os.environ['LLM_PROVIDER'] = 'fake'
+        os.environ['FAKE_LLM_LATENCY'] = args.fake_latency
+    # 비교 대상인 기존 경로가 분류기를 거치지 않도록 전역 분류기 로드는 끔 (벤치마크는 분류기를 직접 사용)
+    os.environ['INTENT_CLASSIFIER_ENABLED'] = 'false'
+
+    result = run_benchmark(args)
+    print()
+    print_report(result)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print()
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,875 @@
+# backend/scripts/benchmark_session_lifecycle.py
+# 학습 세션 전체 흐름 엔드투엔드 벤치마크 스크립트
+#
+# 여러 가상 사용자가 동시에 세션 시작(이론) → 다음 단계(퀴즈) → 답변 제출(피드백) → 세션 완료,
+# QnA 스트리밍, 대시보드 조회를 반복 실행하며 구간별 p50/p95/p99 지연 시간, 처리량, 최대 RSS,
+# LangGraph 노드별 소요 시간을 측정합니다.
+# MySQL/ChromaDB/LLM은 모두 프로세스 내부 대체 구현으로 바꿔서 실행하므로 외부 서비스 없이 재현 가능하며,
+# 결과를 JSON으로 저장해 커밋 간 회귀를 비교할 수 있습니다.
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import zlib
+import threading
+import subprocess
+from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+import pymysql
+from pymysql.converters import escape_item
+import numpy as np
+
+SCENARIOS = ('lifecycle', 'qna_stream', 'dashboard')
+PERCENTILES = (50, 95, 99)
+RESULT_FORMAT_VERSION = 1
+
+QNA_QUESTIONS = [
+    "프롬프트 엔지니어링이 정확히 뭐예요?",
+    "LLM이 틀린 답을 하는 이유는 왜 그런가요?",
+    "AI 추천 시스템은 어떻게 동작하나요?",
+    "생성형 AI와 일반 AI의 차이가 뭔가요?"
+]
+
+
+# ==========================================
+# 측정 도구
+# ==========================================
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값 목록의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class LatencyRecorder:
+    """구간 이름별 소요 시간(ms)을 스레드 안전하게 모으는 기록기"""
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self._samples.setdefault(name, []).append(elapsed_ms)
+
+    def record_error(self, name: str) -> None:
+        with self._lock:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples = {}
+            self._errors = {}
+
+    def measure(self, name: str, func: Callable[[], Any]) -> Any:
+        """func 실행 시간을 기록 (예외가 나면 오류로 집계한 뒤 다시 던짐)"""
+        started = time.perf_counter()
+        try:
+            result = func()
+        except Exception:
+            self.record_error(name)
+            raise
+        self.record(name, (time.perf_counter() - started) * 1000)
+        return result
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """구간별 통계 (count, errors, mean, min, max, p50/p95/p99, 합계)"""
+        with self._lock:
+            names = sorted(set(self._samples) | set(self._errors))
+            snapshot = {name: sorted(self._samples.get(name, [])) for name in names}
+            errors = dict(self._errors)
+
+        result = {}
+        for name, values in snapshot.items():
+            stats = {
+                'count': len(values),
+                'errors': errors.get(name, 0),
+                'total_ms': round(sum(values), 3),
+                'mean_ms': round(sum(values) / len(values), 3) if values else 0.0,
+                'min_ms': round(values[0], 3) if values else 0.0,
+                'max_ms': round(values[-1], 3) if values else 0.0
+            }
+            for p in PERCENTILES:
+                stats[f'p{p}_ms'] = round(percentile(values, p), 3)
+            result[name] = stats
+        return result
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, 지원하지 않는 플랫폼이면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def git_revision() -> Optional[str]:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+# ==========================================
+# MySQL 대체 구현 (pymysql.connect 교체)
+# ==========================================
+
+class InMemoryDatabase:
+    """
+    벤치마크용 인메모리 MySQL 대체 구현
+
+    SQL을 실제로 해석하지 않고 테이블 이름으로 결과 형태만 맞춰 돌려줍니다.
+    - user_progress / user_statistics: 사용자별 고정 행
+    - learning_sessions: INSERT된 행을 사용자별로 보관하여 대시보드 조회에 사용
+    - 그 밖의 쓰기는 영향 행 1로 처리
+    모든 문장 실행에 query_latency_ms만큼 지연을 넣어 DB 왕복 시간을 흉내냅니다.
+    """
+
+    def __init__(self, query_latency_ms: float = 0.0):
+        self.query_latency = max(0.0, query_latency_ms) / 1000
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._sessions: Dict[int, List[Dict[str, Any]]] = {}
+        self.query_count = 0
+        self.connections_created = 0
+
+    def connect(self, **kwargs) -> '_InMemoryConnection':
+        """pymysql.connect 대체"""
+        with self._lock:
+            self.connections_created += 1
+        return _InMemoryConnection(self)
+
+    def run(self, query: str, params: Any) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+        """
+        문장 실행
+
+        Returns:
+            (결과 행 목록, 영향 행 수, lastrowid)
+        """
+        if self.query_latency:
+            time.sleep(self.query_latency)
+
+        with self._lock:
+            self.query_count += 1
+
+        sql = ' '.join(query.split()).lower()
+        args = list(params.values()) if isinstance(params, dict) else list(params or [])
+
+        if sql.startswith('select'):
+            return self._select(sql, params, args), 0, None
+        if sql.startswith('insert into'):
+            return self._insert(query, sql, args)
+        return [], 1, None
+
+    def _select(self, sql: str, params: Any, args: List[Any]) -> List[Dict[str, Any]]:
+        if '@@max_allowed_packet' in sql:
+            return [{'max_allowed_packet': 64 * 1024 * 1024}]
+        if '@@auto_increment_increment' in sql:
+            return [{'auto_increment_increment': 1}]
+
+        table_match = re.search(r'\bfrom\s+(\w+)', sql)
+        if not table_match:
+            return [{'1': 1, 'test': 1}]
+
+        table = table_match.group(1)
+        user_id = None
+        if 'user_id' in sql:
+            user_id = params.get('user_id') if isinstance(params, dict) else (args[0] if args else None)
+
+        if 'count(' in sql:
+            count = len(self._sessions.get(user_id, [])) if table == 'learning_sessions' else 0
+            return [{'count': count}]
+        if table == 'user_progress':
+            return [{
+                'user_id': user_id,
+                'current_chapter': 1,
+                'current_section': 1,
+                'last_study_date': date.today()
+            }]
+        if table == 'user_statistics':
+            with self._lock:
+                sessions = len(self._sessions.get(user_id, []))
+            return [{
+                'user_id': user_id,
+                'total_study_time_seconds': sessions * 600,
+                'total_study_sessions': sessions,
+                'multiple_choice_accuracy': 80.0,
+                'subjective_average_score': 75.0,
+                'total_multiple_choice_count': sessions,
+                'total_subjective_count': 0,
+                'last_study_date': date.today()
+            }]
+        if table == 'learning_sessions':
+            with self._lock:
+                return [dict(row) for row in self._sessions.get(user_id, [])]
+        return []
+
+    def _insert(self, query: str, sql: str, args: List[Any]) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+        with self._lock:
+            row_id = self._next_id
+            self._next_id += 1
+
+        if sql.startswith('insert into learning_sessions'):
+            columns_match = re.search(r'\(([^)]*)\)\s*values', query, re.IGNORECASE)
+            if columns_match and args:
+                columns = [column.strip() for column in columns_match.group(1).split(',')]
+                row = dict(zip(columns, args))
+                end_time = row.get('session_end_time')
+                row['completion_date'] = end_time.date() if isinstance(end_time, datetime) else date.today()
+                with self._lock:
+                    self._sessions.setdefault(row.get('user_id'), []).append(row)
+
+        # 다중 행 INSERT는 VALUES 묶음 수만큼 영향 행으로 계산
+        affected = sql.count('), (') + 1
+        return [], affected, row_id
+
+
+class _InMemoryCursor:
+    """InMemoryDatabase용 DictCursor 호환 커서"""
+
+    def __init__(self, database: InMemoryDatabase):
+        self._database = database
+        self._rows: List[Dict[str, Any]] = []
+        self.rowcount = 0
+        self.lastrowid = None
+        self.description = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query: str, params: Any = None) -> int:
+        self._rows, self.rowcount, lastrowid = self._database.run(query, params)
+        if lastrowid is not None:
+            self.lastrowid = lastrowid
+        return self.rowcount if not self._rows else len(self._rows)
+
+    def executemany(self, query: str, seq_of_params: Any) -> int:
+        total = 0
+        for params in seq_of_params:
+            total += self.execute(query, params)
+        return total
+
+    def mogrify(self, query: str, args: Any = None) -> str:
+        if args is None:
+            return query
+        return query % tuple(escape_item(value, 'utf8mb4') for value in args)
+
+    def fetchone(self) -> Optional[Dict[str, Any]]:
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size: int = 1) -> List[Dict[str, Any]]:
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class _InMemoryConnection:
+    """InMemoryDatabase용 pymysql Connection 호환 객체"""
+
+    def __init__(self, database: InMemoryDatabase):
+        self._database = database
+        self.open = True
+
+    def cursor(self, cursor_class: Any = None) -> _InMemoryCursor:
+        return _InMemoryCursor(self._database)
+
+    def ping(self, reconnect: bool = False) -> None:
+        pass
+
+    def autocommit(self, value: bool) -> None:
+        pass
+
+    def begin(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.open = False
+
+
+# ==========================================
+# ChromaDB 대체 구현 (컬렉션 교체)
+# ==========================================
+
+def _bigrams(text: str) -> set:
+    compact = re.sub(r'\s+', '', text.lower())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+# 대체 임베딩 차원 (바이그램을 해시하여 0/1 벡터로 표현)
+LOCAL_EMBEDDING_DIM = 2048
+
+
+def _bigram_vector(text: str) -> np.ndarray:
+    vector = np.zeros(LOCAL_EMBEDDING_DIM, dtype=np.float32)
+    for bigram in _bigrams(text):
+        vector[zlib.crc32(bigram.encode('utf-8')) % LOCAL_EMBEDDING_DIM] = 1.0
+    return vector
+
+
+class LocalVectorCollection:
+    """
+    벤치마크용 ChromaDB 컬렉션 대체 구현
+
+    data/chapters/chapter_XX.json의 이론/핵심 포인트/퀴즈 해설로 청크를 만들고,
+    get(where=...)은 메타데이터 일치로, query(query_texts=... 또는 query_embeddings=...)는
+    글자 바이그램 겹침 비율로 응답합니다. embed()는 바이그램 해시 벡터를 임베딩 대신 반환합니다.
+    """
+
+    def __init__(self, chapters_dir: str, query_latency_ms: float = 0.0, embedding_latency_ms: float = 0.0):
+        self.query_latency = max(0.0, query_latency_ms) / 1000
+        self.embedding_latency = max(0.0, embedding_latency_ms) / 1000
+        self.embed_calls = 0
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._load(chapters_dir)
+        self._matrix = np.stack([_bigram_vector(doc) for doc in self._documents]) if self._documents else None
+
+    def _load(self, chapters_dir: str) -> None:
+        for file_name in sorted(os.listdir(chapters_dir)):
+            if not re.match(r'chapter_\d+\.json$', file_name):
+                continue
+            with open(os.path.join(chapters_dir, file_name), 'r', encoding='utf-8') as f:
+                chapter_data = json.load(f)
+
+            chapter = chapter_data.get('chapter_number')
+            for section_data in chapter_data.get('sections', []):
+                section = section_data.get('section_number')
+                theory = section_data.get('theory', {})
+                quiz = section_data.get('quiz', {})
+                chunks = [
+                    ('core_concept', theory.get('content', ''), 95),
+                    ('technical_detail', '\n'.join(theory.get('key_points', [])), 92),
+                    ('practical_example', quiz.get('explanation', ''), 91)
+                ]
+                for index, (chunk_type, content, score) in enumerate(chunks):
+                    if not content:
+                        continue
+                    self._documents.append(content)
+                    self._metadatas.append({
+                        'id': f"ch{chapter:02d}_s{section:02d}_{index}",
+                        'chapter': chapter,
+                        'section': section,
+                        'chunk_type': chunk_type,
+                        'content_quality_score': score,
+                        'primary_keywords': section_data.get('title', ''),
+                        'source_url': f"local://chapter_{chapter:02d}.json"
+                    })
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def count(self) -> int:
+        return len(self._documents)
+
+    def get(self, where: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        if self.query_latency:
+            time.sleep(self.query_latency)
+
+        conditions = where.get('$and', [where]) if where else []
+        documents, metadatas = [], []
+        for doc, metadata in zip(self._documents, self._metadatas):
+            if all(metadata.get(key) == value.get('$eq') for condition in conditions for key, value in condition.items()):
+                documents.append(doc)
+                metadatas.append(metadata)
+        return {'ids': [m['id'] for m in metadatas], 'documents': documents, 'metadatas': metadatas}
+
+    def embed(self, texts: List[str]) -> List[np.ndarray]:
+        """임베딩 함수 대체 구현 (호출당 embedding_latency 지연)"""
+        if self.embedding_latency:
+            time.sleep(self.embedding_latency)
+        self.embed_calls += 1
+        return [_bigram_vector(text) for text in texts]
+
+    def query(self,
+              query_texts: Optional[List[str]] = None,
+              n_results: int = 10,
+              query_embeddings: Optional[List[Any]] = None,
+              **kwargs) -> Dict[str, Any]:
+        if self.query_latency:
+            time.sleep(self.query_latency)
+        if query_embeddings is None:
+            query_embeddings = self.embed(query_texts or [])
+
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        for embedding in query_embeddings:
+            query_vector = np.asarray(embedding, dtype=np.float32)
+            overlaps = self._matrix @ query_vector / max(1.0, float(query_vector.sum()))
+            scored = sorted(zip((1.0 - overlaps).tolist(), range(len(self._documents))))
+            top = scored[:n_results]
+            result['ids'].append([self._metadatas[i]['id'] for _, i in top])
+            result['documents'].append([self._documents[i] for _, i in top])
+            result['metadatas'].append([self._metadatas[i] for _, i in top])
+            result['distances'].append([round(distance, 4) for distance, _ in top])
+        return result
+
+
+# ==========================================
+# 환경 구성
+# ==========================================
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """앱 모듈 import 전에 환경변수 설정 (전역 싱글톤이 import 시점에 설정을 읽음)"""
+    os.environ['LLM_PROVIDER'] = 'fake'
+    os.environ['FAKE_LLM_LATENCY'] = args.llm_latency
+    os.environ['FAKE_LLM_TOKEN_DELAY_MS'] = str(args.token_delay_ms)
+    os.environ['FAKE_LLM_SEED'] = str(args.seed)
+    os.environ['STATE_STORE_BACKEND'] = 'memory'
+    os.environ['WORKFLOW_TRACING_ENABLED'] = 'true'
+    # 구간별 백분위수를 측정 구간 전체 표본으로 계산
+    os.environ['WORKFLOW_TRACE_SAMPLE_SIZE'] = str(max(1000, args.users * args.iterations * 50))
+
+    if not args.with_caches:
+        os.environ['GENERATION_CACHE_ENABLED'] = 'false'
+        os.environ['CONTENT_ARTIFACTS_ENABLED'] = 'false'
+
+    # DB 연결 정보는 형식만 맞추면 됨 (pymysql.connect를 대체 구현으로 교체)
+    os.environ.setdefault('DB_NAME', 'benchmark')
+    os.environ.setdefault('DB_USER', 'benchmark')
+    os.environ.setdefault('DB_PASSWORD', 'benchmark')
+    os.environ['DB_ENABLE_HEALTH_CHECK'] = 'false'
+    os.environ['DB_MAX_CONNECTIONS'] = str(args.db_pool_size)
+
+
+def install_stand_ins(args: argparse.Namespace, log_dir: str) -> Tuple[InMemoryDatabase, LocalVectorCollection]:
+    """MySQL/ChromaDB 대체 구현 설치 및 대화 로그 경로를 임시 디렉토리로 변경"""
+    database = InMemoryDatabase(query_latency_ms=args.db_latency_ms)
+    pymysql.connect = database.connect
+
+    # 에이전트 모듈의 순환 import를 피하기 위해 워크플로우 패키지를 먼저 로드
+    import app.core.langraph  # noqa: F401
+    from app.tools.external import vector_search_tools
+    collection = LocalVectorCollection(
+        os.path.join(project_root, 'data', 'chapters'),
+        query_latency_ms=args.vector_latency_ms,
+        embedding_latency_ms=args.embedding_latency_ms
+    )
+    vector_search_tools._get_collection = lambda: collection
+    vector_search_tools._get_embedding_function = lambda: collection.embed
+
+    from app.utils.common.chat_logger import chat_logger
+    chat_logger.base_path = log_dir
+    os.makedirs(log_dir, exist_ok=True)
+
+    return database, collection
+
+
+# ==========================================
+# 실행 방식 (Flask 라우트 / SessionService 직접 호출)
+# ==========================================
+
+class RouteDriver:
+    """Flask 테스트 클라이언트로 실제 API 라우트를 호출"""
+
+    name = 'routes'
+
+    def __init__(self, app):
+        self.app = app
+
+    def _client(self):
+        return self.app.test_client()
+
+    @staticmethod
+    def _headers(token: str) -> Dict[str, str]:
+        return {'Authorization': f'Bearer {token}'}
+
+    def _post(self, path: str, token: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._client().post(path, json=body, headers=self._headers(token))
+        return response.get_json() or {}
+
+    def start_session(self, user: Dict[str, Any], chapter: int, section: int) -> Dict[str, Any]:
+        return self._post('/api/v1/learning/session/start', user['token'], {
+            'chapter_number': chapter, 'section_number': section, 'user_message': f"{chapter}챕터 시작할게요"
+        })
+
+    def send_message(self, user: Dict[str, Any], message: str) -> Dict[str, Any]:
+        return self._post('/api/v1/learning/session/message', user['token'], {'user_message': message})
+
+    def submit_answer(self, user: Dict[str, Any], answer: str) -> Dict[str, Any]:
+        return self._post('/api/v1/learning/quiz/submit', user['token'], {'user_answer': answer})
+
+    def complete_session(self, user: Dict[str, Any], decision: str) -> Dict[str, Any]:
+        return self._post('/api/v1/learning/session/complete', user['token'], {'proceed_decision': decision})
+
+    def dashboard(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._client().get('/api/v1/dashboard/overview', headers=self._headers(user['token']))
+        return response.get_json() or {}
+
+
+class ServiceDriver(RouteDriver):
+    """SessionService/DashboardService를 직접 호출 (HTTP 계층 제외)"""
+
+    name = 'service'
+
+    def __init__(self, app):
+        super().__init__(app)
+        from app.services.learning.session_service import session_service
+        from app.services.dashboard.dashboard_service import dashboard_service
+        self.session_service = session_service
+        self.dashboard_service = dashboard_service
+
+    def start_session(self, user, chapter, section):
+        return self.session_service.start_session(user['token'], chapter, section, f"{chapter}챕터 시작할게요")
+
+    def send_message(self, user, message):
+        return self.session_service.process_message(user['token'], message)
+
+    def submit_answer(self, user, answer):
+        return self.session_service.submit_quiz_answer(user['token'], answer)
+
+    def complete_session(self, user, decision):
+        return self.session_service.complete_session(user['token'], decision)
+
+    def dashboard(self, user):
+        result = self.dashboard_service.get_dashboard_overview(user['user_id'])
+        return {'success': bool(result and result[0])}
+
+
+def stream_qna(app, temp_id: str) -> Tuple[float, float, int]:
+    """
+    QnA SSE 라우트를 끝까지 읽음 (두 실행 방식 모두 스트리밍은 라우트로만 제공)
+
+    Returns:
+        (첫 답변 청크까지 ms, 전체 ms, 받은 답변 청크 수)
+    """
+    started = time.perf_counter()
+    first_token_ms = None
+    content_chunks = 0
+    response = app.test_client().get(f'/api/v1/learning/qna-stream/{temp_id}', buffered=False)
+    try:
+        for raw in response.response:
+            text = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+            for line in text.splitlines():
+                if not line.startswith('data:'):
+                    continue
+                event = json.loads(line[len('data:'):])
+                if event.get('type') in ('stream_error', 'error'):
+                    raise RuntimeError(f"스트리밍 오류: {event.get('message')}")
+                if event.get('type') == 'content_chunk':
+                    content_chunks += 1
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - started) * 1000
+    finally:
+        response.close()
+    total_ms = (time.perf_counter() - started) * 1000
+    return first_token_ms or total_ms, total_ms, content_chunks
+
+
+def _workflow_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    return (result.get('data') or {}).get('workflow_response') or {}
+
+
+def _ensure_success(result: Dict[str, Any], step: str) -> Dict[str, Any]:
+    if not result.get('success'):
+        error = result.get('error') or {}
+        raise RuntimeError(f"{step} 실패: {error.get('code')} {error.get('message')}")
+    return result
+
+
+def _pick_answer(workflow_response: Dict[str, Any], rng: random.Random) -> str:
+    content = workflow_response.get('content') or {}
+    if content.get('quiz_type') == 'subjective':
+        return "AI는 데이터를 학습해서 사람의 판단을 돕는 기술이라고 생각합니다."
+    return str(rng.randint(1, max(1, len(content.get('quiz_options') or [1, 2, 3, 4]))))
+
+
+# ==========================================
+# 시나리오
+# ==========================================
+
+def run_lifecycle(driver, user: Dict[str, Any], recorder: LatencyRecorder, rng: random.Random) -> None:
+    """세션 시작(이론) → 다음 단계(퀴즈) → 답변 제출(피드백) → 세션 완료"""
+    started = time.perf_counter()
+
+    _ensure_success(recorder.measure('lifecycle.start_theory', lambda: driver.start_session(user, 1, 1)), '세션 시작')
+    quiz = _ensure_success(recorder.measure('lifecycle.next_quiz', lambda: driver.send_message(user, '다음')), '퀴즈 요청')
+    answer = _pick_answer(_workflow_response(quiz), rng)
+    _ensure_success(recorder.measure('lifecycle.submit_feedback', lambda: driver.submit_answer(user, answer)), '답변 제출')
+    _ensure_success(recorder.measure('lifecycle.complete', lambda: driver.complete_session(user, 'proceed')), '세션 완료')
+
+    recorder.record('scenario.lifecycle', (time.perf_counter() - started) * 1000)
+
+
+def run_qna_stream(driver, user: Dict[str, Any], recorder: LatencyRecorder, rng: random.Random) -> None:
+    """이론 단계에서 질문 → 스트리밍 준비 → SSE로 답변 수신"""
+    started = time.perf_counter()
+
+    _ensure_success(recorder.measure('qna.start_theory', lambda: driver.start_session(user, 1, 1)), '세션 시작')
+    question = rng.choice(QNA_QUESTIONS)
+    prepared = _ensure_success(recorder.measure('qna.prepare', lambda: driver.send_message(user, question)), '질문 전송')
+
+    temp_id = _workflow_response(prepared).get('temp_session_id')
+    if not temp_id:
+        recorder.record_error('qna.stream_total')
+        raise RuntimeError("스트리밍 세션 ID를 받지 못했습니다 (질문 의도로 분류되지 않음)")
+
+    first_token_ms, total_ms, content_chunks = stream_qna(driver.app, temp_id)
+    if content_chunks == 0:
+        recorder.record_error('qna.stream_total')
+        raise RuntimeError("답변 청크를 받지 못했습니다")
+    recorder.record('qna.stream_first_token', first_token_ms)
+    recorder.record('qna.stream_total', total_ms)
+
+    recorder.record('scenario.qna_stream', (time.perf_counter() - started) * 1000)
+
+
+def run_dashboard(driver, user: Dict[str, Any], recorder: LatencyRecorder, rng: random.Random) -> None:
+    """대시보드 개요 조회"""
+    started = time.perf_counter()
+    _ensure_success(recorder.measure('dashboard.overview', lambda: driver.dashboard(user)), '대시보드 조회')
+    recorder.record('scenario.dashboard', (time.perf_counter() - started) * 1000)
+
+
+SCENARIO_RUNNERS = {
+    'lifecycle': run_lifecycle,
+    'qna_stream': run_qna_stream,
+    'dashboard': run_dashboard
+}
+
+
+def run_user(driver,
+             user: Dict[str, Any],
+             scenarios: List[str],
+             iterations: int,
+             recorder: LatencyRecorder,
+             failures: List[Dict[str, Any]],
+             failures_lock: threading.Lock,
+             seed: int) -> int:
+    """가상 사용자 한 명의 시나리오 반복 실행 (완료한 시나리오 수 반환)"""
+    rng = random.Random(seed + user['user_id'])
+    completed = 0
+    for iteration in range(iterations):
+        for scenario in scenarios:
+            try:
+                SCENARIO_RUNNERS[scenario](driver, user, recorder, rng)
+                completed += 1
+            except Exception as e:
+                recorder.record_error(f'scenario.{scenario}')
+                with failures_lock:
+                    failures.append({'user_id': user['user_id'], 'iteration': iteration, 'scenario': scenario, 'error': str(e)})
+    return completed
+
+
+# ==========================================
+# 실행 및 결과
+# ==========================================
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """벤치마크 실행 후 결과 딕셔너리 반환"""
+    log_dir = tempfile.mkdtemp(prefix='benchmark_chat_log_')
+    database, collection = install_stand_ins(args, log_dir)
+
+    from app import create_app
+    from app.utils.auth.jwt_handler import generate_access_token
+    from app.utils.tracing import workflow_tracer
+
+    flask_app = create_app()
+    driver = ServiceDriver(flask_app) if args.driver == 'service' else RouteDriver(flask_app)
+
+    users = []
+    for index in range(args.users):
+        user_id = 100000 + index
+        user_type = 'beginner' if index % 2 == 0 else 'advanced'
+        token = generate_access_token({
+            'user_id': user_id, 'login_id': f'bench_{index}', 'user_type': user_type, 'diagnosis_completed': True
+        })
+        users.append({'user_id': user_id, 'user_type': user_type, 'token': token})
+
+    # 워밍업 (그래프 컴파일, 프롬프트 체인 생성 등 최초 1회 비용 제외)
+    if args.warmup:
+        warmup_recorder = LatencyRecorder()
+        run_user(driver, {**users[0], 'user_id': 99999}, args.scenarios, 1, warmup_recorder, [], threading.Lock(), args.seed)
+
+    recorder = LatencyRecorder()
+    workflow_tracer.reset()
+    failures: List[Dict[str, Any]] = []
+    failures_lock = threading.Lock()
+    queries_before = database.query_count
+    embed_calls_before = collection.embed_calls
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as executor:
+        futures = [
+            executor.submit(run_user, driver, user, args.scenarios, args.iterations, recorder, failures, failures_lock, args.seed)
+            for user in users
+        ]
+        completed = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - started
+
+    operations = recorder.summary()
+    scenarios = {name.split('.', 1)[1]: stats for name, stats in operations.items() if name.startswith('scenario.')}
+    operations = {name: stats for name, stats in operations.items() if not name.startswith('scenario.')}
+
+    # 워크플로우 추적기의 구간별 집계 (노드 / 노드 안의 도구·LLM·DB 구간)
+    tracing = workflow_tracer.get_summary()
+    span_fields = ('kind', 'count', 'errors', 'total_ms', 'mean_ms', 'max_ms', 'p50_ms', 'p95_ms', 'p99_ms',
+                   'prompt_tokens', 'completion_tokens', 'cache_hits', 'cache_misses')
+    spans = {name: {field: stats[field] for field in span_fields} for name, stats in tracing['spans'].items()}
+    graph_nodes = {name: stats for name, stats in spans.items() if stats['kind'] == 'node'}
+    tool_spans = {name: stats for name, stats in spans.items() if stats['kind'] in ('tool', 'llm', 'db')}
+
+    return {
+        'format_version': RESULT_FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'config': {
+            'driver': args.driver,
+            'users': args.users,
+            'iterations': args.iterations,
+            'scenarios': args.scenarios,
+            'llm_latency': args.llm_latency,
+            'token_delay_ms': args.token_delay_ms,
+            'db_latency_ms': args.db_latency_ms,
+            'vector_latency_ms': args.vector_latency_ms,
+            'embedding_latency_ms': args.embedding_latency_ms,
+            'db_pool_size': args.db_pool_size,
+            'with_caches': args.with_caches,
+            'seed': args.seed
+        },
+        'totals': {
+            'elapsed_seconds': round(elapsed, 3),
+            'completed_scenarios': completed,
+            'failed_scenarios': len(failures),
+            'throughput_scenarios_per_second': round(completed / elapsed, 3) if elapsed > 0 else 0.0,
+            'throughput_requests_per_second': round(
+                sum(stats['count'] for name, stats in operations.items() if name != 'qna.stream_first_token') / elapsed, 3
+            ) if elapsed > 0 else 0.0,
+            'db_queries': database.query_count - queries_before,
+            'prompt_tokens': tracing['total_prompt_tokens'],
+            'completion_tokens': tracing['total_completion_tokens'],
+            'vector_chunks': len(collection),
+            'embedding_calls': collection.embed_calls - embed_calls_before,
+            'peak_rss_mb': peak_rss_mb()
+        },
+        'scenarios': scenarios,
+        'operations': operations,
+        'graph_nodes': graph_nodes,
+        'tool_spans': tool_spans,
+        'failures': failures[:50]
+    }
+
+
+def print_report(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """결과 표 출력 (기준 결과가 있으면 p95 변화율 함께 표시)"""
+    totals = result['totals']
+    config = result['config']
+
+    print(f"=== 학습 세션 엔드투엔드 벤치마크 ({config['driver']}, 사용자 {config['users']}명 × {config['iterations']}회) ===")
+    print(f"총 소요: {totals['elapsed_seconds']:.2f}초 | 완료 시나리오 {totals['completed_scenarios']}개, 실패 {totals['failed_scenarios']}개")
+    print(f"처리량: 시나리오 {totals['throughput_scenarios_per_second']:.2f}/s, 요청 {totals['throughput_requests_per_second']:.2f}/s")
+    print(f"DB 쿼리: {totals['db_queries']}개 | 임베딩 호출: {totals.get('embedding_calls', '-')}개 | LLM 토큰: 입력 {totals['prompt_tokens']}, 출력 {totals['completion_tokens']} | 최대 RSS: {totals['peak_rss_mb']} MB")
+
+    baseline_sections = {
+        section: (baseline or {}).get(section, {}) for section in ('scenarios', 'operations', 'graph_nodes', 'tool_spans')
+    }
+
+    for title, section in (('시나리오', 'scenarios'), ('구간', 'operations'), ('그래프 노드', 'graph_nodes'), ('노드 내부 호출', 'tool_spans')):
+        print()
+        print(f"[{title}]")
+        print(f"{'이름':<28} | {'횟수':>6} | {'p50(ms)':>9} | {'p95(ms)':>9} | {'p99(ms)':>9} | {'p95 변화':>9}")
+        print("-" * 86)
+        for name, stats in result[section].items():
+            change = ''
+            previous = baseline_sections[section].get(name)
+            if previous and previous.get('p95_ms'):
+                change = f"{(stats['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100:+.1f}%"
+            print(f"{name:<28} | {stats['count']:>6} | {stats['p50_ms']:>9.1f} | {stats['p95_ms']:>9.1f} | {stats['p99_ms']:>9.1f} | {change:>9}")
+
+    if result['failures']:
+        print()
+        print("⚠️  실패 예시:")
+        for failure in result['failures'][:5]:
+            print(f"  - 사용자 {failure['user_id']} / {failure['scenario']}: {failure['error']}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='학습 세션 전체 흐름 엔드투엔드 벤치마크')
+    parser.add_argument('--users', type=int, default=8, help='동시 가상 사용자 수')
+    parser.add_argument('--iterations', type=int, default=3, help='사용자별 시나리오 반복 횟수')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS), help='실행할 시나리오')
+    parser.add_argument('--driver', choices=['routes', 'service'], default='routes', help='Flask 라우트 또는 SessionService 직접 호출')
+    parser.add_argument('--llm-latency', default='lognormal:300:0.4', help='가짜 LLM 응답 지연 분포 (예: fixed:200, uniform:100:400)')
+    parser.add_argument('--token-delay-ms', type=float, default=5, help='가짜 LLM 스트리밍 토큰 간격 (ms)')
+    parser.add_argument('--db-latency-ms', type=float, default=1.0, help='DB 문장당 지연 (ms)')
+    parser.add_argument('--vector-latency-ms', type=float, default=10.0, help='벡터 검색 호출당 지연 (ms)')
+    parser.add_argument('--embedding-latency-ms', type=float, default=0.0, help='쿼리 임베딩 호출당 지연 (ms)')
+    parser.add_argument('--db-pool-size', type=int, default=10, help='DB 연결 풀 최대 연결 수')
+    parser.add_argument('--with-caches', action='store_true', help='생성 캐시/사전 생성 콘텐츠를 켠 상태로 측정 (기본: 끔)')
+    parser.add_argument('--no-warmup', dest='warmup', action='store_false', help='워밍업 실행 생략')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (LLM 지연, 답안 선택)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 경로 (p95 변화율 출력)')
+    args = parser.parse_args()
+
+    configure_environment(args)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    result = run_benchmark(args)
+    print_report(result, baseline)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print()
+        print(f"💾 결과 저장: {args.output}")
+
+    sys.exit(1 if result['totals']['failed_scenarios'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# backend/scripts/benchmark_state_copy.py
+# TutorState 복사 비용 마이크로벤치마크 스크립트
+#
+# 한 번의 대화 턴에서 호출되는 관리자 메서드들을 대화 기록 길이별로 실행하여,
+# 기존 방식(메서드마다 copy.deepcopy)과 현재 방식(copy-on-write)의 턴당 소요 시간을 비교합니다.
+
+import os
+import sys
+import copy
+import time
+import argparse
+from datetime import datetime
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+from app.core.langraph.state.state_factory import state_factory
+from app.core.langraph.state.state_copy import with_appended
+from app.core.langraph.managers.agent_manager import agent_manager
+from app.core.langraph.managers.conversation_manager import conversation_manager
+from app.core.state_store import MemoryStateStore
+
+# 기본 대화 기록 길이
+DEFAULT_LENGTHS = [10, 100, 500, 2000]
+
+
+def build_state(conversation_length: int):
+    """대화 기록이 conversation_length개 쌓인 State 생성"""
+    state = state_factory.create_session_state(user_id=1, user_type="beginner", chapter=1, section=1)
+    state["current_session_conversations"] = [
+        {
+            "agent_name": "theory_educator" if i % 2 else "user",
+            "message": f"대화 메시지 {i} " * 20,
+            "timestamp": datetime.now(),
+            "message_type": "system" if i % 2 else "user",
+            "session_stage": "theory_completed"
+        }
+        for i in range(conversation_length)
+    ]
+    return state
+
+
+def run_turn(state, store, legacy: bool):
+    """
+    대화 한 턴 동안의 State 갱신 시뮬레이션
+
+    legacy=True이면 변경 전처럼 관리자 메서드 호출마다 State 전체를 깊은 복사합니다.
+    """
+    copy_before_call = copy.deepcopy if legacy else (lambda value: value)
+
+    state = conversation_manager.add_user_message(copy_before_call(state), "이 개념을 다시 설명해 주세요")
+    state = agent_manager.update_agent_transition(copy_before_call(state), "learning_supervisor")
+    state = agent_manager.update_user_intent(copy_before_call(state), "question")
+    state = agent_manager.update_agent_transition(copy_before_call(state), "qna_resolver")
+    state = conversation_manager.update_agent_draft(copy_before_call(state), "qna_resolver", "답변 대본")
+    state = conversation_manager.add_system_message(copy_before_call(state), "qna_resolver", "답변입니다")
+    state = agent_manager.update_ui_mode(copy_before_call(state), "chat")
+
+    # SessionService._update_user_state (기존: 저장 시 깊은 복사)
+    store.set("1", {"state": copy_before_call(state), "last_activity": datetime.now(), "session_id": "bench"})
+    return state
+
+
+def measure(conversation_length: int, legacy: bool, iterations: int) -> float:
+    """턴당 평균 소요 시간(마이크로초) 측정"""
+    base_state = build_state(conversation_length)
+    store = MemoryStateStore("benchmark", 3600)
+
+    # 워밍업
+    run_turn(base_state, store, legacy)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run_turn(base_state, store, legacy)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / iterations * 1_000_000
+
+
+def measure_append(conversation_length: int, iterations: int) -> float:
+    """with_appended 1회 평균 소요 시간(마이크로초) 측정 (리스트 참조 복사 비용)"""
+    base_state = build_state(conversation_length)
+    item = base_state["current_session_conversations"][-1]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with_appended(base_state, "current_session_conversations", item)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / iterations * 1_000_000
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='TutorState 복사 비용 마이크로벤치마크')
+    parser.add_argument('--lengths', type=int, nargs='+', default=DEFAULT_LENGTHS, help='측정할 대화 기록 길이 목록')
+    parser.add_argument('--iterations', type=int, default=50, help='길이별 반복 횟수')
+    args = parser.parse_args()
+
+    print("=== TutorState 턴당 갱신 비용 (마이크로초) ===")
+    print(f"{'대화 길이':>10} | {'deepcopy(기존)':>16} | {'copy-on-write':>14} | {'배율':>8} | {'추가 1회':>10}")
+    print("-" * 74)
+
+    for length in args.lengths:
+        legacy_us = measure(length, legacy=True, iterations=args.iterations)
+        cow_us = measure(length, legacy=False, iterations=args.iterations)
+        append_us = measure_append(length, iterations=args.iterations * 20)
+        ratio = legacy_us / cow_us if cow_us > 0 else float('inf')
+        print(f"{length:>10} | {legacy_us:>16.1f} | {cow_us:>14.1f} | {ratio:>7.1f}x | {append_us:>10.2f}")
+
+    print()
+    print("copy-on-write 방식은 대화 항목(딕셔너리)을 복사하지 않지만, 대화 리스트에 항목을 추가할 때마다")
+    print("리스트 참조를 새로 복사하므로 턴당 비용은 대화 길이에 비례해 늘어납니다 ('추가 1회' 열 참고).")
+
+
+if __name__ == "__main__":
+    main()
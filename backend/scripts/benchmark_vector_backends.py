@@ -0,0 +1,272 @@
+# backend/scripts/benchmark_vector_backends.py
+# QnA 벡터 검색 백엔드(ChromaDB / NumPy 전수 검색) 지연 시간·재현율 비교 벤치마크 스크립트
+#
+# 같은 컬렉션과 같은 쿼리 임베딩으로 두 백엔드를 호출하여 쿼리 묶음 크기별 p50/p95/p99 지연 시간,
+# ChromaDB(HNSW 근사 검색) 결과의 recall@k(NumPy 정확 검색 기준), max_distance 필터 후 결과 일치율을 출력합니다.
+# 쿼리는 청크 임베딩에 잡음을 더해 만들거나(--query-file 없을 때) 텍스트 파일의 질문을 임베딩해 사용합니다.
+# 로컬 벡터 DB가 비어 있으면 --synthetic으로 임시 ChromaDB 컬렉션에 합성 데이터를 넣어 측정할 수 있습니다.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+CHUNK_TYPES = ('core_concept', 'analogy', 'practical_example', 'technical_detail')
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def latency_summary(values_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(values_ms)
+    return {
+        'calls': len(ordered),
+        'mean_ms': round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 50), 3),
+        'p95_ms': round(percentile(ordered, 95), 3),
+        'p99_ms': round(percentile(ordered, 99), 3)
+    }
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    return matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+
+
+def create_synthetic_collection(chunks: int, dimensions: int, seed: int) -> Tuple[Any, str]:
+    """
+    임시 디렉토리의 ChromaDB(PersistentClient)에 합성 청크 생성
+
+    실제 임베딩처럼 단위 벡터이고, 같은 섹션의 청크끼리 가깝도록 섹션 중심 주변에 분포시킵니다.
+    """
+    import chromadb
+    from chromadb.config import Settings
+
+    rng = np.random.default_rng(seed)
+    sections = max(1, chunks // 4)
+    centers = _unit_rows(rng.standard_normal((sections, dimensions)).astype(np.float32))
+    section_of = rng.integers(0, sections, size=chunks)
+    embeddings = _unit_rows(centers[section_of] + 0.6 * _unit_rows(rng.standard_normal((chunks, dimensions)).astype(np.float32)))
+
+    path = tempfile.mkdtemp(prefix='benchmark_vector_backends_')
+    client = chromadb.PersistentClient(path=path, settings=Settings(anonymized_telemetry=False, allow_reset=True))
+    collection = client.create_collection(name='benchmark_contents', embedding_function=None)
+
+    ids = [f"synthetic-{index}" for index in range(chunks)]
+    metadatas = [{
+        'id': ids[index],
+        'chapter': int(section_of[index]) // 4 + 1,
+        'section': int(section_of[index]) % 4 + 1,
+        'chunk_type': CHUNK_TYPES[index % len(CHUNK_TYPES)],
+        'content_quality_score': int(rng.integers(85, 100)),
+        'primary_keywords': f"keyword-{section_of[index]}",
+        'source_url': 'synthetic://benchmark'
+    } for index in range(chunks)]
+    documents = [f"합성 청크 {index} (섹션 {section_of[index]})" for index in range(chunks)]
+
+    batch = 256
+    for start in range(0, chunks, batch):
+        collection.add(
+            ids=ids[start:start + batch],
+            embeddings=embeddings[start:start + batch],
+            documents=documents[start:start + batch],
+            metadatas=metadatas[start:start + batch]
+        )
+    return collection, path
+
+
+def build_queries(index, args: argparse.Namespace) -> np.ndarray:
+    """쿼리 임베딩 행렬 (텍스트 파일이 있으면 임베딩, 없으면 청크 임베딩 + 잡음)"""
+    if args.query_file:
+        from app.tools.external.vector_search_tools import _get_embedding_function
+        with open(args.query_file, 'r', encoding='utf-8') as f:
+            texts = [line.strip() for line in f if line.strip()][:args.queries]
+        print(f"📝 질문 {len(texts)}개 임베딩 중 (OpenAI)")
+        return np.asarray(_get_embedding_function()(texts), dtype=np.float32)
+
+    rng = np.random.default_rng(args.seed + 1)
+    matrix = index._matrix
+    picks = rng.integers(0, len(matrix), size=args.queries)
+    noise = _unit_rows(rng.standard_normal((args.queries, matrix.shape[1])).astype(np.float32))
+    return _unit_rows(matrix[picks] + args.noise * noise)
+
+
+def time_backend(search, queries: np.ndarray, batch_size: int, n_results: int, repeat: int) -> Tuple[List[float], List[Dict[str, Any]]]:
+    """쿼리를 batch_size개씩 묶어 검색하며 호출당 지연 시간(ms)과 첫 반복 결과 수집"""
+    samples: List[float] = []
+    results: List[Dict[str, Any]] = []
+    for iteration in range(repeat):
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start:start + batch_size]
+            started = time.perf_counter()
+            result = search(batch, n_results)
+            samples.append((time.perf_counter() - started) * 1000)
+            if iteration == 0:
+                for position in range(len(batch)):
+                    results.append({'ids': result['ids'][position], 'distances': result['distances'][position]})
+    return samples, results
+
+
+def compare_results(chroma_results: List[Dict[str, Any]],
+                    numpy_results: List[Dict[str, Any]],
+                    recall_k: List[int],
+                    max_distance: float) -> Dict[str, Any]:
+    """NumPy 정확 검색을 기준으로 ChromaDB 결과 재현율/필터 후 일치율/거리 차이 계산"""
+    recall = {}
+    for k in recall_k:
+        hits = [
+            len(set(chroma['ids'][:k]) & set(exact['ids'][:k])) / max(1, min(k, len(exact['ids'])))
+            for chroma, exact in zip(chroma_results, numpy_results)
+        ]
+        recall[f'recall@{k}'] = round(sum(hits) / len(hits), 4) if hits else 0.0
+
+    # search_qna_materials와 같은 기준: max_distance 이하 상위 5개
+    def filtered(result: Dict[str, Any]) -> List[str]:
+        return [id_ for id_, distance in zip(result['ids'], result['distances']) if distance <= max_distance][:5]
+
+    same = sum(1 for chroma, exact in zip(chroma_results, numpy_results) if filtered(chroma) == filtered(exact))
+
+    differences = []
+    for chroma, exact in zip(chroma_results, numpy_results):
+        exact_distances = dict(zip(exact['ids'], exact['distances']))
+        differences.extend(abs(distance - exact_distances[id_]) for id_, distance in zip(chroma['ids'], chroma['distances']) if id_ in exact_distances)
+
+    return {
+        **recall,
+        'filtered_top5_match_rate': round(same / len(numpy_results), 4) if numpy_results else 0.0,
+        'max_distance_abs_diff': round(max(differences), 6) if differences else 0.0
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """두 백엔드 비교 결과 딕셔너리 반환"""
+    from app.core.external.numpy_vector_index import NumpyVectorIndex
+
+    temp_dir = None
+    if args.synthetic:
+        print(f"🧪 합성 컬렉션 생성: 청크 {args.synthetic}개 × {args.dimensions}차원")
+        collection, temp_dir = create_synthetic_collection(args.synthetic, args.dimensions, args.seed)
+    else:
+        from app.tools.external.vector_search_tools import _get_collection
+        collection = _get_collection()
+        if collection is None or collection.count() == 0:
+            raise SystemExit("❌ 벡터 DB 컬렉션이 비어 있습니다. vector_db_setup.py로 구축하거나 --synthetic N을 사용하세요.")
+
+    try:
+        index = NumpyVectorIndex.from_collection(collection)
+        print(f"📦 NumPy 인덱스: 청크 {index.chunk_count}개, {index.get_stats()['dimensions']}차원, "
+              f"{index.get_stats()['matrix_mb']}MB, 생성 {index.build_ms:.1f}ms (거리 공간 {index.space})")
+
+        queries = build_queries(index, args)
+        print(f"🔎 쿼리 {len(queries)}개, n_results={args.n_results}, 반복 {args.repeat}회")
+        print()
+
+        def chroma_search(batch: np.ndarray, n_results: int) -> Dict[str, Any]:
+            return collection.query(query_embeddings=batch, n_results=n_results, include=['distances', 'documents', 'metadatas'])
+
+        def numpy_search(batch: np.ndarray, n_results: int) -> Dict[str, Any]:
+            return index.query(batch, n_results=n_results)
+
+        # 첫 호출 비용(HNSW 세그먼트 로드 등) 제외
+        chroma_search(queries[:1], args.n_results)
+        numpy_search(queries[:1], args.n_results)
+
+        latency: Dict[str, Dict[str, Any]] = {}
+        quality: Dict[str, Any] = {}
+        for batch_size in args.batch_sizes:
+            chroma_samples, chroma_results = time_backend(chroma_search, queries, batch_size, args.n_results, args.repeat)
+            numpy_samples, numpy_results = time_backend(numpy_search, queries, batch_size, args.n_results, args.repeat)
+            latency[f'batch_{batch_size}'] = {
+                'chroma': latency_summary(chroma_samples),
+                'numpy': latency_summary(numpy_samples)
+            }
+            if not quality:
+                quality = compare_results(chroma_results, numpy_results, args.recall_k, args.max_distance)
+
+        return {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'source': 'synthetic' if args.synthetic else 'collection',
+            'index': index.get_stats(),
+            'queries': len(queries),
+            'n_results': args.n_results,
+            'max_distance': args.max_distance,
+            'latency': latency,
+            'quality': quality
+        }
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """결과 표 출력"""
+    index = result['index']
+    print(f"=== 벡터 검색 백엔드 비교 (청크 {index['chunks']}개 × {index['dimensions']}차원, 쿼리 {result['queries']}개) ===")
+    print(f"{'묶음 크기':<10} | {'백엔드':<7} | {'평균(ms)':>9} | {'p50(ms)':>9} | {'p95(ms)':>9} | {'p99(ms)':>9} | {'p50 배율':>8}")
+    print('-' * 80)
+    for name, backends in result['latency'].items():
+        chroma_p50 = backends['chroma']['p50_ms']
+        for backend in ('chroma', 'numpy'):
+            stats = backends[backend]
+            speedup = f"{chroma_p50 / stats['p50_ms']:.1f}x" if stats['p50_ms'] else '-'
+            print(f"{name.replace('batch_', ''):<10} | {backend:<7} | {stats['mean_ms']:>9.3f} | {stats['p50_ms']:>9.3f} | "
+                  f"{stats['p95_ms']:>9.3f} | {stats['p99_ms']:>9.3f} | {speedup:>8}")
+
+    quality = result['quality']
+    print()
+    recalls = ', '.join(f"{key} {value:.1%}" for key, value in quality.items() if key.startswith('recall@'))
+    print(f"ChromaDB 재현율 (NumPy 정확 검색 기준): {recalls}")
+    print(f"max_distance {result['max_distance']} 필터 후 상위 5개 일치율: {quality['filtered_top5_match_rate']:.1%}")
+    print(f"같은 청크의 거리 최대 차이: {quality['max_distance_abs_diff']}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='QnA 벡터 검색 백엔드(ChromaDB / NumPy) 지연 시간·재현율 비교')
+    parser.add_argument('--synthetic', type=int, help='로컬 벡터 DB 대신 합성 청크 N개로 측정')
+    parser.add_argument('--dimensions', type=int, default=3072, help='합성 임베딩 차원 (text-embedding-3-large: 3072)')
+    parser.add_argument('--queries', type=int, default=200, help='쿼리 수')
+    parser.add_argument('--query-file', help='한 줄에 질문 하나인 텍스트 파일 (OpenAI로 임베딩, 기본: 청크 임베딩 + 잡음)')
+    parser.add_argument('--noise', type=float, default=0.8, help='청크 임베딩에 더할 잡음 크기 (단위 벡터 배수)')
+    parser.add_argument('--n-results', type=int, default=15, help='쿼리별 검색 결과 수 (search_qna_materials와 동일)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 3], help='한 번에 검색할 쿼리 수')
+    parser.add_argument('--recall-k', type=int, nargs='+', default=[5, 15], help='재현율을 계산할 k')
+    parser.add_argument('--max-distance', type=float, default=1.2, help='search_qna_materials 거리 임계값')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    print_report(result)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print()
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
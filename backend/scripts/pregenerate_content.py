@@ -0,0 +1,239 @@
+# backend/scripts/pregenerate_content.py
+# 전체 커리큘럼 이론/퀴즈 대본 사전 생성 배치 스크립트
+#
+# chapters_metadata.json의 모든 챕터/섹션 × 사용자 유형 × (첫 학습/재학습) 조합에 대해
+# 에이전트와 같은 경로로 이론 대본과 퀴즈 대본을 생성하고, 버전별 아티팩트 저장소에 기록합니다.
+# 모든 조합이 성공하면 새 버전을 게시(CURRENT 교체)하여 에이전트가 LLM 호출 대신 바로 읽도록 합니다.
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+# 에이전트 모듈의 순환 import를 피하기 위해 워크플로우 패키지를 먼저 로드
+import app.core.langraph  # noqa: F401
+from app.agents.theory_educator.theory_educator_agent import TheoryEducator
+from app.agents.quiz_generator.quiz_generator_agent import QuizGenerator
+from app.core.artifacts import ContentArtifactStore, theory_fingerprint
+from app.core.llm import get_role_config, llm_registry
+
+DEFAULT_USER_TYPES = ['beginner', 'advanced']
+
+
+class RateLimiter:
+    """
+    스레드 안전 요청 속도 제한기
+
+    호출 시작 간격을 60 / requests_per_minute 초 이상으로 유지합니다.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """다음 호출 가능 시각까지 대기"""
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+
+        wait_seconds = slot - time.monotonic()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+def load_curriculum(chapters: Optional[List[int]] = None) -> List[Tuple[int, int, str]]:
+    """
+    chapters_metadata.json에서 (챕터, 섹션, 섹션 제목) 목록 로드
+
+    Args:
+        chapters: 대상 챕터 번호 목록 (None이면 전체)
+    """
+    metadata_file = os.path.join(project_root, 'data', 'chapters', 'chapters_metadata.json')
+    with open(metadata_file, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+
+    sections = []
+    for chapter in metadata.get('chapters', []):
+        chapter_number = chapter.get('chapter_number')
+        if chapters and chapter_number not in chapters:
+            continue
+        for section in chapter.get('sections', []):
+            sections.append((chapter_number, section.get('section_number'), section.get('section_title', '')))
+    return sections
+
+
+def generate_job(job: Dict[str, Any],
+                 version: str,
+                 store: ContentArtifactStore,
+                 limiter: RateLimiter,
+                 theory_agent: TheoryEducator,
+                 quiz_agent: QuizGenerator,
+                 skip_existing: bool) -> str:
+    """
+    한 조합의 이론 → 퀴즈 대본 생성 및 기록
+
+    Returns:
+        'generated' 또는 'skipped'
+    """
+    chapter, section = job['chapter'], job['section']
+    user_type, is_retry = job['user_type'], job['is_retry_session']
+
+    file_name = store.make_file_name(chapter, section, user_type, is_retry)
+    quiz_path = os.path.join(store.base_dir, version, 'quiz', file_name)
+    if skip_existing and os.path.exists(quiz_path):
+        return 'skipped'
+
+    # 1. 이론 대본 (에이전트와 같은 벡터 검색/폴백 경로)
+    limiter.acquire()
+    theory_content, content_source, material_count = theory_agent.generate_theory_content(
+        chapter, section, user_type, is_retry, raise_on_error=True
+    )
+    store.write_artifact(
+        version, 'theory', chapter, section, user_type, is_retry, theory_content,
+        extra={'content_source': content_source, 'vector_material_count': material_count}
+    )
+
+    # 2. 방금 생성한 이론 대본 기반 퀴즈 대본
+    limiter.acquire()
+    quiz_content, quiz_source = quiz_agent.generate_quiz_content(
+        chapter, section, user_type, is_retry, theory_content, raise_on_error=True
+    )
+    store.write_artifact(
+        version, 'quiz', chapter, section, user_type, is_retry, quiz_content,
+        extra={'content_source': quiz_source, 'theory_fingerprint': theory_fingerprint(theory_content)}
+    )
+    return 'generated'
+
+
+def run_pregeneration(args: argparse.Namespace) -> bool:
+    """
+    사전 생성 실행
+
+    Returns:
+        bool: 모든 조합이 성공했는지 여부
+    """
+    store = ContentArtifactStore(base_dir=args.output_dir)
+    limiter = RateLimiter(args.rate_limit)
+    theory_agent = TheoryEducator()
+    quiz_agent = QuizGenerator()
+
+    retry_flags = [False] if args.no_retry else [False, True]
+    jobs = [
+        {'chapter': chapter, 'section': section, 'title': title, 'user_type': user_type, 'is_retry_session': is_retry}
+        for chapter, section, title in load_curriculum(args.chapters)
+        for user_type in args.user_types
+        for is_retry in retry_flags
+    ]
+
+    print(f"📦 버전: {args.version}")
+    print(f"📁 저장 경로: {os.path.join(store.base_dir, args.version)}")
+    print(f"🤖 LLM 제공자: {llm_registry.provider}")
+    print(f"🧮 조합 수: {len(jobs)}개 (동시 실행 {args.concurrency}, 분당 {args.rate_limit or '무제한'} 요청)")
+    print()
+
+    started_at = time.perf_counter()
+    results = {'generated': 0, 'skipped': 0}
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = {
+            executor.submit(generate_job, job, args.version, store, limiter, theory_agent, quiz_agent, args.resume): job
+            for job in jobs
+        }
+        for index, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            label = f"챕터 {job['chapter']} 섹션 {job['section']} / {job['user_type']} / {'재학습' if job['is_retry_session'] else '첫 학습'}"
+            try:
+                status = future.result()
+                results[status] += 1
+                mark = '⏭️ ' if status == 'skipped' else '✅'
+                print(f"[{index}/{len(jobs)}] {mark} {label}")
+            except Exception as e:
+                failures.append({'job': label, 'error': str(e)})
+                print(f"[{index}/{len(jobs)}] ❌ {label} - {e}")
+
+    elapsed = time.perf_counter() - started_at
+
+    store.write_manifest(args.version, {
+        'version': args.version,
+        'created_at': datetime.now().isoformat(),
+        'provider': llm_registry.provider,
+        'models': {role: list(get_role_config(role).cache_key) for role in ('theory', 'quiz')},
+        'user_types': args.user_types,
+        'include_retry': not args.no_retry,
+        'total_jobs': len(jobs),
+        'generated': results['generated'],
+        'skipped': results['skipped'],
+        'failures': failures,
+        'elapsed_seconds': round(elapsed, 2)
+    })
+
+    print()
+    print(f"생성 {results['generated']}개, 건너뜀 {results['skipped']}개, 실패 {len(failures)}개 ({elapsed:.1f}초)")
+
+    if failures:
+        print("⚠️  실패한 조합이 있어 버전을 게시하지 않았습니다. --resume으로 같은 버전을 다시 실행하세요.")
+        return False
+
+    if args.no_publish:
+        print(f"ℹ️  게시하지 않음 (--no-publish). 게시하려면 --publish-only {args.version}를 실행하세요.")
+    else:
+        store.publish(args.version)
+        print(f"🚀 버전 게시 완료: {args.version}")
+    return True
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='전체 커리큘럼 이론/퀴즈 대본 사전 생성')
+    parser.add_argument('--version', default=datetime.now().strftime('%Y%m%d_%H%M%S'), help='생성할 버전 이름 (기본: 현재 시각)')
+    parser.add_argument('--chapters', type=int, nargs='+', help='대상 챕터 번호 (기본: 전체)')
+    parser.add_argument('--user-types', nargs='+', default=DEFAULT_USER_TYPES, help='대상 사용자 유형')
+    parser.add_argument('--no-retry', action='store_true', help='재학습용 대본은 생성하지 않음')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시에 처리할 조합 수')
+    parser.add_argument('--rate-limit', type=float, default=60, help='분당 최대 LLM 요청 수 (0이면 무제한)')
+    parser.add_argument('--output-dir', help='아티팩트 루트 경로 (기본: CONTENT_ARTIFACTS_DIR 또는 backend/data/pregenerated)')
+    parser.add_argument('--resume', action='store_true', help='같은 버전에 이미 생성된 조합은 건너뜀')
+    parser.add_argument('--no-publish', action='store_true', help='생성 후 CURRENT를 교체하지 않음')
+    parser.add_argument('--publish-only', metavar='VERSION', help='생성 없이 지정한 버전을 게시')
+    parser.add_argument('--fake-llm', action='store_true', help='OpenAI 대신 로컬 가짜 LLM 사용 (테스트용)')
+    parser.add_argument('--fake-latency', default='fixed:0', help='가짜 LLM 응답 지연 분포 (예: fixed:200, uniform:100:400, lognormal:300:0.5)')
+    args = parser.parse_args()
+
+    args.output_dir = args.output_dir or os.getenv('CONTENT_ARTIFACTS_DIR') or None
+
+    if args.publish_only:
+        ContentArtifactStore(base_dir=args.output_dir).publish(args.publish_only)
+        print(f"🚀 버전 게시 완료: {args.publish_only}")
+        return
+
+    if args.fake_llm:
+        os.environ['LLM_PROVIDER'] = 'fake'
+        os.environ['FAKE_LLM_LATENCY'] = args.fake_latency
+        llm_registry.clear()
+
+    success = run_pregeneration(args)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# backend/scripts/reconcile_user_statistics.py
+# user_statistics 퀴즈 통계 일괄 재계산(드리프트 보정) 스크립트
+#
+# 세션 완료 시 퀴즈 통계는 증분(+1)으로만 반영되므로, 저장 실패나 수동 데이터 수정으로
+# 누적값이 session_quizzes와 어긋날 수 있습니다. 이 스크립트는 전체 사용자의 퀴즈 통계를
+# 하나의 GROUP BY 쿼리로 다시 집계해 user_statistics에 일괄 반영합니다.
+
+import os
+import sys
+import argparse
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+from app.utils.database import execute_query, fetch_all
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 사용자별 퀴즈 통계 집계 (session_quizzes 전체를 한 번만 스캔)
+QUIZ_AGGREGATE_SQL = """
+    SELECT
+        ls.user_id,
+        SUM(sq.quiz_type = 'multiple_choice') AS mc_count,
+        SUM(sq.quiz_type = 'multiple_choice' AND sq.multiple_answer_correct) AS mc_correct,
+        SUM(sq.quiz_type <> 'multiple_choice') AS subjective_count,
+        SUM(CASE WHEN sq.quiz_type <> 'multiple_choice'
+            THEN COALESCE(sq.subjective_answer_score, 0) ELSE 0 END) AS subjective_score
+    FROM session_quizzes sq
+    JOIN learning_sessions ls ON sq.session_id = ls.session_id
+    {where}
+    GROUP BY ls.user_id
+"""
+
+# 집계 결과와 저장된 통계가 다른 사용자 조회
+DRIFT_SELECT_SQL = """
+    SELECT
+        us.user_id,
+        us.total_multiple_choice_count, COALESCE(agg.mc_count, 0) AS expected_mc_count,
+        us.total_multiple_choice_correct, COALESCE(agg.mc_correct, 0) AS expected_mc_correct,
+        us.total_subjective_count, COALESCE(agg.subjective_count, 0) AS expected_subjective_count,
+        us.total_subjective_score, COALESCE(agg.subjective_score, 0) AS expected_subjective_score
+    FROM user_statistics us
+    LEFT JOIN ({aggregate}) agg ON agg.user_id = us.user_id
+    WHERE (us.total_multiple_choice_count <> COALESCE(agg.mc_count, 0)
+        OR us.total_multiple_choice_correct <> COALESCE(agg.mc_correct, 0)
+        OR us.total_subjective_count <> COALESCE(agg.subjective_count, 0)
+        OR us.total_subjective_score <> COALESCE(agg.subjective_score, 0))
+    {user_filter}
+    ORDER BY us.user_id
+"""
+
+# 집계 결과로 통계 일괄 갱신 (다중 테이블 UPDATE는 SET 평가 순서가 보장되지 않으므로 집계값으로 직접 계산)
+RECONCILE_UPDATE_SQL = """
+    UPDATE user_statistics us
+    LEFT JOIN ({aggregate}) agg ON agg.user_id = us.user_id
+    SET us.total_multiple_choice_count = COALESCE(agg.mc_count, 0),
+        us.total_multiple_choice_correct = COALESCE(agg.mc_correct, 0),
+        us.multiple_choice_accuracy = CASE WHEN agg.mc_count > 0
+            THEN ROUND(agg.mc_correct / agg.mc_count * 100, 2) ELSE 0 END,
+        us.total_subjective_count = COALESCE(agg.subjective_count, 0),
+        us.total_subjective_score = COALESCE(agg.subjective_score, 0),
+        us.subjective_average_score = CASE WHEN agg.subjective_count > 0
+            THEN ROUND(agg.subjective_score / agg.subjective_count, 2) ELSE 0 END,
+        us.updated_at = NOW()
+    {user_filter}
+"""
+
+def _build_query(template: str, user_id: Optional[int], filter_keyword: str) -> Tuple[str, List[Any]]:
+    """사용자 필터 적용 여부에 따라 쿼리와 파라미터 구성 (filter_keyword: 'WHERE' 또는 'AND')"""
+    if user_id is None:
+        aggregate = QUIZ_AGGREGATE_SQL.format(where='')
+        user_filter = ''
+        params = []
+    else:
+        aggregate = QUIZ_AGGREGATE_SQL.format(where='WHERE ls.user_id = %s')
+        user_filter = f'{filter_keyword} us.user_id = %s'
+        params = [user_id, user_id]
+
+    return template.format(aggregate=aggregate, user_filter=user_filter), params
+
+def find_drifted_users(user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    저장된 퀴즈 통계가 session_quizzes 집계와 다른 사용자 조회
+
+    Args:
+        user_id: 특정 사용자만 확인할 경우 사용자 ID
+
+    Returns:
+        List[Dict[str, Any]]: 드리프트가 있는 사용자별 저장값/기대값
+    """
+    query, params = _build_query(DRIFT_SELECT_SQL, user_id, 'AND')
+    return fetch_all(query, params or None)
+
+def reconcile_user_statistics(user_id: Optional[int] = None) -> int:
+    """
+    퀴즈 통계를 session_quizzes 기준으로 일괄 재계산
+
+    Args:
+        user_id: 특정 사용자만 보정할 경우 사용자 ID (None이면 전체 사용자)
+
+    Returns:
+        int: 갱신된 user_statistics 행 수
+    """
+    query, params = _build_query(RECONCILE_UPDATE_SQL, user_id, 'WHERE')
+    return execute_query(query, params or None)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='user_statistics 퀴즈 통계 일괄 재계산 (드리프트 보정)')
+    parser.add_argument('--user-id', type=int, default=None, help='특정 사용자만 보정 (기본: 전체 사용자)')
+    parser.add_argument('--dry-run', action='store_true', help='갱신하지 않고 드리프트가 있는 사용자만 출력')
+    args = parser.parse_args()
+
+    target = f"user_id={args.user_id}" if args.user_id is not None else "전체 사용자"
+
+    try:
+        drifted_users = find_drifted_users(args.user_id)
+        print(f"=== 퀴즈 통계 드리프트 확인 ({target}) ===")
+        print(f"드리프트가 있는 사용자: {len(drifted_users)}명")
+
+        for row in drifted_users[:20]:
+            print(
+                f"  user_id={row['user_id']}: "
+                f"객관식 {row['total_multiple_choice_correct']}/{row['total_multiple_choice_count']}"
+                f" → {row['expected_mc_correct']}/{row['expected_mc_count']}, "
+                f"주관식 {row['total_subjective_score']}점/{row['total_subjective_count']}개"
+                f" → {row['expected_subjective_score']}점/{row['expected_subjective_count']}개"
+            )
+        if len(drifted_users) > 20:
+            print(f"  ... 외 {len(drifted_users) - 20}명")
+
+        if args.dry_run:
+            print("--dry-run 모드: 통계를 갱신하지 않았습니다.")
+            return
+
+        updated = reconcile_user_statistics(args.user_id)
+        print(f"✅ 퀴즈 통계 재계산 완료: {updated}개 행 갱신")
+
+    except Exception as e:
+        logger.error(f"퀴즈 통계 재계산 실패: {e}")
+        print(f"❌ 퀴즈 통계 재계산 실패: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
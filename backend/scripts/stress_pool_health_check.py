@@ -0,0 +1,116 @@
+# backend/scripts/stress_pool_health_check.py
+# 헬스체크 실행 중 연결 풀 동작 스트레스 테스트 스크립트
+#
+# 요청 스레드들이 풀의 연결을 계속 사용하는 동안 헬스체크를 반복 실행하고,
+# 그 사이에 새 연결이 추가로 생성되지 않았는지 확인합니다.
+
+import os
+import sys
+import time
+import argparse
+import threading
+import logging
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+from app.config.db_config import DatabaseConfig, DatabaseConnectionManager
+
+# 로깅 설정
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def run_stress_test(workers: int, duration: float) -> bool:
+    """
+    헬스체크 동시 실행 스트레스 테스트
+
+    Args:
+        workers: 동시에 쿼리를 실행할 스레드 수 (미리 만들어 둘 연결 수와 같음)
+        duration: 테스트 시간(초)
+
+    Returns:
+        bool: 추가 연결 생성 없이 완료되었는지 여부
+    """
+    config = DatabaseConfig()
+    config.enable_health_check = True
+    config.pool_config.max_connections = max(config.pool_config.max_connections, workers * 2)
+    # 유휴 검증을 매번 수행해 헬스체크와 충돌할 기회를 최대화
+    config.pool_config.validation_idle_threshold = 0
+
+    manager = DatabaseConnectionManager(config)
+    # 백그라운드 헬스체크 스레드 대신 아래에서 직접 반복 실행
+    manager._health_check_running = False
+
+    # 요청 스레드 수만큼 연결을 미리 만들어 풀에 넣어 둔다
+    warm_connections = [manager.get_connection() for _ in range(workers)]
+    for connection in warm_connections:
+        manager.return_connection(connection)
+
+    baseline = manager.get_pool_stats()
+    stop_event = threading.Event()
+    errors = []
+    query_count = [0] * workers
+    health_check_count = 0
+
+    def worker(index: int) -> None:
+        while not stop_event.is_set():
+            try:
+                connection = manager.get_connection()
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                        cursor.fetchone()
+                finally:
+                    manager.return_connection(connection)
+                query_count[index] += 1
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    end_time = time.time() + duration
+    while time.time() < end_time:
+        manager._perform_health_check()
+        health_check_count += 1
+
+    stop_event.set()
+    for thread in threads:
+        thread.join()
+
+    stats = manager.get_pool_stats()
+    manager.close_all_connections()
+
+    extra_connections = stats['total_created'] - baseline['total_created']
+
+    print("=== 헬스체크 스트레스 테스트 결과 ===")
+    print(f"요청 스레드: {workers}개, 테스트 시간: {duration}초")
+    print(f"실행된 쿼리: {sum(query_count)}회, 헬스체크: {health_check_count}회")
+    print(f"대기 발생: {stats['total_waits']}회 (평균 {stats['avg_wait_time_ms']}ms, 최대 {stats['max_wait_time_ms']}ms)")
+    print(f"추가로 생성된 연결: {extra_connections}개")
+    print(f"오류: {len(errors)}건")
+
+    if errors:
+        print(f"첫 번째 오류: {errors[0]}")
+
+    passed = extra_connections == 0 and not errors
+    print("✅ 통과" if passed else "❌ 실패")
+    return passed
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='헬스체크 실행 중 연결 풀 스트레스 테스트')
+    parser.add_argument('--workers', type=int, default=8, help='동시 요청 스레드 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='테스트 시간(초)')
+    args = parser.parse_args()
+
+    sys.exit(0 if run_stress_test(args.workers, args.duration) else 1)
+
+if __name__ == "__main__":
+    main()
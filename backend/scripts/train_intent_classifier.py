@@ -0,0 +1,157 @@
+# backend/scripts/train_intent_classifier.py
+# 로컬 의도 분류기(next_step / question) 학습 스크립트
+#
+# 시드 예시, 대화 로그(logs/user_chat_log), session_conversations 테이블에서 레이블이 붙은 사용자 메시지를 모아
+# 문자 n-gram 로지스틱 회귀 모델을 학습합니다. 평가용 데이터로 정확도를 측정하고,
+# 로컬 결정의 정확도가 목표 이상이 되는 최소 신뢰도 임계값을 찾아 모델과 함께 저장합니다.
+
+import os
+import sys
+import argparse
+from typing import Any, Dict, List
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(os.path.join(project_root, '.env'))
+
+from app.tools.analysis.intent_classifier import (
+    INTENT_LABELS,
+    IntentClassifier,
+    deduplicate_examples,
+    load_chat_log_examples,
+    load_db_examples,
+    load_seed_examples,
+    split_examples
+)
+
+DEFAULT_LOG_DIR = os.path.join(project_root, 'logs', 'user_chat_log')
+DEFAULT_OUTPUT = os.path.join(project_root, 'data', 'intent_classifier.json')
+
+
+def collect_examples(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """설정된 출처에서 레이블 예시 수집 후 중복 제거"""
+    sources = {}
+    if not args.no_seed:
+        sources['시드 예시'] = load_seed_examples(args.seed_file)
+    if args.log_dir:
+        sources['대화 로그'] = load_chat_log_examples(args.log_dir)
+    if args.from_db:
+        sources['session_conversations'] = load_db_examples(args.db_limit)
+
+    for name, examples in sources.items():
+        print(f"📥 {name}: {len(examples)}개")
+
+    examples = deduplicate_examples(example for group in sources.values() for example in group)
+    counts = {label: sum(1 for example in examples if example['intent'] == label) for label in INTENT_LABELS}
+    print(f"🧮 중복 제거 후 {len(examples)}개 ({', '.join(f'{label} {count}' for label, count in counts.items())})")
+    return examples
+
+
+def evaluate(classifier: IntentClassifier, examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """평가 데이터의 전체 정확도와 의도별 정밀도/재현율"""
+    predictions = [(classifier.classify(example['message'], example['stage']), example['intent']) for example in examples]
+    correct = sum(1 for (intent, _), expected in predictions if intent == expected)
+
+    per_label = {}
+    for label in INTENT_LABELS:
+        true_positive = sum(1 for (intent, _), expected in predictions if intent == label and expected == label)
+        predicted = sum(1 for (intent, _), _ in predictions if intent == label)
+        actual = sum(1 for _, expected in predictions if expected == label)
+        per_label[label] = {
+            'precision': round(true_positive / predicted, 4) if predicted else 0.0,
+            'recall': round(true_positive / actual, 4) if actual else 0.0
+        }
+
+    return {
+        'examples': len(examples),
+        'accuracy': round(correct / len(examples), 4) if examples else 0.0,
+        'per_label': per_label,
+        'predictions': predictions
+    }
+
+
+def calibrate_threshold(predictions: List[Any], target_accuracy: float, min_threshold: float) -> Dict[str, Any]:
+    """
+    로컬 결정 정확도가 목표 이상인 최소 신뢰도 임계값 탐색
+
+    임계값이 낮을수록 LLM 호출이 줄어들지만 오분류가 늘어나므로,
+    목표를 만족하는 가장 낮은 값을 선택합니다 (만족하는 값이 없으면 0.99).
+    평가 데이터가 적을 때 지나치게 낮은 값이 선택되지 않도록 min_threshold부터 탐색합니다.
+    """
+    best = None
+    for step in range(int(round(min_threshold * 100)), 100):
+        threshold = step / 100
+        decided = [(intent, expected) for (intent, confidence), expected in predictions if confidence >= threshold]
+        if not decided:
+            break
+        accuracy = sum(1 for intent, expected in decided if intent == expected) / len(decided)
+        if accuracy >= target_accuracy:
+            best = {'threshold': threshold, 'coverage': round(len(decided) / len(predictions), 4), 'local_accuracy': round(accuracy, 4)}
+            break
+
+    return best or {'threshold': 0.99, 'coverage': None, 'local_accuracy': None}
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 의도 분류기 학습')
+    parser.add_argument('--log-dir', default=DEFAULT_LOG_DIR, help='대화 로그 디렉토리 (빈 값이면 사용 안 함)')
+    parser.add_argument('--from-db', action='store_true', help='session_conversations 테이블에서도 레이블 추출')
+    parser.add_argument('--db-limit', type=int, help='DB에서 가져올 최대 예시 수')
+    parser.add_argument('--seed-file', help='시드 예시 파일 (기본: data/intent_seed_examples.json)')
+    parser.add_argument('--no-seed', action='store_true', help='시드 예시를 사용하지 않음')
+    parser.add_argument('--output', default=os.getenv('INTENT_CLASSIFIER_PATH') or DEFAULT_OUTPUT, help='모델 저장 경로')
+    parser.add_argument('--test-ratio', type=float, default=0.2, help='평가용 데이터 비율')
+    parser.add_argument('--target-accuracy', type=float, default=0.97, help='로컬 결정에 요구하는 최소 정확도 (임계값 보정 기준)')
+    parser.add_argument('--min-threshold', type=float, default=0.7, help='보정 시 탐색할 최소 임계값')
+    parser.add_argument('--threshold', type=float, help='임계값 직접 지정 (보정 생략)')
+    parser.add_argument('--epochs', type=int, default=30, help='학습 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='분할/셔플 시드')
+    parser.add_argument('--dry-run', action='store_true', help='평가만 하고 모델을 저장하지 않음')
+    args = parser.parse_args()
+
+    examples = collect_examples(args)
+    if len(examples) < 10:
+        print("❌ 학습 데이터가 너무 적습니다 (최소 10개).")
+        sys.exit(1)
+
+    # 1. 평가용 분할로 정확도 측정 및 임계값 보정
+    train, test = split_examples(examples, args.test_ratio, args.seed)
+    holdout_model = IntentClassifier.train(train, epochs=args.epochs, seed=args.seed)
+    report = evaluate(holdout_model, test)
+    predictions = report.pop('predictions')
+    if args.threshold is not None:
+        calibration = {'threshold': args.threshold, 'coverage': None, 'local_accuracy': None}
+    else:
+        calibration = calibrate_threshold(predictions, args.target_accuracy, args.min_threshold)
+
+    print()
+    print(f"📊 평가 ({report['examples']}개): 정확도 {report['accuracy']:.1%}")
+    for label, scores in report['per_label'].items():
+        print(f"   - {label}: 정밀도 {scores['precision']:.1%}, 재현율 {scores['recall']:.1%}")
+    if calibration['coverage'] is not None:
+        print(f"🎯 임계값 {calibration['threshold']:.2f}: 로컬 결정 {calibration['coverage']:.1%}, "
+              f"로컬 결정 정확도 {calibration['local_accuracy']:.1%}")
+    else:
+        print(f"🎯 임계값 {calibration['threshold']:.2f} (목표 정확도를 만족하는 값이 없거나 직접 지정)")
+
+    if args.dry_run:
+        print("ℹ️  --dry-run: 모델을 저장하지 않았습니다.")
+        return
+
+    # 2. 전체 데이터로 다시 학습하여 저장
+    classifier = IntentClassifier.train(examples, epochs=args.epochs, seed=args.seed)
+    classifier.threshold = calibration['threshold']
+    classifier.metadata['evaluation'] = {**report, 'calibration': calibration, 'target_accuracy': args.target_accuracy}
+    classifier.save(args.output)
+
+    print(f"💾 모델 저장: {args.output} (특징 {len(classifier.weights)}개)")
+    print("ℹ️  실행 중인 서버는 재시작해야 새 모델을 읽습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+# backend/tests/conftest.py
+# pytest 공통 설정 (backend 폴더를 import 경로에 추가)
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# 모듈 로드 시 OpenAI 클라이언트를 만드는 모듈이 있어 키가 없으면 임의 값 사용 (실제 호출 없음)
+os.environ.setdefault('OPENAI_API_KEY', 'sk-test')
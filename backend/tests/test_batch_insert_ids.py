@@ -0,0 +1,98 @@
+# backend/tests/test_batch_insert_ids.py
+# execute_batch_insert의 다중 행 INSERT ID 계산 테스트 (auto_increment_increment 반영)
+
+import pytest
+
+from app.utils.database import transaction as transaction_module
+
+ROWS = [{'session_id': 1, 'message': f"메시지 {index}"} for index in range(5)]
+
+
+class FakeCursor:
+    """INSERT 문마다 auto_increment_increment 간격으로 ID를 할당하는 커서 대체 구현"""
+
+    def __init__(self, server):
+        self.server = server
+        self.lastrowid = None
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def mogrify(self, template, args):
+        return template % tuple(repr(arg) for arg in args)
+
+    def execute(self, query, params=None):
+        if query.startswith("SELECT @@max_allowed_packet"):
+            self._row = {'max_allowed_packet': 64 * 1024 * 1024}
+        elif query.startswith("SELECT @@auto_increment_increment"):
+            if self.server.increment is None:
+                raise RuntimeError("variable lookup denied")
+            self._row = {'auto_increment_increment': self.server.increment}
+        else:
+            rows = query.count('), (') + 1
+            self.server.statements.append(rows)
+            self.lastrowid = self.server.next_id
+            self.server.next_id += rows * (self.server.increment or 1)
+        return 1
+
+    def fetchone(self):
+        return self._row
+
+
+class FakeServer:
+    def __init__(self, increment):
+        self.increment = increment
+        self.next_id = 11
+        self.statements = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    holder = {}
+
+    def fake_run_with_retry(operation, **kwargs):
+        return operation(holder['server'])
+
+    monkeypatch.setattr(transaction_module, 'run_with_retry', fake_run_with_retry)
+    monkeypatch.setattr(transaction_module, '_max_allowed_packet', None)
+    monkeypatch.setattr(transaction_module, '_auto_increment_increment', None)
+
+    def make(increment):
+        holder['server'] = FakeServer(increment)
+        return holder['server']
+
+    return make
+
+
+def test_batch_insert_ids_follow_auto_increment_increment(server):
+    fake = server(increment=3)
+
+    ids = transaction_module.execute_batch_insert('session_conversations', ROWS, batch_size=3)
+
+    assert fake.statements == [3, 2]
+    assert ids == [11, 14, 17, 20, 23]
+
+
+def test_batch_insert_falls_back_to_single_row_statements_when_increment_unknown(server):
+    fake = server(increment=None)
+
+    ids = transaction_module.execute_batch_insert('session_conversations', ROWS, batch_size=3)
+
+    assert fake.statements == [1, 1, 1, 1, 1]
+    assert ids == [11, 12, 13, 14, 15]
+
+
+def test_batch_insert_without_ids_keeps_multi_row_statements(server):
+    fake = server(increment=None)
+
+    ids = transaction_module.execute_batch_insert('session_conversations', ROWS, batch_size=3, return_ids=False)
+
+    assert fake.statements == [3, 2]
+    assert ids == []
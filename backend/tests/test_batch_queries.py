@@ -0,0 +1,90 @@
+# backend/tests/test_batch_queries.py
+# execute_batch_queries 재시도 동작 테스트 (연결 오류 시 커밋된 쿼리 중복 실행 방지)
+
+from contextlib import contextmanager
+
+import pymysql
+import pytest
+
+from app.config.db_config import DatabaseQueryError
+from app.utils.database import connection as connection_module
+
+QUERIES = [
+    ("INSERT INTO t VALUES (1)", None),
+    ("INSERT INTO t VALUES (2)", None),
+    ("UPDATE t SET v = v + 1", None),
+]
+
+
+class FakeConnection:
+    """execute 호출을 기록하고 지정한 시점에 연결 오류를 내는 연결 대체 구현"""
+
+    def __init__(self, executed, fail_on_cursor=None, fail_after=None):
+        self.executed = executed
+        self.fail_on_cursor = fail_on_cursor
+        self.fail_after = fail_after
+        self.cursors = 0
+
+    def autocommit(self, value):
+        pass
+
+    @contextmanager
+    def cursor(self):
+        self.cursors += 1
+        if self.cursors == self.fail_on_cursor:
+            raise pymysql.InterfaceError(0, "")
+        yield self
+
+    def execute(self, query, params=None):
+        self.executed.append(query)
+        if query == self.fail_after:
+            raise pymysql.OperationalError(2013, "Lost connection to MySQL server during query")
+        return 1
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """시도마다 차례로 빌려줄 연결 목록을 받아 get_db_connection 대체"""
+    executed = []
+    plans = []
+
+    @contextmanager
+    def fake_get_db_connection():
+        yield FakeConnection(executed, **plans.pop(0))
+
+    monkeypatch.setattr(connection_module, 'get_db_connection', fake_get_db_connection)
+    monkeypatch.setattr(connection_module, '_get_retry_policy', lambda: (3, 0.0))
+    return executed, plans
+
+
+def test_autocommit_batch_resumes_after_committed_statements(connections):
+    executed, plans = connections
+    # 두 번째 쿼리 전송 전(커서 생성)에 연결이 끊긴 경우: 커밋된 첫 번째 쿼리는 다시 실행하지 않음
+    plans.extend([{'fail_on_cursor': 2}, {}])
+
+    results = connection_module.execute_batch_queries(QUERIES, use_transaction=False)
+
+    assert results == [1, 1, 1]
+    assert executed == [query for query, _ in QUERIES]
+
+
+def test_autocommit_batch_does_not_retry_statement_with_unknown_outcome(connections):
+    executed, plans = connections
+    # 두 번째 쿼리 실행 후 응답 전에 연결이 끊긴 경우: 커밋 여부를 모르므로 재시도하지 않음
+    plans.extend([{'fail_after': QUERIES[1][0]}, {}])
+
+    with pytest.raises(DatabaseQueryError):
+        connection_module.execute_batch_queries(QUERIES, use_transaction=False)
+
+    assert executed == [QUERIES[0][0], QUERIES[1][0]]
+
+
+def test_transactional_batch_reruns_from_start(connections):
+    executed, plans = connections
+    # 트랜잭션은 롤백되므로 처음부터 다시 실행
+    plans.extend([{'fail_after': QUERIES[1][0]}, {}])
+
+    results = connection_module.execute_batch_queries(QUERIES, use_transaction=True)
+
+    assert results == [1, 1, 1]
+    assert executed == [QUERIES[0][0], QUERIES[1][0]] + [query for query, _ in QUERIES]
@@ -0,0 +1,26 @@
+# backend/tests/test_env_bool.py
+# 환경변수 불리언 파싱 헬퍼 테스트
+
+import pytest
+
+from app.utils.common.helpers import env_bool
+
+
+@pytest.mark.parametrize('value, default, expected', [
+    (None, True, True),
+    ('', True, True),
+    ('  ', False, False),
+    ('Yes', False, True),
+    (' ON ', False, True),
+    ('1', False, True),
+    ('0', True, False),
+    ('false', True, False),
+    ('off', True, False),
+])
+def test_env_bool(monkeypatch, value, default, expected):
+    if value is None:
+        monkeypatch.delenv('TEST_FLAG', raising=False)
+    else:
+        monkeypatch.setenv('TEST_FLAG', value)
+
+    assert env_bool('TEST_FLAG', default) is expected
@@ -0,0 +1,111 @@
+# backend/tests/test_hybrid_search.py
+# QnA 하이브리드 검색 (키워드 역색인 + 벡터 검색) 관련성 테스트
+
+import numpy as np
+import pytest
+
+# 에이전트 모듈의 순환 import를 피하기 위해 워크플로우 패키지를 먼저 로드
+import app.core.langraph  # noqa: F401
+from app.core.external.keyword_index import keyword_index
+from app.tools.external import vector_search_tools
+
+DOCUMENTS = [
+    "Chain of Thought(CoT)는 모델이 단계적으로 추론하도록 유도하는 프롬프트 기법입니다. "
+    "예를 들어 '안녕하세요, 오늘 날씨 어때요?' 같은 인사말에도 단계별 사고를 요청할 수 있습니다.",
+    "Few-shot 프롬프팅은 예시를 몇 개 제시하여 모델이 원하는 형식을 따르게 하는 방법입니다. "
+    "점심 메뉴 추천처럼 일상적인 요청도 예시를 주면 답변 형식이 안정됩니다.",
+    "RAG는 검색 증강 생성으로, 외부 문서를 검색하여 답변에 활용하는 방식입니다.",
+    "프롬프트 엔지니어링은 LLM에게 주는 지시문을 설계하는 일입니다.",
+]
+KEYWORDS = [
+    "CoT,Chain of Thought,단계적 추론",
+    "Few-shot,예시,프롬프팅",
+    "RAG,검색 증강 생성",
+    "프롬프트 엔지니어링,지시문",
+]
+METADATAS = [
+    {
+        'id': f"chunk_{index}",
+        'chapter': 1,
+        'section': index + 1,
+        'chunk_type': 'core_concept',
+        'content_quality_score': 95,
+        'primary_keywords': keywords,
+        'source_url': 'test://chunks'
+    }
+    for index, keywords in enumerate(KEYWORDS)
+]
+
+
+class FakeCollection:
+    """
+    ChromaDB 컬렉션 대체 구현
+
+    topical_distances에 있는 질문만 해당 거리로 응답하고, 그 외 질문(인사, 잡담)은
+    실제 임베딩처럼 모든 청크가 max_distance보다 멀게 응답합니다.
+    """
+
+    def __init__(self, topical_distances):
+        self.topical_distances = topical_distances
+        self.embedded_texts = []
+
+    def get(self, **kwargs):
+        return {'ids': [m['id'] for m in METADATAS], 'documents': list(DOCUMENTS), 'metadatas': list(METADATAS)}
+
+    def embed(self, texts):
+        self.embedded_texts.extend(texts)
+        return [np.full(4, index, dtype=np.float32) for index in range(len(self.embedded_texts) - len(texts), len(self.embedded_texts))]
+
+    def query(self, query_embeddings, n_results=10, **kwargs):
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        for embedding in query_embeddings:
+            text = self.embedded_texts[int(np.asarray(embedding)[0])]
+            distances = self.topical_distances.get(text, [1.6] * len(DOCUMENTS))
+            order = np.argsort(distances, kind='stable')[:n_results]
+            result['ids'].append([METADATAS[i]['id'] for i in order])
+            result['documents'].append([DOCUMENTS[i] for i in order])
+            result['metadatas'].append([METADATAS[i] for i in order])
+            result['distances'].append([float(distances[i]) for i in order])
+        return result
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection({'단계적으로 생각하게 만드는 방법': [0.6, 1.5, 1.5, 1.0]})
+    monkeypatch.setattr(vector_search_tools, '_get_collection', lambda: fake)
+    monkeypatch.setattr(vector_search_tools, '_get_embedding_function', lambda: fake.embed)
+    monkeypatch.setattr(vector_search_tools, 'HYBRID_SEARCH_ENABLED', True)
+    monkeypatch.setattr(vector_search_tools, 'VECTOR_SEARCH_BACKEND', 'chroma')
+    vector_search_tools.query_embedding_cache.clear()
+    keyword_index.invalidate()
+    yield fake
+    keyword_index.invalidate()
+    vector_search_tools.query_embedding_cache.clear()
+
+
+@pytest.mark.parametrize('query', ["안녕하세요", "점심 뭐 먹을까요", "오늘 날씨 어때요?", "고마워요"])
+def test_greeting_and_off_topic_queries_return_nothing(collection, query):
+    assert vector_search_tools.search_qna_materials(query) == []
+
+
+def test_off_topic_queries_return_nothing_in_parallel_search(collection):
+    assert vector_search_tools.search_qna_materials_parallel(["안녕하세요", "오늘 날씨 어때요?"]) == []
+
+
+def test_exact_term_query_is_answered_without_embedding(collection):
+    results = vector_search_tools.search_qna_materials("CoT 기법")
+
+    assert collection.embedded_texts == []
+    assert [chunk['id'] for chunk in results][:1] == ['chunk_0']
+    assert all(chunk['retrieval'] == 'keyword' for chunk in results)
+    assert all(0 < chunk['similarity_score'] < 1 for chunk in results)
+
+
+def test_topical_query_fuses_vector_and_keyword_results(collection):
+    results = vector_search_tools.search_qna_materials("단계적으로 생각하게 만드는 방법")
+
+    assert collection.embedded_texts == ["단계적으로 생각하게 만드는 방법"]
+    assert results[0]['id'] == 'chunk_0'
+    assert results[0]['retrieval'] == 'hybrid'
+    # 벡터 검색에서 거리 기준을 통과하지 못한 청크는 어휘 일치만으로 들어오지 않음
+    assert {chunk['id'] for chunk in results} <= {'chunk_0', 'chunk_3'}
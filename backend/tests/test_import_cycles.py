@@ -0,0 +1,28 @@
+# backend/tests/test_import_cycles.py
+# 순환 import 회귀 테스트 (모듈마다 새 인터프리터에서 단독으로 import)
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+MODULES = [
+    'app.tools.analysis',
+    'app.tools.analysis.intent_classifier',
+    'app.tools.analysis.intent_cache',
+]
+
+
+@pytest.mark.parametrize('module', MODULES)
+@pytest.mark.parametrize('state_store_backend', ['memory', 'sqlite'])
+def test_module_imports_in_fresh_interpreter(module, state_store_backend, tmp_path):
+    env = dict(os.environ, STATE_STORE_BACKEND=state_store_backend,
+               STATE_STORE_SQLITE_PATH=str(tmp_path / 'state.db'))
+    result = subprocess.run(
+        [sys.executable, '-c', f'import {module}'],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
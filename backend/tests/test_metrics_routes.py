@@ -0,0 +1,58 @@
+# backend/tests/test_metrics_routes.py
+# 성능 지표 라우트 인증 및 추적 응답의 사용자 정보 제거 테스트
+
+import pytest
+from flask import Flask
+
+from app.routes.system.metrics import metrics_bp
+from app.utils.auth.jwt_handler import generate_access_token
+from app.utils.tracing import WorkflowTracer, workflow_tracer
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(metrics_bp, url_prefix='/api/v1/system')
+    return app.test_client()
+
+
+def _record_failed_trace(tracer):
+    with pytest.raises(RuntimeError):
+        with tracer.trace("workflow", execution_id="exec-1", user_id=42, user_intent="question"):
+            with tracer.span("db", "db", operation="세션 저장"):
+                raise RuntimeError("Access denied for user 'tutor'@'10.0.0.5'")
+
+
+@pytest.mark.parametrize('path', ['/api/v1/system/metrics', '/api/v1/system/metrics/traces'])
+def test_metrics_routes_require_auth(client, path):
+    response = client.get(path)
+
+    assert response.status_code == 401
+    assert response.get_json()['error']['code'] == 'AUTH_TOKEN_REQUIRED'
+
+
+def test_traces_route_redacts_user_attributes_and_errors(client, monkeypatch):
+    tracer = WorkflowTracer()
+    _record_failed_trace(tracer)
+    monkeypatch.setattr(workflow_tracer, 'get_recent_traces', tracer.get_recent_traces)
+    token = generate_access_token({'user_id': 1, 'login_id': 'tester'})
+
+    response = client.get('/api/v1/system/metrics/traces', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 200
+    trace = response.get_json()['data']['traces'][0]
+    assert trace['attributes'] == {'execution_id': 'exec-1'}
+    assert trace['error'] == '[redacted]'
+    assert trace['children'][0]['attributes'] == {'operation': '세션 저장'}
+    assert trace['children'][0]['error'] == '[redacted]'
+    assert 'tutor' not in response.get_data(as_text=True)
+
+
+def test_unredacted_traces_keep_raw_attributes():
+    tracer = WorkflowTracer()
+    _record_failed_trace(tracer)
+
+    trace = tracer.get_recent_traces(redact=False)[0]
+
+    assert trace['attributes']['user_id'] == 42
+    assert 'Access denied' in trace['error']
@@ -0,0 +1,30 @@
+# backend/tests/test_qna_stream_session.py
+# QnA 스트리밍 임시 세션 1회 사용 테스트
+
+import time
+
+import pytest
+from flask import Flask
+
+from app.routes.learning.session import qna_stream
+from app.core.state_store import MemoryStateStore
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(qna_stream, 'streaming_session_store', MemoryStateStore('qna_stream_test', 30))
+    app = Flask(__name__)
+    app.register_blueprint(qna_stream.qna_stream_bp, url_prefix='/api/v1/learning')
+    return app.test_client()
+
+
+def test_streaming_session_is_consumed_on_first_request(client):
+    # 저장소 TTL은 남아 있지만 세션 데이터의 expires_at은 지난 경우
+    qna_stream.streaming_session_store.set("temp-1", {"expires_at": time.time() - 1, "user_message": "질문"})
+
+    first = client.get('/api/v1/learning/qna-stream/temp-1').get_data(as_text=True)
+    second = client.get('/api/v1/learning/qna-stream/temp-1').get_data(as_text=True)
+
+    assert "SESSION_EXPIRED" in first
+    assert "INVALID_SESSION" in second
+    assert qna_stream.streaming_session_store.count() == 0
@@ -0,0 +1,45 @@
+# backend/tests/test_retrieval_executor.py
+# 검색 스레드 풀 포화 지표 테스트 (기다리지 않는 제출은 거부로 집계하지 않음)
+
+import logging
+import threading
+
+import pytest
+
+from app.core.runtime.retrieval_executor import RetrievalExecutor, RetrievalExecutorSaturated
+
+
+@pytest.fixture
+def full_executor():
+    """실행 1개 + 대기 0개가 모두 찬 풀"""
+    executor = RetrievalExecutor(max_workers=1, max_queue=0, queue_timeout=0.05, name="test-retrieval")
+    release = threading.Event()
+    future = executor.submit(release.wait)
+    yield executor
+    release.set()
+    future.result(timeout=1)
+    executor.shutdown()
+
+
+def test_try_submit_on_full_pool_is_not_counted_as_rejection(full_executor, caplog):
+    with caplog.at_level(logging.WARNING, logger='app.core.runtime.retrieval_executor'):
+        with pytest.raises(RetrievalExecutorSaturated):
+            full_executor.submit(lambda: None, timeout=0)
+
+    stats = full_executor.get_stats()
+    assert stats['try_rejected'] == 1
+    assert stats['rejected'] == 0
+    assert stats['waited'] == 0
+    assert not caplog.records
+
+
+def test_waiting_submit_on_full_pool_is_counted_as_rejection(full_executor, caplog):
+    with caplog.at_level(logging.WARNING, logger='app.core.runtime.retrieval_executor'):
+        with pytest.raises(RetrievalExecutorSaturated):
+            full_executor.submit(lambda: None)
+
+    stats = full_executor.get_stats()
+    assert stats['rejected'] == 1
+    assert stats['waited'] == 1
+    assert stats['try_rejected'] == 0
+    assert len(caplog.records) == 1
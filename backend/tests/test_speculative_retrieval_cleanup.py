@@ -0,0 +1,40 @@
+# backend/tests/test_speculative_retrieval_cleanup.py
+# 의도 분석 실패 시 QnA 추측 검색 폐기 테스트
+
+import pytest
+
+# 에이전트 모듈의 순환 import를 피하기 위해 워크플로우 패키지를 먼저 로드
+import app.core.langraph  # noqa: F401
+from app.agents.learning_supervisor import learning_supervisor_agent as supervisor_module
+
+
+class FakeSpeculation:
+    def __init__(self):
+        self.collected = False
+        self.discarded = False
+
+    def collect(self):
+        self.collected = True
+        return None
+
+    def discard(self):
+        self.discarded = True
+
+
+def test_speculation_is_discarded_when_intent_analysis_fails(monkeypatch):
+    speculation = FakeSpeculation()
+    monkeypatch.setattr(supervisor_module.speculative_retrieval, 'start', lambda message, stage: speculation)
+
+    supervisor = supervisor_module.LearningSupervisor()
+    monkeypatch.setattr(supervisor, '_extract_user_message', lambda state: "프롬프트 엔지니어링이 뭔가요?")
+
+    def failing_analysis(state, message):
+        raise RuntimeError("의도 분석 LLM 호출 실패")
+
+    monkeypatch.setattr(supervisor, '_analyze_user_intent', failing_analysis)
+
+    with pytest.raises(RuntimeError):
+        supervisor._handle_with_intent_analysis({"session_progress_stage": "theory_completed"})
+
+    assert speculation.discarded
+    assert not speculation.collected